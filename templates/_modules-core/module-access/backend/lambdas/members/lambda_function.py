@@ -35,6 +35,7 @@ def get_supabase_user_id_from_okta_uid(okta_uid: str) -> Optional[str]:
         print(f"Error getting Supabase user_id from Okta UID: {str(e)}")
         return None
 
+@common.request_scope
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Handle organization membership operations
@@ -181,17 +182,18 @@ def handle_list_members(user_id: str, org_id: str, event: Dict[str, Any]) -> Dic
             offset=offset
         )
         
-        # Get profile info for each member
+        # Get profile info for all members in one query
+        profiles = common.load_many(
+            'user_profiles',
+            [member['user_id'] for member in members],
+            column='user_id'
+        )
+        
         result = []
-        for member in members:
-            profile = common.find_one(
-                table='user_profiles',
-                filters={'user_id': member['user_id']},
-                select='user_id, email, full_name, avatar_url'
-            )
-            
+        for member, profile in zip(members, profiles):
             member_data = common.format_record(member)
             if profile:
+                profile = {key: profile.get(key) for key in ('user_id', 'email', 'full_name', 'avatar_url')}
                 member_data['profile'] = common.format_record(profile)
             
             result.append(member_data)
@@ -279,6 +281,7 @@ def handle_add_member(event: Dict[str, Any], user_id: str, org_id: str) -> Dict[
                 'added_by': supabase_user_id
             }
         )
+        common.invalidate_auth_cache(resource_id=org_id)
         
         result = common.format_record(new_member)
         result['profile'] = common.format_record(target_profile)
@@ -370,6 +373,7 @@ def handle_update_member(
             filters={'id': member_id},
             data={'org_role': new_role}
         )
+        common.invalidate_auth_cache(resource_id=org_id)
         
         # Get profile info
         profile = common.find_one(
@@ -452,6 +456,7 @@ def handle_remove_member(user_id: str, org_id: str, member_id: str) -> Dict[str,
             table='org_members',
             filters={'id': member_id}
         )
+        common.invalidate_auth_cache(resource_id=org_id)
         
         return common.success_response({
             'message': 'Member removed successfully',
@@ -3,26 +3,26 @@ Access module resource permission helpers per ADR-019c.
 Wraps database RPC functions with Python-friendly interface.
 """
 from typing import Optional
-from org_common.db import rpc
+import org_common as common
 
 # Organization Permissions
 def can_view_org(user_id: str, org_id: str) -> bool:
     """Check if user can view organization (is member)."""
-    return rpc('can_view_org', {
+    return common.rpc('can_view_org', {
         'p_user_id': user_id,
         'p_org_id': org_id
     })
 
 def can_edit_org(user_id: str, org_id: str) -> bool:
     """Check if user can edit organization (is org_admin or org_owner)."""
-    return rpc('can_edit_org', {
+    return common.rpc('can_edit_org', {
         'p_user_id': user_id,
         'p_org_id': org_id
     })
 
 def can_delete_org(user_id: str, org_id: str) -> bool:
     """Check if user can delete organization (is org_owner)."""
-    return rpc('can_delete_org', {
+    return common.rpc('can_delete_org', {
         'p_user_id': user_id,
         'p_org_id': org_id
     })
@@ -30,14 +30,14 @@ def can_delete_org(user_id: str, org_id: str) -> bool:
 # Member Management Permissions
 def can_view_members(user_id: str, org_id: str) -> bool:
     """Check if user can view org members (is member)."""
-    return rpc('can_view_members', {
+    return common.rpc('can_view_members', {
         'p_user_id': user_id,
         'p_org_id': org_id
     })
 
 def can_manage_members(user_id: str, org_id: str) -> bool:
     """Check if user can manage members (is org_admin or org_owner)."""
-    return rpc('can_manage_members', {
+    return common.rpc('can_manage_members', {
         'p_user_id': user_id,
         'p_org_id': org_id
     })
@@ -45,14 +45,14 @@ def can_manage_members(user_id: str, org_id: str) -> bool:
 # Invite Permissions
 def can_view_invites(user_id: str, org_id: str) -> bool:
     """Check if user can view invites (is member)."""
-    return rpc('can_view_invites', {
+    return common.rpc('can_view_invites', {
         'p_user_id': user_id,
         'p_org_id': org_id
     })
 
 def can_manage_invites(user_id: str, org_id: str) -> bool:
     """Check if user can manage invites (is org_admin or org_owner)."""
-    return rpc('can_manage_invites', {
+    return common.rpc('can_manage_invites', {
         'p_user_id': user_id,
         'p_org_id': org_id
     })
@@ -60,14 +60,14 @@ def can_manage_invites(user_id: str, org_id: str) -> bool:
 # User Profile Permissions
 def can_view_profile(user_id: str, target_user_id: str) -> bool:
     """Check if user can view profile (self or sys_admin)."""
-    return rpc('can_view_profile', {
+    return common.rpc('can_view_profile', {
         'p_user_id': user_id,
         'p_target_user_id': target_user_id
     })
 
 def can_edit_profile(user_id: str, target_user_id: str) -> bool:
     """Check if user can edit profile (self or sys_admin)."""
-    return rpc('can_edit_profile', {
+    return common.rpc('can_edit_profile', {
         'p_user_id': user_id,
         'p_target_user_id': target_user_id
     })
@@ -75,7 +75,7 @@ def can_edit_profile(user_id: str, target_user_id: str) -> bool:
 # Email Domain Permissions
 def can_manage_email_domains(user_id: str, org_id: str) -> bool:
     """Check if user can manage email domains (is org_admin or org_owner)."""
-    return rpc('can_manage_email_domains', {
+    return common.rpc('can_manage_email_domains', {
         'p_user_id': user_id,
         'p_org_id': org_id
     })
@@ -1,40 +1,152 @@
 r"""
 Org-Module Common Layer
 Shared utilities for org-module Lambda functions
+
+Submodules are imported on first use: `common.success_response` loads only
+responses.py, while `common.find_one` loads db.py and with it the supabase
+client. Lambdas that never touch the database don't pay for the
+supabase/postgrest/httpx (or boto3) imports at cold start. Call sites
+(`common.xxx`, `from org_common import xxx`) are unchanged.
+
+To export a new name, add it to _LAZY_EXPORTS, the TYPE_CHECKING imports
+and __all__.
 """
 import json
-
-from .supabase_client import get_supabase_client, get_secret
-from .jwt_utils import resolve_user_jwt, extract_jwt_from_headers
-from .db import (
-    execute_query, format_record, format_records,
-    insert_one, find_one, find_many, update_one, delete_one, delete_many,
-    rpc, count, update_many
-)
-from .auth import (
-    is_chat_owner, is_chat_participant,
-    is_org_member, is_org_admin, is_org_owner, is_org_colleague,
-    is_project_member, is_project_owner, is_project_admin_or_owner,
-    is_project_colleague, is_project_favorited,
-    is_sys_admin, is_provider_active
-)
-from .responses import (
-    success_response, error_response, created_response, no_content_response,
-    bad_request_response, unauthorized_response, forbidden_response,
-    not_found_response, conflict_response, internal_error_response,
-    method_not_allowed_response
-)
-from .errors import ValidationError, NotFoundError, UnauthorizedError, ForbiddenError
-from .validators import (
-    validate_uuid, validate_email, validate_org_role, validate_sys_role,
-    validate_string_length, validate_url, validate_required, validate_integer,
-    validate_boolean, validate_choices
-)
-from .transform import (
-    snake_to_camel, camel_to_snake,
-    transform_record, transform_records, transform_input,
-    USER_PROFILE_FIELDS, ORG_MEMBER_FIELDS, WORKSPACE_CONFIG_FIELDS, LAMBDA_CONFIG_FIELDS
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Submodule -> public names it provides (resolved by __getattr__ below)
+_LAZY_EXPORTS = {
+    'supabase_client': (
+        'get_supabase_client', 'get_secret', 'get_client_pool', 'SupabaseClientPool',
+    ),
+    'secrets_cache': (
+        'SecretsCache', 'SecretRejectedError', 'get_secrets_cache', 'get_secret_string', 'get_parameter',
+        'invalidate_secret', 'prefetch_secrets', 'call_with_secret', 'secrets_cache_stats',
+    ),
+    'jwt_utils': (
+        'resolve_user_jwt', 'extract_jwt_from_headers',
+    ),
+    'db': (
+        'execute_query', 'format_record', 'format_records',
+        'insert_one', 'find_one', 'find_many', 'update_one', 'delete_one', 'delete_many',
+        'rpc', 'count', 'count_by', 'count_many', 'sum_column', 'update_many',
+        'insert_many', 'upsert_many', 'update_where', 'BulkWriteResult', 'BatchError',
+        'iter_many', 'find_page', 'encode_cursor', 'decode_cursor',
+    ),
+    'auth': (
+        'is_chat_owner', 'is_chat_participant',
+        'is_org_member', 'is_org_admin', 'is_org_owner', 'is_org_colleague',
+        'is_project_member', 'is_project_owner', 'is_project_admin_or_owner',
+        'is_project_colleague', 'is_project_favorited',
+        'is_sys_admin', 'is_provider_active',
+        'AuthContext', 'load_auth_context',
+    ),
+    'auth_cache': (
+        'AuthDecisionCache', 'get_auth_cache', 'set_auth_cache', 'cached_check',
+        'invalidate_auth_cache', 'auth_cache_stats', 'auth_cache_scope',
+    ),
+    'loader': (
+        'DataLoader', 'get_data_loader', 'load', 'load_many', 'data_loader_stats', 'request_scope',
+    ),
+    'embedding_cache': (
+        'EmbeddingCache', 'EmbeddingStore', 'TableEmbeddingStore', 'FileEmbeddingStore',
+        'get_embedding_cache', 'set_embedding_cache', 'get_embedding', 'get_embeddings',
+        'embedding_cache_key', 'embedding_cache_stats',
+    ),
+    'transport': (
+        'get_http_session', 'get_httpx_client', 'get_boto3_client', 'transport_stats',
+    ),
+    'responses': (
+        'success_response', 'error_response', 'created_response', 'no_content_response',
+        'bad_request_response', 'unauthorized_response', 'forbidden_response',
+        'not_found_response', 'conflict_response', 'internal_error_response',
+        'method_not_allowed_response',
+    ),
+    'errors': (
+        'ValidationError', 'NotFoundError', 'UnauthorizedError', 'ForbiddenError', 'BulkWriteError',
+    ),
+    'validators': (
+        'validate_uuid', 'validate_email', 'validate_org_role', 'validate_sys_role',
+        'validate_string_length', 'validate_url', 'validate_required', 'validate_integer',
+        'validate_boolean', 'validate_choices',
+    ),
+    'transform': (
+        'snake_to_camel', 'camel_to_snake',
+        'transform_record', 'transform_records', 'transform_input',
+        'USER_PROFILE_FIELDS', 'ORG_MEMBER_FIELDS', 'WORKSPACE_CONFIG_FIELDS', 'LAMBDA_CONFIG_FIELDS',
+    ),
+}
+
+_LAZY_ATTRS = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+
+def __getattr__(name):
+    """Import the submodule that provides `name` on first access (PEP 562)."""
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+if TYPE_CHECKING:
+    from .supabase_client import get_supabase_client, get_secret, get_client_pool, SupabaseClientPool
+    from .secrets_cache import (
+        SecretsCache, SecretRejectedError, get_secrets_cache, get_secret_string, get_parameter,
+        invalidate_secret, prefetch_secrets, call_with_secret, secrets_cache_stats
+    )
+    from .jwt_utils import resolve_user_jwt, extract_jwt_from_headers
+    from .db import (
+        execute_query, format_record, format_records,
+        insert_one, find_one, find_many, update_one, delete_one, delete_many,
+        rpc, count, count_by, count_many, sum_column, update_many,
+        insert_many, upsert_many, update_where, BulkWriteResult, BatchError,
+        iter_many, find_page, encode_cursor, decode_cursor
+    )
+    from .auth import (
+        is_chat_owner, is_chat_participant,
+        is_org_member, is_org_admin, is_org_owner, is_org_colleague,
+        is_project_member, is_project_owner, is_project_admin_or_owner,
+        is_project_colleague, is_project_favorited,
+        is_sys_admin, is_provider_active,
+        AuthContext, load_auth_context
+    )
+    from .auth_cache import (
+        AuthDecisionCache, get_auth_cache, set_auth_cache, cached_check,
+        invalidate_auth_cache, auth_cache_stats, auth_cache_scope
+    )
+    from .loader import (
+        DataLoader, get_data_loader, load, load_many, data_loader_stats, request_scope
+    )
+    from .embedding_cache import (
+        EmbeddingCache, EmbeddingStore, TableEmbeddingStore, FileEmbeddingStore,
+        get_embedding_cache, set_embedding_cache, get_embedding, get_embeddings,
+        embedding_cache_key, embedding_cache_stats
+    )
+    from .transport import get_http_session, get_httpx_client, get_boto3_client, transport_stats
+    from .responses import (
+        success_response, error_response, created_response, no_content_response,
+        bad_request_response, unauthorized_response, forbidden_response,
+        not_found_response, conflict_response, internal_error_response,
+        method_not_allowed_response
+    )
+    from .errors import ValidationError, NotFoundError, UnauthorizedError, ForbiddenError, BulkWriteError
+    from .validators import (
+        validate_uuid, validate_email, validate_org_role, validate_sys_role,
+        validate_string_length, validate_url, validate_required, validate_integer,
+        validate_boolean, validate_choices
+    )
+    from .transform import (
+        snake_to_camel, camel_to_snake,
+        transform_record, transform_records, transform_input,
+        USER_PROFILE_FIELDS, ORG_MEMBER_FIELDS, WORKSPACE_CONFIG_FIELDS, LAMBDA_CONFIG_FIELDS
+    )
 
 # ============================================================================
 # AUTH ROLE CONSTANTS (ADR-019: Auth Standardization)
@@ -105,6 +217,7 @@ def get_org_context_from_event(event):
 # NEW STANDARD FUNCTIONS - Use these in all new code and migrations
 # These provide consistent authorization checks across all modules.
 # They wrap parameterized RPC functions that enforce auth at the database level.
+# Decisions are memoized per (check, user, resource) - see auth_cache.py.
 # See: docs/arch decisions/ADR-019-AUTH-STANDARDIZATION.md
 # ============================================================================
 
@@ -126,10 +239,14 @@ def check_sys_admin(user_id: str) -> bool:
             # Allow platform-wide operation
     """
     from .db import rpc
+    from .auth_cache import cached_check
     
     # ADR-019: Call new check_sys_admin RPC (backward compatible - doesn't touch old is_sys_admin)
-    result = rpc('check_sys_admin', {'p_user_id': user_id})
-    return result if isinstance(result, bool) else False
+    def check() -> bool:
+        result = rpc('check_sys_admin', {'p_user_id': user_id})
+        return result if isinstance(result, bool) else False
+
+    return cached_check('check_sys_admin', user_id, None, check)
 
 
 def check_org_admin(user_id: str, org_id: str) -> bool:
@@ -151,10 +268,14 @@ def check_org_admin(user_id: str, org_id: str) -> bool:
             # Allow org-scoped operation
     """
     from .db import rpc
+    from .auth_cache import cached_check
     
     # ADR-019: Call new check_org_admin RPC (backward compatible - doesn't touch old is_org_admin)
-    result = rpc('check_org_admin', {'p_user_id': user_id, 'p_org_id': org_id})
-    return result if isinstance(result, bool) else False
+    def check() -> bool:
+        result = rpc('check_org_admin', {'p_user_id': user_id, 'p_org_id': org_id})
+        return result if isinstance(result, bool) else False
+
+    return cached_check('check_org_admin', user_id, org_id, check)
 
 
 def check_ws_admin(user_id: str, ws_id: str) -> bool:
@@ -176,10 +297,14 @@ def check_ws_admin(user_id: str, ws_id: str) -> bool:
             # Allow workspace-scoped operation
     """
     from .db import rpc
+    from .auth_cache import cached_check
     
     # ADR-019: Call new check_ws_admin RPC (backward compatible - doesn't touch old is_ws_admin_or_owner)
-    result = rpc('check_ws_admin', {'p_user_id': user_id, 'p_ws_id': ws_id})
-    return result if isinstance(result, bool) else False
+    def check() -> bool:
+        result = rpc('check_ws_admin', {'p_user_id': user_id, 'p_ws_id': ws_id})
+        return result if isinstance(result, bool) else False
+
+    return cached_check('check_ws_admin', user_id, ws_id, check)
 
 
 # ============================================================================
@@ -214,6 +339,8 @@ def can_access_org_resource(user_id: str, org_id: str) -> bool:
         if not can_view_resource(user_id, resource_id):
             return common.forbidden_response('Access denied')
     """
+    from .auth import is_org_member
+    
     # Wrapper around is_org_member with standardized parameter order
     return is_org_member(org_id, user_id)
 
@@ -286,6 +413,9 @@ def get_supabase_user_id_from_external_uid(external_uid: str) -> str:
         NotFoundError: If no matching user is found in the `user_auth_ext_ids` table.
         ValueError: If the external_uid is empty or None.
     """
+    from .db import find_one
+    from .errors import NotFoundError
+
     if not external_uid:
         raise ValueError("external_uid cannot be empty or None")
 
@@ -347,6 +477,7 @@ def log_ai_error(
         ws_id: Workspace context (if applicable)
     """
     import traceback
+    from .db import insert_one
     
     # Categorize error type
     error_message = str(error)
@@ -435,6 +566,19 @@ __all__ = [
     # Supabase client
     'get_supabase_client',
     'get_secret',
+    'get_client_pool',
+    'SupabaseClientPool',
+    
+    # Secrets cache
+    'SecretsCache',
+    'SecretRejectedError',
+    'get_secrets_cache',
+    'get_secret_string',
+    'get_parameter',
+    'invalidate_secret',
+    'prefetch_secrets',
+    'call_with_secret',
+    'secrets_cache_stats',
     
     # Database helpers
     'execute_query',
@@ -448,7 +592,19 @@ __all__ = [
     'delete_many',
     'rpc',
     'count',
+    'count_by',
+    'count_many',
+    'sum_column',
     'update_many',
+    'insert_many',
+    'upsert_many',
+    'update_where',
+    'BulkWriteResult',
+    'BatchError',
+    'iter_many',
+    'find_page',
+    'encode_cursor',
+    'decode_cursor',
     
     # Auth wrappers
     'is_chat_owner',
@@ -464,7 +620,44 @@ __all__ = [
     'is_project_favorited',
     'is_sys_admin',
     'is_provider_active',
-    
+    'AuthContext',
+    'load_auth_context',
+    
+    # Authorization decision cache
+    'AuthDecisionCache',
+    'get_auth_cache',
+    'set_auth_cache',
+    'cached_check',
+    'invalidate_auth_cache',
+    'auth_cache_stats',
+    'auth_cache_scope',
+    
+    # Request-scoped data loader
+    'DataLoader',
+    'get_data_loader',
+    'load',
+    'load_many',
+    'data_loader_stats',
+    'request_scope',
+
+    # Embedding cache
+    'EmbeddingCache',
+    'EmbeddingStore',
+    'TableEmbeddingStore',
+    'FileEmbeddingStore',
+    'get_embedding_cache',
+    'set_embedding_cache',
+    'get_embedding',
+    'get_embeddings',
+    'embedding_cache_key',
+    'embedding_cache_stats',
+
+    # Provider transport (pooled HTTP / AWS clients)
+    'get_http_session',
+    'get_httpx_client',
+    'get_boto3_client',
+    'transport_stats',
+
     # Response builders
     'success_response',
     'error_response',
@@ -483,6 +676,7 @@ __all__ = [
     'NotFoundError',
     'UnauthorizedError',
     'ForbiddenError',
+    'BulkWriteError',
     
     # Validators
     'validate_uuid',
@@ -6,8 +6,21 @@ Auto-validated by scripts/validation/rpc-validator/
 
 Standard: Every Supabase function callable from Python gets a wrapper here.
 See: docs/implementation/org-common-enhancement-plan.md
+
+Decisions are memoized per (check, user, resource) by auth_cache.py.
 """
+from typing import Any, Dict, Optional
+
 from .db import rpc
+from .auth_cache import cached_check, get_auth_cache
+
+
+def _check(function_name: str, params: dict, user_jwt: str = None, user_id: str = None, resource_id: str = None) -> bool:
+    """Call a boolean authorization RPC through the decision cache."""
+    return cached_check(
+        function_name, user_id or user_jwt, resource_id,
+        lambda: rpc(function_name, params, user_jwt) is True
+    )
 
 # ============================================
 # CHAT AUTHORIZATION
@@ -15,12 +28,12 @@ from .db import rpc
 
 def is_chat_owner(chat_session_id: str, user_jwt: str = None) -> bool:
     """Check if current user owns the chat session."""
-    return rpc('is_chat_owner', {'chat_session_id_param': chat_session_id}, user_jwt) is True
+    return _check('is_chat_owner', {'chat_session_id_param': chat_session_id}, user_jwt, resource_id=chat_session_id)
 
 
 def is_chat_participant(chat_session_id: str, user_jwt: str = None) -> bool:
     """Check if current user is a participant in the chat."""
-    return rpc('is_chat_participant', {'chat_session_id_param': chat_session_id}, user_jwt) is True
+    return _check('is_chat_participant', {'chat_session_id_param': chat_session_id}, user_jwt, resource_id=chat_session_id)
 
 
 # ============================================
@@ -30,25 +43,25 @@ def is_chat_participant(chat_session_id: str, user_jwt: str = None) -> bool:
 def is_org_member(org_id: str, user_id: str = None, user_jwt: str = None) -> bool:
     """Check if user is a member of the organization."""
     if user_id:
-        return rpc('is_org_member', {'p_org_id': org_id, 'p_user_id': user_id}, user_jwt) is True
-    return rpc('is_org_member', {'org_id_param': org_id}, user_jwt) is True
+        return _check('is_org_member', {'p_org_id': org_id, 'p_user_id': user_id}, user_jwt, user_id=user_id, resource_id=org_id)
+    return _check('is_org_member', {'org_id_param': org_id}, user_jwt, resource_id=org_id)
 
 
 def is_org_admin(org_id: str, user_id: str = None, user_jwt: str = None) -> bool:
     """Check if user is an org admin."""
     if user_id:
-        return rpc('is_org_admin', {'p_org_id': org_id, 'p_user_id': user_id}, user_jwt) is True
-    return rpc('is_org_admin', {'org_id': org_id}, user_jwt) is True
+        return _check('is_org_admin', {'p_org_id': org_id, 'p_user_id': user_id}, user_jwt, user_id=user_id, resource_id=org_id)
+    return _check('is_org_admin', {'org_id': org_id}, user_jwt, resource_id=org_id)
 
 
 def is_org_owner(org_id: str, user_id: str, user_jwt: str = None) -> bool:
     """Check if user is the org owner."""
-    return rpc('is_org_owner', {'p_org_id': org_id, 'p_user_id': user_id}, user_jwt) is True
+    return _check('is_org_owner', {'p_org_id': org_id, 'p_user_id': user_id}, user_jwt, user_id=user_id, resource_id=org_id)
 
 
 def is_org_colleague(target_user_id: str, user_jwt: str = None) -> bool:
     """Check if target user is in the same org as current user."""
-    return rpc('is_org_colleague', {'target_user_id': target_user_id}, user_jwt) is True
+    return _check('is_org_colleague', {'target_user_id': target_user_id}, user_jwt, resource_id=target_user_id)
 
 
 # ============================================
@@ -57,27 +70,27 @@ def is_org_colleague(target_user_id: str, user_jwt: str = None) -> bool:
 
 def is_project_member(project_id: str, user_jwt: str = None) -> bool:
     """Check if current user is a project member."""
-    return rpc('is_project_member', {'project_id_param': project_id}, user_jwt) is True
+    return _check('is_project_member', {'project_id_param': project_id}, user_jwt, resource_id=project_id)
 
 
 def is_project_owner(project_id: str, user_jwt: str = None) -> bool:
     """Check if current user is the project owner."""
-    return rpc('is_project_owner', {'project_id_param': project_id}, user_jwt) is True
+    return _check('is_project_owner', {'project_id_param': project_id}, user_jwt, resource_id=project_id)
 
 
 def is_project_admin_or_owner(project_id: str, user_jwt: str = None) -> bool:
     """Check if current user is a project admin or owner."""
-    return rpc('is_project_admin_or_owner', {'project_id_param': project_id}, user_jwt) is True
+    return _check('is_project_admin_or_owner', {'project_id_param': project_id}, user_jwt, resource_id=project_id)
 
 
 def is_project_colleague(target_user_id: str, user_jwt: str = None) -> bool:
     """Check if target user shares any project with current user."""
-    return rpc('is_project_colleague', {'target_user_id': target_user_id}, user_jwt) is True
+    return _check('is_project_colleague', {'target_user_id': target_user_id}, user_jwt, resource_id=target_user_id)
 
 
 def is_project_favorited(project_id: str, user_jwt: str = None) -> bool:
     """Check if current user has favorited the project."""
-    return rpc('is_project_favorited', {'project_id_param': project_id}, user_jwt) is True
+    return _check('is_project_favorited', {'project_id_param': project_id}, user_jwt, resource_id=project_id)
 
 
 # ============================================
@@ -86,9 +99,110 @@ def is_project_favorited(project_id: str, user_jwt: str = None) -> bool:
 
 def is_sys_admin(user_jwt: str = None) -> bool:
     """Check if current user is a sys admin (sys_admin or sys_owner role)."""
-    return rpc('is_sys_admin', {}, user_jwt) is True
+    return _check('is_sys_admin', {}, user_jwt)
 
 
 def is_provider_active(provider_name: str, user_jwt: str = None) -> bool:
     """Check if an AI provider is active."""
-    return rpc('is_provider_active', {'provider_name': provider_name}, user_jwt) is True
+    return _check('is_provider_active', {'provider_name': provider_name}, user_jwt, resource_id=provider_name)
+
+
+
+# ============================================
+# AUTHORIZATION CONTEXT PRELOAD
+# ============================================
+
+class AuthContext:
+    """
+    A user's sys, org and workspace roles, loaded in one RPC.
+
+    Answers the same questions as check_sys_admin / check_org_admin /
+    check_ws_admin / can_access_org_resource without further round trips.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.user_id: Optional[str] = data.get('user_id')
+        self.sys_role: Optional[str] = data.get('sys_role')
+        self.org_id: Optional[str] = data.get('org_id')
+        self.org_role: Optional[str] = data.get('org_role')
+        self.ws_id: Optional[str] = data.get('ws_id')
+        self.ws_org_id: Optional[str] = data.get('ws_org_id')
+        self.ws_role: Optional[str] = data.get('ws_role')
+
+    @property
+    def is_sys_admin(self) -> bool:
+        """sys_owner or sys_admin."""
+        from . import SYS_ADMIN_ROLES
+        return self.sys_role in SYS_ADMIN_ROLES
+
+    @property
+    def is_org_member(self) -> bool:
+        """Member of org_id (any role)."""
+        return self.org_role is not None
+
+    @property
+    def is_org_admin(self) -> bool:
+        """org_owner or org_admin in org_id."""
+        from . import ORG_ADMIN_ROLES
+        return self.org_role in ORG_ADMIN_ROLES
+
+    @property
+    def workspace_exists(self) -> bool:
+        """Whether ws_id refers to an existing workspace."""
+        return self.ws_org_id is not None
+
+    @property
+    def is_ws_member(self) -> bool:
+        """Active member of ws_id (any role)."""
+        return self.ws_role is not None
+
+    @property
+    def is_ws_admin(self) -> bool:
+        """ws_owner or ws_admin in ws_id."""
+        from . import WS_ADMIN_ROLES
+        return self.ws_role in WS_ADMIN_ROLES
+
+    def __repr__(self) -> str:
+        return (
+            f"AuthContext(user_id={self.user_id!r}, sys_role={self.sys_role!r}, "
+            f"org_id={self.org_id!r}, org_role={self.org_role!r}, "
+            f"ws_id={self.ws_id!r}, ws_role={self.ws_role!r})"
+        )
+
+
+def load_auth_context(user_id: str, org_id: str = None, ws_id: str = None) -> AuthContext:
+    """
+    Load a user's sys, org and workspace roles in one round trip.
+
+    When ws_id is given without org_id, the workspace's org is used. The
+    results also prime the authorization cache, so later check_sys_admin,
+    check_org_admin, check_ws_admin and can_access_org_resource calls for
+    the same user in this request don't hit the database.
+
+    Args:
+        user_id: Supabase user UUID
+        org_id: Optional organization UUID
+        ws_id: Optional workspace UUID
+
+    Returns:
+        AuthContext
+
+    Usage:
+        ctx = common.load_auth_context(supabase_user_id, ws_id=ws_id)
+        if not ctx.is_ws_member:
+            raise common.ForbiddenError('You do not have access to this workspace')
+        org_id = ctx.org_id
+    """
+    data = rpc('load_auth_context', {'p_user_id': user_id, 'p_org_id': org_id, 'p_ws_id': ws_id})
+    context = AuthContext(data or {'user_id': user_id, 'org_id': org_id, 'ws_id': ws_id})
+
+    # Key by the caller's IDs so later checks with the same arguments hit
+    cache = get_auth_cache()
+    cache.prime('check_sys_admin', user_id, None, context.is_sys_admin)
+    cache_org_id = org_id or context.org_id
+    if cache_org_id:
+        cache.prime('check_org_admin', user_id, cache_org_id, context.is_org_admin)
+        cache.prime('is_org_member', user_id, cache_org_id, context.is_org_member)
+    if ws_id:
+        cache.prime('check_ws_admin', user_id, ws_id, context.is_ws_admin)
+    return context
@@ -0,0 +1,215 @@
+"""
+Authorization Decision Cache
+
+Memoizes admin and membership checks (check_sys_admin, check_org_admin,
+check_ws_admin, can_access_org_resource and the auth.is_* helpers), keyed
+by (check, user, resource), so a handler that asks the same question
+several times only pays for one RPC.
+
+Scopes:
+- Request (default): decisions live until the end of the current
+  invocation. Handlers opt in with the @auth_cache_scope decorator; outside
+  a scope, checks always call the database.
+- Container (opt-in): decisions live for AUTH_CACHE_TTL_SECONDS across
+  invocations of a warm container. Other containers don't see
+  invalidations, so keep the TTL short (a few seconds).
+
+Handlers that change memberships or roles must call invalidate_auth_cache()
+for the affected org/workspace after the write.
+
+Usage:
+    @common.auth_cache_scope
+    def lambda_handler(event, context):
+        ...
+
+    common.invalidate_auth_cache(resource_id=org_id)
+    common.auth_cache_stats()  # {'hits': 3, 'misses': 2, ...}
+"""
+import os
+import time
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Container-scope TTL (0 = request scope only)
+AUTH_CACHE_TTL_SECONDS = float(os.getenv('AUTH_CACHE_TTL_SECONDS', '0'))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv('AUTH_CACHE_MAX_ENTRIES', '1024'))
+
+CacheKey = Tuple[str, Optional[Hashable], Optional[Hashable]]
+
+
+class AuthDecisionCache:
+    """
+    In-memory cache of authorization decisions.
+
+    Subclass and install with set_auth_cache() to use another backend;
+    get_or_check() and invalidate() are the only methods the helpers call.
+    """
+
+    def __init__(self, ttl_seconds: float = AUTH_CACHE_TTL_SECONDS, max_entries: int = AUTH_CACHE_MAX_ENTRIES):
+        """
+        Args:
+            ttl_seconds: Container-scope lifetime of a decision (0 = request scope only)
+            max_entries: Container-scope entries kept before the oldest are dropped
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._request_entries: Dict[CacheKey, Any] = {}
+        self._container_entries: Dict[CacheKey, Tuple[Any, float]] = {}
+        self._request_depth = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def begin_request(self):
+        """Start a request scope (nested scopes share the outermost one)."""
+        with self._lock:
+            if self._request_depth == 0:
+                self._request_entries.clear()
+            self._request_depth += 1
+
+    def end_request(self):
+        """End a request scope, dropping its decisions."""
+        with self._lock:
+            self._request_depth = max(0, self._request_depth - 1)
+            if self._request_depth == 0:
+                self._request_entries.clear()
+
+    def _lookup(self, key: CacheKey, now: float) -> Tuple[bool, Any]:
+        if key in self._request_entries:
+            return True, self._request_entries[key]
+        entry = self._container_entries.get(key)
+        if entry is not None:
+            if entry[1] > now:
+                return True, entry[0]
+            del self._container_entries[key]
+        return False, None
+
+    def _store(self, key: CacheKey, value: Any, now: float):
+        if self.ttl_seconds > 0:
+            self._container_entries[key] = (value, now + self.ttl_seconds)
+            if len(self._container_entries) > self.max_entries:
+                # Dicts keep insertion order: drop the oldest decisions
+                for old_key in list(self._container_entries)[:len(self._container_entries) - self.max_entries]:
+                    del self._container_entries[old_key]
+        if self._request_depth > 0:
+            self._request_entries[key] = value
+
+    def get_or_check(
+        self,
+        check: str,
+        user: Optional[Hashable],
+        resource: Optional[Hashable],
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the cached decision for (check, user, resource), computing it on a miss.
+
+        Exceptions from compute() propagate and are not cached.
+        """
+        key = (check, user, resource)
+        now = time.time()
+        with self._lock:
+            found, value = self._lookup(key, now)
+            if found:
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._store(key, value, time.time())
+        return value
+
+    def prime(self, check: str, user: Optional[Hashable], resource: Optional[Hashable], value: Any):
+        """Store a decision obtained elsewhere (e.g. from load_auth_context)."""
+        with self._lock:
+            self._store((check, user, resource), value, time.time())
+
+    def invalidate(self, user: Optional[Hashable] = None, resource: Optional[Hashable] = None):
+        """
+        Drop decisions for a user and/or resource (all decisions if neither is given).
+
+        Args:
+            user: User ID (or JWT, for checks that rely on auth.uid())
+            resource: Org/workspace/project/chat ID the decision was about
+        """
+        def matches(key: CacheKey) -> bool:
+            return (user is None or key[1] == user) and (resource is None or key[2] == resource)
+
+        with self._lock:
+            self.invalidations += 1
+            for entries in (self._request_entries, self._container_entries):
+                for key in [k for k in entries if matches(k)]:
+                    del entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'request_entries': len(self._request_entries),
+                'container_entries': len(self._container_entries),
+                'ttl_seconds': self.ttl_seconds,
+            }
+
+
+_auth_cache = AuthDecisionCache()
+
+
+def get_auth_cache() -> AuthDecisionCache:
+    """Get the container's authorization cache."""
+    return _auth_cache
+
+
+def set_auth_cache(cache: AuthDecisionCache):
+    """Replace the container's authorization cache (e.g. with a custom backend or TTL)."""
+    global _auth_cache
+    _auth_cache = cache
+
+
+def cached_check(
+    check: str,
+    user: Optional[Hashable],
+    resource: Optional[Hashable],
+    compute: Callable[[], Any],
+) -> Any:
+    """Run an authorization check through the cache."""
+    return _auth_cache.get_or_check(check, user, resource, compute)
+
+
+def invalidate_auth_cache(user_id: Optional[str] = None, resource_id: Optional[str] = None):
+    """
+    Forget cached decisions after a membership or role change.
+
+    Args:
+        user_id: Affected user (None = all users)
+        resource_id: Affected org/workspace ID (None = all resources)
+
+    Usage:
+        common.insert_one(table='org_members', data={...})
+        common.invalidate_auth_cache(resource_id=org_id)
+    """
+    _auth_cache.invalidate(user_id, resource_id)
+
+
+def auth_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the container's authorization cache."""
+    return _auth_cache.stats()
+
+
+def auth_cache_scope(handler: Callable) -> Callable:
+    """Decorator: memoize authorization decisions for the duration of each invocation."""
+    @wraps(handler)
+    def wrapper(*args, **kwargs):
+        cache = _auth_cache
+        cache.begin_request()
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            cache.end_request()
+    return wrapper
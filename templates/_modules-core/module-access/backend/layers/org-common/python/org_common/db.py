@@ -2,10 +2,31 @@
 Database Helper Module
 Handles database queries using Supabase client
 """
-from typing import Dict, Any, List, Optional
+import os
+import json
+import base64
+import binascii
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 from .supabase_client import get_supabase_client
-from .errors import NotFoundError
+from .errors import NotFoundError, ValidationError, BulkWriteError
+from .loader import get_data_loader
+
+# Bulk writes: rows per request, and the JSON body size a batch may reach
+# before it is split (large bodies are slow to parse and may hit proxy limits)
+BULK_BATCH_SIZE = int(os.getenv('DB_BULK_BATCH_SIZE', '500'))
+BULK_MAX_PAYLOAD_BYTES = int(os.getenv('DB_BULK_MAX_PAYLOAD_BYTES', str(5 * 1024 * 1024)))
+# Values per .in_() filter in update_where (keeps the request URL short)
+BULK_FILTER_BATCH_SIZE = 200
+
+# Keyset pagination: rows per request in iter_many, and the largest page
+# find_page serves to clients
+ITER_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 200
+# PostgREST max-rows (Supabase "Max rows" API setting): the most rows a
+# select returns whatever its limit
+POSTGREST_MAX_ROWS = int(os.getenv('POSTGREST_MAX_ROWS', '1000'))
 
 
 def execute_query(
@@ -45,6 +66,10 @@ def execute_query(
     try:
         client = get_supabase_client(user_jwt)
         
+        if operation != 'select':
+            # Rows memoized by the request's data loader may be stale now
+            get_data_loader().clear(table)
+        
         # Build query based on operation
         if operation == 'select':
             query = client.table(table).select(select)
@@ -309,6 +334,110 @@ def count(
         raise
 
 
+def _aggregate(
+    table: str,
+    aggregate: str,
+    column: Optional[str] = None,
+    group_by: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    user_jwt: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Call the aggregate_rows RPC; returns [{'group_key': ..., 'value': ...}, ...]."""
+    # Same filter semantics as find_many: None is skipped, lists mean IN
+    rpc_filters = {
+        key: list(value) if isinstance(value, (list, tuple)) else value
+        for key, value in (filters or {}).items()
+        if value is not None
+    }
+    return rpc('aggregate_rows', {
+        'p_table': table,
+        'p_aggregate': aggregate,
+        'p_column': column,
+        'p_group_by': group_by,
+        'p_filters': rpc_filters
+    }, user_jwt=user_jwt) or []
+
+
+def count_by(
+    table: str,
+    group_by: str,
+    filters: Optional[Dict[str, Any]] = None,
+    user_jwt: Optional[str] = None
+) -> Dict[str, int]:
+    """
+    Count records per value of a column, server-side.
+
+    Args:
+        table: Table name
+        group_by: Column to group on
+        filters: Filter conditions (list values mean IN)
+        user_jwt: User JWT token for RLS
+
+    Returns:
+        Dict of group value (as text) -> count; groups without rows are absent
+
+    Example:
+        members_per_org = count_by('org_members', 'org_id')
+    """
+    rows = _aggregate(table, 'count', group_by=group_by, filters=filters, user_jwt=user_jwt)
+    return {row['group_key']: int(row['value']) for row in rows}
+
+
+def count_many(
+    table: str,
+    column: str,
+    values: List[Any],
+    filters: Optional[Dict[str, Any]] = None,
+    user_jwt: Optional[str] = None
+) -> Dict[Any, int]:
+    """
+    Count records for each of several keys in one request.
+
+    Args:
+        table: Table name
+        column: Key column (e.g. 'session_id')
+        values: Keys to count
+        filters: Additional filter conditions
+        user_jwt: User JWT token for RLS
+
+    Returns:
+        Dict of key -> count, with 0 for keys that have no rows
+
+    Example:
+        message_counts = count_many('chat_messages', 'session_id', chat_ids)
+    """
+    if not values:
+        return {}
+    counts = count_by(table, column, {**(filters or {}), column: list(values)}, user_jwt=user_jwt)
+    return {value: counts.get(str(value), 0) for value in values}
+
+
+def sum_column(
+    table: str,
+    column: str,
+    filters: Optional[Dict[str, Any]] = None,
+    user_jwt: Optional[str] = None
+) -> float:
+    """
+    Sum a numeric column over records matching filters, server-side.
+
+    Args:
+        table: Table name
+        column: Numeric column to sum (NULLs are ignored)
+        filters: Filter conditions
+        user_jwt: User JWT token for RLS
+
+    Returns:
+        The sum (0 if no records match); integral sums are returned as int
+
+    Example:
+        total_size = sum_column('kb_docs', 'file_size', {'kb_id': kb_id, 'is_deleted': False})
+    """
+    rows = _aggregate(table, 'sum', column=column, filters=filters, user_jwt=user_jwt)
+    total = float(rows[0]['value']) if rows and rows[0].get('value') is not None else 0
+    return int(total) if float(total).is_integer() else total
+
+
 def update_many(
     table: str,
     filters: Dict[str, Any],
@@ -387,6 +516,12 @@ def find_one(
     Returns:
         Record if found, None otherwise
     """
+    # Lookups by id inside a request scope are batched and memoized (see loader.py)
+    loader = get_data_loader()
+    if loader.active and select == "*" and filters.get('id') is not None \
+            and not isinstance(filters['id'], (list, tuple)):
+        return loader.find_one(table, filters, user_jwt)
+    
     try:
         return execute_query(
             table=table,
@@ -524,3 +659,468 @@ def delete_many(
     )
     
     return result if isinstance(result, list) else [result] if result else []
+
+
+# =============================================================================
+# BULK WRITES
+# =============================================================================
+
+@dataclass
+class BatchError:
+    """A failed batch of a bulk write."""
+    batch: int    # Batch number (0-based)
+    start: int    # Index of the batch's first row (or filter value) in the input
+    size: int     # Rows (or filter values) in the batch
+    error: str
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of insert_many / upsert_many / update_where."""
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    written: int = 0
+    batches: int = 0
+    errors: List[BatchError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def failed_rows(self) -> int:
+        return sum(e.size for e in self.errors)
+
+
+def _chunk_rows(
+    rows: List[Dict[str, Any]],
+    batch_size: int,
+    max_payload_bytes: int
+) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    Split rows into (start index, batch) pairs.
+
+    A batch ends when it reaches batch_size rows, when the next row would
+    push its JSON body over max_payload_bytes, or when the next row has
+    different columns (PostgREST requires matching keys within one request).
+    A single row larger than the limit is sent on its own.
+    """
+    batch: List[Dict[str, Any]] = []
+    batch_start = 0
+    batch_bytes = 2
+    batch_keys = None
+    for index, row in enumerate(rows):
+        row_bytes = len(json.dumps(row, default=str)) + 1
+        keys = frozenset(row)
+        if batch and (
+            len(batch) >= batch_size
+            or batch_bytes + row_bytes > max_payload_bytes
+            or keys != batch_keys
+        ):
+            yield batch_start, batch
+            batch, batch_start, batch_bytes = [], index, 2
+        batch.append(row)
+        batch_bytes += row_bytes
+        batch_keys = keys
+    if batch:
+        yield batch_start, batch
+
+
+def _run_batches(
+    table: str,
+    operation: str,
+    batches: Iterator[Tuple[int, int, Any]],
+    write: Callable[[Any], List[Dict[str, Any]]],
+    raise_on_error: bool
+) -> BulkWriteResult:
+    """Run write() per (start, size, payload) batch, collecting records and per-batch errors."""
+    result = BulkWriteResult()
+    for batch_number, (start, size, payload) in enumerate(batches):
+        result.batches += 1
+        try:
+            records = write(payload) or []
+            result.records.extend(records)
+            result.written += size
+        except Exception as e:
+            print(f"Database error in {operation} on {table} (batch {batch_number}, rows {start}-{start + size - 1}): {str(e)}")
+            result.errors.append(BatchError(batch=batch_number, start=start, size=size, error=str(e)))
+
+    if result.errors and raise_on_error:
+        raise BulkWriteError(
+            f"{operation} on {table}: {len(result.errors)} of {result.batches} batches failed "
+            f"({result.failed_rows} rows)",
+            result=result
+        )
+    return result
+
+
+def insert_many(
+    table: str,
+    rows: List[Dict[str, Any]],
+    user_jwt: Optional[str] = None,
+    batch_size: int = BULK_BATCH_SIZE,
+    max_payload_bytes: int = BULK_MAX_PAYLOAD_BYTES,
+    on_conflict: Optional[str] = None,
+    ignore_duplicates: bool = False,
+    returning: str = 'representation',
+    raise_on_error: bool = True
+) -> BulkWriteResult:
+    """
+    Insert many records in batched requests
+    
+    Rows use the same snake_case column names as insert_one; use
+    format_records() on result.records for API responses.
+    
+    Args:
+        table: Table name
+        rows: Records to insert
+        user_jwt: User JWT token for RLS
+        batch_size: Maximum rows per request
+        max_payload_bytes: Maximum JSON body size per request
+        on_conflict: Comma-separated conflict columns; makes this an upsert
+        ignore_duplicates: With on_conflict, skip conflicting rows instead of updating them
+        returning: 'representation' (return inserted rows) or 'minimal' (return nothing,
+                   cheaper for large rows such as embeddings)
+        raise_on_error: Raise BulkWriteError if any batch failed (otherwise check result.errors)
+        
+    Returns:
+        BulkWriteResult with inserted records, counts and per-batch errors
+        
+    Raises:
+        BulkWriteError: If a batch failed and raise_on_error is set (error.result
+                        holds the successful batches' records and the failures)
+        
+    Example:
+        # 2,000 embedded chunks -> about a dozen requests instead of 2,000
+        common.insert_many('kb_chunks', chunk_rows, returning='minimal')
+    """
+    if not rows:
+        return BulkWriteResult()
+    
+    client = get_supabase_client(user_jwt)
+    get_data_loader().clear(table)
+    
+    def write(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if on_conflict:
+            query = client.table(table).upsert(
+                batch, on_conflict=on_conflict, ignore_duplicates=ignore_duplicates, returning=returning
+            )
+        else:
+            query = client.table(table).insert(batch, returning=returning)
+        return query.execute().data
+    
+    return _run_batches(
+        table,
+        'upsert' if on_conflict else 'insert',
+        ((start, len(batch), batch) for start, batch in _chunk_rows(rows, batch_size, max_payload_bytes)),
+        write,
+        raise_on_error
+    )
+
+
+def upsert_many(
+    table: str,
+    rows: List[Dict[str, Any]],
+    on_conflict: str,
+    user_jwt: Optional[str] = None,
+    ignore_duplicates: bool = False,
+    **kwargs
+) -> BulkWriteResult:
+    """
+    Insert or update many records in batched requests
+    
+    Args:
+        table: Table name
+        rows: Records to upsert
+        on_conflict: Comma-separated columns of the unique constraint to match on
+        user_jwt: User JWT token for RLS
+        ignore_duplicates: Keep existing rows unchanged instead of updating them
+        **kwargs: batch_size, max_payload_bytes, returning, raise_on_error (see insert_many)
+        
+    Returns:
+        BulkWriteResult with upserted records, counts and per-batch errors
+        
+    Example:
+        common.upsert_many('eval_opt_run_results', results,
+            on_conflict='run_id,group_id,criteria_item_id,variation_name',
+            ignore_duplicates=True
+        )
+    """
+    if not on_conflict:
+        raise ValueError("on_conflict is required for upsert_many")
+    return insert_many(
+        table, rows, user_jwt=user_jwt, on_conflict=on_conflict,
+        ignore_duplicates=ignore_duplicates, **kwargs
+    )
+
+
+def update_where(
+    table: str,
+    filters: Dict[str, Any],
+    data: Dict[str, Any],
+    user_jwt: Optional[str] = None,
+    batch_size: int = BULK_FILTER_BATCH_SIZE,
+    raise_on_error: bool = True
+) -> BulkWriteResult:
+    """
+    Apply the same update to many records
+    
+    Like update_many, but list-valued filters of any length are split into
+    batches of batch_size values (one request each) so large ID lists
+    don't overflow the request URL.
+    
+    Args:
+        table: Table name
+        filters: Filter conditions (required); at most one may be a long list
+        data: Update data
+        user_jwt: User JWT token for RLS
+        batch_size: Maximum values of the list filter per request
+        raise_on_error: Raise BulkWriteError if any batch failed
+        
+    Returns:
+        BulkWriteResult with updated records, counts and per-batch errors
+        
+    Example:
+        common.update_where('kb_docs',
+            {'id': doc_ids},
+            {'status': 'archived', 'updated_by': user_id}
+        )
+    """
+    if not filters:
+        raise ValueError("Filters are required for update operation")
+    
+    list_keys = [k for k, v in filters.items() if isinstance(v, (list, tuple)) and len(v) > batch_size]
+    if len(list_keys) > 1:
+        raise ValueError(f"update_where can split only one list filter, got {', '.join(list_keys)}")
+    
+    if list_keys:
+        key = list_keys[0]
+        values = list(filters[key])
+        batches = (
+            (start, len(values[start:start + batch_size]), {**filters, key: values[start:start + batch_size]})
+            for start in range(0, len(values), batch_size)
+        )
+    else:
+        batches = iter([(0, 1, filters)])
+    
+    def write(batch_filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return execute_query(
+            table=table,
+            operation='update',
+            filters=batch_filters,
+            data=data,
+            user_jwt=user_jwt,
+            single=False
+        )
+    
+    result = _run_batches(table, 'update', batches, write, raise_on_error)
+    # written counts rows actually updated, not filter values
+    result.written = len(result.records)
+    return result
+
+
+# =============================================================================
+# KEYSET PAGINATION
+# =============================================================================
+
+def _apply_filters(query, filters: Optional[Dict[str, Any]]):
+    """Apply equality filters (.in_() for list/tuple values) to a query."""
+    for key, value in (filters or {}).items():
+        if value is not None:
+            if isinstance(value, (list, tuple)):
+                query = query.in_(key, list(value))
+            else:
+                query = query.eq(key, value)
+    return query
+
+
+def _with_columns(select: str, columns: List[str]) -> str:
+    """Make sure the keyset columns are part of a select list."""
+    if select.strip() == '*':
+        return select
+    selected = {c.strip() for c in select.split(',')}
+    missing = [c for c in columns if c not in selected]
+    return ','.join([select] + missing) if missing else select
+
+
+def _quote_filter_value(value: Any) -> str:
+    """Quote a value for a PostgREST or=() filter (commas, parentheses, ...)."""
+    text = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{text}"'
+
+
+def _fetch_keyset_page(
+    client,
+    table: str,
+    filters: Optional[Dict[str, Any]],
+    select: str,
+    order_key: str,
+    tiebreak_key: Optional[str],
+    descending: bool,
+    after: Optional[Tuple[Any, Any]],
+    limit: int
+) -> List[Dict[str, Any]]:
+    """One page of rows strictly after the (order value, tiebreak value) position."""
+    columns = [order_key] + ([tiebreak_key] if tiebreak_key else [])
+    query = _apply_filters(client.table(table).select(_with_columns(select, columns)), filters)
+
+    if after is not None:
+        op = 'lt' if descending else 'gt'
+        last_value, last_tiebreak = after
+        if tiebreak_key:
+            quoted = _quote_filter_value(last_value)
+            query = query.or_(
+                f"{order_key}.{op}.{quoted},"
+                f"and({order_key}.eq.{quoted},{tiebreak_key}.{op}.{_quote_filter_value(last_tiebreak)})"
+            )
+        else:
+            query = getattr(query, op)(order_key, last_value)
+
+    query = query.order(order_key, desc=descending)
+    if tiebreak_key:
+        query = query.order(tiebreak_key, desc=descending)
+    return query.limit(limit).execute().data or []
+
+
+def iter_many(
+    table: str,
+    filters: Optional[Dict[str, Any]] = None,
+    order_key: str = 'id',
+    page_size: int = ITER_PAGE_SIZE,
+    user_jwt: Optional[str] = None,
+    select: str = "*",
+    descending: bool = False,
+    tiebreak_key: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all matching records, fetching them page by page
+    
+    Pages by keyset (order_key > last seen value) instead of OFFSET, so each
+    request costs the same however deep the iteration goes, and only one
+    page is held in memory at a time.
+    
+    A page shorter than page_size only ends the iteration if it is also
+    shorter than the server's row cap (POSTGREST_MAX_ROWS), so a page_size
+    above the cap doesn't truncate the results.
+    
+    Args:
+        table: Table name
+        filters: Filter conditions
+        order_key: Column to page on; must be unique and non-null unless
+                   tiebreak_key is given
+        page_size: Rows requested per page
+        user_jwt: User JWT token for RLS
+        select: Fields to select (order_key/tiebreak_key are added if missing)
+        descending: Iterate in descending order
+        tiebreak_key: Unique column that breaks ties in a non-unique order_key
+                      (e.g. order_key='created_at', tiebreak_key='id')
+        
+    Yields:
+        Records, in order_key order
+        
+    Example:
+        for doc in common.iter_many('kb_docs', {'kb_id': kb_id}, select='id,file_size'):
+            total_size += doc.get('file_size') or 0
+    """
+    client = get_supabase_client(user_jwt)
+    # Fewest rows a page that isn't the last one can have
+    full_page = min(page_size, POSTGREST_MAX_ROWS)
+    after = None
+    while True:
+        try:
+            rows = _fetch_keyset_page(
+                client, table, filters, select, order_key, tiebreak_key, descending, after, page_size
+            )
+        except Exception as e:
+            print(f"Database error in select on {table}: {str(e)}")
+            raise
+        yield from rows
+        if len(rows) < full_page:
+            return
+        last = rows[-1]
+        after = (last.get(order_key), last.get(tiebreak_key) if tiebreak_key else None)
+
+
+def encode_cursor(row: Dict[str, Any], order_key: str, tiebreak_key: Optional[str] = None) -> str:
+    """Opaque, URL-safe pagination cursor pointing just after a row."""
+    position = [row.get(order_key), row.get(tiebreak_key) if tiebreak_key else None]
+    raw = json.dumps(position, default=str, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    """
+    Decode a cursor from encode_cursor()
+    
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        position = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        raise ValidationError("Invalid pagination cursor")
+    if not isinstance(position, list) or len(position) != 2:
+        raise ValidationError("Invalid pagination cursor")
+    return position[0], position[1]
+
+
+def find_page(
+    table: str,
+    filters: Optional[Dict[str, Any]] = None,
+    cursor: Optional[str] = None,
+    page_size: int = 50,
+    order_key: str = 'id',
+    user_jwt: Optional[str] = None,
+    select: str = "*",
+    descending: bool = False,
+    tiebreak_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Fetch one page of records for a cursor-paginated API
+    
+    Args:
+        table: Table name
+        filters: Filter conditions
+        cursor: nextCursor from the previous page (None = first page)
+        page_size: Records per page (1 to MAX_PAGE_SIZE)
+        order_key: Column to page on (see iter_many)
+        user_jwt: User JWT token for RLS
+        select: Fields to select
+        descending: Page in descending order
+        tiebreak_key: Unique column that breaks ties in order_key
+        
+    Returns:
+        {'items': [...], 'nextCursor': str or None, 'hasMore': bool}
+        
+    Raises:
+        ValidationError: If the cursor or page size is invalid
+        
+    Example:
+        params = event.get('queryStringParameters') or {}
+        page = common.find_page('kb_docs', {'kb_id': kb_id, 'is_deleted': False},
+            cursor=params.get('cursor'),
+            page_size=int(params.get('limit', 50)),
+            order_key='created_at', tiebreak_key='id', descending=True
+        )
+        return common.success_response({**page, 'items': common.format_records(page['items'])})
+    """
+    if page_size < 1 or page_size > MAX_PAGE_SIZE:
+        raise ValidationError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    
+    after = decode_cursor(cursor) if cursor else None
+    try:
+        rows = _fetch_keyset_page(
+            get_supabase_client(user_jwt), table, filters, select,
+            order_key, tiebreak_key, descending, after, page_size + 1
+        )
+    except Exception as e:
+        print(f"Database error in select on {table}: {str(e)}")
+        raise
+    
+    has_more = len(rows) > page_size
+    items = rows[:page_size]
+    return {
+        'items': items,
+        'nextCursor': encode_cursor(items[-1], order_key, tiebreak_key) if has_more else None,
+        'hasMore': has_more
+    }
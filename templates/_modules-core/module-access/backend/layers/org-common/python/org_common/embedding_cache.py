@@ -0,0 +1,326 @@
+"""
+Embedding Cache
+
+Caches embedding vectors keyed by (model, hash of normalized text), so a
+repeated or retried chat query, or the same boilerplate paragraph in many
+documents, is embedded once.
+
+Tiers:
+- Container (always): LRU of EMBEDDING_CACHE_MAX_ENTRIES vectors, kept
+  across invocations of a warm container
+- Shared (optional): a store every container can read, looked up on an
+  LRU miss; hits are copied into the LRU. Enable it with
+  EMBEDDING_CACHE_TABLE (e.g. kb_embedding_cache, see module-kb) or
+  EMBEDDING_CACHE_FILE (a local JSON-lines file, for tests and local runs),
+  or install one with set_embedding_cache()
+
+The cache works with any provider: callers pass a function that embeds a
+list of texts, and only texts found in neither tier are sent to it (each
+distinct text once). Shared-store errors are logged and treated as misses,
+so a cache outage never fails an embedding request.
+
+Text is normalized before hashing (Unicode NFC, whitespace runs collapsed,
+ends stripped). Case is kept: embeddings are case-sensitive.
+
+Usage:
+    vector = common.get_embedding(model, query, embed_texts)
+    vectors = common.get_embeddings(model, [c['content'] for c in chunks], embed_texts)
+
+    # embed_texts(texts: List[str]) -> List[List[float]], same order
+"""
+import os
+import re
+import json
+import hashlib
+import threading
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', '2048'))
+EMBEDDING_CACHE_TABLE = os.getenv('EMBEDDING_CACHE_TABLE', '')
+EMBEDDING_CACHE_FILE = os.getenv('EMBEDDING_CACHE_FILE', '')
+
+# Keys per in_() lookup against the shared table (keeps the request URL short)
+SHARED_LOOKUP_BATCH_SIZE = 100
+
+Embedder = Callable[[List[str]], List[List[float]]]
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys (NFC, collapsed whitespace, stripped)."""
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+
+def embedding_cache_key(model: str, text: str) -> str:
+    """Cache key of a text's embedding: sha256 hex of model and normalized text."""
+    return hashlib.sha256(f"{model}\0{normalize_text(text)}".encode('utf-8')).hexdigest()
+
+
+class EmbeddingStore(ABC):
+    """
+    Shared tier of the embedding cache.
+
+    Subclass to use another backend; get_many() and put_many() are the only
+    methods the cache calls.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Vectors for the keys that are stored (missing keys are left out)."""
+
+    @abstractmethod
+    def put_many(self, model: str, vectors: Dict[str, List[float]]):
+        """Store vectors by key (existing keys may be left unchanged)."""
+
+
+class TableEmbeddingStore(EmbeddingStore):
+    """Shared tier in a database table (cache_key, model, dimensions, embedding)."""
+
+    def __init__(self, table: str = 'kb_embedding_cache'):
+        self.table = table
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        from .db import find_many
+
+        found = {}
+        for start in range(0, len(keys), SHARED_LOOKUP_BATCH_SIZE):
+            rows = find_many(
+                table=self.table,
+                filters={'cache_key': keys[start:start + SHARED_LOOKUP_BATCH_SIZE]},
+                select='cache_key,embedding'
+            ) or []
+            for row in rows:
+                embedding = row.get('embedding')
+                if isinstance(embedding, str):
+                    embedding = json.loads(embedding.replace('{', '[').replace('}', ']'))
+                if embedding:
+                    found[row['cache_key']] = embedding
+        return found
+
+    def put_many(self, model: str, vectors: Dict[str, List[float]]):
+        from .db import upsert_many
+
+        upsert_many(
+            self.table,
+            [
+                {'cache_key': key, 'model': model, 'dimensions': len(vector), 'embedding': vector}
+                for key, vector in vectors.items()
+            ],
+            on_conflict='cache_key',
+            ignore_duplicates=True,
+            returning='minimal',
+            raise_on_error=False
+        )
+
+
+class FileEmbeddingStore(EmbeddingStore):
+    """Shared tier in a local JSON-lines file (for tests and local runs)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Optional[Dict[str, List[float]]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, List[float]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                            self._entries[entry['key']] = entry['embedding']
+                        except (ValueError, KeyError):
+                            continue  # Partially written line
+            except FileNotFoundError:
+                pass
+        return self._entries
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        with self._lock:
+            entries = self._load()
+            return {key: entries[key] for key in keys if key in entries}
+
+    def put_many(self, model: str, vectors: Dict[str, List[float]]):
+        with self._lock:
+            entries = self._load()
+            new = {key: vector for key, vector in vectors.items() if key not in entries}
+            if not new:
+                return
+            with open(self.path, 'a', encoding='utf-8') as f:
+                for key, vector in new.items():
+                    f.write(json.dumps({'key': key, 'model': model, 'embedding': vector}) + '\n')
+            entries.update(new)
+
+
+def _default_store() -> Optional[EmbeddingStore]:
+    """Shared tier configured by environment (file wins over table), if any."""
+    if EMBEDDING_CACHE_FILE:
+        return FileEmbeddingStore(EMBEDDING_CACHE_FILE)
+    if EMBEDDING_CACHE_TABLE:
+        return TableEmbeddingStore(EMBEDDING_CACHE_TABLE)
+    return None
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache (see module docstring)."""
+
+    def __init__(self, max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES, store: Optional[EmbeddingStore] = None):
+        """
+        Args:
+            max_entries: Vectors kept in the container LRU
+            store: Shared tier (None = container LRU only)
+        """
+        self.max_entries = max_entries
+        self.store = store
+        self._entries: 'OrderedDict[str, List[float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.store_errors = 0
+
+    def _remember(self, key: str, vector: List[float]):
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _from_store(self, keys: List[str]) -> Dict[str, List[float]]:
+        if self.store is None or not keys:
+            return {}
+        try:
+            return self.store.get_many(keys)
+        except Exception as e:
+            with self._lock:
+                self.store_errors += 1
+            print(f"Embedding cache lookup failed: {str(e)}")
+            return {}
+
+    def _to_store(self, model: str, vectors: Dict[str, List[float]]):
+        if self.store is None or not vectors:
+            return
+        try:
+            self.store.put_many(model, vectors)
+        except Exception as e:
+            with self._lock:
+                self.store_errors += 1
+            print(f"Embedding cache write failed: {str(e)}")
+
+    def get_many(self, model: str, texts: Iterable[str], embed: Embedder) -> List[List[float]]:
+        """
+        Embeddings for several texts, in order.
+
+        Texts found in neither tier are passed to embed() in one call (each
+        distinct text once); its vectors are added to both tiers.
+
+        Args:
+            model: Embedding model ID (part of the cache key)
+            texts: Texts to embed
+            embed: Embeds a list of texts with the model, returning vectors in order
+        """
+        texts = list(texts)
+        keys = [embedding_cache_key(model, text) for text in texts]
+
+        vectors: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                if key in vectors:
+                    continue
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    vectors[key] = vector
+                    self.hits += 1
+
+        # Distinct missing keys, with the first text for each
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors and key not in missing:
+                missing[key] = text
+
+        shared = self._from_store(list(missing))
+        if shared:
+            with self._lock:
+                self.shared_hits += len(shared)
+                for key, vector in shared.items():
+                    self._remember(key, vector)
+            vectors.update(shared)
+            missing = {key: text for key, text in missing.items() if key not in shared}
+
+        if missing:
+            embedded = embed(list(missing.values()))
+            if len(embedded) != len(missing):
+                raise ValueError(f"Embedder returned {len(embedded)} vectors for {len(missing)} texts")
+            new = dict(zip(missing, embedded))
+            with self._lock:
+                self.misses += len(new)
+                for key, vector in new.items():
+                    self._remember(key, vector)
+            vectors.update(new)
+            self._to_store(model, new)
+
+        # Copies, so callers that modify a vector don't change the cached one
+        return [list(vectors[key]) for key in keys]
+
+    def get(self, model: str, text: str, embed: Embedder) -> List[float]:
+        """Embedding for one text (see get_many)."""
+        return self.get_many(model, [text], embed)[0]
+
+    def clear(self):
+        """Forget the container tier (the shared store is unchanged)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'shared_hits': self.shared_hits,
+                'misses': self.misses,
+                'store_errors': self.store_errors,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'shared_store': type(self.store).__name__ if self.store is not None else None,
+            }
+
+
+_embedding_cache = EmbeddingCache(store=_default_store())
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the container's embedding cache."""
+    return _embedding_cache
+
+
+def set_embedding_cache(cache: EmbeddingCache):
+    """Replace the container's embedding cache (e.g. with another shared store or size)."""
+    global _embedding_cache
+    _embedding_cache = cache
+
+
+def get_embedding(model: str, text: str, embed: Embedder) -> List[float]:
+    """
+    Embedding for a text through the container's cache.
+
+    Args:
+        model: Embedding model ID
+        text: Text to embed
+        embed: Embeds a list of texts, returning vectors in order
+    """
+    return _embedding_cache.get(model, text, embed)
+
+
+def get_embeddings(model: str, texts: Iterable[str], embed: Embedder) -> List[List[float]]:
+    """Embeddings for several texts through the container's cache (duplicates embedded once)."""
+    return _embedding_cache.get_many(model, texts, embed)
+
+
+def embedding_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the container's embedding cache."""
+    return _embedding_cache.stats()
@@ -46,3 +46,10 @@ class InternalError(OrgModuleError):
     """Raised when an internal error occurs"""
     def __init__(self, message: str = "Internal server error"):
         super().__init__(message, status_code=500)
+
+
+class BulkWriteError(OrgModuleError):
+    """Raised when one or more batches of a bulk write fail"""
+    def __init__(self, message: str, result=None):
+        super().__init__(message, status_code=500)
+        self.result = result
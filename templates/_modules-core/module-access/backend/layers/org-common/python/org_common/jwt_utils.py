@@ -1,13 +1,32 @@
 """
 JWT Utilities for Supabase Token Generation
 Generates Supabase-compatible JWTs for RLS enforcement
+
+resolve_user_jwt() reuses a minted token per user until it is within
+JWT_REFRESH_MARGIN_SECONDS of expiry. The signing key is read through the
+secrets cache (see secrets_cache.py) on every call, so a rotated
+SUPABASE_JWT_SECRET is picked up on the cache's next refresh, and tokens
+signed with the previous key are re-minted. Reusing the same token also
+lets get_supabase_client() reuse the user's pooled client.
 """
 import os
 import jwt
+import hashlib
 import time
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
 from .supabase_client import get_secret
 
+# Minted token lifetime and reuse window
+JWT_TTL_SECONDS = 3600
+JWT_REFRESH_MARGIN_SECONDS = int(os.getenv('SUPABASE_JWT_REFRESH_MARGIN_SECONDS', '300'))
+MAX_CACHED_JWTS = int(os.getenv('SUPABASE_MAX_CACHED_JWTS', '256'))
+
+# Minted tokens (supabase_user_id -> (token, exp, signing key fingerprint))
+_jwt_cache: 'OrderedDict[str, Tuple[str, int, str]]' = OrderedDict()
+_jwt_cache_lock = threading.Lock()
+
 
 def resolve_user_jwt(supabase_user_id: str) -> str:
     """
@@ -26,10 +45,76 @@ def resolve_user_jwt(supabase_user_id: str) -> str:
     Args:
         supabase_user_id: The Supabase Auth user ID (UUID)
         
+    Tokens are cached per user and re-minted once they are within
+    JWT_REFRESH_MARGIN_SECONDS of expiry, or when the signing key has
+    changed.
+    
     Returns:
         Signed JWT token string
     """
-    return generate_supabase_jwt(supabase_user_id)
+    try:
+        signing_key = _get_signing_key()
+        key_fingerprint = hashlib.sha256(signing_key.encode('utf-8')).hexdigest()
+        now = int(time.time())
+        with _jwt_cache_lock:
+            cached = _jwt_cache.get(supabase_user_id)
+            if (
+                cached is not None
+                and cached[2] == key_fingerprint
+                and cached[1] - JWT_REFRESH_MARGIN_SECONDS > now
+            ):
+                _jwt_cache.move_to_end(supabase_user_id)
+                return cached[0]
+        
+        user_jwt = _sign_jwt(supabase_user_id, signing_key, JWT_TTL_SECONDS, now)
+    except Exception as e:
+        print(f"Failed to generate Supabase JWT: {str(e)}")
+        raise
+    
+    with _jwt_cache_lock:
+        _jwt_cache[supabase_user_id] = (user_jwt, now + JWT_TTL_SECONDS, key_fingerprint)
+        _jwt_cache.move_to_end(supabase_user_id)
+        while len(_jwt_cache) > MAX_CACHED_JWTS:
+            _jwt_cache.popitem(last=False)
+    return user_jwt
+
+
+def _get_signing_key() -> str:
+    """
+    Get the Supabase JWT secret (cached and refreshed by the secrets cache).
+    
+    Raises:
+        ValueError: If SUPABASE_SECRET_ARN or SUPABASE_JWT_SECRET is not configured
+    """
+    # Get Supabase credentials from Secrets Manager
+    supabase_secret_arn = os.getenv('SUPABASE_SECRET_ARN')
+    if not supabase_secret_arn:
+        raise ValueError("SUPABASE_SECRET_ARN environment variable not set")
+    
+    secret = get_secret(supabase_secret_arn)
+    supabase_jwt_secret = secret.get('SUPABASE_JWT_SECRET')
+    
+    if not supabase_jwt_secret:
+        print(f"ERROR: SUPABASE_JWT_SECRET missing. Available keys: {list(secret.keys())}")
+        raise ValueError("SUPABASE_JWT_SECRET not found in secret")
+    
+    return supabase_jwt_secret
+
+
+def _sign_jwt(supabase_user_id: str, signing_key: str, ttl_seconds: int, issued_at: int) -> str:
+    """Sign a Supabase-compatible JWT for the user with the given key (callers log failures)."""
+    # Build JWT payload (matches Supabase Auth token format)
+    payload = {
+        "sub": supabase_user_id,     # Subject: Supabase user ID
+        "role": "authenticated",      # Role for RLS policies
+        "aud": "authenticated",       # Audience (required by Supabase)
+        "iat": issued_at,             # Issued at
+        "exp": issued_at + ttl_seconds,  # Expiry time
+    }
+    
+    # Sign JWT with Supabase JWT secret using HS256
+    # (Supabase uses HS256 for JWT signing, not RS256)
+    return jwt.encode(payload, signing_key, algorithm="HS256")
 
 
 def generate_supabase_jwt(supabase_user_id: str, ttl_seconds: int = 3600) -> str:
@@ -52,40 +137,8 @@ def generate_supabase_jwt(supabase_user_id: str, ttl_seconds: int = 3600) -> str
         Exception: If JWT generation fails
     """
     try:
-        # Get Supabase credentials from Secrets Manager
-        supabase_secret_arn = os.getenv('SUPABASE_SECRET_ARN')
-        if not supabase_secret_arn:
-            raise ValueError("SUPABASE_SECRET_ARN environment variable not set")
-        
-        # Retrieve secret
-        secret = get_secret(supabase_secret_arn)
-        
-        # DEBUG LOGGING
-        print(f"DEBUG: Retrieved secret from {supabase_secret_arn}")
-        print(f"DEBUG: Secret keys present: {list(secret.keys())}")
-        
-        supabase_jwt_secret = secret.get('SUPABASE_JWT_SECRET')
-        
-        if not supabase_jwt_secret:
-            print(f"ERROR: SUPABASE_JWT_SECRET missing. Available keys: {list(secret.keys())}")
-            raise ValueError("SUPABASE_JWT_SECRET not found in secret")
-        
-        # Build JWT payload (matches Supabase Auth token format)
-        current_time = int(time.time())
-        payload = {
-            "sub": supabase_user_id,     # Subject: Supabase user ID
-            "role": "authenticated",      # Role for RLS policies
-            "aud": "authenticated",       # Audience (required by Supabase)
-            "iat": current_time,          # Issued at
-            "exp": current_time + ttl_seconds,  # Expiry time
-        }
-        
-        # Sign JWT with Supabase JWT secret using HS256
-        # (Supabase uses HS256 for JWT signing, not RS256)
-        user_jwt = jwt.encode(payload, supabase_jwt_secret, algorithm="HS256")
-        
-        return user_jwt
-        
+        supabase_jwt_secret = _get_signing_key()
+        return _sign_jwt(supabase_user_id, supabase_jwt_secret, ttl_seconds, int(time.time()))
     except Exception as e:
         print(f"Failed to generate Supabase JWT: {str(e)}")
         raise
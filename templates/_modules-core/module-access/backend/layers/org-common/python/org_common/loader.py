@@ -0,0 +1,262 @@
+"""
+Request-Scoped Data Loader
+
+Batches and deduplicates row lookups by a unique key (normally 'id') for
+the duration of one invocation:
+
+- queue(table, keys) collects keys without fetching; the next load() that
+  misses fetches every queued key for that table in one in_() query
+- load_many(table, keys) fetches all missing keys in one query
+- Every row (and every miss) is memoized, so the same row is never fetched
+  twice in a request - e.g. once in the router's auth check and again in
+  the handler
+- Inside a scope, find_one() with an 'id' filter is served by the loader
+  (other equality filters are checked on the loaded row), so existing
+  handlers benefit without changes
+- Writes through the db helpers (insert/update/delete) drop the memoized
+  rows of the table they touch. Writes made through rpc() are not tracked:
+  call clear(table) after them.
+
+Rows are memoized per user JWT (RLS can hide rows from some users). Outside
+a scope nothing is memoized and find_one() queries the database as before.
+
+Usage:
+    @common.request_scope
+    def lambda_handler(event, context):
+        ...
+
+    loader = common.get_data_loader()
+    loader.queue('workspaces', [c['workspace_id'] for c in chats])
+    for chat in chats:
+        workspace = loader.load('workspaces', chat['workspace_id'])
+"""
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from .auth_cache import get_auth_cache
+
+# Keys per in_() query (keeps the request URL short)
+LOADER_BATCH_SIZE = 200
+
+MemoKey = Tuple[Optional[str], str, str, str]
+QueueKey = Tuple[Optional[str], str, str]
+
+
+def _equal(actual: Any, expected: Any) -> bool:
+    """Compare a row value to a filter value the way PostgREST would (loosely typed)."""
+    if actual == expected:
+        return True
+    return actual is not None and expected is not None and str(actual).lower() == str(expected).lower()
+
+
+def _matches(row: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Whether a row satisfies equality filters (lists mean IN, None is skipped)."""
+    for key, value in filters.items():
+        if value is None:
+            continue
+        actual = row.get(key)
+        if isinstance(value, (list, tuple)):
+            if not any(_equal(actual, v) for v in value):
+                return False
+        elif not _equal(actual, value):
+            return False
+    return True
+
+
+class DataLoader:
+    """Batching, memoizing row loader (see module docstring)."""
+
+    def __init__(self, batch_size: int = LOADER_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._memo: Dict[MemoKey, Optional[Dict[str, Any]]] = {}
+        self._queued: Dict[QueueKey, Set[str]] = {}
+        self._depth = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.queries = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether a request scope is open."""
+        return self._depth > 0
+
+    def begin_request(self):
+        """Start a request scope (nested scopes share the outermost one)."""
+        with self._lock:
+            if self._depth == 0:
+                self._memo.clear()
+                self._queued.clear()
+            self._depth += 1
+
+    def end_request(self):
+        """End a request scope, dropping memoized rows."""
+        with self._lock:
+            self._depth = max(0, self._depth - 1)
+            if self._depth == 0:
+                self._memo.clear()
+                self._queued.clear()
+
+    def queue(self, table: str, keys: Iterable[Hashable], column: str = 'id', user_jwt: Optional[str] = None):
+        """Collect keys to fetch with the next load of this table (no query yet)."""
+        if not self.active:
+            return
+        with self._lock:
+            pending = self._queued.setdefault((user_jwt, table, column), set())
+            for key in keys:
+                if key is not None and (user_jwt, table, column, str(key)) not in self._memo:
+                    pending.add(str(key))
+
+    def _fetch(self, table: str, column: str, keys: List[str], user_jwt: Optional[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch keys with one in_() query per batch; returns key -> row (None if missing)."""
+        from .db import execute_query
+
+        found: Dict[str, Optional[Dict[str, Any]]] = {}
+        for start in range(0, len(keys), self.batch_size):
+            batch = keys[start:start + self.batch_size]
+            rows = execute_query(
+                table=table,
+                operation='select',
+                filters={column: batch},
+                user_jwt=user_jwt
+            ) or []
+            by_key = {str(row.get(column)): row for row in rows}
+            lowered = {k.lower(): row for k, row in by_key.items()}
+            with self._lock:
+                self.queries += 1
+            for key in batch:
+                # UUIDs compare case-insensitively in the database
+                found[key] = by_key.get(key) or lowered.get(key.lower())
+        return found
+
+    def load_many(
+        self,
+        table: str,
+        keys: Iterable[Hashable],
+        column: str = 'id',
+        user_jwt: Optional[str] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Rows for several keys (None where no row exists), in key order.
+
+        Missing keys, plus any queued for the table, are fetched together.
+        """
+        keys = [None if key is None else str(key) for key in keys]
+        with self._lock:
+            rows = {}
+            for key in keys:
+                memo_key = (user_jwt, table, column, key)
+                if key is None or key in rows:
+                    continue
+                if memo_key in self._memo:
+                    self.hits += 1
+                    rows[key] = self._memo[memo_key]
+                else:
+                    self.misses += 1
+            pending = self._queued.pop((user_jwt, table, column), set())
+            missing = sorted(
+                k for k in set(k for k in keys if k is not None) | pending
+                if k not in rows and (user_jwt, table, column, k) not in self._memo
+            )
+
+        if missing:
+            fetched = self._fetch(table, column, missing, user_jwt)
+            rows.update(fetched)
+            if self.active:
+                with self._lock:
+                    for key, row in fetched.items():
+                        self._memo[(user_jwt, table, column, key)] = row
+
+        # Copies, so callers that modify a row don't change the memoized one
+        return [None if rows.get(key) is None else dict(rows[key]) for key in keys]
+
+    def load(
+        self,
+        table: str,
+        key: Hashable,
+        column: str = 'id',
+        user_jwt: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Row for one key, or None (fetched together with queued keys)."""
+        return self.load_many(table, [key], column, user_jwt)[0]
+
+    def find_one(self, table: str, filters: Dict[str, Any], user_jwt: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """find_one() by 'id' through the loader; other filters are checked on the row."""
+        row = self.load(table, filters['id'], 'id', user_jwt)
+        if row is None or not _matches(row, filters):
+            return None
+        return row
+
+    def prime(self, table: str, row: Dict[str, Any], column: str = 'id', user_jwt: Optional[str] = None):
+        """Memoize a row fetched elsewhere (e.g. from a find_many list)."""
+        if not self.active or row.get(column) is None:
+            return
+        with self._lock:
+            self._memo[(user_jwt, table, column, str(row[column]))] = row
+
+    def clear(self, table: Optional[str] = None):
+        """Forget memoized rows of a table (all tables if None)."""
+        with self._lock:
+            if table is None:
+                self._memo.clear()
+            else:
+                for memo_key in [k for k in self._memo if k[1] == table]:
+                    del self._memo[memo_key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/query counters and current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'queries': self.queries,
+                'entries': len(self._memo),
+            }
+
+
+_data_loader = DataLoader()
+
+
+def get_data_loader() -> DataLoader:
+    """Get the container's data loader."""
+    return _data_loader
+
+
+def load(table: str, key: Hashable, column: str = 'id', user_jwt: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Load one row by key through the request's data loader."""
+    return _data_loader.load(table, key, column, user_jwt)
+
+
+def load_many(
+    table: str,
+    keys: Iterable[Hashable],
+    column: str = 'id',
+    user_jwt: Optional[str] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """Load several rows by key in one query through the request's data loader."""
+    return _data_loader.load_many(table, keys, column, user_jwt)
+
+
+def data_loader_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the container's data loader."""
+    return _data_loader.stats()
+
+
+def request_scope(handler: Callable) -> Callable:
+    """
+    Decorator: open a data loader scope and an authorization cache scope for
+    the duration of each invocation (superset of @auth_cache_scope).
+    """
+    @wraps(handler)
+    def wrapper(*args, **kwargs):
+        loader = _data_loader
+        auth_cache = get_auth_cache()
+        loader.begin_request()
+        auth_cache.begin_request()
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            auth_cache.end_request()
+            loader.end_request()
+    return wrapper
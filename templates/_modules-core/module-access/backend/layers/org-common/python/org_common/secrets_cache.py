@@ -0,0 +1,268 @@
+"""
+Secrets Cache
+
+Container-scoped cache for AWS Secrets Manager secrets and SSM parameters.
+
+- One boto3 client per service and region, created on first use from the
+  cache's own boto3 Session
+- Values are kept for SECRETS_CACHE_TTL_SECONDS; once a value is older
+  than REFRESH_AHEAD_FRACTION of that, it is still returned but refreshed
+  in a background thread, so steady-state requests never wait on AWS
+- prefetch_secrets() fetches several secrets concurrently (call it at
+  module level so the work happens during Lambda init)
+- call_with_secret() handles rotation: if the downstream service rejects
+  a cached credential (SecretRejectedError), the secret is refetched and
+  the call retried once
+
+Usage:
+    common.prefetch_secrets([os.environ.get('SUPABASE_SECRET_ARN'), DAILY_API_KEY_SECRET_ARN])
+
+    secret = common.get_secret(secret_arn)          # JSON secret -> dict
+    value = common.get_secret_string(secret_arn)    # raw SecretString
+    value = common.get_parameter('/app/api-key')    # SSM, decrypted
+"""
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+import boto3
+
+SECRETS_CACHE_TTL_SECONDS = float(os.getenv('SECRETS_CACHE_TTL_SECONDS', '900'))
+REFRESH_AHEAD_FRACTION = 0.75
+PREFETCH_MAX_WORKERS = 8
+
+SERVICE_SECRETS_MANAGER = 'secretsmanager'
+SERVICE_SSM = 'ssm'
+
+CacheKey = Tuple[str, str]
+
+
+class SecretRejectedError(Exception):
+    """Raised by call_with_secret() callbacks when a service rejects the credential."""
+    pass
+
+
+def _redact(secret_id: str) -> str:
+    """Partially redact a secret ARN for logging (hide account ID and full secret name)."""
+    # ARN format: arn:aws:secretsmanager:region:account-id:secret:name-random
+    arn_parts = secret_id.split(':')
+    if len(arn_parts) >= 6:
+        return f"{arn_parts[0]}:{arn_parts[1]}:{arn_parts[2]}:{arn_parts[3]}:***:secret:***{arn_parts[-1][-6:]}"
+    return "***"
+
+
+def _region_for(service: str, name: str) -> Optional[str]:
+    """Region of an ARN, else the configured default (None = boto3 default)."""
+    if name.startswith('arn:'):
+        arn_parts = name.split(':')
+        if len(arn_parts) > 3 and arn_parts[3]:
+            return arn_parts[3]
+    if service == SERVICE_SECRETS_MANAGER:
+        return os.getenv('REGION', 'us-east-1')
+    return os.getenv('REGION') or None
+
+
+class SecretsCache:
+    """TTL cache with refresh-ahead for Secrets Manager secrets and SSM parameters."""
+
+    def __init__(self, ttl_seconds: float = SECRETS_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[CacheKey, Tuple[str, float]] = {}
+        self._session = None  # boto3 Session the clients are built from
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._refreshing: Set[CacheKey] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def _client(self, service: str, region: Optional[str]):
+        key = (service, region)
+        # Created under the lock: boto3 sessions are not thread-safe, and
+        # prefetch() asks for clients from several threads at once
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                if self._session is None:
+                    self._session = boto3.session.Session()
+                client = self._session.client(service, region_name=region)
+                self._clients[key] = client
+        return client
+
+    def _fetch(self, key: CacheKey) -> str:
+        service, name = key
+        client = self._client(service, _region_for(service, name))
+        if service == SERVICE_SSM:
+            response = client.get_parameter(Name=name, WithDecryption=True)
+            value = response.get('Parameter', {}).get('Value')
+            if not value:
+                raise ValueError(f'No value in SSM Parameter Store response: {name}')
+        else:
+            response = client.get_secret_value(SecretId=name)
+            value = response.get('SecretString')
+            if not value:
+                raise ValueError(f'No SecretString in Secrets Manager response: {_redact(name)}')
+        with self._lock:
+            self._entries[key] = (value, time.time())
+        return value
+
+    def _refresh_in_background(self, key: CacheKey):
+        def refresh():
+            try:
+                self._fetch(key)
+            except Exception as e:
+                # Keep serving the cached value; the next hard expiry retries in the foreground
+                print(f"Background refresh of {_redact(key[1])} failed: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self.refreshes += 1
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def get(self, service: str, name: str) -> str:
+        """Cached value, fetched on a miss or after the TTL."""
+        key = (service, name)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] < self.ttl_seconds:
+                self.hits += 1
+                refresh = now - entry[1] >= self.ttl_seconds * REFRESH_AHEAD_FRACTION
+            else:
+                self.misses += 1
+                entry = None
+        if entry is None:
+            return self._fetch(key)
+        if refresh:
+            self._refresh_in_background(key)
+        return entry[0]
+
+    def invalidate(self, service: str, name: str):
+        """Forget a cached value (e.g. after the secret was rotated)."""
+        with self._lock:
+            self._entries.pop((service, name), None)
+
+    def prefetch(self, keys: Iterable[CacheKey]) -> Dict[CacheKey, Optional[Exception]]:
+        """
+        Fetch several values concurrently.
+
+        Errors are returned (and logged), not raised: a later get() retries
+        and raises in the request that needs the value.
+        """
+        keys = [key for key in dict.fromkeys(keys) if key[1]]
+        if not keys:
+            return {}
+
+        def fetch(key: CacheKey) -> Optional[Exception]:
+            try:
+                self._fetch(key)
+                return None
+            except Exception as e:
+                print(f"Prefetch of {_redact(key[1])} failed: {str(e)}")
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(PREFETCH_MAX_WORKERS, len(keys))) as executor:
+            return dict(zip(keys, executor.map(fetch, keys)))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/refresh counters and current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes,
+                'entries': len(self._entries),
+                'ttl_seconds': self.ttl_seconds,
+            }
+
+
+_secrets_cache = SecretsCache()
+
+
+def get_secrets_cache() -> SecretsCache:
+    """Get the container's secrets cache."""
+    return _secrets_cache
+
+
+def get_secret_string(secret_id: str) -> str:
+    """
+    Get a Secrets Manager SecretString (cached).
+
+    Args:
+        secret_id: Secret ARN or name
+    """
+    if not secret_id:
+        raise ValueError("Secret ARN not provided")
+    try:
+        return _secrets_cache.get(SERVICE_SECRETS_MANAGER, secret_id)
+    except Exception as e:
+        print(f"Failed to retrieve secret from {_redact(secret_id)}: {str(e)}")
+        raise
+
+
+def get_parameter(name: str) -> str:
+    """
+    Get a decrypted SSM Parameter Store value (cached).
+
+    Args:
+        name: Parameter name, e.g. /app/provider/credentials
+    """
+    if not name:
+        raise ValueError("Parameter name not provided")
+    return _secrets_cache.get(SERVICE_SSM, name)
+
+
+def invalidate_secret(secret_id: str):
+    """Forget a cached Secrets Manager secret or SSM parameter."""
+    service = SERVICE_SSM if secret_id.startswith('/') else SERVICE_SECRETS_MANAGER
+    _secrets_cache.invalidate(service, secret_id)
+
+
+def prefetch_secrets(secret_ids: Iterable[Optional[str]]):
+    """
+    Warm the cache with several secrets concurrently (None/empty IDs are skipped).
+
+    IDs starting with '/' are SSM parameters; anything else is a Secrets
+    Manager ARN or name.
+    """
+    _secrets_cache.prefetch(
+        (SERVICE_SSM if secret_id.startswith('/') else SERVICE_SECRETS_MANAGER, secret_id)
+        for secret_id in secret_ids if secret_id
+    )
+
+
+def call_with_secret(secret_id: str, call: Callable[[str], Any]) -> Any:
+    """
+    Call a function with a cached secret, refetching once if it is rejected.
+
+    Args:
+        secret_id: Secret ARN/name, or SSM parameter name (starting with '/')
+        call: Receives the secret string; raises SecretRejectedError when the
+              downstream service rejects the credential (e.g. HTTP 401)
+
+    Returns:
+        The call's result
+    """
+    is_parameter = secret_id.startswith('/')
+    fetch = get_parameter if is_parameter else get_secret_string
+    value = fetch(secret_id)
+    try:
+        return call(value)
+    except SecretRejectedError:
+        invalidate_secret(secret_id)
+        fresh_value = fetch(secret_id)
+        if fresh_value == value:
+            raise
+        print(f"Secret {_redact(secret_id)} was rotated; retrying with the new value")
+        return call(fresh_value)
+
+
+def secrets_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the container's secrets cache."""
+    return _secrets_cache.stats()
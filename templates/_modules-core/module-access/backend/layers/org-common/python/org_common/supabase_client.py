@@ -1,21 +1,39 @@
 """
 Supabase Client Module
 Handles Supabase connection with secrets management
+
+Clients are pooled per container: the service role client and all per-user
+(RLS) clients share one keep-alive HTTP connection pool, and per-user
+clients are kept in a small LRU keyed by JWT until shortly before the
+token expires. A user client differs from the others only in its
+Authorization header, so repeated queries with the same JWT reuse both the
+client and its warm connections instead of paying TLS setup per call.
 """
 import os
 import json
-import boto3
-from typing import Dict, Any, Optional
-from supabase import create_client, Client
+import time
+import base64
+import threading
+from collections import OrderedDict
+import httpx
+from typing import Dict, Any, Optional, Tuple
+from supabase import create_client, Client, ClientOptions
+from .secrets_cache import get_secret_string
+
+# Per-user client pool size and lifetime
+MAX_USER_CLIENTS = int(os.getenv('SUPABASE_MAX_USER_CLIENTS', '64'))
+USER_CLIENT_MAX_TTL_SECONDS = 3600  # Used when a JWT has no exp claim
+USER_CLIENT_EXPIRY_MARGIN_SECONDS = 30  # Drop clients this long before the JWT expires
 
-# Cache for secrets and client
-_secrets_cache: Dict[str, Any] = {}
-_client_cache: Optional[Client] = None
+# Shared HTTP transport (matches the PostgREST client defaults)
+HTTP_TIMEOUT_SECONDS = 120
+HTTP_MAX_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60
 
 
 def get_secret(secret_arn: str) -> Dict[str, Any]:
     """
-    Retrieve secret from AWS Secrets Manager
+    Retrieve secret from AWS Secrets Manager (cached, see secrets_cache.py)
     
     Args:
         secret_arn: ARN of the secret in Secrets Manager
@@ -27,36 +45,134 @@ def get_secret(secret_arn: str) -> Dict[str, Any]:
         ValueError: If secret_arn is not provided
         Exception: If secret retrieval fails
     """
-    if not secret_arn:
-        raise ValueError("Secret ARN not provided")
-    
-    # Check cache
-    if secret_arn in _secrets_cache:
-        return _secrets_cache[secret_arn]
-    
+    return json.loads(get_secret_string(secret_arn))
+
+
+def _jwt_expiry(user_jwt: str) -> Optional[float]:
+    """Read the exp claim of a JWT (unverified; only used to bound cache lifetime)."""
     try:
-        region = os.getenv('REGION', 'us-east-1')
-        client = boto3.client('secretsmanager', region_name=region)
-        
-        response = client.get_secret_value(SecretId=secret_arn)
-        secret_dict = json.loads(response['SecretString'])
-        
-        # Cache the secret
-        _secrets_cache[secret_arn] = secret_dict
-        
-        return secret_dict
-        
-    except Exception as e:
-        # Partial redaction of ARN for security (hide account ID and full secret name)
-        # ARN format: arn:aws:secretsmanager:region:account-id:secret:name-random
-        arn_parts = secret_arn.split(':')
-        if len(arn_parts) >= 6:
-            # Show service and redact account ID and partial secret name
-            redacted_arn = f"{arn_parts[0]}:{arn_parts[1]}:{arn_parts[2]}:{arn_parts[3]}:***:secret:***{arn_parts[-1][-6:]}"
-        else:
-            redacted_arn = "***"
-        print(f"Failed to retrieve secret from {redacted_arn}: {str(e)}")
-        raise
+        payload = user_jwt.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+
+class SupabaseClientPool:
+    """
+    Container-scoped pool of Supabase clients sharing one HTTP connection pool.
+
+    - The service role client is created once
+    - Per-user clients (JWT in the PostgREST Authorization header) are kept
+      in an LRU of up to max_user_clients entries, each until shortly before
+      its token's exp
+    - All clients send requests through the same httpx.Client, so
+      connections (and their TLS sessions) are kept alive across calls
+    """
+
+    def __init__(self, supabase_url: str, supabase_key: str, max_user_clients: int = MAX_USER_CLIENTS):
+        self.supabase_url = supabase_url
+        self.supabase_key = supabase_key
+        self.max_user_clients = max_user_clients
+        self.http_client = httpx.Client(
+            timeout=HTTP_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        self._service_client: Optional[Client] = None
+        self._user_clients: 'OrderedDict[str, Tuple[Client, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _create_client(self) -> Client:
+        return create_client(
+            self.supabase_url,
+            self.supabase_key,
+            options=ClientOptions(httpx_client=self.http_client),
+        )
+
+    def get_service_client(self) -> Client:
+        """Service role client (bypasses RLS)."""
+        with self._lock:
+            if self._service_client is None:
+                self._service_client = self._create_client()
+            return self._service_client
+
+    def get_user_client(self, user_jwt: str) -> Client:
+        """Client that sends user_jwt to PostgREST, enforcing RLS."""
+        now = time.time()
+        with self._lock:
+            entry = self._user_clients.get(user_jwt)
+            if entry is not None and entry[1] > now:
+                self._user_clients.move_to_end(user_jwt)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        client = self._create_client()
+        # Set the user's JWT token for RLS
+        client.postgrest.auth(user_jwt)
+
+        exp = _jwt_expiry(user_jwt)
+        expires_at = min(
+            now + USER_CLIENT_MAX_TTL_SECONDS,
+            exp - USER_CLIENT_EXPIRY_MARGIN_SECONDS if exp is not None else float('inf'),
+        )
+        if expires_at > now:
+            with self._lock:
+                self._user_clients[user_jwt] = (client, expires_at)
+                self._user_clients.move_to_end(user_jwt)
+                # Drop expired clients first, then least recently used ones
+                for jwt_key in [k for k, (_, expiry) in self._user_clients.items() if expiry <= now]:
+                    del self._user_clients[jwt_key]
+                while len(self._user_clients) > self.max_user_clients:
+                    self._user_clients.popitem(last=False)
+        return client
+
+    def clear_user_clients(self):
+        """Forget all per-user clients (the shared connection pool stays open)."""
+        with self._lock:
+            self._user_clients.clear()
+
+
+_client_pool: Optional[SupabaseClientPool] = None
+_client_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> SupabaseClientPool:
+    """
+    Get the container's Supabase client pool, creating it on first use.
+
+    Raises:
+        ValueError: If required environment variables or secret values are missing
+    """
+    global _client_pool
+    if _client_pool is not None:
+        return _client_pool
+
+    # Get Supabase credentials from Secrets Manager
+    supabase_secret_arn = os.getenv('SUPABASE_SECRET_ARN')
+    if not supabase_secret_arn:
+        raise ValueError("SUPABASE_SECRET_ARN environment variable not set")
+
+    secret = get_secret(supabase_secret_arn)
+    supabase_url = secret.get('SUPABASE_URL')
+    supabase_key = secret.get('SUPABASE_SERVICE_ROLE_KEY')
+
+    if not supabase_url or not supabase_key:
+        raise ValueError("Supabase URL or service role key not found in secret")
+
+    with _client_pool_lock:
+        if _client_pool is None:
+            _client_pool = SupabaseClientPool(supabase_url, supabase_key)
+        return _client_pool
 
 
 def get_supabase_client(user_jwt: Optional[str] = None) -> Client:
@@ -75,34 +191,20 @@ def get_supabase_client(user_jwt: Optional[str] = None) -> Client:
         ValueError: If required environment variables are missing
         Exception: If client creation fails
     """
-    # Get Supabase credentials from Secrets Manager
-    supabase_secret_arn = os.getenv('SUPABASE_SECRET_ARN')
-    if not supabase_secret_arn:
+    if not os.getenv('SUPABASE_SECRET_ARN'):
         raise ValueError("SUPABASE_SECRET_ARN environment variable not set")
     
     try:
-        # Retrieve secret
-        secret = get_secret(supabase_secret_arn)
-        supabase_url = secret.get('SUPABASE_URL')
-        supabase_key = secret.get('SUPABASE_SERVICE_ROLE_KEY')
-        
-        if not supabase_url or not supabase_key:
-            raise ValueError("Supabase URL or service role key not found in secret")
+        pool = get_client_pool()
         
         # If user JWT is provided, use it for RLS
         # Otherwise, use service role key (bypasses RLS)
         if user_jwt:
-            # Create client with user JWT for RLS enforcement
-            client = create_client(supabase_url, supabase_key)
-            # Set the user's JWT token for RLS
-            client.postgrest.auth(user_jwt)
-            return client
+            # Pooled client with the user JWT for RLS enforcement
+            return pool.get_user_client(user_jwt)
         else:
-            # Use cached service role client if available
-            global _client_cache
-            if _client_cache is None:
-                _client_cache = create_client(supabase_url, supabase_key)
-            return _client_cache
+            # Shared service role client
+            return pool.get_service_client()
             
     except Exception as e:
         print(f"Failed to create Supabase client: {str(e)}")
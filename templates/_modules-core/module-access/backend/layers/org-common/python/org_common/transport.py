@@ -0,0 +1,181 @@
+"""
+Provider Transport
+
+Container-scoped HTTP and AWS clients for calls to AI providers (chat,
+embeddings, evaluation), so a warm container reuses connections and their
+TLS sessions across calls and invocations instead of opening one per call:
+
+- get_http_session(): one requests.Session whose adapter keeps up to
+  PROVIDER_HTTP_POOL_MAXSIZE connections per host alive, with TCP
+  keepalive on the sockets. Failed connects are retried; a request that
+  reached the provider is never resent.
+- get_httpx_client(): the same for SDKs built on httpx (openai and
+  anthropic accept it as http_client=)
+- get_boto3_client(): one client per (service, region, credentials), with
+  a connection pool of the same size and TCP keepalive, built from a
+  module-level boto3 Session
+
+requests, httpx and boto3 are imported on first use.
+
+Usage:
+    response = common.get_http_session().post(url, json=payload, timeout=300)
+
+    client = openai.OpenAI(api_key=api_key, http_client=common.get_httpx_client())
+
+    bedrock = common.get_boto3_client('bedrock-runtime', region)
+"""
+import os
+import socket
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+# Connections kept alive per host (requests, httpx) or per client (boto3)
+PROVIDER_HTTP_POOL_MAXSIZE = int(os.getenv('PROVIDER_HTTP_POOL_MAXSIZE', '16'))
+# Distinct hosts with a pool in the requests session
+PROVIDER_HTTP_POOL_CONNECTIONS = 8
+# Retries of failed connects (never of requests that reached the server)
+PROVIDER_HTTP_CONNECT_RETRIES = 2
+# Idle time before httpx closes a pooled connection
+PROVIDER_HTTP_KEEPALIVE_EXPIRY_SECONDS = 60
+# Default httpx timeout (SDKs pass their own per request)
+PROVIDER_HTTP_TIMEOUT_SECONDS = 300
+
+# TCP keepalive probes, so idle pooled connections survive NAT/load balancer timeouts
+TCP_KEEPALIVE_IDLE_SECONDS = 60
+TCP_KEEPALIVE_INTERVAL_SECONDS = 15
+
+BotoClientKey = Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]]
+
+_lock = threading.Lock()
+_http_session = None
+_httpx_client = None
+_boto3_session = None  # boto3 Session the shared clients are built from
+_boto3_clients: Dict[BotoClientKey, Any] = {}
+
+
+def _socket_options() -> list:
+    """TCP_NODELAY (the urllib3/httpx default) plus keepalive probes where supported."""
+    options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE_SECONDS))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL_SECONDS))
+    return options
+
+
+def _create_http_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class KeepAliveAdapter(HTTPAdapter):
+        """HTTPAdapter whose pooled sockets send TCP keepalive probes."""
+
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs['socket_options'] = _socket_options()
+            super().init_poolmanager(*args, **kwargs)
+
+    session = requests.Session()
+    # Retry failed connects only: no read retries (an int max_retries would
+    # retry reads of idempotent methods) and no retries on HTTP status
+    retries = Retry(
+        total=PROVIDER_HTTP_CONNECT_RETRIES,
+        connect=PROVIDER_HTTP_CONNECT_RETRIES,
+        read=False,
+        status=0,
+        redirect=False,
+    )
+    adapter = KeepAliveAdapter(
+        pool_connections=PROVIDER_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=PROVIDER_HTTP_POOL_MAXSIZE,
+        max_retries=retries,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_http_session():
+    """
+    Get the container's requests.Session for provider calls.
+
+    Pass headers and timeout per request; the session carries no
+    credentials.
+    """
+    global _http_session
+    if _http_session is None:
+        with _lock:
+            if _http_session is None:
+                _http_session = _create_http_session()
+    return _http_session
+
+
+def get_httpx_client():
+    """Get the container's httpx.Client for provider SDKs (http_client=)."""
+    global _httpx_client
+    if _httpx_client is None:
+        with _lock:
+            if _httpx_client is None:
+                import httpx
+
+                _httpx_client = httpx.Client(
+                    timeout=PROVIDER_HTTP_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(
+                        max_connections=PROVIDER_HTTP_POOL_MAXSIZE * PROVIDER_HTTP_POOL_CONNECTIONS,
+                        max_keepalive_connections=PROVIDER_HTTP_POOL_MAXSIZE,
+                        keepalive_expiry=PROVIDER_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                    ),
+                    transport=httpx.HTTPTransport(
+                        retries=PROVIDER_HTTP_CONNECT_RETRIES,
+                        socket_options=_socket_options(),
+                    ),
+                )
+    return _httpx_client
+
+
+def get_boto3_client(service: str, region: Optional[str] = None, credentials: Optional[Dict[str, str]] = None):
+    """
+    Get a cached boto3 client.
+
+    Args:
+        service: AWS service name, e.g. 'bedrock-runtime'
+        region: AWS region (None = boto3 default)
+        credentials: Optional aws_access_key_id / aws_secret_access_key /
+                     aws_session_token (None = the Lambda's role)
+    """
+    credentials = {k: v for k, v in (credentials or {}).items() if v}
+    key = (
+        service,
+        region,
+        credentials.get('aws_access_key_id'),
+        credentials.get('aws_secret_access_key'),
+        credentials.get('aws_session_token'),
+    )
+    global _boto3_session
+    # Created under the lock: boto3 sessions are not thread-safe, and
+    # request threads ask for clients concurrently
+    with _lock:
+        client = _boto3_clients.get(key)
+        if client is None:
+            import boto3
+            from botocore.config import Config
+
+            if _boto3_session is None:
+                _boto3_session = boto3.session.Session()
+            config = Config(max_pool_connections=PROVIDER_HTTP_POOL_MAXSIZE, tcp_keepalive=True)
+            client = _boto3_session.client(service, region_name=region, config=config, **credentials)
+            _boto3_clients[key] = client
+    return client
+
+
+def transport_stats() -> Dict[str, Any]:
+    """Which shared clients exist in this container."""
+    with _lock:
+        return {
+            'http_session': _http_session is not None,
+            'httpx_client': _httpx_client is not None,
+            'boto3_clients': sorted({(key[0], key[1] or '') for key in _boto3_clients}),
+        }
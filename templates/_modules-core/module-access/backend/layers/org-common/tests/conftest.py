@@ -0,0 +1,185 @@
+"""
+Shared fixtures for org_common unit tests
+
+FakeSupabase is an in-memory stand-in for the Supabase client: it supports
+the query-builder calls org_common.db makes (select/insert/upsert/update/
+delete, eq/in_/gt/lt/or_, order, limit) and records every executed request,
+so tests can assert on both results and request counts.
+"""
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+# Add org_common to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'python'))
+
+_OR_KEYSET = re.compile(
+    r'^(\w+)\.(gt|lt)\."((?:[^"\\]|\\.)*)",and\(\1\.eq\."((?:[^"\\]|\\.)*)",(\w+)\.\2\."((?:[^"\\]|\\.)*)"\)$'
+)
+
+
+def _unquote(text: str) -> str:
+    return text.replace('\\"', '"').replace('\\\\', '\\')
+
+
+def _compare(a: Any, op: str, b: Any) -> bool:
+    a, b = str(a), str(b)
+    return a > b if op == 'gt' else a < b
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeQuery:
+    """Query builder over one FakeSupabase table."""
+
+    def __init__(self, db: 'FakeSupabase', table: str, operation: str, payload=None, **options):
+        self.db = db
+        self.table = table
+        self.operation = operation
+        self.payload = payload
+        self.options = options
+        self.predicates = []
+        self.orders = []
+        self.limit_value: Optional[int] = None
+
+    def eq(self, key, value):
+        self.predicates.append(lambda row: str(row.get(key)) == str(value))
+        return self
+
+    def in_(self, key, values):
+        values = {str(v) for v in values}
+        self.predicates.append(lambda row: str(row.get(key)) in values)
+        return self
+
+    def gt(self, key, value):
+        self.predicates.append(lambda row: _compare(row.get(key), 'gt', value))
+        return self
+
+    def lt(self, key, value):
+        self.predicates.append(lambda row: _compare(row.get(key), 'lt', value))
+        return self
+
+    def or_(self, expression):
+        # Only the keyset form built by db._fetch_keyset_page
+        match = _OR_KEYSET.match(expression)
+        assert match, f"unsupported or_() filter: {expression}"
+        key, op, value, _, tiebreak, tiebreak_value = match.groups()
+        value, tiebreak_value = _unquote(value), _unquote(tiebreak_value)
+        self.predicates.append(lambda row: (
+            _compare(row.get(key), op, value)
+            or (str(row.get(key)) == value and _compare(row.get(tiebreak), op, tiebreak_value))
+        ))
+        return self
+
+    def order(self, key, desc=False):
+        self.orders.append((key, desc))
+        return self
+
+    def limit(self, n):
+        self.limit_value = n
+        return self
+
+    def _matching(self) -> List[Dict[str, Any]]:
+        return [row for row in self.db.tables.setdefault(self.table, []) if all(p(row) for p in self.predicates)]
+
+    def execute(self) -> FakeResponse:
+        self.db.requests.append((self.operation, self.table, self.payload))
+        if self.db.fail_when is not None and self.db.fail_when(self.operation, self.payload):
+            raise Exception('simulated request failure')
+
+        rows = self.db.tables.setdefault(self.table, [])
+        if self.operation == 'select':
+            result = [dict(row) for row in self._matching()]
+            for key, desc in reversed(self.orders):
+                result.sort(key=lambda row: str(row.get(key)), reverse=desc)
+            limits = [x for x in (self.limit_value, self.db.max_rows) if x is not None]
+            return FakeResponse(result[:min(limits)] if limits else result)
+
+        if self.operation in ('insert', 'upsert'):
+            on_conflict = self.options.get('on_conflict')
+            written = []
+            for row in self.payload:
+                existing = None
+                if on_conflict:
+                    keys = on_conflict.split(',')
+                    existing = next((r for r in rows if all(r.get(k) == row.get(k) for k in keys)), None)
+                if existing is not None:
+                    if not self.options.get('ignore_duplicates'):
+                        existing.update(row)
+                        written.append(dict(existing))
+                else:
+                    rows.append(dict(row))
+                    written.append(dict(row))
+            return FakeResponse([] if self.options.get('returning') == 'minimal' else written)
+
+        if self.operation == 'update':
+            matched = self._matching()
+            for row in matched:
+                row.update(self.payload)
+            return FakeResponse([dict(row) for row in matched])
+
+        if self.operation == 'delete':
+            matched = self._matching()
+            self.db.tables[self.table] = [row for row in rows if row not in matched]
+            return FakeResponse([dict(row) for row in matched])
+
+        raise AssertionError(f"unsupported operation {self.operation}")
+
+
+class FakeTable:
+    def __init__(self, db: 'FakeSupabase', name: str):
+        self.db = db
+        self.name = name
+
+    def select(self, columns='*'):
+        return FakeQuery(self.db, self.name, 'select', columns)
+
+    def insert(self, rows, returning='representation'):
+        return FakeQuery(self.db, self.name, 'insert', list(rows) if isinstance(rows, list) else [rows], returning=returning)
+
+    def upsert(self, rows, on_conflict=None, ignore_duplicates=False, returning='representation'):
+        return FakeQuery(
+            self.db, self.name, 'upsert', list(rows),
+            on_conflict=on_conflict, ignore_duplicates=ignore_duplicates, returning=returning
+        )
+
+    def update(self, data):
+        return FakeQuery(self.db, self.name, 'update', data)
+
+    def delete(self):
+        return FakeQuery(self.db, self.name, 'delete')
+
+
+class FakeSupabase:
+    """In-memory Supabase client (see module docstring)."""
+
+    def __init__(self, max_rows: Optional[int] = None):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        self.requests: List[tuple] = []
+        # PostgREST max-rows: the most rows a select returns, whatever its limit
+        self.max_rows = max_rows
+        # fail_when(operation, payload) -> bool makes matching requests raise
+        self.fail_when = None
+
+    def table(self, name: str) -> FakeTable:
+        return FakeTable(self, name)
+
+    def count(self, operation: str) -> int:
+        return sum(1 for request in self.requests if request[0] == operation)
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """FakeSupabase installed as org_common.db's client (any user JWT)."""
+    pytest.importorskip('supabase')
+    from org_common import db
+
+    client = FakeSupabase()
+    monkeypatch.setattr(db, 'get_supabase_client', lambda user_jwt=None: client)
+    return client
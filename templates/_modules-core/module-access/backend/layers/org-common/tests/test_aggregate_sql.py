@@ -0,0 +1,110 @@
+"""
+Tests for the aggregate_rows RPC behind count_by, count_many and sum_column
+
+Runs the SQL itself against a real Postgres (DATABASE_URL), since the
+Python wrapper tests in test_db.py never execute it:
+1. Both the schema file and the migration create a working aggregate_rows
+2. Ungrouped and grouped counts, equality / IN / NULL filters and sums
+3. Unknown tables and columns are rejected
+
+Each test runs in a transaction that is rolled back. Skipped when
+psycopg2 is not installed or DATABASE_URL is not set.
+"""
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+psycopg2 = pytest.importorskip('psycopg2')
+
+DATABASE_URL = os.environ.get('DATABASE_URL')
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason='DATABASE_URL not set')
+
+DB_DIR = Path(__file__).resolve().parents[4] / 'db'
+SQL_FILES = [
+    DB_DIR / 'schema' / '009-aggregate-rpcs.sql',
+    DB_DIR / 'migrations' / '20261016_aggregate_rows.sql',
+]
+
+# The GRANTs name Supabase roles that a plain Postgres does not have
+_GRANT = re.compile(r'^GRANT .*?;\s*$', re.MULTILINE)
+
+
+@pytest.fixture(params=SQL_FILES, ids=lambda path: path.name)
+def cursor(request):
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        cur = conn.cursor()
+        cur.execute(_GRANT.sub('', request.param.read_text()))
+        cur.execute("""
+            CREATE TABLE agg_test_docs (
+                id SERIAL PRIMARY KEY,
+                kb_id UUID NOT NULL,
+                status TEXT,
+                file_size BIGINT,
+                is_deleted BOOLEAN NOT NULL DEFAULT false
+            );
+            INSERT INTO agg_test_docs (kb_id, status, file_size, is_deleted) VALUES
+                ('00000000-0000-0000-0000-00000000000a', 'indexed', 100, false),
+                ('00000000-0000-0000-0000-00000000000a', 'indexed', 250, false),
+                ('00000000-0000-0000-0000-00000000000a', NULL, 50, true),
+                ('00000000-0000-0000-0000-00000000000b', 'failed', 10, false),
+                ('00000000-0000-0000-0000-00000000000c', 'indexed', 1, false);
+        """)
+        yield cur
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+def aggregate(cur, *args, filters='{}'):
+    cur.execute(
+        'SELECT group_key, value FROM aggregate_rows(%s, %s, %s, %s, %s::jsonb)',
+        (*args, filters),
+    )
+    return sorted(cur.fetchall(), key=lambda row: row[0] or '')
+
+
+KB_A = '00000000-0000-0000-0000-00000000000a'
+KB_B = '00000000-0000-0000-0000-00000000000b'
+
+
+class TestAggregateRows:
+    """aggregate_rows against a real table."""
+
+    def test_ungrouped_count(self, cursor):
+        assert aggregate(cursor, 'agg_test_docs', 'count', None, None) == [(None, 5)]
+
+    def test_equality_filter(self, cursor):
+        rows = aggregate(cursor, 'agg_test_docs', 'count', None, None,
+                         filters=f'{{"kb_id": "{KB_A}", "is_deleted": false}}')
+        assert rows == [(None, 2)]
+
+    def test_grouped_count_with_in_filter(self, cursor):
+        rows = aggregate(cursor, 'agg_test_docs', 'count', None, 'kb_id',
+                         filters=f'{{"kb_id": ["{KB_A}", "{KB_B}"]}}')
+        assert rows == [(KB_A, 3), (KB_B, 1)]
+
+    def test_null_filter(self, cursor):
+        rows = aggregate(cursor, 'agg_test_docs', 'count', None, None,
+                         filters='{"status": null}')
+        assert rows == [(None, 1)]
+
+    def test_sum(self, cursor):
+        rows = aggregate(cursor, 'agg_test_docs', 'sum', 'file_size', None,
+                         filters=f'{{"kb_id": "{KB_A}", "is_deleted": false}}')
+        assert rows == [(None, 350)]
+
+    def test_sum_of_no_rows_is_zero(self, cursor):
+        rows = aggregate(cursor, 'agg_test_docs', 'sum', 'file_size', None,
+                         filters='{"status": "missing"}')
+        assert rows == [(None, 0)]
+
+    def test_unknown_column_rejected(self, cursor):
+        with pytest.raises(psycopg2.errors.UndefinedColumn):
+            aggregate(cursor, 'agg_test_docs', 'count', None, None, filters='{"nope": 1}')
+
+    def test_unknown_table_rejected(self, cursor):
+        with pytest.raises(psycopg2.errors.UndefinedTable):
+            aggregate(cursor, 'agg_test_no_such_table', 'count', None, None)
@@ -0,0 +1,206 @@
+"""
+Tests for org_common.db bulk writes and keyset pagination
+
+Runs against FakeSupabase (see conftest.py):
+1. _chunk_rows splits by row count, payload size and column set
+2. insert_many / upsert_many / update_where send one request per batch and
+   report written rows, batches and per-batch errors in BulkWriteResult
+3. iter_many / find_page visit every row once, in order, and stop at the
+   end (also when the server caps rows per request below page_size)
+4. Cursors round-trip and malformed cursors are rejected
+"""
+import pytest
+
+pytest.importorskip('supabase')
+
+from org_common import db
+from org_common.errors import BulkWriteError, ValidationError
+
+
+def make_rows(n, **extra):
+    return [{'id': f'{i:04d}', 'name': f'row {i}', **extra} for i in range(n)]
+
+
+class TestChunkRows:
+    """Batch boundaries."""
+
+    def test_splits_by_batch_size(self):
+        batches = list(db._chunk_rows(make_rows(7), batch_size=3, max_payload_bytes=10 ** 6))
+        assert [(start, len(batch)) for start, batch in batches] == [(0, 3), (3, 3), (6, 1)]
+
+    def test_splits_by_payload_size(self):
+        rows = make_rows(4, body='x' * 100)
+        batches = list(db._chunk_rows(rows, batch_size=100, max_payload_bytes=300))
+        assert [(start, len(batch)) for start, batch in batches] == [(0, 2), (2, 2)]
+
+    def test_oversized_row_is_sent_alone(self):
+        rows = [{'id': '0', 'body': 'x' * 500}, {'id': '1', 'body': ''}]
+        batches = list(db._chunk_rows(rows, batch_size=100, max_payload_bytes=100))
+        assert [len(batch) for _, batch in batches] == [1, 1]
+
+    def test_splits_on_column_change(self):
+        rows = [{'id': '0'}, {'id': '1'}, {'id': '2', 'name': 'x'}, {'id': '3'}]
+        batches = list(db._chunk_rows(rows, batch_size=100, max_payload_bytes=10 ** 6))
+        assert [start for start, _ in batches] == [0, 2, 3]
+
+
+class TestInsertMany:
+    """Batched inserts and upserts."""
+
+    def test_one_request_per_batch(self, fake_db):
+        result = db.insert_many('items', make_rows(1200), batch_size=500)
+        assert fake_db.count('insert') == 3
+        assert (result.written, result.batches, result.ok) == (1200, 3, True)
+        assert len(result.records) == 1200
+        assert len(fake_db.tables['items']) == 1200
+
+    def test_returning_minimal_still_counts_written(self, fake_db):
+        result = db.insert_many('items', make_rows(10), batch_size=4, returning='minimal')
+        assert (result.written, result.batches, result.records) == (10, 3, [])
+
+    def test_empty_input_sends_nothing(self, fake_db):
+        result = db.insert_many('items', [])
+        assert (result.written, result.batches) == (0, 0)
+        assert fake_db.requests == []
+
+    def test_failed_batch_is_reported(self, fake_db):
+        fake_db.fail_when = lambda operation, payload: payload[0]['id'] == '0004'
+        result = db.insert_many('items', make_rows(10), batch_size=4, raise_on_error=False)
+        assert (result.written, result.batches, result.failed_rows, result.ok) == (6, 3, 4, False)
+        error = result.errors[0]
+        assert (error.batch, error.start, error.size) == (1, 4, 4)
+
+    def test_failed_batch_raises_with_partial_result(self, fake_db):
+        fake_db.fail_when = lambda operation, payload: payload[0]['id'] == '0000'
+        with pytest.raises(BulkWriteError) as excinfo:
+            db.insert_many('items', make_rows(6), batch_size=4)
+        assert excinfo.value.result.written == 2
+        assert excinfo.value.result.failed_rows == 4
+
+    def test_upsert_updates_or_ignores_existing_rows(self, fake_db):
+        db.insert_many('items', make_rows(3))
+        changed = [{'id': '0001', 'name': 'changed'}, {'id': '0003', 'name': 'new'}]
+
+        result = db.upsert_many('items', changed, on_conflict='id', ignore_duplicates=True)
+        assert [r['id'] for r in result.records] == ['0003']
+        assert fake_db.tables['items'][1]['name'] == 'row 1'
+
+        db.upsert_many('items', changed, on_conflict='id')
+        assert fake_db.tables['items'][1]['name'] == 'changed'
+        assert fake_db.count('upsert') == 2
+
+    def test_upsert_requires_on_conflict(self, fake_db):
+        with pytest.raises(ValueError):
+            db.upsert_many('items', make_rows(1), on_conflict='')
+
+
+class TestUpdateWhere:
+    """Updates with a long list filter."""
+
+    def test_list_filter_is_split(self, fake_db):
+        db.insert_many('items', make_rows(450))
+        ids = [row['id'] for row in fake_db.tables['items']] + ['missing']
+
+        result = db.update_where('items', {'id': ids}, {'name': 'archived'}, batch_size=200)
+        assert fake_db.count('update') == 3
+        # written counts updated rows, not filter values
+        assert (result.written, result.batches) == (450, 3)
+        assert all(row['name'] == 'archived' for row in fake_db.tables['items'])
+
+    def test_short_filter_is_one_request(self, fake_db):
+        db.insert_many('items', make_rows(3))
+        result = db.update_where('items', {'id': ['0000', '0001']}, {'name': 'x'})
+        assert (fake_db.count('update'), result.written, result.batches) == (1, 2, 1)
+
+    def test_only_one_long_list_filter(self, fake_db):
+        long_list = [str(i) for i in range(5)]
+        with pytest.raises(ValueError):
+            db.update_where('items', {'id': long_list, 'kb_id': long_list}, {'name': 'x'}, batch_size=2)
+
+    def test_filters_required(self, fake_db):
+        with pytest.raises(ValueError):
+            db.update_where('items', {}, {'name': 'x'})
+
+
+@pytest.fixture
+def events(fake_db):
+    """25 rows with a non-unique created_at (5 rows per timestamp)."""
+    fake_db.tables['events'] = [
+        {'id': f'{i:03d}', 'created_at': f'2026-01-0{1 + i // 5}', 'note': f'a,b "{i}"'}
+        for i in range(25)
+    ]
+    return fake_db.tables['events']
+
+
+class TestIterMany:
+    """Keyset iteration."""
+
+    def test_visits_every_row_in_order(self, fake_db, events):
+        ids = [row['id'] for row in db.iter_many('events', page_size=10)]
+        assert ids == [row['id'] for row in events]
+        assert fake_db.count('select') == 3
+
+    def test_exact_multiple_needs_one_empty_page(self, fake_db, events):
+        assert len(list(db.iter_many('events', page_size=5))) == 25
+        assert fake_db.count('select') == 6
+
+    def test_tiebreak_on_non_unique_order_key(self, fake_db, events):
+        rows = list(db.iter_many('events', order_key='created_at', tiebreak_key='id', page_size=3))
+        assert [row['id'] for row in rows] == [row['id'] for row in events]
+
+    def test_descending(self, fake_db, events):
+        rows = list(db.iter_many('events', order_key='created_at', tiebreak_key='id', page_size=4, descending=True))
+        assert [row['id'] for row in rows] == [row['id'] for row in reversed(events)]
+
+    def test_filters_apply_to_every_page(self, fake_db, events):
+        rows = list(db.iter_many('events', {'created_at': '2026-01-02'}, page_size=2))
+        assert [row['id'] for row in rows] == ['005', '006', '007', '008', '009']
+
+    def test_server_row_cap_below_page_size(self, fake_db, events, monkeypatch):
+        # The server returns at most 10 rows per request; a full capped page is not the end
+        fake_db.max_rows = 10
+        monkeypatch.setattr(db, 'POSTGREST_MAX_ROWS', 10)
+        assert len(list(db.iter_many('events', page_size=1000))) == 25
+        assert fake_db.count('select') == 3
+
+
+class TestFindPage:
+    """Cursor pages for APIs."""
+
+    def test_pages_until_no_more(self, events):
+        cursor, seen, pages = None, [], 0
+        while True:
+            page = db.find_page('events', cursor=cursor, page_size=10, order_key='created_at', tiebreak_key='id')
+            seen.extend(row['id'] for row in page['items'])
+            pages += 1
+            if not page['hasMore']:
+                assert page['nextCursor'] is None
+                break
+            cursor = page['nextCursor']
+        assert seen == [row['id'] for row in events]
+        assert pages == 3
+
+    def test_last_full_page_has_no_more(self, events):
+        page = db.find_page('events', page_size=25)
+        assert (len(page['items']), page['hasMore'], page['nextCursor']) == (25, False, None)
+
+    def test_page_size_limits(self, events):
+        for page_size in (0, db.MAX_PAGE_SIZE + 1):
+            with pytest.raises(ValidationError):
+                db.find_page('events', page_size=page_size)
+
+
+class TestCursor:
+    """Cursor encoding."""
+
+    def test_round_trip(self):
+        row = {'created_at': '2026-01-01T00:00:00+00:00', 'id': 'a,b "c"'}
+        cursor = db.encode_cursor(row, 'created_at', 'id')
+        assert '=' not in cursor
+        assert db.decode_cursor(cursor) == ('2026-01-01T00:00:00+00:00', 'a,b "c"')
+        assert db.decode_cursor(db.encode_cursor({'id': 7}, 'id')) == (7, None)
+
+    @pytest.mark.parametrize('cursor', ['not base64!', 'bm90IGpzb24', 'WzFd', 'eyJhIjoxfQ'])
+    def test_malformed_cursor(self, cursor):
+        with pytest.raises(ValidationError):
+            db.decode_cursor(cursor)
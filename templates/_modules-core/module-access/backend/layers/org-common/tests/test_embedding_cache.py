@@ -0,0 +1,171 @@
+"""
+Tests for org_common.embedding_cache
+
+1. Keys ignore whitespace/Unicode form differences but not case or model
+2. The container LRU serves repeats, evicts least recently used vectors
+   and embeds each distinct missing text once
+3. The shared store is consulted on LRU misses, filled with new vectors,
+   and its errors are treated as misses
+4. FileEmbeddingStore and TableEmbeddingStore round-trip vectors
+"""
+import pytest
+
+from org_common.embedding_cache import (
+    EmbeddingCache,
+    EmbeddingStore,
+    FileEmbeddingStore,
+    TableEmbeddingStore,
+    embedding_cache_key,
+)
+
+MODEL = 'test-embedding-model'
+
+
+class CountingEmbedder:
+    """Embeds a text as [len(text), call number]; records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), float(len(self.calls))] for text in texts]
+
+    @property
+    def texts(self):
+        return [text for call in self.calls for text in call]
+
+
+class MemoryStore(EmbeddingStore):
+    def __init__(self, fail=False):
+        self.vectors = {}
+        self.fail = fail
+        self.lookups = 0
+
+    def get_many(self, keys):
+        self.lookups += 1
+        if self.fail:
+            raise ConnectionError('store down')
+        return {key: self.vectors[key] for key in keys if key in self.vectors}
+
+    def put_many(self, model, vectors):
+        if self.fail:
+            raise ConnectionError('store down')
+        self.vectors.update(vectors)
+
+
+class TestCacheKey:
+    def test_normalized_text_shares_a_key(self):
+        assert embedding_cache_key(MODEL, '  hello\n\tworld ') == embedding_cache_key(MODEL, 'hello world')
+        # NFC: precomposed and combining forms of é
+        assert embedding_cache_key(MODEL, 'caf\u00e9') == embedding_cache_key(MODEL, 'cafe\u0301')
+
+    def test_case_and_model_are_part_of_the_key(self):
+        assert embedding_cache_key(MODEL, 'Hello') != embedding_cache_key(MODEL, 'hello')
+        assert embedding_cache_key(MODEL, 'hello') != embedding_cache_key('other-model', 'hello')
+
+
+class TestContainerTier:
+    def test_repeats_are_served_from_the_lru(self):
+        cache, embed = EmbeddingCache(max_entries=10), CountingEmbedder()
+        first = cache.get(MODEL, 'query', embed)
+        assert cache.get(MODEL, ' query ', embed) == first
+        assert len(embed.calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_distinct_missing_texts_are_embedded_once_in_order(self):
+        cache, embed = EmbeddingCache(max_entries=10), CountingEmbedder()
+        cache.get(MODEL, 'bb', embed)
+        vectors = cache.get_many(MODEL, ['a', 'bb', 'a', 'ccc'], embed)
+        assert embed.calls == [['bb'], ['a', 'ccc']]
+        assert [v[0] for v in vectors] == [1.0, 2.0, 1.0, 3.0]
+
+    def test_least_recently_used_is_evicted(self):
+        cache, embed = EmbeddingCache(max_entries=2), CountingEmbedder()
+        cache.get_many(MODEL, ['a', 'b'], embed)
+        cache.get(MODEL, 'a', embed)   # b is now least recently used
+        cache.get(MODEL, 'c', embed)   # evicts b
+        assert cache.stats()['entries'] == 2
+        cache.get_many(MODEL, ['a', 'c', 'b'], embed)
+        assert embed.texts == ['a', 'b', 'c', 'b']
+
+    def test_returned_vectors_are_copies(self):
+        cache, embed = EmbeddingCache(max_entries=10), CountingEmbedder()
+        cache.get(MODEL, 'a', embed).append(99.0)
+        assert cache.get(MODEL, 'a', embed) == [1.0, 1.0]
+
+    def test_embedder_returning_wrong_count_raises(self):
+        cache = EmbeddingCache(max_entries=10)
+        with pytest.raises(ValueError):
+            cache.get_many(MODEL, ['a', 'b'], lambda texts: [[0.0]])
+
+    def test_clear_forgets_the_container_tier(self):
+        cache, embed = EmbeddingCache(max_entries=10), CountingEmbedder()
+        cache.get(MODEL, 'a', embed)
+        cache.clear()
+        cache.get(MODEL, 'a', embed)
+        assert len(embed.calls) == 2
+
+
+class TestSharedTier:
+    def test_store_is_filled_and_read_on_lru_miss(self):
+        store, embed = MemoryStore(), CountingEmbedder()
+        EmbeddingCache(max_entries=10, store=store).get_many(MODEL, ['a', 'bb'], embed)
+        assert len(store.vectors) == 2
+
+        # Another container: nothing in its LRU, everything in the store
+        other = EmbeddingCache(max_entries=10, store=store)
+        assert other.get(MODEL, 'bb', embed) == [2.0, 1.0]
+        assert len(embed.calls) == 1
+        assert other.stats()['shared_hits'] == 1
+
+        # Store hits are copied into the LRU
+        other.get(MODEL, 'bb', embed)
+        assert store.lookups == 2
+
+    def test_only_lru_misses_reach_the_store(self):
+        store, embed = MemoryStore(), CountingEmbedder()
+        cache = EmbeddingCache(max_entries=10, store=store)
+        cache.get(MODEL, 'a', embed)
+        cache.get(MODEL, 'a', embed)
+        assert store.lookups == 1
+
+    def test_store_errors_are_misses(self):
+        cache, embed = EmbeddingCache(max_entries=10, store=MemoryStore(fail=True)), CountingEmbedder()
+        assert cache.get(MODEL, 'abc', embed) == [3.0, 1.0]
+        # Lookup and write both failed; the LRU still works
+        assert cache.stats()['store_errors'] == 2
+        cache.get(MODEL, 'abc', embed)
+        assert len(embed.calls) == 1
+
+    def test_store_must_implement_both_methods(self):
+        class ReadOnlyStore(EmbeddingStore):
+            def get_many(self, keys):
+                return {}
+
+        with pytest.raises(TypeError):
+            ReadOnlyStore()
+
+
+class TestStores:
+    def test_file_store_round_trip(self, tmp_path):
+        path = tmp_path / 'embeddings.jsonl'
+        store = FileEmbeddingStore(str(path))
+        store.put_many(MODEL, {'k1': [0.1, 0.2]})
+        store.put_many(MODEL, {'k1': [9.9], 'k2': [0.3]})  # existing keys are kept
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"key": "partial')  # interrupted write
+
+        reloaded = FileEmbeddingStore(str(path))
+        assert reloaded.get_many(['k1', 'k2', 'k3']) == {'k1': [0.1, 0.2], 'k2': [0.3]}
+
+    def test_table_store_round_trip(self, fake_db):
+        store = TableEmbeddingStore()
+        store.put_many(MODEL, {'k1': [0.1, 0.2]})
+        store.put_many(MODEL, {'k1': [9.9], 'k2': [0.3]})
+        row = fake_db.tables['kb_embedding_cache'][0]
+        assert (row['model'], row['dimensions']) == (MODEL, 2)
+
+        # pgvector columns may come back as text
+        fake_db.tables['kb_embedding_cache'].append({'cache_key': 'k3', 'embedding': '[0.5,0.6]'})
+        assert store.get_many(['k1', 'k2', 'k3', 'k4']) == {'k1': [0.1, 0.2], 'k2': [0.3], 'k3': [0.5, 0.6]}
@@ -0,0 +1,181 @@
+"""
+Import-time benchmark for org_common and the major Lambdas
+
+Measures cold imports with `python -X importtime` in a fresh interpreter and
+asserts budgets, so regressions in Lambda init time show up in tests:
+
+- org_common itself, and its light helpers (responses, validators), must
+  not pull in supabase/httpx/boto3/jwt (the package resolves names lazily)
+- each Lambda's module-level import must not load the database stack
+  (DB_MODULES); permission layers and Lambdas resolve org_common names at
+  call time
+- with LAMBDA_IMPORT_BUDGET_MS set, each Lambda's module-level import must
+  also fit that wall-clock budget (opt-in: timings depend on the machine)
+
+Lambda imports run with the layer paths prepended to the current
+PYTHONPATH, so installed dependencies stay importable; a Lambda that fails
+to import fails its test. The Lambda tests are skipped only when the layer's
+own requirements (LAYER_REQUIREMENTS) aren't installed at all.
+
+The org_common budget can be overridden with ORG_COMMON_IMPORT_BUDGET_MS.
+
+Run as a script for a report:
+    python tests/test_import_time.py
+"""
+import os
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+LAYER_PATH = Path(__file__).parent.parent / 'python'
+TEMPLATES_PATH = Path(__file__).resolve().parents[6]
+
+ORG_COMMON_IMPORT_BUDGET_MS = float(os.getenv('ORG_COMMON_IMPORT_BUDGET_MS', '50'))
+LAMBDA_IMPORT_BUDGET_MS = float(os.getenv('LAMBDA_IMPORT_BUDGET_MS', '0'))  # 0: not checked
+
+# Third-party packages that only database/secret helpers need
+HEAVY_MODULES = ('supabase', 'postgrest', 'httpx', 'boto3', 'botocore', 'jwt')
+
+# The part of HEAVY_MODULES no Lambda needs at init (some import boto3 themselves)
+DB_MODULES = ('supabase', 'postgrest', 'httpx', 'jwt')
+
+# Cold imports per Lambda test; the fastest counts (one slow run is noise)
+IMPORT_MEASURE_RUNS = 2
+
+# Packages from the layer's requirements.txt every Lambda imports through org_common
+LAYER_REQUIREMENTS = ('supabase', 'httpx', 'boto3', 'jwt')
+
+LAMBDAS = [
+    '_modules-core/module-access/backend/lambdas/members',
+    '_modules-core/module-access/backend/lambdas/orgs',
+    '_modules-core/module-chat/backend/lambdas/chat-session',
+    '_modules-core/module-chat/backend/lambdas/chat-stream',
+    '_modules-core/module-kb/backend/lambdas/kb-base',
+    '_modules-core/module-kb/backend/lambdas/kb-processor',
+    '_modules-core/module-ws/backend/lambdas/workspace',
+    '_modules-core/module-ai/backend/lambdas/provider',
+]
+
+
+def _layer_paths() -> List[str]:
+    """org-common first, then every other module layer."""
+    layers = sorted(str(p) for p in TEMPLATES_PATH.glob('_modules-*/*/backend/layers/*/python'))
+    return [str(LAYER_PATH)] + [p for p in layers if p != str(LAYER_PATH)]
+
+
+def measure_import(code: str, module: str, extra_paths: List[str] = ()) -> Tuple[float, Dict[str, int]]:
+    """
+    Run `code` in a fresh interpreter with -X importtime.
+
+    Returns:
+        (cumulative import time of `module` in ms, {imported module: cumulative us})
+
+    Raises:
+        ImportError: If the code fails to import something
+    """
+    env = dict(os.environ)
+    existing = [env['PYTHONPATH']] if env.get('PYTHONPATH') else []
+    env['PYTHONPATH'] = os.pathsep.join(list(extra_paths) + _layer_paths() + existing)
+    env.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, env=env
+    )
+    imported = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        imported[name] = int(cumulative)
+    if proc.returncode != 0:
+        raise ImportError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'import failed')
+    return imported.get(module, 0) / 1000, imported
+
+
+def _heavy(imported: Dict[str, int], packages: Tuple[str, ...] = HEAVY_MODULES) -> List[str]:
+    return sorted(name for name in imported if name.split('.')[0] in packages)
+
+
+def _missing_layer_requirements() -> List[str]:
+    return [name for name in LAYER_REQUIREMENTS if importlib.util.find_spec(name) is None]
+
+
+def test_org_common_import_is_light():
+    """Importing the package loads no database/AWS dependencies."""
+    ms, imported = measure_import('import org_common', 'org_common')
+    assert not _heavy(imported), f"import org_common loaded {_heavy(imported)}"
+    assert ms <= ORG_COMMON_IMPORT_BUDGET_MS, f"import org_common took {ms:.1f}ms"
+
+
+def test_light_helpers_stay_light():
+    """Responses and validators resolve without touching supabase/boto3."""
+    code = (
+        'import org_common as common\n'
+        'common.success_response({})\n'
+        'common.validate_uuid("00000000-0000-0000-0000-000000000000", "id")\n'
+        'common.NotFoundError\n'
+    )
+    _, imported = measure_import(code, 'org_common')
+    assert not _heavy(imported), f"light helpers loaded {_heavy(imported)}"
+
+
+def test_lazy_exports_resolve():
+    """Every name in __all__ is provided by the package or a registered submodule."""
+    sys.path.insert(0, str(LAYER_PATH))
+    import org_common
+
+    missing = [
+        name for name in org_common.__all__
+        if name not in vars(org_common) and name not in org_common._LAZY_ATTRS
+    ]
+    assert not missing, f"__all__ names without a source: {missing}"
+
+
+@pytest.mark.parametrize('lambda_dir', LAMBDAS, ids=[Path(p).name for p in LAMBDAS])
+def test_lambda_import_budget(lambda_dir):
+    """A Lambda's module-level import (its init phase) stays off the database stack and fits the budget."""
+    path = TEMPLATES_PATH / lambda_dir
+    if not (path / 'lambda_function.py').exists():
+        pytest.skip(f"{lambda_dir} not in this tree")
+    missing = _missing_layer_requirements()
+    if missing:
+        pytest.skip(f"layer requirements not installed: {', '.join(missing)}")
+    runs = IMPORT_MEASURE_RUNS if LAMBDA_IMPORT_BUDGET_MS else 1
+    try:
+        measurements = [
+            measure_import('import lambda_function', 'lambda_function', [str(path)])
+            for _ in range(runs)
+        ]
+    except ImportError as e:
+        pytest.fail(f"{path.name} failed to import: {e}")
+    db_modules = _heavy(measurements[0][1], DB_MODULES)
+    assert not db_modules, f"{path.name} import loaded {db_modules}"
+    if LAMBDA_IMPORT_BUDGET_MS:
+        ms = min(ms for ms, _ in measurements)
+        assert ms <= LAMBDA_IMPORT_BUDGET_MS, f"{path.name} import took {ms:.1f}ms"
+
+
+def main():
+    """Print an import-time report."""
+    print("=" * 60)
+    print("Import-time benchmark (cumulative, cold interpreter)")
+    print("=" * 60)
+    ms, imported = measure_import('import org_common', 'org_common')
+    print(f"{'org_common':<30} {ms:>8.1f}ms  heavy: {_heavy(imported) or '-'}")
+    for lambda_dir in LAMBDAS:
+        path = TEMPLATES_PATH / lambda_dir
+        try:
+            ms, imported = measure_import('import lambda_function', 'lambda_function', [str(path)])
+            packages = sorted({name.split('.')[0] for name in _heavy(imported)})
+            print(f"{path.name:<30} {ms:>8.1f}ms  heavy: {', '.join(packages) or '-'}")
+        except ImportError as e:
+            print(f"{path.name:<30}  skipped ({e})")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
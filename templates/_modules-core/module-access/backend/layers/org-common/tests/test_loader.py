@@ -0,0 +1,123 @@
+"""
+Tests for org_common.loader
+
+Runs against FakeSupabase (see conftest.py):
+1. Keys are fetched in one in_() query per batch, memoized and returned in order
+2. Queued keys are fetched together with the next load of their table
+3. Nothing is memoized outside a request scope
+4. Writes through the db helpers drop the memoized rows of their table
+"""
+import pytest
+
+pytest.importorskip('supabase')
+
+from org_common import db
+from org_common.loader import DataLoader, get_data_loader, request_scope
+
+
+@pytest.fixture
+def workspaces(fake_db):
+    fake_db.tables['workspaces'] = [{'id': f'ws-{i}', 'name': f'Workspace {i}'} for i in range(5)]
+    return fake_db
+
+
+@pytest.fixture
+def loader():
+    loader = DataLoader(batch_size=2)
+    loader.begin_request()
+    yield loader
+    loader.end_request()
+
+
+class TestDataLoader:
+    """Batching and memoization."""
+
+    def test_load_many_batches_and_keeps_order(self, workspaces, loader):
+        rows = loader.load_many('workspaces', ['ws-3', 'ws-0', 'missing', 'ws-3', None])
+        assert [row and row['id'] for row in rows] == ['ws-3', 'ws-0', None, 'ws-3', None]
+        # 3 distinct keys in batches of 2
+        assert workspaces.count('select') == 2
+
+    def test_rows_and_misses_are_memoized(self, workspaces, loader):
+        loader.load_many('workspaces', ['ws-1', 'missing'])
+        assert loader.load('workspaces', 'ws-1')['name'] == 'Workspace 1'
+        assert loader.load('workspaces', 'missing') is None
+        assert workspaces.count('select') == 1
+        assert loader.stats()['hits'] == 2
+
+    def test_queued_keys_are_fetched_with_next_load(self, workspaces, loader):
+        loader.queue('workspaces', ['ws-0', 'ws-1'])
+        assert workspaces.count('select') == 0
+        loader.load('workspaces', 'ws-1')
+        loader.load('workspaces', 'ws-0')
+        assert workspaces.count('select') == 1
+
+    def test_returned_rows_are_copies(self, workspaces, loader):
+        loader.load('workspaces', 'ws-0')['name'] = 'modified'
+        assert loader.load('workspaces', 'ws-0')['name'] == 'Workspace 0'
+
+    def test_rows_are_memoized_per_user_jwt(self, workspaces, loader):
+        loader.load('workspaces', 'ws-0', user_jwt='a')
+        loader.load('workspaces', 'ws-0', user_jwt='b')
+        assert workspaces.count('select') == 2
+
+    def test_find_one_checks_other_filters(self, workspaces, loader):
+        assert loader.find_one('workspaces', {'id': 'ws-0', 'name': 'Workspace 0'})['id'] == 'ws-0'
+        assert loader.find_one('workspaces', {'id': 'ws-0', 'name': 'Other'}) is None
+
+    def test_nothing_is_memoized_outside_a_scope(self, workspaces):
+        loader = DataLoader()
+        loader.load('workspaces', 'ws-0')
+        loader.load('workspaces', 'ws-0')
+        assert workspaces.count('select') == 2
+        assert loader.stats()['entries'] == 0
+
+    def test_end_of_scope_drops_rows(self, workspaces, loader):
+        loader.load('workspaces', 'ws-0')
+        loader.end_request()
+        loader.begin_request()
+        loader.load('workspaces', 'ws-0')
+        assert workspaces.count('select') == 2
+
+
+class TestClearOnWrite:
+    """db writes invalidate memoized rows through the container loader."""
+
+    def test_find_one_is_served_by_the_loader_in_a_scope(self, workspaces):
+        @request_scope
+        def handler():
+            first = db.find_one('workspaces', {'id': 'ws-0'})
+            second = db.find_one('workspaces', {'id': 'ws-0'})
+            return first, second
+
+        first, second = handler()
+        assert first == second
+        assert workspaces.count('select') == 1
+        assert not get_data_loader().active
+
+    @pytest.mark.parametrize('write, expected_name', [
+        (lambda: db.update_one('workspaces', {'id': 'ws-0'}, {'name': 'Renamed'}), 'Renamed'),
+        (lambda: db.update_where('workspaces', {'id': ['ws-0']}, {'name': 'Renamed'}), 'Renamed'),
+        (lambda: db.insert_many('workspaces', [{'id': 'ws-9', 'name': 'New'}]), 'Workspace 0'),
+        (lambda: db.delete_one('workspaces', {'id': 'ws-0'}), None),
+    ], ids=['update_one', 'update_where', 'insert_many', 'delete_one'])
+    def test_write_drops_memoized_rows(self, workspaces, write, expected_name):
+        @request_scope
+        def handler():
+            db.find_one('workspaces', {'id': 'ws-0'})
+            write()
+            return db.find_one('workspaces', {'id': 'ws-0'})
+
+        row = handler()
+        assert workspaces.count('select') == 2
+        assert (row and row['name']) == expected_name
+
+    def test_write_to_another_table_keeps_rows(self, workspaces):
+        @request_scope
+        def handler():
+            db.find_one('workspaces', {'id': 'ws-0'})
+            db.insert_one('audit_log', {'id': 'a-1'})
+            db.find_one('workspaces', {'id': 'ws-0'})
+
+        handler()
+        assert workspaces.count('select') == 1
@@ -0,0 +1,68 @@
+-- ============================================================================
+-- Migration: Add load_auth_context RPC function
+-- Date: 2026-10-16
+-- Module: module-access
+-- ============================================================================
+-- Purpose: Return a user's sys, org and workspace roles in one round trip so
+-- Lambdas can answer check_sys_admin / check_org_admin / check_ws_admin and
+-- membership checks without one RPC each.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION load_auth_context(
+    p_user_id UUID,
+    p_org_id UUID DEFAULT NULL,
+    p_ws_id UUID DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_sys_role TEXT;
+    v_ws_org_id UUID;
+    v_ws_role TEXT;
+    v_org_id UUID;
+    v_org_role TEXT;
+BEGIN
+    SELECT sys_role INTO v_sys_role
+    FROM user_profiles
+    WHERE user_id = p_user_id;
+
+    IF p_ws_id IS NOT NULL THEN
+        SELECT org_id INTO v_ws_org_id
+        FROM workspaces
+        WHERE id = p_ws_id;
+
+        -- Same rule as check_ws_admin: only active memberships count
+        SELECT ws_role INTO v_ws_role
+        FROM ws_members
+        WHERE user_id = p_user_id
+        AND ws_id = p_ws_id
+        AND deleted_at IS NULL;
+    END IF;
+
+    v_org_id := COALESCE(p_org_id, v_ws_org_id);
+
+    IF v_org_id IS NOT NULL THEN
+        SELECT org_role INTO v_org_role
+        FROM org_members
+        WHERE user_id = p_user_id
+        AND org_id = v_org_id;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'user_id', p_user_id,
+        'sys_role', v_sys_role,
+        'org_id', v_org_id,
+        'org_role', v_org_role,
+        'ws_id', p_ws_id,
+        'ws_org_id', v_ws_org_id,
+        'ws_role', v_ws_role
+    );
+END;
+$$;
+
+COMMENT ON FUNCTION load_auth_context(UUID, UUID, UUID) IS 'Return sys, org and workspace roles for a user in one call (org defaults to the workspace''s org)';
+
+GRANT EXECUTE ON FUNCTION load_auth_context(UUID, UUID, UUID) TO authenticated;
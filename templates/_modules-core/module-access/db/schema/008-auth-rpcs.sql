@@ -11,6 +11,7 @@
 -- - common.check_sys_admin(user_id) -> calls check_sys_admin(p_user_id) RPC
 -- - common.check_org_admin(user_id, org_id) -> calls check_org_admin(p_user_id, p_org_id) RPC
 -- - common.check_ws_admin(user_id, ws_id) -> calls check_ws_admin(p_user_id, p_ws_id) RPC
+-- - common.load_auth_context(user_id, org_id, ws_id) -> calls load_auth_context(...) RPC
 --
 -- NAMING CONVENTION: check_* (not is_*) to avoid conflicts with existing functions
 -- that may exist in legacy databases with different signatures.
@@ -103,6 +104,73 @@ GRANT EXECUTE ON FUNCTION check_sys_admin(UUID) TO authenticated;
 GRANT EXECUTE ON FUNCTION check_org_admin(UUID, UUID) TO authenticated;
 GRANT EXECUTE ON FUNCTION check_ws_admin(UUID, UUID) TO authenticated;
 
+-- =============================================================================
+-- Authorization Context Preload
+-- =============================================================================
+-- Returns everything the check_* helpers need for one request in a single
+-- round trip: the user's sys role, their role in the org and workspace, and
+-- the workspace's org (so callers don't need a separate workspaces lookup).
+-- Called by common.load_auth_context(user_id, org_id, ws_id).
+
+CREATE OR REPLACE FUNCTION load_auth_context(
+    p_user_id UUID,
+    p_org_id UUID DEFAULT NULL,
+    p_ws_id UUID DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_sys_role TEXT;
+    v_ws_org_id UUID;
+    v_ws_role TEXT;
+    v_org_id UUID;
+    v_org_role TEXT;
+BEGIN
+    SELECT sys_role INTO v_sys_role
+    FROM user_profiles
+    WHERE user_id = p_user_id;
+
+    IF p_ws_id IS NOT NULL THEN
+        SELECT org_id INTO v_ws_org_id
+        FROM workspaces
+        WHERE id = p_ws_id;
+
+        -- Same rule as check_ws_admin: only active memberships count
+        SELECT ws_role INTO v_ws_role
+        FROM ws_members
+        WHERE user_id = p_user_id
+        AND ws_id = p_ws_id
+        AND deleted_at IS NULL;
+    END IF;
+
+    v_org_id := COALESCE(p_org_id, v_ws_org_id);
+
+    IF v_org_id IS NOT NULL THEN
+        SELECT org_role INTO v_org_role
+        FROM org_members
+        WHERE user_id = p_user_id
+        AND org_id = v_org_id;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'user_id', p_user_id,
+        'sys_role', v_sys_role,
+        'org_id', v_org_id,
+        'org_role', v_org_role,
+        'ws_id', p_ws_id,
+        'ws_org_id', v_ws_org_id,
+        'ws_role', v_ws_role
+    );
+END;
+$$;
+
+COMMENT ON FUNCTION load_auth_context(UUID, UUID, UUID) IS 'Return sys, org and workspace roles for a user in one call (org defaults to the workspace''s org)';
+
+GRANT EXECUTE ON FUNCTION load_auth_context(UUID, UUID, UUID) TO authenticated;
+
 -- =============================================================================
 -- ADR-019c: Resource Permission Authorization - Layer 2
 -- =============================================================================
@@ -365,6 +433,9 @@ GRANT EXECUTE ON FUNCTION can_manage_email_domains(UUID, UUID) TO authenticated;
 -- Test workspace admin check:
 -- SELECT check_ws_admin('user-uuid-here'::uuid, 'ws-uuid-here'::uuid);
 --
+-- Test auth context preload:
+-- SELECT load_auth_context('user-uuid-here'::uuid, NULL, 'ws-uuid-here'::uuid);
+--
 -- Test org permissions:
 -- SELECT can_view_org('user-uuid-here'::uuid, 'org-uuid-here'::uuid);
 -- SELECT can_edit_org('user-uuid-here'::uuid, 'org-uuid-here'::uuid);
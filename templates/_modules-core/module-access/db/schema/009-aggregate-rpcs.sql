@@ -0,0 +1,142 @@
+-- =============================================================================
+-- Aggregate RPC Functions
+-- =============================================================================
+-- Purpose: Server-side counts and sums, so Lambdas don't fetch whole row
+-- sets just to call len() on them
+-- Author: CORA Dev Toolkit
+-- Created: 2026-10-16
+--
+-- These functions are called by the org-common db helpers:
+-- - common.count_by(table, group_by, filters) -> aggregate_rows(table, 'count', NULL, group_by, filters)
+-- - common.count_many(table, column, values, filters) -> same, with column IN values
+-- - common.sum_column(table, column, filters) -> aggregate_rows(table, 'sum', column, NULL, filters)
+-- =============================================================================
+
+-- =============================================================================
+-- aggregate_column_type: Column type lookup (validates column names)
+-- =============================================================================
+-- Returns the SQL type of a column (e.g. 'uuid', 'character varying(255)'),
+-- raising if the table has no such column. Used by aggregate_rows to reject
+-- unknown identifiers and to cast JSON filter values to the column type.
+
+CREATE OR REPLACE FUNCTION aggregate_column_type(p_relid REGCLASS, p_column TEXT)
+RETURNS TEXT
+LANGUAGE plpgsql
+STABLE
+SET search_path = public
+AS $$
+DECLARE
+    v_type TEXT;
+BEGIN
+    SELECT format_type(a.atttypid, a.atttypmod) INTO v_type
+    FROM pg_attribute a
+    WHERE a.attrelid = p_relid
+      AND a.attname = p_column
+      AND a.attnum > 0
+      AND NOT a.attisdropped;
+
+    IF v_type IS NULL THEN
+        RAISE EXCEPTION 'Unknown column % on %', p_column, p_relid USING ERRCODE = '42703';
+    END IF;
+
+    RETURN v_type;
+END;
+$$;
+
+-- =============================================================================
+-- aggregate_rows: COUNT / SUM, optionally grouped, over filtered rows
+-- =============================================================================
+-- Called by org_common count_by(), count_many() and sum_column().
+--
+-- p_filters is a JSON object of column -> value (equality) or
+-- column -> array (IN). Values are bound as parameters and cast to the
+-- column type, so indexes on filter columns are used; identifiers are
+-- validated against the catalog and quoted.
+--
+-- SECURITY INVOKER: row level security applies as for a normal SELECT.
+--
+-- Returns one row per group (group_key NULL when ungrouped); groups with
+-- no rows are absent.
+
+CREATE OR REPLACE FUNCTION aggregate_rows(
+    p_table TEXT,
+    p_aggregate TEXT DEFAULT 'count',
+    p_column TEXT DEFAULT NULL,
+    p_group_by TEXT DEFAULT NULL,
+    p_filters JSONB DEFAULT '{}'::jsonb
+)
+RETURNS TABLE (group_key TEXT, value NUMERIC)
+LANGUAGE plpgsql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+    v_relid REGCLASS;
+    v_aggregate TEXT;
+    v_where TEXT := '';
+    v_key TEXT;
+    v_value JSONB;
+    v_type TEXT;
+BEGIN
+    v_relid := to_regclass(format('public.%I', p_table));
+    IF v_relid IS NULL THEN
+        RAISE EXCEPTION 'Unknown table %', p_table USING ERRCODE = '42P01';
+    END IF;
+
+    IF p_aggregate = 'count' THEN
+        v_aggregate := 'COUNT(*)::numeric';
+    ELSIF p_aggregate = 'sum' THEN
+        PERFORM aggregate_column_type(v_relid, p_column);
+        v_aggregate := format('COALESCE(SUM(%I), 0)::numeric', p_column);
+    ELSE
+        RAISE EXCEPTION 'Unsupported aggregate %', p_aggregate USING ERRCODE = '22023';
+    END IF;
+
+    FOR v_key, v_value IN SELECT e.key, e.value FROM jsonb_each(COALESCE(p_filters, '{}'::jsonb)) e LOOP
+        v_type := aggregate_column_type(v_relid, v_key);
+        IF jsonb_typeof(v_value) = 'null' THEN
+            v_where := v_where || format(' AND %I IS NULL', v_key);
+        ELSIF jsonb_typeof(v_value) = 'array' THEN
+            v_where := v_where || format(
+                ' AND %I = ANY (ARRAY(SELECT jsonb_array_elements_text($1->%L))::%s[])',
+                v_key, v_key, v_type
+            );
+        ELSE
+            v_where := v_where || format(' AND %I = ($1->>%L)::%s', v_key, v_key, v_type);
+        END IF;
+    END LOOP;
+
+    IF p_group_by IS NULL THEN
+        RETURN QUERY EXECUTE format(
+            'SELECT NULL::text, %s FROM %s WHERE TRUE%s',
+            v_aggregate, v_relid, v_where
+        ) USING p_filters;
+    ELSE
+        PERFORM aggregate_column_type(v_relid, p_group_by);
+        RETURN QUERY EXECUTE format(
+            'SELECT %I::text, %s FROM %s WHERE TRUE%s GROUP BY 1',
+            p_group_by, v_aggregate, v_relid, v_where
+        ) USING p_filters;
+    END IF;
+END;
+$$;
+
+-- =============================================================================
+-- Grant Permissions
+-- =============================================================================
+
+GRANT EXECUTE ON FUNCTION aggregate_rows(TEXT, TEXT, TEXT, TEXT, JSONB) TO authenticated;
+GRANT EXECUTE ON FUNCTION aggregate_rows(TEXT, TEXT, TEXT, TEXT, JSONB) TO service_role;
+
+-- =============================================================================
+-- Verification Queries
+-- =============================================================================
+-- Messages per chat session:
+-- SELECT * FROM aggregate_rows('chat_messages', 'count', NULL, 'session_id',
+--     '{"session_id": ["session-uuid-1", "session-uuid-2"]}'::jsonb);
+--
+-- Total document size of a KB:
+-- SELECT * FROM aggregate_rows('kb_docs', 'sum', 'file_size', NULL,
+--     '{"kb_id": "kb-uuid-here", "is_deleted": false}'::jsonb);
+-- =============================================================================
@@ -15,6 +15,9 @@ import org_common as common
 # Get Lambda function name from environment
 LAMBDA_FUNCTION_NAME = os.environ.get('AWS_LAMBDA_FUNCTION_NAME', 'ai-provider-function')
 
+# Fetch secrets during cold-start init rather than on the first request
+common.prefetch_secrets([os.environ.get('SUPABASE_SECRET_ARN')])
+
 # Error categorization patterns
 ERROR_CATEGORIES = {
     'requires_inference_profile': [
@@ -1129,41 +1132,31 @@ def _get_provider_credentials(provider: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     try:
-        # Handle Secrets Manager ARNs
+        # Handle Secrets Manager ARNs (cached per container, see org_common.secrets_cache)
         if credentials_path.startswith('arn:aws:secretsmanager:'):
-            secrets_client = boto3.client('secretsmanager')
             try:
-                response = secrets_client.get_secret_value(SecretId=credentials_path)
-                secret_string = response.get('SecretString')
-                if secret_string:
-                    # Try to parse as JSON
-                    try:
-                        return json.loads(secret_string)
-                    except json.JSONDecodeError:
-                        # If not JSON, return as simple value
-                        return {'value': secret_string}
-                else:
-                    raise ValueError(f'No SecretString in Secrets Manager response: {credentials_path}')
+                secret_string = common.get_secret_string(credentials_path)
             except Exception as sm_error:
                 raise ValueError(f'Failed to retrieve secret from Secrets Manager: {str(sm_error)}')
+            # Try to parse as JSON
+            try:
+                return json.loads(secret_string)
+            except json.JSONDecodeError:
+                # If not JSON, return as simple value
+                return {'value': secret_string}
         
         # Handle SSM Parameter Store paths (starting with '/')
         elif credentials_path.startswith('/'):
-            ssm_client = boto3.client('ssm')
             try:
-                response = ssm_client.get_parameter(Name=credentials_path, WithDecryption=True)
-                parameter_value = response.get('Parameter', {}).get('Value')
-                if parameter_value:
-                    # Try to parse as JSON
-                    try:
-                        return json.loads(parameter_value)
-                    except json.JSONDecodeError:
-                        # If not JSON, return as simple value
-                        return {'value': parameter_value}
-                else:
-                    raise ValueError(f'No value in SSM Parameter Store response: {credentials_path}')
+                parameter_value = common.get_parameter(credentials_path)
             except Exception as ssm_error:
                 raise ValueError(f'Failed to retrieve secret from SSM Parameter Store: {str(ssm_error)}')
+            # Try to parse as JSON
+            try:
+                return json.loads(parameter_value)
+            except json.JSONDecodeError:
+                # If not JSON, return as simple value
+                return {'value': parameter_value}
         
         else:
             raise ValueError(f'Invalid credentials path format: {credentials_path}. Must start with "/" (SSM) or "arn:aws:secretsmanager:" (Secrets Manager)')
@@ -23,6 +23,9 @@ from typing import Any, Dict, List, Optional
 import org_common as common
 from chat_common.permissions import can_view_chat, can_edit_chat, is_chat_owner
 
+# RAG query embeddings
+QUERY_EMBEDDING_MODEL = 'text-embedding-ada-002'
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -600,15 +603,8 @@ def _retrieve_rag_context(
             'error': 'Failed to generate query embedding'
         }
     
-    # Search for similar chunks across all KBs
-    all_chunks = []
-    for kb_id in kb_ids:
-        try:
-            chunks = _search_kb_chunks(kb_id, query_embedding, top_k)
-            all_chunks.extend(chunks)
-        except Exception as e:
-            print(f'Error searching KB {kb_id}: {str(e)}')
-            continue
+    # Search for similar chunks across all KBs (one round trip)
+    all_chunks = _search_kb_chunks(kb_ids, query_embedding, top_k)
     
     if not all_chunks:
         return {
@@ -660,29 +656,35 @@ def _get_query_embedding(query: str) -> List[float]:
     Generate embedding for query using OpenAI ada-002.
     
     This function calls the embedding endpoint to convert the query
-    text into a vector for similarity search.
+    text into a vector for similarity search. Repeated queries are served
+    from the org_common embedding cache.
     
     Returns:
         List of floats representing the embedding vector
     """
+    return common.get_embedding(QUERY_EMBEDDING_MODEL, query, _embed_texts)
+
+
+def _embed_texts(texts: List[str]) -> List[List[float]]:
+    """
+    Embed texts with one OpenAI embeddings API call (vectors in input order).
+    """
     import os
-    import requests
-    
     # Get OpenAI API key from environment
     openai_api_key = os.environ.get('OPENAI_API_KEY')
     if not openai_api_key:
         raise Exception('OPENAI_API_KEY not configured')
     
     # Call OpenAI embeddings API
-    response = requests.post(
+    response = common.get_http_session().post(
         'https://api.openai.com/v1/embeddings',
         headers={
             'Authorization': f'Bearer {openai_api_key}',
             'Content-Type': 'application/json'
         },
         json={
-            'model': 'text-embedding-ada-002',
-            'input': query
+            'model': QUERY_EMBEDDING_MODEL,
+            'input': texts
         },
         timeout=30
     )
@@ -691,28 +693,27 @@ def _get_query_embedding(query: str) -> List[float]:
         raise Exception(f'OpenAI API error: {response.status_code} {response.text}')
     
     result = response.json()
-    embedding = result['data'][0]['embedding']
-    
-    return embedding
+    return [item['embedding'] for item in sorted(result['data'], key=lambda item: item['index'])]
 
 
 def _search_kb_chunks(
-    kb_id: str,
+    kb_ids: List[str],
     query_embedding: List[float],
     top_k: int
 ) -> List[Dict[str, Any]]:
     """
     Search KB chunks using pgvector similarity search.
     
-    Uses the RPC function from module-kb to perform vector search.
+    Uses the RPC function from module-kb to perform vector search across
+    all KBs in one call.
     
     Args:
-        kb_id: Knowledge base ID to search
+        kb_ids: Knowledge base IDs to search
         query_embedding: Query embedding vector
-        top_k: Number of results to return
+        top_k: Number of results to return (across all KBs)
     
     Returns:
-        List of chunk dictionaries with content and metadata
+        List of chunk dictionaries with content and metadata, most similar first
     """
     # Call the KB search RPC function
     # This RPC is provided by module-kb
@@ -722,7 +723,7 @@ def _search_kb_chunks(
 'search_kb_chunks',
             
 {
-                'p_kb_id': kb_id,
+                'p_kb_ids': list(kb_ids),
                 'p_query_embedding': query_embedding,
                 'p_top_k': top_k,
                 'p_similarity_threshold': 0.7  # Minimum similarity score
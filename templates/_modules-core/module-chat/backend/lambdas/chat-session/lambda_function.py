@@ -59,6 +59,7 @@ import org_common as common
 from chat_common.permissions import can_view_chat, can_edit_chat, is_chat_owner
 
 
+@common.request_scope
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for chat session operations.
@@ -289,28 +290,16 @@ def handle_list_workspace_chats(
     )
     filter_type = query_params.get('filter', 'all')
     
-    # Verify user has access to workspace
-    ws_membership = common.find_one(
-        table='ws_members',
-        filters={
-            'ws_id': ws_id,
-            'user_id': user_id
-        }
-    )
+    # Verify user has access to workspace (membership and workspace org in one round trip)
+    auth_context = common.load_auth_context(user_id, ws_id=ws_id)
     
-    if not ws_membership or ws_membership.get('deleted_at'):
+    if not auth_context.is_ws_member:
         raise common.ForbiddenError('You do not have access to this workspace')
     
-    # Get workspace to find org_id
-    workspace = common.find_one(
-        table='workspaces',
-        filters={'id': ws_id}
-    )
-    
-    if not workspace:
+    if not auth_context.workspace_exists:
         raise common.NotFoundError('Workspace not found')
     
-    org_id = workspace['org_id']
+    org_id = auth_context.ws_org_id
     
     # Build query based on filter
     if filter_type == 'mine':
@@ -441,25 +430,13 @@ def handle_create_workspace_chat(
     """
     ws_id = common.validate_uuid(ws_id, 'wsId')
     
-    # Verify user has access to workspace
-    ws_membership = common.find_one(
-        table='ws_members',
-        filters={
-            'ws_id': ws_id,
-            'user_id': user_id
-        }
-    )
+    # Verify user has access to workspace (membership and workspace org in one round trip)
+    auth_context = common.load_auth_context(user_id, ws_id=ws_id)
     
-    if not ws_membership or ws_membership.get('deleted_at'):
+    if not auth_context.is_ws_member:
         raise common.ForbiddenError('You do not have access to this workspace')
     
-    # Get workspace to find org_id
-    workspace = common.find_one(
-        table='workspaces',
-        filters={'id': ws_id}
-    )
-    
-    if not workspace:
+    if not auth_context.workspace_exists:
         raise common.NotFoundError('Workspace not found')
     
     body = json.loads(event.get('body', '{}'))
@@ -475,7 +452,7 @@ def handle_create_workspace_chat(
     chat_data = {
         'title': title,
         'ws_id': ws_id,
-        'org_id': workspace['org_id'],
+        'org_id': auth_context.ws_org_id,
         'created_by': user_id,
         'is_shared_with_workspace': is_shared_with_workspace,
         'metadata': json.dumps({'messageCount': 0}),
@@ -924,15 +901,15 @@ def handle_list_shares(user_id: str, session_id: str) -> Dict[str, Any]:
         order='created_at.asc'
     )
     
-    # Enrich with user info
+    # Enrich with user info (one query for all profiles)
+    profiles = common.load_many(
+        'user_profiles',
+        [share['shared_with_user_id'] for share in shares],
+        column='user_id'
+    )
+    
     result = []
-    for share in shares:
-        # Get user profile
-        profile = common.find_one(
-            table='user_profiles',
-            filters={'user_id': share['shared_with_user_id']}
-        )
-        
+    for share, profile in zip(shares, profiles):
         result.append({
             'id': share['id'],
             'sessionId': share['session_id'],
@@ -1632,22 +1609,20 @@ def _enrich_chat_list(chats: List[Dict], user_id: str) -> List[Dict]:
     """
     Enrich list of chats with metadata for list view.
     """
-    result = []
-    for chat in chats:
-        formatted = _format_chat_response(chat, user_id)
-        
-        # Add message count if not already in metadata
+    result = [_format_chat_response(chat, user_id) for chat in chats]
+    
+    # Count messages for chats without a count in metadata (one request for the whole list)
+    uncounted_ids = [
+        chat['id'] for chat, formatted in zip(chats, result)
+        if 'messageCount' not in formatted['metadata']
+    ]
+    message_counts = common.count_many('chat_messages', 'session_id', uncounted_ids)
+    
+    for chat, formatted in zip(chats, result):
         if 'messageCount' not in formatted['metadata']:
-            messages = common.find_many(
-                table='chat_messages',
-                filters={'session_id': chat['id']},
-                select='id'
-            )
-            formatted['messageCount'] = len(messages)
+            formatted['messageCount'] = message_counts.get(chat['id'], 0)
         else:
             formatted['messageCount'] = formatted['metadata'].get('messageCount', 0)
-        
-        result.append(formatted)
     
     return result
 
@@ -15,11 +15,12 @@ Request Body:
     "model": "gpt-4",  // optional model override
     "temperature": 0.7,  // optional temperature
     "maxTokens": 4096,  // optional max tokens
-    "systemPrompt": "Custom system prompt"  // optional system prompt
+    "systemPrompt": "Custom system prompt",  // optional system prompt
+    "contextTokenBudget": 4000  // optional prompt token budget
 }
 
 Response: Server-Sent Events (SSE) stream
-- data: {"type": "session", "sessionId": "...", "messageId": "..."}
+- data: {"type": "session", "sessionId": "...", "messageId": "...", "timings": {...}, "promptTokens": 1234}
 - data: {"type": "chunk", "content": "..."}
 - data: {"type": "context", "citations": [...]}
 - data: {"type": "complete", "message": {...}}
@@ -29,7 +30,11 @@ Response: Server-Sent Events (SSE) stream
 
 import json
 import os
+import time
+import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, Generator, List, Optional, Union
 import org_common as common
 from chat_common.permissions import can_view_chat, can_edit_chat, is_chat_owner
@@ -42,9 +47,49 @@ logger.setLevel(logging.INFO)
 DEFAULT_MODEL = 'gpt-4'
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_MAX_TOKENS = 4096
-DEFAULT_HISTORY_LIMIT = 10
+DEFAULT_HISTORY_LIMIT = 20  # Upper bound; _assemble_prompt keeps what fits the token budget
 DEFAULT_RAG_TOP_K = 5
 DEFAULT_SIMILARITY_THRESHOLD = 0.7
+FALLBACK_SIMILARITY_THRESHOLD = 0.5  # Generic queries ("summarize ...") with no close matches
+QUERY_EMBEDDING_MODEL = 'text-embedding-ada-002'
+
+# Threads for the concurrent pre-stream lookups (auth checks, RAG, history)
+PIPELINE_MAX_WORKERS = 8
+
+# Prompt assembly (see _assemble_prompt)
+DEFAULT_CONTEXT_TOKEN_BUDGET = int(os.environ.get('CHAT_CONTEXT_TOKEN_BUDGET', '4000'))
+MIN_CONTEXT_TOKEN_BUDGET = 256
+DEFAULT_CONTEXT_WINDOW = 8192  # Caps the prompt budget of models not listed below
+MODEL_CONTEXT_WINDOWS = (  # (model ID prefix, context window), most specific first
+    ('gpt-4.1', 1047576),
+    ('gpt-4o', 128000),
+    ('gpt-4-turbo', 128000),
+    ('gpt-4-32k', 32768),
+    ('gpt-4', 8192),
+    ('gpt-5', 400000),
+    ('gpt-3.5-turbo', 16385),
+    ('o1-mini', 128000),
+    ('o1-preview', 128000),
+    ('o1', 200000),
+    ('o3', 200000),
+    ('o4', 200000),
+    ('claude-', 200000),
+    ('anthropic.claude', 200000),
+    ('meta.llama3-1', 128000),
+    ('meta.llama3-2', 128000),
+    ('meta.llama3-3', 128000),
+    ('meta.llama3', 8192),
+    ('amazon.nova-micro', 128000),
+    ('amazon.nova', 300000),
+    ('amazon.titan-text-premier', 32000),
+    ('amazon.titan-text', 8192),
+)
+BEDROCK_PROFILE_PREFIXES = ('us.', 'us-gov.', 'eu.', 'apac.', 'global.')  # Cross-region inference profiles
+RAG_CONTEXT_BUDGET_SHARE = 0.6  # Max share of the budget left after system prompt + message
+MESSAGE_OVERHEAD_TOKENS = 4  # Role and separator tokens per chat message
+REPLY_PRIMING_TOKENS = 3  # Tokens that prime the assistant reply
+FALLBACK_ENCODING = 'cl100k_base'  # For models tiktoken doesn't know (Claude, Bedrock)
+ENCODER_CACHE_SIZE = 32  # Models whose encoder lookup is cached
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -148,27 +193,13 @@ def response_stream_handler(event: Dict[str, Any], context: Any) -> Generator[st
     ```
     """
     try:
+        timings: Dict[str, float] = {}
+        
         # Extract user info from authorizer
         user_info = common.get_user_from_event(event)
         okta_uid = user_info['user_id']
-        supabase_user_id = common.get_supabase_user_id_from_okta_uid(okta_uid)
-        
-        # Get org_id for multi-tenancy (CORA Compliance)
-        user = common.find_one(
-            table='user_profiles',
-            filters={'user_id': supabase_user_id}
-        )
         
-        if not user:
-            yield _sse_event('error', {'message': 'User profile not found'})
-            return
-        
-        org_id = user.get('current_org_id') or user.get('org_id')
-        if not org_id:
-            yield _sse_event('error', {'message': 'User not associated with an organization'})
-            return
-        
-        # Extract session ID
+        # Extract session ID (validated up front so the lookups can start together)
         path_params = event.get('pathParameters', {}) or {}
         session_id = path_params.get('sessionId')
         
@@ -181,23 +212,34 @@ def response_stream_handler(event: Dict[str, Any], context: Any) -> Generator[st
         # Parse request body
         body = json.loads(event.get('body', '{}'))
         
-        # 1. Fetch resource (ADR-019c)
-        session = common.find_one(
-            table='chat_sessions',
-            filters={'id': session_id, 'is_deleted': False}
-        )
+        # Profile, session and permission lookups run concurrently
+        lookups = _timed(timings, 'authorize', _load_stream_context, okta_uid, session_id, timings)
+        supabase_user_id = lookups['user_id']
+        user = lookups['user']
+        session = lookups['session']
+        
+        # Get org_id for multi-tenancy (CORA Compliance)
+        if not user:
+            yield _sse_event('error', {'message': 'User profile not found'})
+            return
         
+        org_id = user.get('current_org_id') or user.get('org_id')
+        if not org_id:
+            yield _sse_event('error', {'message': 'User not associated with an organization'})
+            return
+        
+        # 1. Fetch resource (ADR-019c)
         if not session:
             yield _sse_event('error', {'message': 'Chat session not found'})
             return
         
         # 2. Verify org membership (ADR-019c: MUST come before permission check)
-        if not common.can_access_org_resource(supabase_user_id, session['org_id']):
+        if not lookups['is_org_member']:
             yield _sse_event('error', {'message': 'Not a member of organization'})
             return
         
         # 3. Check resource permission (ADR-019c)
-        if not can_edit_chat(supabase_user_id, session_id):
+        if not lookups['can_edit']:
             yield _sse_event('error', {'message': 'You do not have permission to send messages to this chat'})
             return
         
@@ -210,8 +252,9 @@ def response_stream_handler(event: Dict[str, Any], context: Any) -> Generator[st
         kb_ids = body.get('kbIds')
         model = body.get('model', DEFAULT_MODEL)
         temperature = body.get('temperature', DEFAULT_TEMPERATURE)
-        max_tokens = body.get('maxTokens', DEFAULT_MAX_TOKENS)
+        max_tokens = common.validate_integer(body.get('maxTokens', DEFAULT_MAX_TOKENS), 'maxTokens', min_value=1)
         system_prompt = body.get('systemPrompt')
+        context_budget = _get_context_budget(body.get('contextTokenBudget'), model, max_tokens)
         
         # Stream the response
         yield from _stream_ai_response(
@@ -223,7 +266,9 @@ def response_stream_handler(event: Dict[str, Any], context: Any) -> Generator[st
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            context_budget=context_budget,
+            timings=timings
         )
         
     except Exception as e:
@@ -233,6 +278,54 @@ def response_stream_handler(event: Dict[str, Any], context: Any) -> Generator[st
         yield _sse_event('error', {'message': str(e)})
 
 
+def _load_stream_context(okta_uid: str, session_id: str, timings: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Run the streaming handler's lookups concurrently.
+    
+    Stage 1: resolve the Supabase user ID || fetch the chat session
+    Stage 2: user profile || org membership || chat permission
+    
+    Every check runs, but the caller evaluates the results in the ADR-019c
+    order (resource, org membership, then permission), so the error a user
+    sees is the same as with sequential checks.
+    """
+    with ThreadPoolExecutor(max_workers=PIPELINE_MAX_WORKERS) as executor:
+        user_id_future = executor.submit(
+            _timed, timings, 'resolveUser',
+            common.get_supabase_user_id_from_okta_uid, okta_uid
+        )
+        session_future = executor.submit(
+            _timed, timings, 'fetchSession',
+            common.find_one, 'chat_sessions', {'id': session_id, 'is_deleted': False}
+        )
+        
+        supabase_user_id = user_id_future.result()
+        profile_future = executor.submit(
+            _timed, timings, 'fetchProfile',
+            common.find_one, 'user_profiles', {'user_id': supabase_user_id}
+        )
+        can_edit_future = executor.submit(
+            _timed, timings, 'checkPermission',
+            can_edit_chat, supabase_user_id, session_id
+        )
+        
+        session = session_future.result()
+        is_org_member = False
+        if session:
+            is_org_member = _timed(
+                timings, 'checkOrgMembership',
+                common.can_access_org_resource, supabase_user_id, session['org_id']
+            )
+        
+        return {
+            'user_id': supabase_user_id,
+            'user': profile_future.result(),
+            'session': session,
+            'is_org_member': is_org_member,
+            'can_edit': bool(session) and can_edit_future.result(),
+        }
+
+
 def handle_stream_sync(
     event: Dict[str, Any],
     user_id: str,
@@ -272,8 +365,9 @@ def handle_stream_sync(
     kb_ids = body.get('kbIds')
     model = body.get('model', DEFAULT_MODEL)
     temperature = body.get('temperature', DEFAULT_TEMPERATURE)
-    max_tokens = body.get('maxTokens', DEFAULT_MAX_TOKENS)
+    max_tokens = common.validate_integer(body.get('maxTokens', DEFAULT_MAX_TOKENS), 'maxTokens', min_value=1)
     system_prompt = body.get('systemPrompt')
+    context_budget = _get_context_budget(body.get('contextTokenBudget'), model, max_tokens)
     
     # Get complete response (non-streaming)
     result = _get_ai_response_sync(
@@ -285,7 +379,8 @@ def handle_stream_sync(
         model=model,
         temperature=temperature,
         max_tokens=max_tokens,
-        system_prompt=system_prompt
+        system_prompt=system_prompt,
+        context_budget=context_budget
     )
     
     return common.success_response(result)
@@ -304,94 +399,72 @@ def _stream_ai_response(
     model: str,
     temperature: float,
     max_tokens: int,
-    system_prompt: Optional[str]
+    system_prompt: Optional[str],
+    context_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET,
+    timings: Optional[Dict[str, float]] = None
 ) -> Generator[str, None, None]:
     """
     Stream AI response with RAG grounding.
     
     Flow based on production pm-app-stack patterns:
-    1. Send session info first
-    2. Save user message in DB
-    3. Retrieve RAG context from grounded KBs
-    4. Get conversation history
-    5. Build messages array with system prompt + context + history
-    6. Call AI provider streaming API
-    7. Yield chunks as SSE events
-    8. Save assistant message after completion
-    9. Send complete event with usage
-    """
-    import uuid
+    1. Prepare concurrently (see _prepare_response): save user message,
+       retrieve RAG context from grounded KBs, get conversation history
+       and the AI provider
+    2. Pack system prompt + RAG context + history into the token budget
+       (see _assemble_prompt)
+    3. Send session info (with per-stage timings and prompt tokens) and
+       citations of the sources in the prompt
+    4. Call AI provider streaming API
+    5. Yield chunks as SSE events
+    6. Save assistant message after completion
+    7. Send complete event with usage (the provider's token counts where
+       it reports them, else the local estimates)
+    """
     from datetime import datetime
     
     response_id = str(uuid.uuid4())
+    timings = dict(timings or {})
     
-    # Step 1: Send session info first (production pattern)
-    yield _sse_event('session', {
-        'sessionId': session_id,
-        'messageId': response_id
-    })
-    
-    # Step 2: Save user message
-    user_msg = _create_user_message(session_id, user_message, user_id)
-    
-    # Step 3: Get RAG context
-    rag_context = None
-    citations = []
-    has_rag_context = False
-    
-    if kb_ids is None:
-        # Use session's grounded KBs
-        try:
-            grounded_kbs = common.rpc(
-                
-'get_grounded_kbs_for_chat',
-                
-{'p_session_id': session_id}
-            )
-            kb_ids = [kb['kb_id'] for kb in grounded_kbs if kb.get('is_enabled', True)]
-        except Exception as e:
-            logger.warning(f'Failed to get grounded KBs: {str(e)}')
-            kb_ids = []
-    
-    if kb_ids:
-        try:
-            rag_result = _retrieve_rag_context(user_message, kb_ids, DEFAULT_RAG_TOP_K, user_id)
-            rag_context = rag_result.get('context')
-            citations = rag_result.get('citations', [])
-            has_rag_context = bool(rag_context)
-            
-            if citations:
-                yield _sse_event('context', {
-                    'citations': citations,
-                    'tokensUsed': rag_result.get('tokensUsed', 0)
-                })
-        except Exception as e:
-            logger.warning(f'RAG retrieval error: {str(e)}')
-            # Continue without RAG context
-    
-    # Step 4: Get conversation history
-    history = _get_conversation_history(session_id, DEFAULT_HISTORY_LIMIT)
+    # Step 1: Independent lookups run concurrently
+    prepared = _timed(
+        timings, 'prepare',
+        _prepare_response, session_id, session, user_id, user_message, kb_ids, model, timings
+    )
+    provider = prepared['provider']
     
-    # Step 5: Build messages array with RAG awareness
-    messages = _build_messages_array(
+    # Step 2: Build messages array within the token budget
+    prompt = _timed(
+        timings, 'assemble',
+        _assemble_prompt,
         system_prompt=system_prompt,
-        rag_context=rag_context,
-        history=history,
+        rag_chunks=prepared['rag_chunks'],
+        history=prepared['history'],
         user_message=user_message,
         session=session,
-        has_rag_context=has_rag_context
+        model=model,
+        budget=context_budget
     )
+    messages = prompt['messages']
+    citations = prompt['citations']
+    prompt_tokens = prompt['promptTokens']
     
-    # Step 6: Determine provider and stream
-    provider = _get_ai_provider(session.get('org_id'), model)
+    # Step 3: Send session info first (production pattern)
+    yield _sse_event('session', {
+        'sessionId': session_id,
+        'messageId': response_id,
+        'timings': timings,
+        'promptTokens': prompt_tokens
+    })
     
-    # Count prompt tokens
-    system_content = messages[0]['content'] if messages else ''
-    prompt_tokens = _count_tokens(system_content + user_message, model)
+    if citations:
+        yield _sse_event('context', {
+            'citations': citations,
+            'tokensUsed': prompt['ragTokens']
+        })
     
-    # Step 7: Stream from provider
+    # Step 4-5: Stream from provider
     full_content = ''
-    completion_tokens = 0
+    provider_usage = {}  # Token counts reported by the provider
     was_truncated = False
     
     try:
@@ -401,7 +474,7 @@ def _stream_ai_response(
                     full_content += event['content']
                     yield _sse_event('chunk', {'content': event['content']})
                 elif event['type'] == 'usage':
-                    completion_tokens = event['usage'].get('completion_tokens', 0)
+                    provider_usage.update({k: v for k, v in event['usage'].items() if v})
                 elif event['type'] == 'truncated':
                     was_truncated = True
                     
@@ -411,7 +484,7 @@ def _stream_ai_response(
                     full_content += event['content']
                     yield _sse_event('chunk', {'content': event['content']})
                 elif event['type'] == 'usage':
-                    completion_tokens = event['usage'].get('completion_tokens', 0)
+                    provider_usage.update({k: v for k, v in event['usage'].items() if v})
                 elif event['type'] == 'truncated':
                     was_truncated = True
                     
@@ -421,7 +494,7 @@ def _stream_ai_response(
                     full_content += event['content']
                     yield _sse_event('chunk', {'content': event['content']})
                 elif event['type'] == 'usage':
-                    completion_tokens = event['usage'].get('completion_tokens', 0)
+                    provider_usage.update({k: v for k, v in event['usage'].items() if v})
                 elif event['type'] == 'truncated':
                     was_truncated = True
         else:
@@ -435,9 +508,9 @@ def _stream_ai_response(
         yield _sse_event('error', {'error': f'AI provider error: {str(e)}'})
         return
     
-    # Calculate completion tokens if not provided by API
-    if completion_tokens == 0:
-        completion_tokens = _count_tokens(full_content, model)
+    # Prefer the provider's counts; estimate locally where it sent none
+    prompt_tokens = provider_usage.get('prompt_tokens') or prompt_tokens
+    completion_tokens = provider_usage.get('completion_tokens') or _count_tokens(full_content, model)
     
     total_tokens = prompt_tokens + completion_tokens
     
@@ -447,7 +520,7 @@ def _stream_ai_response(
         'total_tokens': total_tokens
     }
     
-    # Step 8: Save assistant message
+    # Step 6: Save assistant message
     metadata = {
         'model': model,
         'temperature': temperature,
@@ -466,7 +539,7 @@ def _stream_ai_response(
         was_truncated=was_truncated
     )
     
-    # Step 9: Send complete event with full message info (production pattern)
+    # Step 7: Send complete event with full message info (production pattern)
     complete_message = {
         'id': assistant_msg['id'],
         'message': full_content,
@@ -494,51 +567,32 @@ def _get_ai_response_sync(
     model: str,
     temperature: float,
     max_tokens: int,
-    system_prompt: Optional[str]
+    system_prompt: Optional[str],
+    context_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET
 ) -> Dict[str, Any]:
     """
     Get AI response synchronously (non-streaming).
     
     Used for testing or when streaming is not available.
     """
-    # Save user message
-    user_msg = _create_user_message(session_id, user_message, user_id)
+    # Save user message, get RAG context, history and provider (concurrently)
+    timings: Dict[str, float] = {}
+    prepared = _prepare_response(session_id, session, user_id, user_message, kb_ids, model, timings)
+    user_msg = prepared['user_message']
+    provider = prepared['provider']
     
-    # Get RAG context
-    rag_context = None
-    citations = []
-    
-    if kb_ids is None:
-        grounded_kbs = common.rpc(
-            
-'get_grounded_kbs_for_chat',
-            
-{'p_session_id': session_id}
-        )
-        kb_ids = [kb['kb_id'] for kb in grounded_kbs if kb.get('is_enabled', True)]
-    
-    if kb_ids:
-        try:
-            rag_result = _retrieve_rag_context(user_message, kb_ids, DEFAULT_RAG_TOP_K, user_id)
-            rag_context = rag_result.get('context')
-            citations = rag_result.get('citations', [])
-        except Exception as e:
-            print(f'RAG retrieval error: {str(e)}')
-    
-    # Get conversation history
-    history = _get_conversation_history(session_id, DEFAULT_HISTORY_LIMIT)
-    
-    # Build messages array
-    messages = _build_messages_array(
+    # Build messages array within the token budget
+    prompt = _assemble_prompt(
         system_prompt=system_prompt,
-        rag_context=rag_context,
-        history=history,
+        rag_chunks=prepared['rag_chunks'],
+        history=prepared['history'],
         user_message=user_message,
-        session=session
+        session=session,
+        model=model,
+        budget=context_budget
     )
-    
-    # Get provider
-    provider = _get_ai_provider(session.get('org_id'), model)
+    messages = prompt['messages']
+    citations = prompt['citations']
     
     # Get response (non-streaming)
     if provider['type'] == 'openai':
@@ -570,10 +624,119 @@ def _get_ai_response_sync(
     return {
         'userMessage': user_msg,
         'assistantMessage': assistant_msg,
-        'citations': citations
+        'citations': citations,
+        'promptTokens': prompt['promptTokens']
     }
 
 
+# =============================================================================
+# CONCURRENT PREPARATION
+# =============================================================================
+
+def _timed(timings: Dict[str, float], stage: str, fn, *args, **kwargs):
+    """Call fn(*args, **kwargs), recording its duration in ms as timings[stage]."""
+    start = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        timings[stage] = round((time.perf_counter() - start) * 1000, 1)
+
+
+def _get_grounded_kb_ids(session_id: str) -> List[str]:
+    """IDs of the session's enabled grounded KBs ([] if they can't be loaded)."""
+    try:
+        grounded_kbs = common.rpc(
+            
+'get_grounded_kbs_for_chat',
+            
+{'p_session_id': session_id}
+        )
+        return [kb['kb_id'] for kb in grounded_kbs or [] if kb.get('is_enabled', True)]
+    except Exception as e:
+        logger.warning(f'Failed to get grounded KBs: {str(e)}')
+        return []
+
+
+def _prepare_response(
+    session_id: str,
+    session: Dict[str, Any],
+    user_id: str,
+    user_message: str,
+    kb_ids: Optional[List[str]],
+    model: str,
+    timings: Dict[str, float]
+) -> Dict[str, Any]:
+    """
+    Everything needed before calling the AI provider, with independent
+    steps running concurrently:
+    
+        save user message ───────────────────────────────────┐
+        conversation history ────────────────────────────────┤
+        AI provider config ──────────────────────────────────┤
+        grounded KBs ─> query embedding ─> KB search ────────┴─> ready
+    
+    The user message is inserted with a pre-generated ID, so the history
+    query can exclude it whether or not the insert has landed yet. The
+    insert is joined before returning: if it fails, nothing is sent to
+    the provider.
+    
+    Stage durations (ms) are recorded in `timings`.
+    
+    Returns:
+        {'user_message', 'rag_chunks', 'history', 'provider'}
+    """
+    user_message_id = str(uuid.uuid4())
+    
+    with ThreadPoolExecutor(max_workers=PIPELINE_MAX_WORKERS) as executor:
+        user_message_future = executor.submit(
+            _timed, timings, 'saveUserMessage',
+            _create_user_message, session_id, user_message, user_id, user_message_id
+        )
+        history_future = executor.submit(
+            _timed, timings, 'history',
+            _get_conversation_history, session_id, DEFAULT_HISTORY_LIMIT, user_message_id
+        )
+        provider_future = executor.submit(
+            _timed, timings, 'provider',
+            _get_ai_provider, session.get('org_id'), model
+        )
+        
+        # RAG: explicit KB IDs let the embedding start right away
+        embedding_future = None
+        if kb_ids:
+            embedding_future = executor.submit(_timed, timings, 'embedding', _get_query_embedding, user_message)
+        if kb_ids is None:
+            # Use session's grounded KBs
+            kb_ids = _timed(timings, 'groundedKbs', _get_grounded_kb_ids, session_id)
+            if kb_ids:
+                embedding_future = executor.submit(_timed, timings, 'embedding', _get_query_embedding, user_message)
+        
+        rag_result = {}
+        if embedding_future is not None:
+            try:
+                query_embedding = embedding_future.result()
+            except Exception as e:
+                logger.error(f'Error generating embedding: {str(e)}')
+                query_embedding = None
+            if query_embedding is not None:
+                try:
+                    rag_result = _timed(
+                        timings, 'kbSearch',
+                        _retrieve_rag_context, user_message, kb_ids, DEFAULT_RAG_TOP_K, user_id,
+                        query_embedding=query_embedding
+                    )
+                except Exception as e:
+                    logger.warning(f'RAG retrieval error: {str(e)}')
+                    # Continue without RAG context
+        
+        return {
+            'user_message': user_message_future.result(),
+            'rag_chunks': rag_result.get('chunks', []),
+            'history': history_future.result(),
+            'provider': provider_future.result(),
+        }
+
+
 # =============================================================================
 # PROVIDER INTEGRATION
 # =============================================================================
@@ -631,6 +794,19 @@ def _get_ai_provider(org_id: Optional[str], model: str) -> Dict[str, Any]:
         }
 
 
+def _release_stream(response) -> None:
+    """
+    Read the rest of a streamed provider response (normally just the stream
+    terminator), so its connection goes back to the shared pool instead of
+    being closed.
+    """
+    try:
+        for _ in response.iter_content(chunk_size=None):
+            pass
+    except Exception:
+        response.close()
+
+
 # =============================================================================
 # OPENAI STREAMING
 # =============================================================================
@@ -645,15 +821,13 @@ def _stream_openai(
     """
     Stream response from OpenAI API.
     """
-    import requests
-    
     api_key = provider.get('api_key')
     if not api_key:
         raise Exception('OpenAI API key not configured')
     
     base_url = provider.get('base_url', 'https://api.openai.com/v1')
     
-    response = requests.post(
+    response = common.get_http_session().post(
         f'{base_url}/chat/completions',
         headers={
             'Authorization': f'Bearer {api_key}',
@@ -710,6 +884,8 @@ def _stream_openai(
                         }
                 except json.JSONDecodeError:
                     continue
+    
+    _release_stream(response)
 
 
 def _call_openai_sync(
@@ -722,15 +898,13 @@ def _call_openai_sync(
     """
     Call OpenAI API synchronously (non-streaming).
     """
-    import requests
-    
     api_key = provider.get('api_key')
     if not api_key:
         raise Exception('OpenAI API key not configured')
     
     base_url = provider.get('base_url', 'https://api.openai.com/v1')
     
-    response = requests.post(
+    response = common.get_http_session().post(
         f'{base_url}/chat/completions',
         headers={
             'Authorization': f'Bearer {api_key}',
@@ -772,8 +946,6 @@ def _stream_anthropic(
     """
     Stream response from Anthropic API.
     """
-    import requests
-    
     api_key = provider.get('api_key')
     if not api_key:
         raise Exception('Anthropic API key not configured')
@@ -800,7 +972,7 @@ def _stream_anthropic(
     if system_content:
         request_body['system'] = system_content
     
-    response = requests.post(
+    response = common.get_http_session().post(
         f'{base_url}/v1/messages',
         headers={
             'x-api-key': api_key,
@@ -824,7 +996,16 @@ def _stream_anthropic(
                     event = json.loads(data)
                     event_type = event.get('type')
                     
-                    if event_type == 'content_block_delta':
+                    if event_type == 'message_start':
+                        # Prompt tokens are only reported here
+                        usage = event.get('message', {}).get('usage')
+                        if usage:
+                            yield {
+                                'type': 'usage',
+                                'usage': {'prompt_tokens': usage.get('input_tokens', 0)}
+                            }
+                    
+                    elif event_type == 'content_block_delta':
                         delta = event.get('delta', {})
                         if delta.get('type') == 'text_delta':
                             text = delta.get('text', '')
@@ -854,6 +1035,8 @@ def _stream_anthropic(
                         
                 except json.JSONDecodeError:
                     continue
+    
+    _release_stream(response)
 
 
 def _call_anthropic_sync(
@@ -866,8 +1049,6 @@ def _call_anthropic_sync(
     """
     Call Anthropic API synchronously (non-streaming).
     """
-    import requests
-    
     api_key = provider.get('api_key')
     if not api_key:
         raise Exception('Anthropic API key not configured')
@@ -893,7 +1074,7 @@ def _call_anthropic_sync(
     if system_content:
         request_body['system'] = system_content
     
-    response = requests.post(
+    response = common.get_http_session().post(
         f'{base_url}/v1/messages',
         headers={
             'x-api-key': api_key,
@@ -943,10 +1124,8 @@ def _stream_bedrock(
     
     Based on production patterns with inference profile fallback.
     """
-    import boto3
-    
     region = provider.get('region', os.environ.get('AWS_REGION', 'us-east-1'))
-    client = boto3.client('bedrock-runtime', region_name=region)
+    client = common.get_boto3_client('bedrock-runtime', region)
     
     # Build request based on model
     try:
@@ -1019,7 +1198,16 @@ def _stream_bedrock_anthropic(
         chunk = json.loads(event['chunk']['bytes'].decode('utf-8'))
         chunk_type = chunk.get('type')
         
-        if chunk_type == 'content_block_delta':
+        if chunk_type == 'message_start':
+            # Prompt tokens are only reported here
+            usage = chunk.get('message', {}).get('usage')
+            if usage:
+                yield {
+                    'type': 'usage',
+                    'usage': {'prompt_tokens': usage.get('input_tokens', 0)}
+                }
+        
+        elif chunk_type == 'content_block_delta':
             delta = chunk.get('delta', {})
             if delta.get('type') == 'text_delta':
                 text = delta.get('text', '')
@@ -1128,10 +1316,8 @@ def _call_bedrock_sync(
     """
     Call Bedrock API synchronously (non-streaming).
     """
-    import boto3
-    
     region = provider.get('region', os.environ.get('AWS_REGION', 'us-east-1'))
-    client = boto3.client('bedrock-runtime', region_name=region)
+    client = common.get_boto3_client('bedrock-runtime', region)
     
     if model.startswith('anthropic.'):
         # Anthropic model on Bedrock
@@ -1283,6 +1469,88 @@ def _convert_messages_to_llama_prompt(messages: List[Dict]) -> str:
 # HELPER FUNCTIONS
 # =============================================================================
 
+def _assemble_prompt(
+    system_prompt: Optional[str],
+    rag_chunks: List[Dict[str, Any]],
+    history: List[Dict],
+    user_message: str,
+    session: Dict[str, Any],
+    model: str,
+    budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET
+) -> Dict[str, Any]:
+    """
+    Build the messages array within a prompt token budget.
+    
+    The system prompt and the current user message always go in. The rest
+    of the budget is packed greedily:
+    1. RAG chunks in similarity order, while the formatted context fits
+       RAG_CONTEXT_BUDGET_SHARE of it (a chunk that doesn't fit is skipped;
+       a smaller, less similar one may still fit)
+    2. History, newest first, until a message doesn't fit (older messages
+       are dropped so the conversation stays contiguous)
+    
+    Returns:
+        {'messages', 'promptTokens', 'citations', 'ragTokens',
+         'historyMessages', 'historyDropped'}
+    """
+    history = [msg for msg in history if msg.get('role') != 'system']
+    
+    # Fixed part: system prompt (with RAG instructions if chunks may go in) + message
+    system_content = _build_system_prompt(system_prompt, bool(rag_chunks), session)
+    remaining = budget - _count_message_tokens([
+        {'role': 'system', 'content': system_content},
+        {'role': 'user', 'content': user_message}
+    ], model)
+    
+    # RAG chunks; the context is re-formatted per candidate since sources are numbered
+    rag_budget = int(max(remaining, 0) * RAG_CONTEXT_BUDGET_SHARE)
+    selected: List[Dict[str, Any]] = []
+    rag_tokens = 0
+    for chunk in rag_chunks:
+        tokens = _count_tokens(_format_rag_context(selected + [chunk]), model)
+        if tokens <= rag_budget:
+            selected.append(chunk)
+            rag_tokens = tokens
+    remaining -= rag_tokens
+    
+    # History, newest first
+    kept: List[Dict] = []
+    for msg in reversed(history):
+        tokens = MESSAGE_OVERHEAD_TOKENS + _count_tokens(msg.get('content') or '', model)
+        if tokens > remaining:
+            break
+        kept.append(msg)
+        remaining -= tokens
+    kept.reverse()
+    
+    rag_context = _format_rag_context(selected)
+    messages = _build_messages_array(
+        system_prompt=system_prompt,
+        rag_context=rag_context or None,
+        history=kept,
+        user_message=user_message,
+        session=session,
+        has_rag_context=bool(rag_context)
+    )
+    prompt_tokens = _count_message_tokens(messages, model)
+    
+    logger.info(
+        f'Prompt: {prompt_tokens}/{budget} tokens, '
+        f'{len(selected)}/{len(rag_chunks)} chunks, {len(kept)}/{len(history)} history messages'
+    )
+    if prompt_tokens > budget:
+        logger.warning(f'Prompt is {prompt_tokens} tokens, over the {budget} token budget')
+    
+    return {
+        'messages': messages,
+        'promptTokens': prompt_tokens,
+        'citations': _format_citations(selected),
+        'ragTokens': rag_tokens,
+        'historyMessages': len(kept),
+        'historyDropped': len(history) - len(kept)
+    }
+
+
 def _build_messages_array(
     system_prompt: Optional[str],
     rag_context: Optional[str],
@@ -1376,93 +1644,95 @@ GOOD ✅: "According to [Source 1] (95% relevance), ..."
     return base_prompt
 
 
-def _get_conversation_history(session_id: str, limit: int) -> List[Dict]:
+def _get_conversation_history(
+    session_id: str,
+    limit: int,
+    exclude_message_id: Optional[str] = None
+) -> List[Dict]:
     """
-    Get recent conversation history for context.
+    Get recent conversation history for context (up to limit - 1 messages).
+    
+    The current user message is added separately. Pass its ID when it is
+    being inserted concurrently; otherwise the most recent message is
+    assumed to be it and dropped.
     """
     messages = common.find_many(
         table='chat_messages',
         filters={'session_id': session_id},
+        select='id,role,content',
         order='created_at.desc',
         limit=limit
     )
     
-    # Reverse to chronological order and exclude the most recent user message
-    # (which will be added separately)
-    return list(reversed(messages))[:-1] if messages else []
+    # Reverse to chronological order and exclude the current user message
+    messages = list(reversed(messages or []))
+    if exclude_message_id is None:
+        return messages[:-1]
+    messages = [m for m in messages if str(m.get('id')) != exclude_message_id]
+    return messages[-(limit - 1):] if limit > 1 else []
 
 
 def _retrieve_rag_context(
     query: str,
     kb_ids: List[str],
     top_k: int,
-    user_id: str
+    user_id: str,
+    query_embedding: Optional[List[float]] = None
 ) -> Dict[str, Any]:
     """
     Retrieve RAG context from knowledge bases.
     
     Enhanced based on production patterns from pm-app-stack.
     Includes fallback logic for generic queries.
+    
+    All KBs are searched in one search_kb_chunks call. For generic queries
+    the call uses the fallback threshold, and the fallback reuses those
+    candidates instead of searching again: results are ordered by
+    similarity, so the matches above the default threshold are a prefix
+    of them.
+    
+    Context and citations are formatted by _assemble_prompt, from the
+    chunks that fit the prompt.
+    
+    Args:
+        query_embedding: Precomputed query embedding (generated if None)
+    
+    Returns:
+        Dict with the top_k chunks, most similar first, under 'chunks'
+        (and 'error' if the query embedding failed)
     """
     # Get query embedding
-    try:
-        query_embedding = _get_query_embedding(query)
-    except Exception as e:
-        logger.error(f'Error generating embedding: {str(e)}')
-        return {
-            'context': '',
-            'citations': [],
-            'tokensUsed': 0,
-            'error': 'Failed to generate query embedding'
-        }
-    
-    # Search for similar chunks across all KBs
-    all_chunks = []
-    for kb_id in kb_ids:
+    if query_embedding is None:
         try:
-            chunks = _search_kb_chunks(kb_id, query_embedding, top_k)
-            all_chunks.extend(chunks)
+            query_embedding = _get_query_embedding(query)
         except Exception as e:
-            logger.warning(f'Error searching KB {kb_id}: {str(e)}')
-            continue
+            logger.error(f'Error generating embedding: {str(e)}')
+            return {
+                'chunks': [],
+                'error': 'Failed to generate query embedding'
+            }
     
-    # Fallback for generic queries or no results (production pattern)
-    if not all_chunks:
-        generic_patterns = ['summarize', 'summary', 'overview', "what's in", 'tell me about']
-        is_generic = any(p in query.lower() for p in generic_patterns)
-        
-        if is_generic:
-            # Try with lower threshold for generic queries
-            for kb_id in kb_ids:
-                try:
-                    chunks = _search_kb_chunks(kb_id, query_embedding, top_k, threshold=0.5)
-                    all_chunks.extend(chunks)
-                except Exception as e:
-                    continue
+    generic_patterns = ['summarize', 'summary', 'overview', "what's in", 'tell me about']
+    is_generic = any(p in query.lower() for p in generic_patterns)
     
-    if not all_chunks:
-        return {
-            'context': '',
-            'citations': [],
-            'tokensUsed': 0
-        }
+    # Search for similar chunks across all KBs (one round trip)
+    candidates = _search_kb_chunks(
+        kb_ids,
+        query_embedding,
+        top_k,
+        threshold=FALLBACK_SIMILARITY_THRESHOLD if is_generic else DEFAULT_SIMILARITY_THRESHOLD
+    )
+    all_chunks = [c for c in candidates if c.get('similarity', 0) >= DEFAULT_SIMILARITY_THRESHOLD]
+    
+    # Fallback for generic queries or no results (production pattern):
+    # accept the lower-threshold candidates
+    if not all_chunks and is_generic:
+        all_chunks = candidates
     
     # Sort by similarity and take top_k
     all_chunks.sort(key=lambda x: x.get('similarity', 0), reverse=True)
-    top_chunks = all_chunks[:top_k]
-    
-    # Format context and citations (production format)
-    context = _format_rag_context(top_chunks)
-    citations = _format_citations(top_chunks)
     
-    # Estimate tokens (rough: 1 token ≈ 4 characters)
-    tokens_used = len(context) // 4
-    
-    return {
-        'context': context,
-        'citations': citations,
-        'tokensUsed': tokens_used
-    }
+    return {'chunks': all_chunks[:top_k]}
 
 
 def _format_rag_context(chunks: List[Dict[str, Any]]) -> str:
@@ -1515,22 +1785,30 @@ def _format_citations(chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 def _get_query_embedding(query: str) -> List[float]:
     """
     Generate embedding for query using OpenAI ada-002.
-    """
-    import requests
     
+    Repeated queries (and retried sends) are served from the org_common
+    embedding cache.
+    """
+    return common.get_embedding(QUERY_EMBEDDING_MODEL, query, _embed_texts)
+
+
+def _embed_texts(texts: List[str]) -> List[List[float]]:
+    """
+    Embed texts with one OpenAI embeddings API call (vectors in input order).
+    """
     openai_api_key = os.environ.get('OPENAI_API_KEY')
     if not openai_api_key:
         raise Exception('OPENAI_API_KEY not configured')
     
-    response = requests.post(
+    response = common.get_http_session().post(
         'https://api.openai.com/v1/embeddings',
         headers={
             'Authorization': f'Bearer {openai_api_key}',
             'Content-Type': 'application/json'
         },
         json={
-            'model': 'text-embedding-ada-002',
-            'input': query
+            'model': QUERY_EMBEDDING_MODEL,
+            'input': texts
         },
         timeout=30
     )
@@ -1539,18 +1817,19 @@ def _get_query_embedding(query: str) -> List[float]:
         raise Exception(f'OpenAI API error: {response.status_code} {response.text}')
     
     result = response.json()
-    return result['data'][0]['embedding']
+    return [item['embedding'] for item in sorted(result['data'], key=lambda item: item['index'])]
 
 
 def _search_kb_chunks(
-    kb_id: str,
+    kb_ids: List[str],
     query_embedding: List[float],
     top_k: int,
     threshold: float = DEFAULT_SIMILARITY_THRESHOLD
 ) -> List[Dict[str, Any]]:
     """
-    Search KB chunks using pgvector similarity search.
+    Search chunks of several KBs using pgvector similarity search.
     
+    One RPC returns the global top_k across all KBs, most similar first.
     Supports configurable threshold for fallback queries.
     """
     try:
@@ -1559,7 +1838,7 @@ def _search_kb_chunks(
 'search_kb_chunks',
             
 {
-                'p_kb_id': kb_id,
+                'p_kb_ids': list(kb_ids),
                 'p_query_embedding': query_embedding,
                 'p_top_k': top_k,
                 'p_similarity_threshold': threshold
@@ -1571,6 +1850,74 @@ def _search_kb_chunks(
         return []
 
 
+def _get_context_window(model: str) -> Optional[int]:
+    """Get a model's context window in tokens (None if unknown)."""
+    for profile_prefix in BEDROCK_PROFILE_PREFIXES:
+        if model.startswith(profile_prefix):
+            model = model[len(profile_prefix):]
+            break
+    for prefix, window in MODEL_CONTEXT_WINDOWS:
+        if model.startswith(prefix):
+            return window
+    return None
+
+
+def _get_context_budget(requested: Any, model: str, max_tokens: int) -> int:
+    """
+    Get the prompt token budget for a request.
+
+    The prompt and the reply (max_tokens) must fit the model's context
+    window, so the budget is capped at the window minus max_tokens.
+    Without contextTokenBudget the smaller of DEFAULT_CONTEXT_TOKEN_BUDGET
+    and that cap is used. For models with an unknown window the cap is
+    DEFAULT_CONTEXT_WINDOW minus max_tokens, but max_tokens itself is not
+    limited.
+
+    Raises:
+        ValidationError: If contextTokenBudget is out of range, or max_tokens
+            leaves less than MIN_CONTEXT_TOKEN_BUDGET of a known window
+            for the prompt
+    """
+    context_window = _get_context_window(model)
+    if context_window is None:
+        max_budget = max(DEFAULT_CONTEXT_WINDOW - max_tokens, MIN_CONTEXT_TOKEN_BUDGET)
+    else:
+        max_budget = context_window - max_tokens
+        if max_budget < MIN_CONTEXT_TOKEN_BUDGET:
+            raise common.ValidationError(
+                f'maxTokens must be no more than {context_window - MIN_CONTEXT_TOKEN_BUDGET} for {model}'
+            )
+    if requested is None:
+        return min(DEFAULT_CONTEXT_TOKEN_BUDGET, max_budget)
+    return common.validate_integer(
+        requested,
+        'contextTokenBudget',
+        min_value=MIN_CONTEXT_TOKEN_BUDGET,
+        max_value=max_budget
+    )
+
+
+@lru_cache(maxsize=ENCODER_CACHE_SIZE)
+def _get_encoder(model: str):
+    """
+    Get the tiktoken encoding for a model, cached for the container
+    (loading one parses its BPE ranks). The model comes from the request,
+    so the cache is bounded.
+    
+    Models tiktoken doesn't know (Claude, Bedrock) use FALLBACK_ENCODING.
+    Returns None if tiktoken is unavailable or fails to load.
+    """
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding(FALLBACK_ENCODING)
+    except Exception as e:
+        logger.warning(f'No tokenizer for {model}, estimating token counts: {str(e)}')
+        return None
+
+
 def _count_tokens(text: str, model: str = 'gpt-4') -> int:
     """
     Count tokens for a given text.
@@ -1578,19 +1925,33 @@ def _count_tokens(text: str, model: str = 'gpt-4') -> int:
     Uses tiktoken if available, falls back to rough estimate.
     Based on production count_tokens() from pm-app-stack.
     """
-    try:
-        import tiktoken
-        encoding = tiktoken.encoding_for_model(model)
-        return len(encoding.encode(text))
-    except Exception as e:
-        logger.warning(f'Failed to count tokens precisely: {str(e)}')
+    encoder = _get_encoder(model)
+    if encoder is None:
         # Fallback to rough estimate (1 token ≈ 4 characters)
         return len(text) // 4
+    # Special-token text in user content is counted as plain text
+    return len(encoder.encode(text, disallowed_special=()))
 
 
-def _create_user_message(session_id: str, content: str, user_id: str) -> Dict[str, Any]:
+def _count_message_tokens(messages: List[Dict], model: str = 'gpt-4') -> int:
+    """Count prompt tokens for a messages array (content plus per-message overhead)."""
+    return REPLY_PRIMING_TOKENS + sum(
+        MESSAGE_OVERHEAD_TOKENS + _count_tokens(msg.get('content') or '', model)
+        for msg in messages
+    )
+
+
+def _create_user_message(
+    session_id: str,
+    content: str,
+    user_id: str,
+    message_id: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Create a user message in the database.
+    
+    Args:
+        message_id: Pre-generated message ID (database default if None)
     """
     message_data = {
         'session_id': session_id,
@@ -1599,6 +1960,8 @@ def _create_user_message(session_id: str, content: str, user_id: str) -> Dict[st
         'metadata': '{}',
         'created_by': user_id
     }
+    if message_id:
+        message_data['id'] = message_id
     
     message = common.insert_one(
         table='chat_messages',
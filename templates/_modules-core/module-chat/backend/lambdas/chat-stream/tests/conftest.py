@@ -0,0 +1,16 @@
+"""
+Shared fixtures for chat-stream unit tests
+
+Puts the Lambda and the layers it imports (org_common, chat_common) on the
+path, the way they are laid out in the deployed function.
+"""
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[3]
+MODULES = BACKEND.parents[1]
+
+# Add the Lambda and its layers to path
+sys.path.insert(0, str(BACKEND / 'lambdas' / 'chat-stream'))
+sys.path.insert(0, str(BACKEND / 'layers' / 'chat_common' / 'python'))
+sys.path.insert(0, str(MODULES / 'module-access' / 'backend' / 'layers' / 'org-common' / 'python'))
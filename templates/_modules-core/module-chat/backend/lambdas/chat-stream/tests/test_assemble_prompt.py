@@ -0,0 +1,136 @@
+"""
+Tests for chat-stream _assemble_prompt
+
+Token counts come from a stub encoder (one token per word), so budgets can
+be set exactly:
+1. The system prompt and message always go in, even over the budget
+2. RAG chunks use at most RAG_CONTEXT_BUDGET_SHARE of the budget; a chunk
+   that doesn't fit is skipped and later ones may still go in
+3. History is kept newest first up to the first message that doesn't fit
+4. promptTokens is the token count of the returned messages
+"""
+import logging
+
+import pytest
+
+pytest.importorskip('supabase')
+
+import lambda_function as lf
+
+MODEL = 'test-model'
+SESSION = {'id': 'session-1'}
+MESSAGE = 'what does the handbook say about leave'
+
+
+class WordEncoder:
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+
+@pytest.fixture(autouse=True)
+def word_encoder(monkeypatch):
+    monkeypatch.setattr(lf, '_get_encoder', lambda model: WordEncoder())
+
+
+def words(n, word='word'):
+    return ' '.join([word] * n)
+
+
+def chunk(name, n_words):
+    return {'document_name': name, 'content': words(n_words), 'similarity': 0.9}
+
+
+def message(role, n_words):
+    return {'id': f'{role}-{n_words}', 'role': role, 'content': words(n_words)}
+
+
+def fixed_tokens(has_rag_context):
+    """Tokens of the system prompt plus the current message."""
+    return lf._count_message_tokens([
+        {'role': 'system', 'content': lf._build_system_prompt(None, has_rag_context, SESSION)},
+        {'role': 'user', 'content': MESSAGE}
+    ], MODEL)
+
+
+def rag_tokens(chunks):
+    return lf._count_tokens(lf._format_rag_context(chunks), MODEL)
+
+
+def history_tokens(msg):
+    return lf.MESSAGE_OVERHEAD_TOKENS + lf._count_tokens(msg['content'], MODEL)
+
+
+def assemble(budget, rag_chunks=(), history=()):
+    return lf._assemble_prompt(
+        system_prompt=None,
+        rag_chunks=list(rag_chunks),
+        history=list(history),
+        user_message=MESSAGE,
+        session=SESSION,
+        model=MODEL,
+        budget=budget
+    )
+
+
+def test_budget_below_system_prompt_and_message(caplog):
+    history = [message('user', 5), message('assistant', 5)]
+    with caplog.at_level(logging.WARNING):
+        prompt = assemble(10, rag_chunks=[chunk('a', 5)], history=history)
+
+    assert [msg['role'] for msg in prompt['messages']] == ['system', 'user']
+    assert prompt['messages'][-1]['content'] == MESSAGE
+    assert (prompt['citations'], prompt['ragTokens']) == ([], 0)
+    assert (prompt['historyMessages'], prompt['historyDropped']) == (0, 2)
+    assert prompt['promptTokens'] > 10
+    assert 'over the 10 token budget' in caplog.text
+
+
+def test_rag_context_is_capped_at_its_share():
+    chunks = [chunk(f'doc-{i}', 80) for i in range(10)]
+    remaining = 1000
+    rag_budget = int(remaining * lf.RAG_CONTEXT_BUDGET_SHARE)
+    # Without the cap all chunks would fit
+    assert rag_tokens(chunks) <= remaining
+    expected = max(k for k in range(len(chunks) + 1) if rag_tokens(chunks[:k]) <= rag_budget)
+
+    prompt = assemble(fixed_tokens(True) + remaining, rag_chunks=chunks)
+    assert [c['documentName'] for c in prompt['citations']] == [f'doc-{i}' for i in range(expected)]
+    assert 0 < expected < len(chunks)
+    assert prompt['ragTokens'] == rag_tokens(chunks[:expected]) <= rag_budget
+
+
+def test_chunk_that_does_not_fit_is_skipped():
+    small, large, last = chunk('small', 10), chunk('large', 500), chunk('last', 10)
+    rag_budget = rag_tokens([small, last])
+    remaining = int(rag_budget / lf.RAG_CONTEXT_BUDGET_SHARE) + 1
+    assert int(remaining * lf.RAG_CONTEXT_BUDGET_SHARE) < rag_tokens([small, large])
+
+    prompt = assemble(fixed_tokens(True) + remaining, rag_chunks=[small, large, last])
+    assert [c['documentName'] for c in prompt['citations']] == ['small', 'last']
+    assert prompt['ragTokens'] == rag_tokens([small, last])
+
+
+def test_history_stops_at_first_message_that_does_not_fit():
+    oldest, long_reply, newest = message('user', 5), message('assistant', 300), message('user', 20)
+    # Room for the newest and oldest messages, not the long reply between them
+    budget = fixed_tokens(False) + history_tokens(newest) + history_tokens(oldest) + 10
+
+    prompt = assemble(budget, history=[oldest, long_reply, newest])
+    assert prompt['messages'][1:-1] == [{'role': 'user', 'content': newest['content']}]
+    assert (prompt['historyMessages'], prompt['historyDropped']) == (1, 2)
+
+
+def test_system_messages_in_history_are_ignored():
+    history = [{'role': 'system', 'content': 'old instructions'}, message('user', 5)]
+    prompt = assemble(1000, history=history)
+    assert [msg['role'] for msg in prompt['messages']] == ['system', 'user', 'user']
+    assert (prompt['historyMessages'], prompt['historyDropped']) == (1, 0)
+
+
+def test_prompt_tokens_count_the_returned_messages():
+    history = [message('user', 30), message('assistant', 40), message('user', 30)]
+    prompt = assemble(600, rag_chunks=[chunk('a', 50), chunk('b', 50)], history=history)
+
+    assert prompt['citations'] and prompt['historyMessages']
+    assert prompt['promptTokens'] == lf._count_message_tokens(prompt['messages'], MODEL)
+    assert prompt['promptTokens'] <= 600
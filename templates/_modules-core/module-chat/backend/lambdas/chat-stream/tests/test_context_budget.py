@@ -0,0 +1,57 @@
+"""
+Tests for chat-stream _get_context_window and _get_context_budget
+
+1. Context windows are matched by the most specific model ID prefix,
+   including Bedrock cross-region inference profile IDs
+2. For known windows, maxTokens must leave MIN_CONTEXT_TOKEN_BUDGET for the prompt
+3. Unknown models cap only the prompt budget; maxTokens is not rejected
+"""
+import pytest
+
+pytest.importorskip('supabase')
+
+import lambda_function as lf
+from org_common.errors import ValidationError
+
+
+@pytest.mark.parametrize('model, window', [
+    ('gpt-4', 8192),
+    ('gpt-4-0613', 8192),
+    ('gpt-4.1-mini', 1047576),
+    ('gpt-4o-mini', 128000),
+    ('gpt-5', 400000),
+    ('o1-mini', 128000),
+    ('o3-mini', 200000),
+    ('anthropic.claude-3-5-sonnet-20241022-v2:0', 200000),
+    ('us.anthropic.claude-3-5-sonnet-20241022-v2:0', 200000),
+    ('meta.llama3-1-70b-instruct-v1:0', 128000),
+    ('meta.llama3-8b-instruct-v1:0', 8192),
+    ('some-unknown-model', None),
+])
+def test_context_window(model, window):
+    assert lf._get_context_window(model) == window
+
+
+def test_default_budget_fits_window():
+    assert lf._get_context_budget(None, 'gpt-4', 6000) == 8192 - 6000
+
+
+def test_max_tokens_over_known_window_rejected():
+    with pytest.raises(ValidationError):
+        lf._get_context_budget(None, 'gpt-4', 8000)
+
+
+def test_large_max_tokens_allowed_for_large_window():
+    assert lf._get_context_budget(None, 'gpt-4.1', 16000) == lf.DEFAULT_CONTEXT_TOKEN_BUDGET
+
+
+def test_unknown_model_caps_only_prompt_budget():
+    assert lf._get_context_budget(None, 'some-unknown-model', 16000) == lf.MIN_CONTEXT_TOKEN_BUDGET
+    with pytest.raises(ValidationError):
+        lf._get_context_budget(1000, 'some-unknown-model', 16000)
+
+
+def test_requested_budget_capped():
+    assert lf._get_context_budget(2000, 'gpt-4o', 4096) == 2000
+    with pytest.raises(ValidationError):
+        lf._get_context_budget(200000, 'gpt-4o', 4096)
@@ -0,0 +1,96 @@
+"""
+Tests for the token usage reported by chat-stream _stream_ai_response
+
+The provider stream, prompt assembly and message save are stubbed:
+1. The provider's prompt and completion counts are used when it sends them,
+   also when they arrive in separate usage events (Anthropic)
+2. Local estimates are the fallback where the provider sends none
+3. The pre-stream session event always carries the local prompt estimate
+"""
+import json
+
+import pytest
+
+pytest.importorskip('supabase')
+
+import lambda_function as lf
+
+LOCAL_PROMPT_TOKENS = 100
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    """Run _stream_ai_response over the given provider events; return SSE events and saved usage."""
+    saved = {}
+
+    def run(provider_events):
+        monkeypatch.setattr(lf, '_prepare_response', lambda *args: {
+            'provider': {'type': 'openai'}, 'rag_chunks': [], 'history': []
+        })
+        monkeypatch.setattr(lf, '_assemble_prompt', lambda **kwargs: {
+            'messages': [], 'citations': [], 'ragTokens': 0,
+            'promptTokens': LOCAL_PROMPT_TOKENS
+        })
+        monkeypatch.setattr(lf, '_stream_openai', lambda *args: iter(provider_events))
+        monkeypatch.setattr(lf, '_count_tokens', lambda text, model: len(text.split()))
+
+        def create_assistant_message(**kwargs):
+            saved.update(kwargs['token_usage'])
+            return {'id': 'assistant-1'}
+
+        monkeypatch.setattr(lf, '_create_assistant_message', create_assistant_message)
+
+        events = [
+            json.loads(line[len('data: '):])
+            for line in lf._stream_ai_response(
+                'session-1', {'id': 'session-1'}, 'user-1', 'hello', None,
+                'gpt-4o', 0.7, 1024, None
+            )
+            if line.startswith('data: {')
+        ]
+        return events, saved
+
+    return run
+
+
+def tokens(text):
+    return {'type': 'token', 'content': text}
+
+
+def usage(**counts):
+    return {'type': 'usage', 'usage': counts}
+
+
+def complete_usage(events):
+    return next(e for e in events if e['type'] == 'complete')['message']['usage']
+
+
+def test_uses_provider_counts(stream):
+    events, saved = stream([
+        tokens('three word reply'),
+        usage(prompt_tokens=120, completion_tokens=5, total_tokens=125)
+    ])
+    assert complete_usage(events) == {'promptTokens': 120, 'completionTokens': 5, 'totalTokens': 125}
+    assert saved == {'prompt_tokens': 120, 'completion_tokens': 5, 'total_tokens': 125}
+
+
+def test_merges_split_usage_events(stream):
+    events, _ = stream([
+        usage(prompt_tokens=120),
+        tokens('three word reply'),
+        usage(prompt_tokens=0, completion_tokens=5, total_tokens=5)
+    ])
+    assert complete_usage(events) == {'promptTokens': 120, 'completionTokens': 5, 'totalTokens': 125}
+
+
+def test_falls_back_to_local_estimates(stream):
+    events, _ = stream([tokens('three word reply')])
+    assert complete_usage(events) == {
+        'promptTokens': LOCAL_PROMPT_TOKENS, 'completionTokens': 3, 'totalTokens': LOCAL_PROMPT_TOKENS + 3
+    }
+
+
+def test_session_event_has_local_estimate(stream):
+    events, _ = stream([tokens('reply'), usage(prompt_tokens=120, completion_tokens=1)])
+    assert events[0]['type'] == 'session'
+    assert events[0]['promptTokens'] == LOCAL_PROMPT_TOKENS
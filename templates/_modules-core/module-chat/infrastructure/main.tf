@@ -180,10 +180,11 @@ resource "aws_lambda_function" "chat_message" {
 
   environment {
     variables = {
-      REGION              = var.aws_region
-      SUPABASE_SECRET_ARN = var.supabase_secret_arn
-      OPENAI_API_KEY      = var.openai_api_key
-      LOG_LEVEL           = var.log_level
+      REGION                = var.aws_region
+      SUPABASE_SECRET_ARN   = var.supabase_secret_arn
+      OPENAI_API_KEY        = var.openai_api_key
+      EMBEDDING_CACHE_TABLE = "kb_embedding_cache"
+      LOG_LEVEL             = var.log_level
     }
   }
 
@@ -233,11 +234,12 @@ resource "aws_lambda_function" "chat_stream" {
 
   environment {
     variables = {
-      REGION              = var.aws_region
-      SUPABASE_SECRET_ARN = var.supabase_secret_arn
-      OPENAI_API_KEY      = var.openai_api_key
-      ANTHROPIC_API_KEY   = var.anthropic_api_key
-      LOG_LEVEL           = var.log_level
+      REGION                = var.aws_region
+      SUPABASE_SECRET_ARN   = var.supabase_secret_arn
+      OPENAI_API_KEY        = var.openai_api_key
+      ANTHROPIC_API_KEY     = var.anthropic_api_key
+      EMBEDDING_CACHE_TABLE = "kb_embedding_cache"
+      LOG_LEVEL             = var.log_level
     }
   }
 
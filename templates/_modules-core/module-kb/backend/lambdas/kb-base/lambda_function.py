@@ -36,6 +36,7 @@ import org_common as common
 from kb_common.permissions import can_view_kb, can_edit_kb, can_delete_kb
 
 
+@common.request_scope
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Handle KB base operations with multi-scope support
@@ -122,13 +123,15 @@ def route_workspace_handlers(event: Dict[str, Any], user_id: str, method: str, p
     # ========================================
     # ADR-019c: STEP 1 - Workspace Membership
     # ========================================
-    if not _is_ws_member(workspace_id, user_id):
+    # One round trip for the workspace role (admin checks below reuse it)
+    auth_context = common.load_auth_context(user_id, ws_id=workspace_id)
+    if not auth_context.is_ws_member:
         return common.forbidden_response('Not a workspace member')
     
     # For write operations, require ws_admin
     is_write_operation = method in ['POST', 'PATCH', 'DELETE']
     if is_write_operation and '/toggle' in path:
-        if not _is_ws_admin_or_owner(workspace_id, user_id):
+        if not auth_context.is_ws_admin:
             return common.forbidden_response('Only workspace admins can toggle KB access')
     
     # ========================================
@@ -148,7 +151,7 @@ def route_workspace_handlers(event: Dict[str, Any], user_id: str, method: str, p
             return handle_get_workspace_kb(user_id, workspace_id)
         elif method == 'POST':
             # Require admin for KB creation
-            if not _is_ws_admin_or_owner(workspace_id, user_id):
+            if not auth_context.is_ws_admin:
                 return common.forbidden_response('Only workspace admins can create workspace KBs')
             return handle_create_workspace_kb(event, user_id, workspace_id)
     elif '/kb/' in path:
@@ -157,7 +160,7 @@ def route_workspace_handlers(event: Dict[str, Any], user_id: str, method: str, p
             return common.bad_request_response('KB ID is required')
         if method == 'PATCH':
             # Require admin for KB update
-            if not _is_ws_admin_or_owner(workspace_id, user_id):
+            if not auth_context.is_ws_admin:
                 return common.forbidden_response('Only workspace admins can update workspace KBs')
             return handle_update_kb(event, user_id, kb_id)
     
@@ -626,17 +629,23 @@ def handle_list_available_kbs_for_chat(user_id: str, chat_id: str) -> Dict[str,
         {'p_user_id': user_id, 'p_ws_id': chat['workspace_id']}
     )
     
-    # Add chat-specific toggles - wrap KB fields in 'kb' object to match AvailableKb type
-    kbs = []
-    for row in result:
-        # Check if KB is toggled for this chat
-        chat_toggle = common.find_one(
+    # Chat-specific toggles for all KBs in one query
+    chat_toggles = {
+        toggle['kb_id']: toggle
+        for toggle in common.find_many(
             table='kb_access_chats',
             filters={
-                'kb_id': row['kb_id'],
+                'kb_id': [row['kb_id'] for row in result],
                 'chat_session_id': chat_id
             }
         )
+    } if result else {}
+    
+    # Add chat-specific toggles - wrap KB fields in 'kb' object to match AvailableKb type
+    kbs = []
+    for row in result:
+        # Check if KB is toggled for this chat
+        chat_toggle = chat_toggles.get(row['kb_id'])
         
         kb_data = {
             'kb': {
@@ -1128,23 +1137,11 @@ def format_kb_record(kb: Dict[str, Any]) -> Dict[str, Any]:
 
 def get_kb_stats(kb_id: str) -> Dict[str, Any]:
     """Get KB statistics (document count, chunk count, total size)"""
-    # Get document stats
-    docs = common.find_many(
-        table='kb_docs',
-        filters={'kb_id': kb_id, 'is_deleted': False}
-    )
-    
-    doc_count = len(docs)
-    total_size = sum(doc.get('file_size', 0) for doc in docs)
-    
-    # Get chunk count
-    chunks = common.find_many(
-        table='kb_chunks',
-        filters={'kb_id': kb_id},
-        select='id'
-    )
-    
-    chunk_count = len(chunks)
+    # Counted and summed server-side (no rows transferred)
+    doc_filters = {'kb_id': kb_id, 'is_deleted': False}
+    doc_count = common.count('kb_docs', doc_filters)
+    total_size = common.sum_column('kb_docs', 'file_size', doc_filters)
+    chunk_count = common.count('kb_chunks', {'kb_id': kb_id})
     
     return {
         'documentCount': doc_count,
@@ -1153,24 +1150,6 @@ def get_kb_stats(kb_id: str) -> Dict[str, Any]:
     }
 
 
-def _is_ws_member(workspace_id: str, user_id: str) -> bool:
-    """Check if user is a member of the workspace."""
-    result = common.rpc(
-        function_name='is_ws_member',
-        params={'p_user_id': user_id, 'p_ws_id': workspace_id}
-    )
-    return result is True
-
-
-def _is_ws_admin_or_owner(workspace_id: str, user_id: str) -> bool:
-    """Check if user is admin or owner of the workspace."""
-    result = common.rpc(
-        function_name='is_ws_admin_or_owner',
-        params={'p_user_id': user_id, 'p_ws_id': workspace_id}
-    )
-    return result is True
-
-
 def check_chat_access(user_id: str, chat_id: str) -> bool:
     """Check if user has access to chat (owner, workspace member, or shared)"""
     try:
@@ -512,19 +512,24 @@ def generate_embeddings(chunks: List[Dict], model: str) -> List[List[float]]:
     """
     Generate embeddings for all chunks using configured model.
     
-    Supports batching for efficiency.
+    Supports batching for efficiency. Goes through the org_common embedding
+    cache, so chunk text repeated within or across documents (headers,
+    disclaimers, boilerplate) is embedded once.
     """
-    try:
+    def embed_texts(texts: List[str]) -> List[List[float]]:
         all_embeddings = []
         
         # Process in batches
-        for i in range(0, len(chunks), BATCH_SIZE):
-            batch_chunks = chunks[i:i + BATCH_SIZE]
+        for i in range(0, len(texts), BATCH_SIZE):
+            batch_chunks = [{'content': text} for text in texts[i:i + BATCH_SIZE]]
             batch_embeddings = generate_embeddings_batch(batch_chunks, model)
             all_embeddings.extend(batch_embeddings)
         
         return all_embeddings
     
+    try:
+        return common.get_embeddings(model, [chunk['content'] for chunk in chunks], embed_texts)
+    
     except Exception as e:
         raise ValueError(f"Embedding generation failed: {str(e)}")
 
@@ -606,29 +611,29 @@ def store_chunks(document_id: str, kb_id: str, org_id: str, chunks: List[Dict],
                 embeddings: List[List[float]], embedding_model: str):
     """Store chunks with embeddings in database (with org_id for multi-tenancy)."""
     try:
+        rows = []
         for chunk, embedding in zip(chunks, embeddings):
             # Convert embedding list to pgvector format string
             # pgvector accepts '[x,y,z]' format for vector columns
             embedding_str = '[' + ','.join(map(str, embedding)) + ']'
             
-            # Use common.insert_one for inserts
-            # The database driver handles the vector type conversion
-            common.insert_one(
-                table='kb_chunks',
-                data={
-                    'kb_id': kb_id,
-                    'document_id': document_id,
-                    'content': chunk['content'],
-                    'embedding': embedding_str,
-                    'chunk_index': chunk['chunk_index'],
-                    'token_count': estimate_token_count(chunk['content']),
-                    'metadata': chunk['metadata'],
-                    'embedding_model': embedding_model,
-                    'org_id': org_id
-                }
-            )
+            rows.append({
+                'kb_id': kb_id,
+                'document_id': document_id,
+                'content': chunk['content'],
+                'embedding': embedding_str,
+                'chunk_index': chunk['chunk_index'],
+                'token_count': estimate_token_count(chunk['content']),
+                'metadata': chunk['metadata'],
+                'embedding_model': embedding_model,
+                'org_id': org_id
+            })
+        
+        # Batched inserts (a few requests per document instead of one per chunk);
+        # the database driver handles the vector type conversion
+        result = common.insert_many(table='kb_chunks', rows=rows, returning='minimal')
         
-        print(f"Stored {len(chunks)} chunks for document {document_id}")
+        print(f"Stored {result.written} chunks for document {document_id} in {result.batches} requests")
     
     except Exception as e:
         raise ValueError(f"Failed to store chunks: {str(e)}")
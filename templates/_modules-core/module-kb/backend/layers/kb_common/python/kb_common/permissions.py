@@ -7,7 +7,7 @@ KB resource permissions (ownership and future sharing).
 Module-specific permission helpers live in the module's layer to avoid
 dependencies on optional functional modules in org-common.
 """
-from org_common.db import rpc
+import org_common as common
 
 
 def is_kb_owner(user_id: str, kb_id: str) -> bool:
@@ -21,7 +21,7 @@ def is_kb_owner(user_id: str, kb_id: str) -> bool:
     Returns:
         True if user is the owner, False otherwise
     """
-    return rpc('is_kb_owner', {
+    return common.rpc('is_kb_owner', {
         'p_user_id': user_id,
         'p_kb_id': kb_id
     })
@@ -40,7 +40,7 @@ def can_view_kb(user_id: str, kb_id: str) -> bool:
     Returns:
         True if user can view the KB, False otherwise
     """
-    return rpc('can_view_kb', {
+    return common.rpc('can_view_kb', {
         'p_user_id': user_id,
         'p_kb_id': kb_id
     })
@@ -59,7 +59,7 @@ def can_edit_kb(user_id: str, kb_id: str) -> bool:
     Returns:
         True if user can edit the KB, False otherwise
     """
-    return rpc('can_edit_kb', {
+    return common.rpc('can_edit_kb', {
         'p_user_id': user_id,
         'p_kb_id': kb_id
     })
@@ -76,7 +76,7 @@ def can_delete_kb(user_id: str, kb_id: str) -> bool:
     Returns:
         True if user can delete the KB, False otherwise
     """
-    return rpc('can_delete_kb', {
+    return common.rpc('can_delete_kb', {
         'p_user_id': user_id,
         'p_kb_id': kb_id
     })
@@ -93,7 +93,7 @@ def can_view_kb_document(user_id: str, doc_id: str) -> bool:
     Returns:
         True if user can view the document, False otherwise
     """
-    return rpc('can_view_kb_document', {
+    return common.rpc('can_view_kb_document', {
         'p_user_id': user_id,
         'p_doc_id': doc_id
     })
@@ -110,7 +110,7 @@ def can_edit_kb_document(user_id: str, doc_id: str) -> bool:
     Returns:
         True if user can edit the document, False otherwise
     """
-    return rpc('can_edit_kb_document', {
+    return common.rpc('can_edit_kb_document', {
         'p_user_id': user_id,
         'p_doc_id': doc_id
     })
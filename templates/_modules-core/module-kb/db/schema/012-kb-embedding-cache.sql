@@ -0,0 +1,34 @@
+-- ========================================
+-- Knowledge Base Module Schema
+-- Migration: 012-kb-embedding-cache.sql
+-- Created: October 16, 2026
+-- ========================================
+
+-- Table: kb_embedding_cache
+-- Shared tier of the org_common embedding cache (enabled in a Lambda with
+-- EMBEDDING_CACHE_TABLE=kb_embedding_cache). Rows are keyed by a hash of
+-- (model, normalized text), so identical chunk text across documents and
+-- repeated chat queries are embedded once. Holds no text and no org data.
+CREATE TABLE IF NOT EXISTS public.kb_embedding_cache (
+    cache_key VARCHAR(64) PRIMARY KEY,  -- sha256 hex of model + normalized text
+    model VARCHAR(100) NOT NULL,
+    dimensions INTEGER NOT NULL,
+    embedding DOUBLE PRECISION[] NOT NULL,  -- Any dimension, exactly as returned by the provider
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- For pruning old entries or a model's entries after it is retired
+CREATE INDEX IF NOT EXISTS idx_kb_embedding_cache_model ON public.kb_embedding_cache(model, created_at);
+
+-- Only Lambdas (service role) read and write the cache
+ALTER TABLE public.kb_embedding_cache ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Service role full access to kb_embedding_cache" ON public.kb_embedding_cache;
+CREATE POLICY "Service role full access to kb_embedding_cache" ON public.kb_embedding_cache
+FOR ALL
+USING (current_setting('request.jwt.claims', true)::json->>'role' = 'service_role');
+
+-- Comments
+COMMENT ON TABLE public.kb_embedding_cache IS 'Shared embedding cache keyed by (model, normalized text) hash';
+COMMENT ON COLUMN public.kb_embedding_cache.cache_key IS 'sha256 hex of model and normalized text (see org_common.embedding_cache)';
+COMMENT ON COLUMN public.kb_embedding_cache.embedding IS 'Embedding vector as returned by the provider (dimension varies by model)';
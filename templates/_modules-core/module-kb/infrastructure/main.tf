@@ -384,10 +384,11 @@ resource "aws_lambda_function" "kb_processor" {
 
   environment {
     variables = {
-      REGION              = var.aws_region
-      SUPABASE_SECRET_ARN = var.supabase_secret_arn
-      S3_BUCKET           = aws_s3_bucket.kb_documents.id
-      LOG_LEVEL           = var.log_level
+      REGION                = var.aws_region
+      SUPABASE_SECRET_ARN   = var.supabase_secret_arn
+      S3_BUCKET             = aws_s3_bucket.kb_documents.id
+      EMBEDDING_CACHE_TABLE = "kb_embedding_cache"
+      LOG_LEVEL             = var.log_level
     }
   }
 
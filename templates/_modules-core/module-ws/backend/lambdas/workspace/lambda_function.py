@@ -60,6 +60,7 @@ def is_sys_route(path: str) -> bool:
     return any(path.startswith(route) for route in SYS_ROUTES)
 
 
+@common.request_scope
 def lambda_handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
     """
     Main Lambda handler with route dispatcher.
@@ -309,40 +310,32 @@ def _transform_config(data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _ws_auth_context(workspace_id: str, user_id: str) -> 'common.AuthContext':
+    """Load user's workspace role once per request (invalidated by membership writes)."""
+    return common.cached_check(
+        'load_auth_context', user_id, workspace_id,
+        lambda: common.load_auth_context(user_id, ws_id=workspace_id)
+    )
+
+
 def _get_user_ws_role(workspace_id: str, user_id: str) -> Optional[str]:
     """Get user's role in a workspace."""
-    result = common.rpc(
-        function_name='get_ws_role',
-        params={'p_user_id': user_id, 'p_ws_id': workspace_id}  # ADR-019c: user_id first
-    )
-    return result
+    return _ws_auth_context(workspace_id, user_id).ws_role
 
 
 def _is_ws_member(workspace_id: str, user_id: str) -> bool:
     """Check if user is a member of the workspace."""
-    result = common.rpc(
-        function_name='is_ws_member',
-        params={'p_user_id': user_id, 'p_ws_id': workspace_id}  # ADR-019c: user_id first
-    )
-    return result is True
+    return _ws_auth_context(workspace_id, user_id).is_ws_member
 
 
 def _is_ws_owner(workspace_id: str, user_id: str) -> bool:
     """Check if user is an owner of the workspace."""
-    result = common.rpc(
-        function_name='is_ws_owner',
-        params={'p_user_id': user_id, 'p_ws_id': workspace_id}  # ADR-019c: user_id first
-    )
-    return result is True
+    return _ws_auth_context(workspace_id, user_id).ws_role == 'ws_owner'
 
 
 def _is_ws_admin_or_owner(workspace_id: str, user_id: str) -> bool:
     """Check if user is admin or owner of the workspace."""
-    result = common.rpc(
-        function_name='is_ws_admin_or_owner',
-        params={'p_user_id': user_id, 'p_ws_id': workspace_id}  # ADR-019c: user_id first
-    )
-    return result is True
+    return _ws_auth_context(workspace_id, user_id).is_ws_admin
 
 
 def _is_sys_admin(user_id: str) -> bool:
@@ -454,27 +447,43 @@ def handle_sys_analytics(user_id: str, user_info: Dict[str, Any]) -> Dict[str, A
         Platform-wide workspace statistics with org breakdown
     """
     try:
-        # Get all workspaces across all organizations
-        all_workspaces = common.find_many(table='workspaces', filters={})
-        
-        # Calculate platform-wide metrics
-        total_count = len(all_workspaces)
-        active_count = len([w for w in all_workspaces if w.get('deleted_at') is None and w.get('status') == 'active'])
-        archived_count = len([w for w in all_workspaces if w.get('deleted_at') is None and w.get('status') == 'archived'])
-        
-        # Count workspaces created this month
+        # Stream all workspaces across all organizations (keyset pages, flat memory)
+        # and accumulate every metric in a single pass
         now = datetime.now()
-        this_month_count = len([
-            w for w in all_workspaces
-            if w.get('created_at') and w.get('created_at').startswith(f"{now.year}-{now.month:02d}")
-        ])
-        
-        # Build org usage table
+        this_month_prefix = f"{now.year}-{now.month:02d}"
+        
+        total_count = 0
+        active_count = 0
+        archived_count = 0
+        this_month_count = 0
+        workspaces_with_favorites = 0
+        workspaces_with_tags = 0
+        workspaces_with_colors = 0
         org_stats = {}
-        for workspace in all_workspaces:
+        
+        # Workspaces with at least one favorite (one row per workspace, not per favorite)
+        favorited_ws_ids = set(common.count_by('ws_favorites', 'ws_id'))
+        
+        for workspace in common.iter_many(
+            table='workspaces',
+            select='id,org_id,status,deleted_at,created_at,tags,color'
+        ):
+            total_count += 1
+            
+            # Count workspaces created this month
+            if workspace.get('created_at') and workspace.get('created_at').startswith(this_month_prefix):
+                this_month_count += 1
+            
             if workspace.get('deleted_at') is not None:
                 continue  # Skip deleted workspaces
             
+            status = workspace.get('status')
+            if status == 'active':
+                active_count += 1
+            elif status == 'archived':
+                archived_count += 1
+            
+            # Build org usage table
             org_id = workspace.get('org_id')
             if org_id:
                 if org_id not in org_stats:
@@ -485,34 +494,25 @@ def handle_sys_analytics(user_id: str, user_info: Dict[str, Any]) -> Dict[str, A
                         'archived': 0,
                     }
                 org_stats[org_id]['total'] += 1
-                if workspace.get('status') == 'active':
+                if status == 'active':
                     org_stats[org_id]['active'] += 1
-                elif workspace.get('status') == 'archived':
+                elif status == 'archived':
                     org_stats[org_id]['archived'] += 1
-        
-        # Get org member counts and calculate average
+            
+            # Feature adoption
+            if workspace['id'] in favorited_ws_ids:
+                workspaces_with_favorites += 1
+            if workspace.get('tags') and len(workspace.get('tags', [])) > 0:
+                workspaces_with_tags += 1
+            if workspace.get('color') is not None:
+                workspaces_with_colors += 1
+        
+        # Get org member counts (one grouped count) and calculate average
+        member_counts = common.count_many('org_members', 'org_id', list(org_stats))
         for org_id, stats in org_stats.items():
-            org_members = common.find_many(
-                table='org_members',
-                filters={'org_id': org_id}
-            )
-            member_count = len(org_members)
+            member_count = member_counts.get(org_id, 0)
             stats['avgPerUser'] = round(stats['total'] / member_count, 2) if member_count > 0 else 0
         
-        # Calculate feature adoption
-        workspaces_with_favorites = len([
-            w for w in all_workspaces
-            if w.get('deleted_at') is None and common.find_one('ws_favorites', {'ws_id': w['id']}) is not None
-        ])
-        workspaces_with_tags = len([
-            w for w in all_workspaces
-            if w.get('deleted_at') is None and w.get('tags') and len(w.get('tags', [])) > 0
-        ])
-        workspaces_with_colors = len([
-            w for w in all_workspaces
-            if w.get('deleted_at') is None and w.get('color') is not None
-        ])
-        
         active_and_archived = active_count + archived_count
         feature_adoption = {
             'favoritesPct': round((workspaces_with_favorites / active_and_archived * 100), 1) if active_and_archived > 0 else 0,
@@ -1090,13 +1090,14 @@ def handle_get_workspace_activity(
             filters={'ws_id': workspace_id}
         )
         
-        # Enrich with user profile data
+        # Enrich with user profile data (one query for all profiles)
+        profiles = common.load_many(
+            'user_profiles',
+            [activity['user_id'] for activity in activities],
+            column='user_id'
+        )
         enriched_activities = []
-        for activity in activities:
-            profile = common.find_one(
-                table='user_profiles',
-                filters={'user_id': activity['user_id']}
-            )
+        for activity, profile in zip(activities, profiles):
             enriched_activities.append({
                 'id': activity.get('id'),
                 'action': activity.get('action'),
@@ -1228,6 +1229,7 @@ def handle_transfer_ownership(
                 )
             
             result = workspace
+        common.invalidate_auth_cache(resource_id=workspace_id)
         
         # Log activity
         _log_activity(workspace_id, user_id, 'Ownership transferred', {'new_owner_id': new_owner_id})
@@ -1293,13 +1295,14 @@ def handle_list_members(
             filters={'ws_id': workspace_id, 'deleted_at': None}
         )
         
-        # Enrich with user profile data
+        # Enrich with user profile data (one query for all profiles)
+        profiles = common.load_many(
+            'user_profiles',
+            [member['user_id'] for member in members],
+            column='user_id'
+        )
         enriched_members = []
-        for member in members:
-            profile = common.find_one(
-                table='user_profiles',
-                filters={'user_id': member['user_id']}
-            )
+        for member, profile in zip(members, profiles):
             # Always set profile fields, even if profile not found
             member['email'] = profile.get('email') if profile else None
             member['display_name'] = profile.get('display_name') if profile else None
@@ -1388,6 +1391,7 @@ def handle_add_member(
                 'created_by': user_id
             }
         )
+        common.invalidate_auth_cache(resource_id=workspace_id)
         
         # Log activity
         _log_activity(workspace_id, user_id, 'Member added', {'member_user_id': member_user_id, 'role': ws_role})
@@ -1471,6 +1475,7 @@ def handle_update_member(
             filters={'id': member_id},
             data={'ws_role': ws_role, 'updated_by': user_id}
         )
+        common.invalidate_auth_cache(resource_id=workspace_id)
         
         # Log activity
         _log_activity(workspace_id, user_id, 'Member role updated', {'member_id': member_id, 'new_role': ws_role})
@@ -1545,6 +1550,7 @@ def handle_remove_member(
             filters={'id': member_id},
             data={'deleted_at': 'NOW()'}
         )
+        common.invalidate_auth_cache(resource_id=workspace_id)
         
         # Remove favorite if exists
         common.delete_many(
@@ -1860,6 +1866,7 @@ def handle_admin_list_workspaces(
             workspaces = common.find_many(table='workspaces', filters=filters)
         
         # Enrich with member counts and owner info
+        owner_ids = {}
         for workspace in workspaces:
             # Get member count
             members = common.find_many(
@@ -1871,8 +1878,16 @@ def handle_admin_list_workspaces(
             # Get owner info
             owners = [m for m in members if m.get('ws_role') == 'ws_owner']
             if owners:
-                owner = owners[0]  # Get first owner
-                profile = common.find_one('user_profiles', {'user_id': owner['user_id']})
+                owner_ids[workspace['id']] = owners[0]['user_id']  # Get first owner
+        
+        # Owner profiles in one query
+        owner_profiles = dict(zip(
+            owner_ids.values(),
+            common.load_many('user_profiles', list(owner_ids.values()), column='user_id')
+        ))
+        for workspace in workspaces:
+            if workspace['id'] in owner_ids:
+                profile = owner_profiles.get(owner_ids[workspace['id']])
                 workspace['owner_name'] = profile.get('display_name') if profile else 'Unknown'
                 workspace['owner_email'] = profile.get('email') if profile else None
         
@@ -27,7 +27,7 @@ See: docs/standards/03_std_back_RESOURCE-PERMISSIONS.md
 """
 
 from typing import Optional, List, Dict, Any
-from org_common import rpc
+import org_common as common
 
 
 def is_ws_owner(user_id: str, ws_id: str) -> bool:
@@ -51,7 +51,7 @@ def is_ws_owner(user_id: str, ws_id: str) -> bool:
         >>>     common.delete_one('workspaces', {'id': ws_id})
     """
     # ADR-019c: RPC function expects (p_user_id, p_ws_id) parameter order
-    return rpc(function_name='is_ws_owner', params={
+    return common.rpc(function_name='is_ws_owner', params={
         'p_user_id': user_id,
         'p_ws_id': ws_id
     })
@@ -80,7 +80,7 @@ def can_view_ws(user_id: str, ws_id: str) -> bool:
         >>>     members = common.find_many('workspace_members', {'ws_id': ws_id})
     """
     # ADR-019c: RPC function expects (p_user_id, p_ws_id) parameter order
-    return rpc(function_name='is_ws_member', params={
+    return common.rpc(function_name='is_ws_member', params={
         'p_user_id': user_id,
         'p_ws_id': ws_id
     })
@@ -113,7 +113,7 @@ def can_edit_ws(user_id: str, ws_id: str) -> bool:
         >>>     })
     """
     # ADR-019c: RPC function expects (p_user_id, p_ws_id) parameter order
-    return rpc(function_name='is_ws_admin_or_owner', params={
+    return common.rpc(function_name='is_ws_admin_or_owner', params={
         'p_user_id': user_id,
         'p_ws_id': ws_id
     })
@@ -183,7 +183,7 @@ def get_accessible_workspaces(
         >>>     print(f"{ws['name']} ({ws['user_role']}) - {ws['member_count']} members")
     """
     # Use existing get_ws_with_member_info RPC function
-    result = rpc(function_name='get_ws_with_member_info', params={
+    result = common.rpc(function_name='get_ws_with_member_info', params={
         'p_org_id': org_id,
         'p_user_id': user_id,
         'p_favorites_only': favorites_only,
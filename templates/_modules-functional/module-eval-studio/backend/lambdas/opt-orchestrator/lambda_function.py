@@ -1323,13 +1323,14 @@ def import_truth_set_json(truth_set_data: Dict[str, Any], run_id: str, ws_id: st
     criteria_set = common.find_one('eval_criteria_sets', {'id': criteria_set_id})
     criteria_set_version = int(float(criteria_set.get('version', 1)))
     
-    documents_imported = 0
-    evaluations_imported = 0
+    # Get default status (required field)
+    default_statuses = common.find_many('eval_sys_status_options', {}, order='score_value.asc', limit=1)
     
-    # Import each document
-    for doc in truth_set_data.get('documents', []):
-        # Create doc_group
-        doc_group_data = {
+    documents = truth_set_data.get('documents', [])
+    
+    # Create doc_groups in one batched insert
+    doc_groups = common.insert_many('eval_opt_doc_groups', [
+        {
             'ws_id': ws_id,
             'run_id': run_id,
             'name': doc.get('document_name'),
@@ -1337,11 +1338,23 @@ def import_truth_set_json(truth_set_data: Dict[str, Any], run_id: str, ws_id: st
             'status': 'evaluated',
             'created_by': user_id
         }
-        
-        doc_group = common.insert_one('eval_opt_doc_groups', doc_group_data)
-        documents_imported += 1
-        
-        # Import evaluations as truth keys
+        for doc in documents
+    ]).records
+    
+    # Pair documents with their groups by (name, primary_doc_id); RETURNING
+    # order is not guaranteed. Groups with the same key are interchangeable.
+    def group_key(name: Optional[str], doc_id: Optional[str]) -> tuple:
+        return (name, str(doc_id).lower() if doc_id else None)
+    
+    groups_by_key: Dict[tuple, List[Dict[str, Any]]] = {}
+    for doc_group in doc_groups:
+        key = group_key(doc_group.get('name'), doc_group.get('primary_doc_id'))
+        groups_by_key.setdefault(key, []).append(doc_group)
+    
+    # Import evaluations as truth keys
+    truth_keys = []
+    for doc in documents:
+        doc_group = groups_by_key[group_key(doc.get('document_name'), doc.get('document_id'))].pop()
         for evaluation in doc.get('evaluations', []):
             truth_key_data = {
                 'group_id': doc_group['id'],
@@ -1361,17 +1374,16 @@ def import_truth_set_json(truth_set_data: Dict[str, Any], run_id: str, ws_id: st
                 'evaluated_by': user_id
             }
             
-            # Get default status (required field)
-            default_statuses = common.find_many('eval_sys_status_options', {}, order='score_value.asc', limit=1)
             if default_statuses and len(default_statuses) > 0:
                 truth_key_data['truth_status_id'] = default_statuses[0]['id']
             
-            common.insert_one('eval_opt_truth_keys', truth_key_data)
-            evaluations_imported += 1
+            truth_keys.append(truth_key_data)
+    
+    result = common.insert_many('eval_opt_truth_keys', truth_keys, returning='minimal')
     
     return {
-        'documents_imported': documents_imported,
-        'evaluations_imported': evaluations_imported
+        'documents_imported': len(doc_groups),
+        'evaluations_imported': result.written
     }
 
 
@@ -1818,6 +1830,7 @@ def process_optimization_run(
                 )
                 
                 # Compare results to truth keys (Sprint 5 Phase 3: score-based comparison)
+                group_results = []
                 for truth_key in truth_keys:
                     criteria_item_id = truth_key.get('criteria_item_id')
                     
@@ -1849,31 +1862,38 @@ def process_optimization_run(
                         result_type = 'false_positive'
                         var_result['false_positives'] += 1
                     
-                    # Save individual result with score-based fields
-                    # Part 1B: Try/except as safety net for duplicate key conflicts
-                    try:
-                        result_data = {
-                            'run_id': run_id,
-                            'group_id': group['id'],
-                            'criteria_item_id': criteria_item_id,
-                            'truth_key_id': truth_key['id'],
-                            'variation_name': variation.name,
-                            'ai_score': ai_score,
-                            'ai_result': ai_result,  # Full JSON response
-                            'score_diff': score_diff,
-                            'status_match': status_match,
-                            'result_type': result_type,
-                            'ai_status_id': None  # DEPRECATED (nullable)
-                        }
-                        # S6: Add execution_id if provided
-                        if execution_id:
-                            result_data['execution_id'] = execution_id
-                        
-                        common.insert_one('eval_opt_run_results', result_data)
-                    except Exception as insert_error:
-                        # Log but don't fail - Part 1A cleanup should prevent this
-                        logger.warning(f"Duplicate result for variation={variation.name}, criterion={criteria_item_id}: {insert_error}")
-                        continue
+                    # Collect individual result with score-based fields
+                    result_data = {
+                        'run_id': run_id,
+                        'group_id': group['id'],
+                        'criteria_item_id': criteria_item_id,
+                        'truth_key_id': truth_key['id'],
+                        'variation_name': variation.name,
+                        'ai_score': ai_score,
+                        'ai_result': ai_result,  # Full JSON response
+                        'score_diff': score_diff,
+                        'status_match': status_match,
+                        'result_type': result_type,
+                        'ai_status_id': None  # DEPRECATED (nullable)
+                    }
+                    # S6: Add execution_id if provided
+                    if execution_id:
+                        result_data['execution_id'] = execution_id
+                    group_results.append(result_data)
+                
+                # Save the group's results in one batched request
+                # Part 1B: ignore_duplicates is the safety net for duplicate key conflicts
+                save_result = common.upsert_many(
+                    'eval_opt_run_results',
+                    group_results,
+                    on_conflict='run_id,group_id,criteria_item_id,variation_name',
+                    ignore_duplicates=True,
+                    returning='minimal',
+                    raise_on_error=False
+                )
+                for batch_error in save_result.errors:
+                    # Log but don't fail - Part 1A cleanup should prevent this
+                    logger.warning(f"Failed to save {batch_error.size} results for variation={variation.name}, group={group['id']}: {batch_error.error}")
                 
                 completed += 1
                 criteria_evaluated += len(truth_keys)
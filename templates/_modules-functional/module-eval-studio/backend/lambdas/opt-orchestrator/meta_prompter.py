@@ -361,8 +361,6 @@ def _call_azure(
     
     Includes automatic retry with exponential backoff for rate limiting errors.
     """
-    import requests
-    
     headers = {
         "Content-Type": "application/json",
         "api-key": api_key
@@ -377,7 +375,7 @@ def _call_azure(
         "max_tokens": max_tokens
     }
     
-    response = requests.post(
+    response = common.get_http_session().post(
         f"{endpoint}/chat/completions",
         headers=headers,
         json=payload,
@@ -441,9 +439,7 @@ def _call_bedrock(
     
     Includes automatic retry with exponential backoff for rate limiting errors.
     """
-    import boto3
-    
-    client = boto3.client('bedrock-runtime')
+    client = common.get_boto3_client('bedrock-runtime')
     
     # Build request body based on vendor
     if model_vendor == 'anthropic':
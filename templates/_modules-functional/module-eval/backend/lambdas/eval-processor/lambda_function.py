@@ -1253,7 +1253,8 @@ def call_openai(
     try:
         import openai
         
-        client = openai.OpenAI(api_key=api_key)
+        # Shared connection pool: warm containers skip TCP/TLS setup
+        client = openai.OpenAI(api_key=api_key, http_client=common.get_httpx_client())
         
         response = client.chat.completions.create(
             model=model_name,
@@ -1284,7 +1285,8 @@ def call_anthropic(
     try:
         import anthropic
         
-        client = anthropic.Anthropic(api_key=api_key)
+        # Shared connection pool: warm containers skip TCP/TLS setup
+        client = anthropic.Anthropic(api_key=api_key, http_client=common.get_httpx_client())
         
         response = client.messages.create(
             model=model_name,
@@ -1320,9 +1322,7 @@ def call_bedrock(
     - meta, mistral, cohere, etc.: Vendor-specific formats as needed
     """
     try:
-        import boto3
-        
-        client = boto3.client('bedrock-runtime')
+        client = common.get_boto3_client('bedrock-runtime')
         
         # Determine API format based on model vendor
         if model_vendor == 'anthropic':
@@ -39,9 +39,11 @@ DAILY_API_KEY_SECRET_ARN = os.environ.get('DAILY_API_KEY_SECRET_ARN')
 WEBSOCKET_API_URL = os.environ.get('WEBSOCKET_API_URL')
 
 # AWS clients
-secrets_client = boto3.client('secretsmanager')
 ecs_client = boto3.client('ecs')
 
+# Fetch secrets during cold-start init rather than on the first request
+common.prefetch_secrets([os.environ.get('SUPABASE_SECRET_ARN'), DAILY_API_KEY_SECRET_ARN])
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -606,8 +608,8 @@ def handle_start_session(event: Dict[str, Any], user_id: str, session_id: str) -
 # DAILY.CO INTEGRATION
 # =============================================================================
 
-def _get_daily_api_key(org_id: str) -> str:
-    """Get Daily.co API key from AWS Secrets Manager."""
+def _get_daily_secret_arn(org_id: str) -> str:
+    """Get the Secrets Manager ARN holding the org's Daily.co API key."""
     # First check for org-specific credentials
     credential = common.find_one(
         table='voice_credentials',
@@ -623,40 +625,54 @@ def _get_daily_api_key(org_id: str) -> str:
     if not secret_arn:
         raise common.ValidationError('Daily.co API key not configured')
     
-    response = secrets_client.get_secret_value(SecretId=secret_arn)
-    secret_data = json.loads(response['SecretString'])
-    return secret_data.get('api_key') or secret_data.get('DAILY_API_KEY')
+    return secret_arn
+
+
+def _daily_post(org_id: str, path: str, payload: Dict[str, Any]) -> requests.Response:
+    """
+    POST to the Daily.co API with the org's API key.
+    
+    The key comes from the shared secrets cache; if Daily.co rejects it
+    (rotated key), it is refetched and the request retried once.
+    """
+    def post(secret_string: str) -> requests.Response:
+        secret_data = json.loads(secret_string)
+        api_key = secret_data.get('api_key') or secret_data.get('DAILY_API_KEY')
+        response = requests.post(
+            f'{DAILY_API_BASE}{path}',
+            headers={
+                'Authorization': f'Bearer {api_key}',
+                'Content-Type': 'application/json'
+            },
+            json=payload,
+            timeout=30
+        )
+        if response.status_code == 401:
+            raise common.SecretRejectedError(f'Daily.co rejected the API key: {response.text}')
+        return response
+    
+    return common.call_with_secret(_get_daily_secret_arn(org_id), post)
 
 
 def _create_daily_room(org_id: str, session_id: str) -> Dict[str, str]:
     """Create a Daily.co room for the interview session."""
-    api_key = _get_daily_api_key(org_id)
-    
     room_name = f"voice-{session_id[:8]}"
     
     # Room expires in 24 hours
     exp_time = int((datetime.utcnow() + timedelta(hours=24)).timestamp())
     
-    response = requests.post(
-        f'{DAILY_API_BASE}/rooms',
-        headers={
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
-        },
-        json={
-            'name': room_name,
-            'privacy': 'private',
-            'properties': {
-                'exp': exp_time,
-                'max_participants': 2,
-                'enable_recording': False,
-                'enable_chat': False,
-                'start_audio_off': False,
-                'start_video_off': True
-            }
-        },
-        timeout=30
-    )
+    response = _daily_post(org_id, '/rooms', {
+        'name': room_name,
+        'privacy': 'private',
+        'properties': {
+            'exp': exp_time,
+            'max_participants': 2,
+            'enable_recording': False,
+            'enable_chat': False,
+            'start_audio_off': False,
+            'start_video_off': True
+        }
+    })
     
     if response.status_code != 200:
         print(f'Daily.co room creation failed: {response.text}')
@@ -671,27 +687,17 @@ def _create_daily_room(org_id: str, session_id: str) -> Dict[str, str]:
 
 def _create_meeting_token(org_id: str, room_name: str, is_bot: bool = False) -> str:
     """Create a meeting token for room access."""
-    api_key = _get_daily_api_key(org_id)
-    
     # Token expires in 2 hours
     exp_time = int((datetime.utcnow() + timedelta(hours=2)).timestamp())
     
-    response = requests.post(
-        f'{DAILY_API_BASE}/meeting-tokens',
-        headers={
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
-        },
-        json={
-            'properties': {
-                'room_name': room_name,
-                'is_owner': is_bot,
-                'exp': exp_time,
-                'user_name': 'Interview Bot' if is_bot else 'Candidate'
-            }
-        },
-        timeout=30
-    )
+    response = _daily_post(org_id, '/meeting-tokens', {
+        'properties': {
+            'room_name': room_name,
+            'is_owner': is_bot,
+            'exp': exp_time,
+            'user_name': 'Interview Bot' if is_bot else 'Candidate'
+        }
+    })
     
     if response.status_code != 200:
         print(f'Daily.co token creation failed: {response.text}')
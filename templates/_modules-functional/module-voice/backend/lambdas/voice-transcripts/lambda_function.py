@@ -26,6 +26,7 @@ S3_BUCKET_NAME = os.environ.get('VOICE_TRANSCRIPTS_BUCKET')
 s3_client = boto3.client('s3')
 
 
+@common.request_scope
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for voice transcript operations.
@@ -5,7 +5,7 @@ Module-specific permission functions for voice resources.
 All functions wrap database RPC calls with Python-friendly interface.
 """
 
-from org_common.db import rpc
+import org_common as common
 
 
 def can_view_voice_session(user_id: str, session_id: str) -> bool:
@@ -19,7 +19,7 @@ def can_view_voice_session(user_id: str, session_id: str) -> bool:
     Returns:
         True if user has permission, False otherwise
     """
-    return rpc('can_view_voice_session', {
+    return common.rpc('can_view_voice_session', {
         'p_user_id': user_id,
         'p_session_id': session_id
     })
@@ -36,7 +36,7 @@ def can_edit_voice_session(user_id: str, session_id: str) -> bool:
     Returns:
         True if user has permission, False otherwise
     """
-    return rpc('can_edit_voice_session', {
+    return common.rpc('can_edit_voice_session', {
         'p_user_id': user_id,
         'p_session_id': session_id
     })
@@ -53,7 +53,7 @@ def can_delete_voice_session(user_id: str, session_id: str) -> bool:
     Returns:
         True if user has permission, False otherwise
     """
-    return rpc('can_delete_voice_session', {
+    return common.rpc('can_delete_voice_session', {
         'p_user_id': user_id,
         'p_session_id': session_id
     })
@@ -70,7 +70,7 @@ def can_view_voice_config(user_id: str, config_id: str) -> bool:
     Returns:
         True if user has permission, False otherwise
     """
-    return rpc('can_view_voice_config', {
+    return common.rpc('can_view_voice_config', {
         'p_user_id': user_id,
         'p_config_id': config_id
     })
@@ -87,7 +87,7 @@ def can_edit_voice_config(user_id: str, config_id: str) -> bool:
     Returns:
         True if user has permission, False otherwise
     """
-    return rpc('can_edit_voice_config', {
+    return common.rpc('can_edit_voice_config', {
         'p_user_id': user_id,
         'p_config_id': config_id
     })
@@ -104,7 +104,7 @@ def can_view_voice_transcript(user_id: str, transcript_id: str) -> bool:
     Returns:
         True if user has permission, False otherwise
     """
-    return rpc('can_view_voice_transcript', {
+    return common.rpc('can_view_voice_transcript', {
         'p_user_id': user_id,
         'p_transcript_id': transcript_id
     })
@@ -121,7 +121,7 @@ def can_view_voice_analytics(user_id: str, session_id: str) -> bool:
     Returns:
         True if user has permission, False otherwise
     """
-    return rpc('can_view_voice_analytics', {
+    return common.rpc('can_view_voice_analytics', {
         'p_user_id': user_id,
         'p_session_id': session_id
     })
@@ -4,9 +4,14 @@ Extracts JSX elements and their attributes for accessibility validation
 """
 
 import re
+import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+# Shared project file index (validation/shared)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from shared.project_index import get_project_index
+
 
 class ComponentParser:
     """Parses React/TSX files to extract JSX elements and attributes."""
@@ -43,21 +48,17 @@ class ComponentParser:
         }
         
         results = []
-        for file_path in directory.rglob('*'):
-            # Skip if any parent directory is in excluded list
-            if any(excluded in file_path.parts for excluded in excluded_dirs):
-                continue
-            
-            # Only process actual files, not directories
-            if not file_path.is_file():
-                continue
-                
-            if file_path.suffix in self.supported_extensions:
-                if self.verbose:
-                    print(f"Parsing: {file_path}")
-                result = self.parse_file(str(file_path))
-                if result:
-                    results.append(result)
+        index = get_project_index(directory)
+        for file_path in index.files(
+            under=directory,
+            suffixes=self.supported_extensions,
+            exclude_dirs=excluded_dirs,
+        ):
+            if self.verbose:
+                print(f"Parsing: {file_path}")
+            result = self.parse_file(str(file_path))
+            if result:
+                results.append(result)
         
         return results
     
@@ -11,10 +11,15 @@ Usage:
 
 import ast
 import re
+import sys
 import json
 from pathlib import Path
 from typing import List, Dict, Any, Set
 
+# Shared project file index (validation/shared)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.project_index import get_project_index, KIND_LAMBDA
+
 
 def snake_to_camel(snake_str: str) -> str:
     """Convert snake_case to camelCase"""
@@ -557,8 +562,9 @@ def validate_project_api_responses(project_path: Path) -> Dict[str, Any]:
         backend_paths.append(module_template_lambdas)
     
     # Scan all discovered paths
+    index = get_project_index(project_path)
     for backend_path in backend_paths:
-        for lambda_file in backend_path.rglob("lambda_function.py"):
+        for lambda_file in index.files(kind=KIND_LAMBDA, under=backend_path):
             lambda_files.append(lambda_file)
             file_violations = check_lambda_response_format(lambda_file)
             violations.extend(file_violations)
@@ -1014,12 +1020,12 @@ def validate_frontend_files(project_path: Path) -> Dict[str, Any]:
                     frontend_paths.append(frontend_path)
     
     # Scan all discovered frontend paths
+    index = get_project_index(project_path)
     for frontend_path in frontend_paths:
         for pattern in FRONTEND_FILE_PATTERNS:
-            for ts_file in frontend_path.rglob(pattern):
-                # Skip node_modules and other excluded dirs
-                if any(skip_dir in ts_file.parts for skip_dir in SKIP_DIRS):
-                    continue
+            suffix = pattern.lstrip('*')
+            # Skip node_modules and other excluded dirs
+            for ts_file in index.files(under=frontend_path, suffixes=(suffix,), exclude_dirs=SKIP_DIRS):
                 
                 # Skip type definition files (*.d.ts) as they define expected shape
                 if ts_file.name.endswith('.d.ts'):
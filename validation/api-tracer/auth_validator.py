@@ -14,6 +14,8 @@ from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from source_cache import get_parsed_source, line_number, parse_python, source_segment
+
 logger = logging.getLogger(__name__)
 
 
@@ -213,7 +215,7 @@ class FrontendAuthValidator:
             True if server component, False if client component
         """
         # Check for "use client" directive at start of file (after comments/imports)
-        lines = content.split('\n')
+        lines = get_parsed_source(content).lines
         
         for line in lines[:20]:  # Check first 20 lines
             line_stripped = line.strip()
@@ -287,7 +289,7 @@ class FrontendAuthValidator:
                         # Check if component exists in known components
                         if component_name not in self.known_components:
                             # Component doesn't exist - report error
-                            line = content[:match.start()].count('\n') + 1
+                            line = line_number(content, match.start())
                             self.issues.append(AuthIssue(
                                 severity='error',
                                 issue_type=AuthIssueType.ADMIN_MISSING_USE_USER,  # Reuse existing type
@@ -526,7 +528,7 @@ class FrontendAuthValidator:
             return
         
         destructured = match.group(1)
-        line = content[:match.start()].count('\n') + 1
+        line = line_number(content, match.start())
         
         # Valid properties from useRole hook
         valid_props = {'role', 'hasPermission', 'isSysAdmin', 'isOrgAdmin'}
@@ -585,7 +587,7 @@ class FrontendAuthValidator:
         # NEW: Check for hasRole() function calls (function doesn't exist)
         if re.search(r'hasRole\s*\(', content):
             match = re.search(r'hasRole\s*\(', content)
-            call_line = content[:match.start()].count('\n') + 1
+            call_line = line_number(content, match.start())
             self.issues.append(AuthIssue(
                 severity='error',
                 issue_type=AuthIssueType.ADMIN_INVALID_HOOK_DESTRUCTURING,
@@ -613,7 +615,7 @@ class FrontendAuthValidator:
         
         for pattern in patterns:
             for match in re.finditer(pattern, content):
-                line = content[:match.start()].count('\n') + 1
+                line = line_number(content, match.start())
                 route = match.group(0).strip('"\'`')
                 
                 # Extract the path after /orgs/${orgId}/
@@ -648,7 +650,7 @@ class FrontendAuthValidator:
             match = re.search(pattern, content)
             if match:
                 # Find line number
-                line = content[:match.start()].count('\n') + 1
+                line = line_number(content, match.start())
                 self.issues.append(AuthIssue(
                     severity='error',
                     issue_type=AuthIssueType.ADMIN_DIRECT_ROLE_ACCESS,
@@ -820,7 +822,7 @@ class FrontendAuthValidator:
             
             if not path_found and called_paths:  # Only flag if component has some API calls
                 line = content.find(doc_path)
-                line_num = content[:line].count('\n') + 1 if line > 0 else 1
+                line_num = line_number(content, line) if line > 0 else 1
                 
                 self.issues.append(AuthIssue(
                     severity='warning',
@@ -852,7 +854,7 @@ class FrontendAuthValidator:
         Also detects anti-pattern:
         - /orgs/${orgId}/... (path parameter instead of query parameter)
         """
-        lines = content.split('\n')
+        lines = get_parsed_source(content).lines
         
         # First, check for anti-pattern: /orgs/${orgId}/... (path parameter)
         # This is WRONG per ADR-019 - should use /admin/org/*?orgId= instead
@@ -920,7 +922,7 @@ class FrontendAuthValidator:
         for match in re.finditer(arrow_pattern, content):
             func_name = match.group(1)
             route = match.group(2)
-            line = content[:match.start()].count('\n') + 1
+            line = line_number(content, match.start())
             
             # Check if orgId is in the URL (either as query param or template)
             url_part = content[match.start():match.end()]
@@ -983,7 +985,7 @@ class LambdaAuthValidator:
         self.ws_routes = []
         
         try:
-            tree = ast.parse(content, filename=file_path)
+            tree = parse_python(content, filename=file_path)
         except SyntaxError as e:
             logger.warning(f"Syntax error parsing {file_path}: {e}")
             return []
@@ -1278,7 +1280,7 @@ class LambdaAuthValidator:
         for pattern in anti_patterns:
             match = re.search(pattern, content)
             if match:
-                line = content[:match.start()].count('\n') + 1
+                line = line_number(content, match.start())
                 self.issues.append(AuthIssue(
                     severity='error',
                     issue_type=AuthIssueType.ADMIN_DIRECT_JWT_ROLE_ACCESS,
@@ -1304,7 +1306,7 @@ class LambdaAuthValidator:
         
         for node in ast.walk(tree):
             if isinstance(node, ast.FunctionDef):
-                func_content = ast.get_source_segment(content, node) if hasattr(ast, 'get_source_segment') else ""
+                func_content = source_segment(content, node)
                 
                 # Check for auth patterns in this function
                 auth_patterns = ['check_sys_admin', 'check_org_admin', 'check_ws_admin', 
@@ -1351,7 +1353,7 @@ class LambdaAuthValidator:
     
     def _find_route_line(self, content: str, route_pattern: str) -> int:
         """Find the line number where a route pattern appears."""
-        lines = content.split('\n')
+        lines = get_parsed_source(content).lines
         for i, line in enumerate(lines, 1):
             if route_pattern in line:
                 return i
@@ -1388,7 +1390,7 @@ class ResourcePermissionValidator:
         self.issues = []
         
         try:
-            tree = ast.parse(content, filename=file_path)
+            tree = parse_python(content, filename=file_path)
         except SyntaxError as e:
             logger.warning(f"Syntax error parsing {file_path}: {e}")
             return []
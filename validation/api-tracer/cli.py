@@ -148,6 +148,12 @@ logger = logging.getLogger(__name__)
     default=None,
     help='Route patterns to exclude from orphaned route warnings (e.g., ^/internal/, ^/webhooks/). Can be specified multiple times.'
 )
+@click.option(
+    '--workers',
+    type=int,
+    default=1,
+    help='Worker processes for per-file analysis (1 = serial, 0 = one per CPU). Results are identical to a serial run.'
+)
 def validate(
     path: str, 
     output: str, 
@@ -169,7 +175,8 @@ def validate(
     no_db_functions: bool,
     db_only: bool,
     module: str,
-    exclude_routes: tuple
+    exclude_routes: tuple,
+    workers: int
 ):
     """
     Validate API contracts across frontend, API Gateway, and Lambda layers.
@@ -307,7 +314,8 @@ def validate(
             validate_layer1=validate_layer1,
             validate_layer2=validate_layer2,
             module_filter=module,
-            route_exclusion_patterns=route_exclusions
+            route_exclusion_patterns=route_exclusions,
+            workers=workers
         )
         
         # Set DB function validation flag
@@ -24,6 +24,8 @@ from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from source_cache import get_parsed_source, parse_python
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,7 +99,7 @@ class RoleNamingValidator:
     def validate_content(self, file_path: str, content: str) -> List[CodeQualityIssue]:
         """Validate content for role naming violations."""
         issues = []
-        lines = content.split('\n')
+        lines = get_parsed_source(content).lines
         
         for line_num, line in enumerate(lines, 1):
             # Skip comment lines
@@ -178,7 +180,7 @@ class APIResponseValidator:
         issues = []
         
         try:
-            tree = ast.parse(content)
+            tree = parse_python(content)
         except SyntaxError:
             return issues
         
@@ -223,7 +225,7 @@ class APIResponseValidator:
     def validate_frontend_content(self, file_path: str, content: str) -> List[CodeQualityIssue]:
         """Validate frontend file for snake_case property access."""
         issues = []
-        lines = content.split('\n')
+        lines = get_parsed_source(content).lines
         
         # Pattern for interface property definitions with snake_case
         interface_pattern = re.compile(r'^\s+([a-z][a-z0-9]*(?:_[a-z0-9]+)+)\s*\??\s*:')
@@ -521,7 +523,7 @@ class KeyConsistencyValidator:
         issues = []
         
         try:
-            tree = ast.parse(content)
+            tree = parse_python(content)
         except SyntaxError:
             return issues
         
@@ -651,7 +653,7 @@ class RPCFunctionValidator:
     def validate_lambda_content(self, file_path: str, content: str) -> List[CodeQualityIssue]:
         """Validate Lambda file for RPC function calls."""
         issues = []
-        lines = content.split('\n')
+        lines = get_parsed_source(content).lines
         
         for line_num, line in enumerate(lines, 1):
             for pattern in self.RPC_PATTERNS:
@@ -736,7 +738,7 @@ class ImportSignatureValidator:
         issues = []
         
         try:
-            tree = ast.parse(content)
+            tree = parse_python(content)
         except SyntaxError:
             return issues
         
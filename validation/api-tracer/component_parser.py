@@ -42,12 +42,13 @@ class ComponentParser:
         self.component_routes: List[ComponentRoute] = []
         self.components_with_metadata: Set[str] = set()
     
-    def parse_component_file(self, file_path: str) -> List[ComponentRoute]:
+    def parse_component_file(self, file_path: str, content: Optional[str] = None) -> List[ComponentRoute]:
         """
         Parse a component file to extract @routes metadata.
         
         Args:
             file_path: Path to the component file (.tsx or .ts)
+            content: File contents, if already loaded (read from disk otherwise)
             
         Returns:
             List of ComponentRoute objects
@@ -55,8 +56,9 @@ class ComponentParser:
         routes = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
             
             # Find @component and @routes docstring
             # Pattern: /**\n * @component ComponentName\n * @routes\n * - METHOD /path - Description\n */
@@ -98,7 +100,12 @@ class ComponentParser:
         
         return routes
     
-    def parse_directory(self, directory: str, pattern: str = "**/components/admin/*.tsx") -> List[ComponentRoute]:
+    def parse_directory(
+        self,
+        directory: str,
+        pattern: str = "**/components/admin/*.tsx",
+        project_index=None,
+    ) -> List[ComponentRoute]:
         """
         Parse all admin component files in a directory.
         
@@ -109,6 +116,7 @@ class ComponentParser:
         Args:
             directory: Directory path
             pattern: Glob pattern for component files (default for module components)
+            project_index: Optional shared ProjectIndex to query instead of walking the tree
             
         Returns:
             List of all ComponentRoute objects found
@@ -126,10 +134,19 @@ class ComponentParser:
         
         # Find all admin component files across all patterns
         for glob_pattern in patterns:
-            for file_path in path.glob(glob_pattern):
-                if file_path.is_file():
-                    routes = self.parse_component_file(str(file_path))
-                    all_routes.extend(routes)
+            if project_index is not None:
+                for file_path in project_index.glob(glob_pattern, under=path):
+                    try:
+                        content = project_index.read_text(file_path)
+                    except Exception as e:
+                        logger.error(f"Failed to parse component file {file_path}: {e}")
+                        continue
+                    all_routes.extend(self.parse_component_file(str(file_path), content))
+            else:
+                for file_path in path.glob(glob_pattern):
+                    if file_path.is_file():
+                        routes = self.parse_component_file(str(file_path))
+                        all_routes.extend(routes)
         
         logger.info(f"Parsed directory {directory}: found {len(all_routes)} component routes in {len(self.components_with_metadata)} components")
         
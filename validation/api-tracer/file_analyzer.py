@@ -0,0 +1,182 @@
+"""
+Per-File Analysis Fan-Out
+
+Runs a per-file analysis pass (frontend API call parsing, Lambda route
+parsing, code quality and auth checks) over a list of files, either in
+this process or across a ProcessPoolExecutor (api-tracer --workers N).
+
+Files are sent to worker processes in chunks together with their
+contents, and results are returned in input order, so merged findings are
+identical to a serial run. Files whose findings are in the incremental
+results cache (shared/result_cache.py) are replayed and never dispatched.
+
+Usage:
+    analyzer = FileAnalyzer(workers=4)
+    results = analyzer.analyze(
+        TASK_CODE_QUALITY_LAMBDA, [(path, content), ...],
+        lambda path, content: validator.validate_lambda_file(str(path), content),
+        CodeQualityIssue, result_cache=cache,
+    )
+    analyzer.close()
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Analysis passes that can run in worker processes
+TASK_FRONTEND_CALLS = 'frontend_calls'
+TASK_LAMBDA_ROUTES = 'lambda_routes'
+TASK_CODE_QUALITY_LAMBDA = 'code_quality_lambda'
+TASK_CODE_QUALITY_FRONTEND = 'code_quality_frontend'
+TASK_AUTH_LAMBDA = 'auth_lambda'
+TASK_AUTH_FRONTEND = 'auth_frontend'
+
+# Chunks per worker: small enough to balance uneven files, large enough
+# to amortize pickling overhead
+CHUNKS_PER_WORKER = 4
+
+# Analyzer functions built in each worker process, keyed by (task, options)
+_worker_analyzers: Dict[Tuple[str, str], Callable[[str, str], list]] = {}
+
+
+def _build_analyzer(task: str, options: Dict[str, Any]) -> Callable[[str, str], list]:
+    """Create the analysis function for a task, configured like FullStackValidator's."""
+    # Imported here: the parsers import this module
+    if task == TASK_FRONTEND_CALLS:
+        from frontend_parser import FrontendParser
+        return FrontendParser().parse_file
+    if task == TASK_LAMBDA_ROUTES:
+        from lambda_parser import LambdaParser
+        return LambdaParser().parse_file
+    if task in (TASK_CODE_QUALITY_LAMBDA, TASK_CODE_QUALITY_FRONTEND):
+        from code_quality_validator import CodeQualityValidator
+        validator = CodeQualityValidator()
+        if task == TASK_CODE_QUALITY_LAMBDA:
+            return validator.validate_lambda_file
+        return validator.validate_frontend_file
+    if task == TASK_AUTH_LAMBDA:
+        from auth_validator import AuthLifecycleValidator
+        validator = AuthLifecycleValidator()
+        validate_layer2 = options.get('validate_layer2', False)
+        return lambda file_path, content: validator.validate_lambda_file(
+            file_path, content, validate_layer2=validate_layer2
+        )
+    if task == TASK_AUTH_FRONTEND:
+        from auth_validator import AuthLifecycleValidator
+        validator = AuthLifecycleValidator(known_components=set(options.get('known_components', [])))
+        return validator.validate_frontend_file
+    raise ValueError(f"Unknown analysis task: {task}")
+
+
+def _analyze_chunk(task: str, options: Dict[str, Any], chunk: List[Tuple[str, str]]) -> List[Tuple[Optional[list], Optional[str]]]:
+    """Worker entry point: analyze a chunk of (path, content) pairs."""
+    key = (task, json.dumps(options, sort_keys=True))
+    analyze = _worker_analyzers.get(key)
+    if analyze is None:
+        analyze = _worker_analyzers[key] = _build_analyzer(task, options)
+
+    results = []
+    for file_path, content in chunk:
+        try:
+            results.append((analyze(file_path, content), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+class FileAnalyzer:
+    """Runs per-file analysis passes serially or on a process pool."""
+
+    def __init__(self, workers: int = 1):
+        """
+        Args:
+            workers: Worker processes (1 = analyze in this process, 0 = one per CPU)
+        """
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def analyze(
+        self,
+        task: str,
+        items: List[Tuple[Path, str]],
+        local_fn: Callable[[Path, str], list],
+        cls: type,
+        result_cache=None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> List[list]:
+        """
+        Analyze files, returning each file's findings in input order.
+
+        Args:
+            task: TASK_* name (selects the analyzer in worker processes)
+            items: (file_path, content) pairs
+            local_fn: Serial analysis function, called in this process when
+                      workers == 1; must match the task's worker analyzer
+            cls: Findings dataclass (for the results cache)
+            result_cache: Optional ResultCache to replay unchanged files from
+            options: JSON-serializable analyzer config for worker processes
+
+        Returns:
+            One list of findings per item (empty if analysis failed)
+        """
+        results: List[Optional[list]] = [None] * len(items)
+        pending = []
+        for i, (file_path, content) in enumerate(items):
+            cached = result_cache.get(file_path, content) if result_cache is not None else None
+            if cached is not None:
+                results[i] = [cls(**fields) for fields in cached]
+            else:
+                pending.append(i)
+
+        if self.workers > 1 and len(pending) > 1:
+            computed = self._analyze_in_pool(task, [items[i] for i in pending], options or {})
+        else:
+            computed = []
+            for i in pending:
+                file_path, content = items[i]
+                try:
+                    computed.append((local_fn(file_path, content), None))
+                except Exception as e:
+                    computed.append((None, str(e)))
+
+        for i, (findings, error) in zip(pending, computed):
+            file_path, content = items[i]
+            if error is not None:
+                logger.warning(f"Failed to analyze {file_path} ({task}): {error}")
+                results[i] = []
+                continue
+            if result_cache is not None:
+                result_cache.put(file_path, content, [asdict(f) for f in findings])
+            results[i] = findings
+
+        return results
+
+    def _analyze_in_pool(self, task: str, items: List[Tuple[Path, str]], options: Dict[str, Any]) -> list:
+        """Fan items out to the process pool in chunks; results keep input order."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        chunk_size = max(1, -(-len(items) // (self.workers * CHUNKS_PER_WORKER)))
+        chunks = [
+            [(str(file_path), content) for file_path, content in items[start:start + chunk_size]]
+            for start in range(0, len(items), chunk_size)
+        ]
+        futures = [self._executor.submit(_analyze_chunk, task, options, chunk) for chunk in chunks]
+
+        computed = []
+        for future in futures:
+            computed.extend(future.result())
+        return computed
+
+    def close(self):
+        """Shut down worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
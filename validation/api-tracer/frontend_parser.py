@@ -11,6 +11,9 @@ from typing import Dict, List, Set, Optional, Any
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from source_cache import line_number
+from file_analyzer import FileAnalyzer, TASK_FRONTEND_CALLS
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,12 +39,13 @@ class FrontendParser:
         self.api_calls: List[APICall] = []
         self.current_file: str = ""
     
-    def parse_file(self, file_path: str) -> List[APICall]:
+    def parse_file(self, file_path: str, content: Optional[str] = None) -> List[APICall]:
         """
         Parse a TypeScript/JavaScript file to extract API calls.
         
         Args:
             file_path: Path to the TypeScript/JavaScript file
+            content: File contents, if already loaded (read from disk otherwise)
             
         Returns:
             List of APICall objects
@@ -50,8 +54,9 @@ class FrontendParser:
         self.api_calls = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
             
             # Parse different API call patterns
             self._parse_fetch_calls(content)
@@ -70,13 +75,23 @@ class FrontendParser:
             logger.error(f"Failed to parse {file_path}: {e}")
             return []
     
-    def parse_directory(self, directory: str, pattern: str = "**/*.{ts,tsx,js,jsx}") -> List[APICall]:
+    def parse_directory(
+        self,
+        directory: str,
+        pattern: str = "**/*.{ts,tsx,js,jsx}",
+        project_index=None,
+        result_cache=None,
+        file_analyzer: Optional[FileAnalyzer] = None,
+    ) -> List[APICall]:
         """
         Parse all TypeScript/JavaScript files in a directory.
         
         Args:
             directory: Directory path
             pattern: Glob pattern for files
+            project_index: Optional shared ProjectIndex to query instead of walking the tree
+            result_cache: Optional ResultCache to replay calls of unchanged files
+            file_analyzer: Optional FileAnalyzer to parse files on worker processes
             
         Returns:
             List of all APICall objects found
@@ -88,12 +103,30 @@ class FrontendParser:
         # Skip common directories that shouldn't be scanned
         skip_dirs = ['.next', 'node_modules', '.build', 'dist', 'build', '__pycache__', '.venv']
         
-        for ext in ['ts', 'tsx', 'js', 'jsx']:
-            for file_path in path.glob(f"**/*.{ext}"):
-                # Skip if file is in an excluded directory
-                if file_path.is_file() and not any(skip in str(file_path) for skip in skip_dirs):
-                    calls = self.parse_file(str(file_path))
-                    all_calls.extend(calls)
+        if project_index is not None:
+            items = []
+            for file_path in project_index.files(
+                under=path, suffixes=('.ts', '.tsx', '.js', '.jsx'), exclude_dirs=skip_dirs
+            ):
+                try:
+                    items.append((file_path, project_index.read_text(file_path)))
+                except Exception as e:
+                    logger.error(f"Failed to parse {file_path}: {e}")
+            
+            file_analyzer = file_analyzer or FileAnalyzer()
+            for calls in file_analyzer.analyze(
+                TASK_FRONTEND_CALLS, items,
+                lambda file_path, content: self.parse_file(str(file_path), content),
+                APICall, result_cache,
+            ):
+                all_calls.extend(calls)
+        else:
+            for ext in ['ts', 'tsx', 'js', 'jsx']:
+                for file_path in path.glob(f"**/*.{ext}"):
+                    # Skip if file is in an excluded directory
+                    if file_path.is_file() and not any(skip in str(file_path) for skip in skip_dirs):
+                        calls = self.parse_file(str(file_path))
+                        all_calls.extend(calls)
         
         logger.info(f"Parsed directory {directory}: found {len(all_calls)} total API calls")
         
@@ -174,7 +207,7 @@ class FrontendParser:
             method = match.group(2) if match.group(2) else 'GET'
             
             # Extract line number
-            line = content[:match.start()].count('\n') + 1
+            line = line_number(content, match.start())
             
             # Strip query parameters from endpoint
             endpoint, query_params = self._strip_query_params(raw_endpoint)
@@ -213,7 +246,7 @@ class FrontendParser:
             raw_endpoint = match.group(2)
             
             # Extract line number
-            line = content[:match.start()].count('\n') + 1
+            line = line_number(content, match.start())
             
             # Strip query parameters from endpoint
             endpoint, query_params = self._strip_query_params(raw_endpoint)
@@ -271,7 +304,7 @@ class FrontendParser:
             raw_endpoint = match.group(1)
             
             # Extract line number
-            line = content[:match.start()].count('\n') + 1
+            line = line_number(content, match.start())
             
             # Strip query parameters from endpoint
             endpoint, query_params = self._strip_query_params(raw_endpoint)
@@ -313,7 +346,7 @@ class FrontendParser:
             raw_endpoint = match.group(2)
             
             # Extract line number
-            line = content[:match.start()].count('\n') + 1
+            line = line_number(content, match.start())
             
             # Strip query parameters from endpoint
             endpoint, query_params = self._strip_query_params(raw_endpoint)
@@ -381,7 +414,7 @@ class FrontendParser:
             raw_endpoint = match.group(1)
             
             # Extract line number
-            line = content[:match.start()].count('\n') + 1
+            line = line_number(content, match.start())
             
             # Strip query parameters from endpoint
             endpoint, query_params = self._strip_query_params(raw_endpoint)
@@ -21,6 +21,9 @@ from typing import Dict, List, Set, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from source_cache import parse_python, source_segment
+from file_analyzer import FileAnalyzer, TASK_LAMBDA_ROUTES
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,7 +80,7 @@ class LambdaParser:
         self.routes: List[LambdaRoute] = []
         self.current_file: str = ""
     
-    def parse_file(self, file_path: str) -> List[LambdaRoute]:
+    def parse_file(self, file_path: str, source: Optional[str] = None) -> List[LambdaRoute]:
         """
         Parse a Python Lambda file to extract route handlers.
         
@@ -88,6 +91,7 @@ class LambdaParser:
         
         Args:
             file_path: Path to the Python Lambda file
+            source: File contents, if already loaded (read from disk otherwise)
             
         Returns:
             List of LambdaRoute objects
@@ -96,11 +100,12 @@ class LambdaParser:
         self.routes = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
+            if source is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    source = f.read()
             
             # Parse with AST
-            tree = ast.parse(source, filename=file_path)
+            tree = parse_python(source, filename=file_path)
             
             # Strategy 1: Try to extract routes from module docstring (dispatcher pattern)
             docstring_routes = self._parse_docstring_routes(tree, source)
@@ -126,13 +131,23 @@ class LambdaParser:
             logger.error(f"Failed to parse {file_path}: {e}")
             return []
     
-    def parse_directory(self, directory: str, pattern: str = "**/lambda_function.py") -> List[LambdaRoute]:
+    def parse_directory(
+        self,
+        directory: str,
+        pattern: str = "**/lambda_function.py",
+        project_index=None,
+        result_cache=None,
+        file_analyzer: Optional[FileAnalyzer] = None,
+    ) -> List[LambdaRoute]:
         """
         Parse all Lambda handler files in a directory.
         
         Args:
             directory: Directory path
             pattern: Glob pattern for files
+            project_index: Optional shared ProjectIndex to query instead of walking the tree
+            result_cache: Optional ResultCache to replay routes of unchanged files
+            file_analyzer: Optional FileAnalyzer to parse files on worker processes
             
         Returns:
             List of all LambdaRoute objects found
@@ -147,7 +162,13 @@ class LambdaParser:
         # __pycache__, .venv: Python artifacts
         skip_patterns = ['.build', '.next', 'node_modules', '__pycache__', '.venv', 'dist', 'build']
         
-        for file_path in path.glob(pattern):
+        if project_index is not None:
+            candidates = project_index.glob(pattern, under=path)
+        else:
+            candidates = path.glob(pattern)
+        
+        items = []
+        for file_path in candidates:
             # Skip files in build/artifact directories
             # Use Path.parts to check each directory component explicitly
             path_parts = file_path.parts
@@ -157,10 +178,24 @@ class LambdaParser:
                 logger.debug(f"Skipping build artifact: {file_path}")
                 continue
             
-            if file_path.is_file():
+            if project_index is not None:
+                try:
+                    items.append((file_path, project_index.read_text(file_path)))
+                except Exception as e:
+                    logger.error(f"Failed to parse {file_path}: {e}")
+            elif file_path.is_file():
                 routes = self.parse_file(str(file_path))
                 all_routes.extend(routes)
         
+        if items:
+            file_analyzer = file_analyzer or FileAnalyzer()
+            for routes in file_analyzer.analyze(
+                TASK_LAMBDA_ROUTES, items,
+                lambda file_path, source: self.parse_file(str(file_path), source),
+                LambdaRoute, result_cache,
+            ):
+                all_routes.extend(routes)
+        
         # Store accumulated routes in self.routes for validator access
         self.routes = all_routes
         
@@ -611,7 +646,7 @@ class LambdaParser:
                     method=compound_route['method'],
                     path=compound_route['path'],
                     path_params=compound_route.get('path_params', []),
-                    source_code=ast.get_source_segment(source, if_node) if hasattr(ast, 'get_source_segment') else ""
+                    source_code=source_segment(source, if_node)
                 ))
                 return
         
@@ -650,7 +685,7 @@ class LambdaParser:
                     handler_function=func_name,
                     method=method_value.upper(),
                     path=path,
-                    source_code=ast.get_source_segment(source, if_node) if hasattr(ast, 'get_source_segment') else ""
+                    source_code=source_segment(source, if_node)
                 ))
     
     def _check_compound_routing(self, bool_op: ast.BoolOp, func_name: str, source: str) -> Optional[Dict[str, Any]]:
@@ -782,7 +817,7 @@ class LambdaParser:
                             handler_function=func_name,
                             method=method,
                             path=path_value,
-                            source_code=ast.get_source_segment(source, if_node) if hasattr(ast, 'get_source_segment') else ""
+                            source_code=source_segment(source, if_node)
                         ))
         
         # Pattern 2: path == '/admin/ai/config'
@@ -814,7 +849,7 @@ class LambdaParser:
                         handler_function=func_name,
                         method=method,
                         path=path_value,
-                        source_code=ast.get_source_segment(source, if_node) if hasattr(ast, 'get_source_segment') else ""
+                        source_code=source_segment(source, if_node)
                     ))
     
     def _infer_path_from_function_name(self, func_name: str) -> str:
@@ -0,0 +1,160 @@
+"""
+Route Indexes
+
+Precomputed lookups over a parsed route list (GatewayRoute or LambdaRoute),
+built once per validation run instead of scanning every route for every
+frontend call or gateway route:
+
+- by_key:      "METHOD path" -> routes (the key format used across the validator)
+- by_path:     path -> routes (any method)
+- by_file:     source file -> routes
+- by_function: Lambda function -> routes (gateway routes' lambda_function)
+
+Paths are normalized once per route with the supplied normalize function
+(e.g. LambdaParser.normalize_path), so lookups never re-normalize the index.
+
+A path-template trie resolves request paths to the templates that match
+them up to parameter names, in O(path length): concrete paths
+(/ws/123/members) and paths with differently named parameters
+(/ws/{param}/members) both find /ws/{workspaceId}/members. The validator
+uses it to match frontend calls to API Gateway routes.
+
+Usage:
+    from route_index import RouteIndex
+
+    index = RouteIndex(lambda_parser.routes, normalize=lambda_parser.normalize_path)
+    routes = index.get('GET', '/ws/{workspaceId}/members')
+    any_method = index.find_by_path('/ws/{workspaceId}/members')
+    templates = index.resolve('GET', '/ws/123/members')
+    any_method = index.resolve_path('/ws/123/members')
+"""
+
+from typing import Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+def is_path_param(segment: str) -> bool:
+    """Whether a path segment is a template parameter ({id}, {param}, ...)."""
+    return segment.startswith('{') and segment.endswith('}')
+
+
+def split_path(path: str) -> List[str]:
+    """Split a path into segments ('/ws/{id}/members' -> ['ws', '{id}', 'members'])."""
+    return path.strip('/').split('/') if path.strip('/') else []
+
+
+class _TrieNode:
+    """One path segment in a PathTrie."""
+
+    __slots__ = ('static', 'param', 'values')
+
+    def __init__(self):
+        self.static: Dict[str, '_TrieNode'] = {}
+        self.param: Optional['_TrieNode'] = None
+        self.values: List[Tuple[int, object]] = []
+
+
+class PathTrie(Generic[T]):
+    """
+    Trie of path templates, one level per segment.
+
+    Parameter segments ({id}, {orgId}, ...) share a single wildcard edge, so
+    templates differing only in parameter names land on the same node.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._count = 0
+
+    def insert(self, template: str, value: T):
+        """Add a value under a path template."""
+        node = self._root
+        for segment in split_path(template):
+            if is_path_param(segment):
+                if node.param is None:
+                    node.param = _TrieNode()
+                node = node.param
+            else:
+                node = node.static.setdefault(segment, _TrieNode())
+        node.values.append((self._count, value))
+        self._count += 1
+
+    def match(self, path: str) -> List[T]:
+        """
+        Return values whose template matches a path, in insertion order.
+
+        Literal segments match the same literal or a template parameter;
+        parameter segments in the path only match template parameters, so
+        looking up a template finds the templates equal to it up to
+        parameter names.
+        """
+        nodes = [self._root]
+        for segment in split_path(path):
+            param_segment = is_path_param(segment)
+            next_nodes = []
+            for node in nodes:
+                if not param_segment:
+                    child = node.static.get(segment)
+                    if child is not None:
+                        next_nodes.append(child)
+                if node.param is not None:
+                    next_nodes.append(node.param)
+            if not next_nodes:
+                return []
+            nodes = next_nodes
+
+        if len(nodes) == 1:
+            return [value for _, value in nodes[0].values]
+        return [value for _, value in sorted(
+            (entry for node in nodes for entry in node.values), key=lambda entry: entry[0]
+        )]
+
+
+class RouteIndex(Generic[T]):
+    """Indexes over a list of routes with .method, .path and .file attributes."""
+
+    def __init__(self, routes: List[T], normalize: Optional[Callable[[str], str]] = None):
+        """
+        Args:
+            routes: Parsed routes, in report order (index lists keep it)
+            normalize: Path normalization applied to indexed and looked-up paths
+        """
+        self.routes = routes
+        self.normalize = normalize or (lambda path: path)
+        self.by_key: Dict[str, List[T]] = {}
+        self.by_path: Dict[str, List[T]] = {}
+        self.by_file: Dict[str, List[T]] = {}
+        self.by_function: Dict[str, List[T]] = {}
+        self._trie: Dict[str, PathTrie[T]] = {}
+        self._any_trie: PathTrie[T] = PathTrie()
+
+        for route in routes:
+            path = self.normalize(route.path)
+            self.by_key.setdefault(f"{route.method} {path}", []).append(route)
+            self.by_path.setdefault(path, []).append(route)
+            self.by_file.setdefault(route.file, []).append(route)
+            function = getattr(route, 'lambda_function', None)
+            if function:
+                self.by_function.setdefault(function, []).append(route)
+            if route.method not in self._trie:
+                self._trie[route.method] = PathTrie()
+            self._trie[route.method].insert(path, route)
+            self._any_trie.insert(path, route)
+
+    def get(self, method: str, path: str) -> List[T]:
+        """Routes for a method and path (normalized like the index)."""
+        return self.by_key.get(f"{method} {self.normalize(path)}", [])
+
+    def find_by_path(self, path: str) -> List[T]:
+        """Routes for a path with any method (normalized like the index)."""
+        return self.by_path.get(self.normalize(path), [])
+
+    def resolve(self, method: str, path: str) -> List[T]:
+        """Routes whose path template matches a request path, e.g. /ws/123/members."""
+        trie = self._trie.get(method)
+        return trie.match(self.normalize(path)) if trie is not None else []
+
+    def resolve_path(self, path: str) -> List[T]:
+        """Routes with any method whose path template matches a request path."""
+        return self._any_trie.match(self.normalize(path))
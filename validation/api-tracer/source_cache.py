@@ -0,0 +1,155 @@
+"""
+Parsed Source Cache
+
+Holds the artifacts the api-tracer analyzers derive from a file's source
+text - its lines, line-start offsets and, for Python, the AST - so each
+file is split and parsed once no matter how many analyzers look at it
+(LambdaParser, CodeQualityValidator and AuthLifecycleValidator for Lambdas;
+FrontendParser, ComponentParser, CodeQualityValidator and
+AuthLifecycleValidator for TypeScript).
+
+Artifacts are keyed by the content string. The shared ProjectIndex hands
+every analyzer the same string object for a file, so lookups after the
+first are a dictionary hit. AST trees are shared between analyzers and
+must be treated as read-only.
+
+Usage:
+    from source_cache import parse_python, line_number, source_segment
+
+    tree = parse_python(content, filename=file_path)   # raises SyntaxError like ast.parse
+    line = line_number(content, match.start())          # 1-based line of an offset
+    code = source_segment(content, node)                # ast.get_source_segment()
+"""
+
+import ast
+import bisect
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+# Upper bound on cached files (a full CORA project has a few thousand sources)
+MAX_ENTRIES = 8192
+
+# Lines with their endings, split like ast.get_source_segment() does
+# ('\r\n', '\r' or '\n'; form feeds don't end a line)
+_LINE_WITH_ENDING = re.compile(r'[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+\Z')
+
+
+class ParsedSource:
+    """Lazily computed parse artifacts for one source text."""
+
+    __slots__ = ('text', '_lines', '_lines_with_endings', '_line_offsets', '_tree', '_tree_error')
+
+    def __init__(self, text: str):
+        self.text = text
+        self._lines: Optional[Tuple[str, ...]] = None
+        self._lines_with_endings: Optional[List[str]] = None
+        self._line_offsets: Optional[List[int]] = None
+        self._tree: Optional[ast.Module] = None
+        self._tree_error = False
+
+    @property
+    def lines(self) -> Tuple[str, ...]:
+        """Source lines (text.split('\\n'), as an immutable tuple)."""
+        if self._lines is None:
+            self._lines = tuple(self.text.split('\n'))
+        return self._lines
+
+    @property
+    def line_offsets(self) -> List[int]:
+        """Offset of the first character of each line."""
+        if self._line_offsets is None:
+            offsets = [0]
+            for line in self.lines[:-1]:
+                offsets.append(offsets[-1] + len(line) + 1)
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def line_at(self, offset: int) -> int:
+        """1-based line number containing a character offset."""
+        return bisect.bisect_right(self.line_offsets, offset)
+
+    def segment(self, node: ast.AST) -> Optional[str]:
+        """
+        Source text of an AST node, like ast.get_source_segment().
+
+        get_source_segment() re-splits the whole file on every call; this
+        splits it once per file.
+        """
+        try:
+            if node.end_lineno is None or node.end_col_offset is None:
+                return None
+            lineno = node.lineno - 1
+            end_lineno = node.end_lineno - 1
+            col_offset = node.col_offset
+            end_col_offset = node.end_col_offset
+        except AttributeError:
+            return None
+
+        if self._lines_with_endings is None:
+            self._lines_with_endings = _LINE_WITH_ENDING.findall(self.text)
+        lines = self._lines_with_endings
+
+        # Column offsets are UTF-8 byte offsets
+        if end_lineno == lineno:
+            return lines[lineno].encode()[col_offset:end_col_offset].decode()
+        first = lines[lineno].encode()[col_offset:].decode()
+        last = lines[end_lineno].encode()[:end_col_offset].decode()
+        return ''.join([first] + lines[lineno + 1:end_lineno] + [last])
+
+    @property
+    def tree(self) -> Optional[ast.Module]:
+        """Python AST, or None if the source doesn't parse."""
+        if self._tree is None and not self._tree_error:
+            try:
+                self._tree = ast.parse(self.text)
+            except SyntaxError:
+                self._tree_error = True
+        return self._tree
+
+
+_sources: 'OrderedDict[str, ParsedSource]' = OrderedDict()
+_sources_lock = threading.Lock()
+
+
+def get_parsed_source(content: str) -> ParsedSource:
+    """Return the cached ParsedSource for content, creating it on first use."""
+    with _sources_lock:
+        source = _sources.get(content)
+        if source is None:
+            source = ParsedSource(content)
+            _sources[content] = source
+            if len(_sources) > MAX_ENTRIES:
+                _sources.popitem(last=False)
+        return source
+
+
+def parse_python(content: str, filename: str = '<unknown>') -> ast.Module:
+    """
+    Cached ast.parse().
+
+    Raises:
+        SyntaxError: If the source doesn't parse (with filename in the message)
+    """
+    tree = get_parsed_source(content).tree
+    if tree is None:
+        # Re-parse to raise the error with this caller's filename
+        return ast.parse(content, filename=filename)
+    return tree
+
+
+def line_number(content: str, offset: int) -> int:
+    """1-based line number of a character offset (content[:offset].count('\\n') + 1)."""
+    return get_parsed_source(content).line_at(offset)
+
+
+def source_segment(content: str, node: ast.AST) -> Optional[str]:
+    """Cached ast.get_source_segment(content, node)."""
+    return get_parsed_source(content).segment(node)
+
+
+def clear_source_cache():
+    """Drop all cached artifacts (e.g. at the end of a validation run)."""
+    with _sources_lock:
+        _sources.clear()
@@ -0,0 +1,121 @@
+"""
+Tests for route_index.py
+
+1. RouteIndex lookups agree with the linear scans they replace
+2. PathTrie resolves concrete paths to matching templates
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from route_index import PathTrie, RouteIndex
+from lambda_parser import LambdaParser, LambdaRoute
+from gateway_parser import GatewayRoute
+
+
+def make_lambda_route(method, path, file='lambdas/ws/lambda_function.py'):
+    return LambdaRoute(file=file, line=1, handler_function='handler', method=method, path=path)
+
+
+@pytest.fixture
+def lambda_routes():
+    return [
+        make_lambda_route('GET', '/ws/{id}/members'),
+        make_lambda_route('POST', '/ws/{workspaceId}/members'),
+        make_lambda_route('GET', '/ws/:wsId/members/{memberId}'),
+        make_lambda_route('GET', '/ws/config', file='lambdas/config/lambda_function.py'),
+        make_lambda_route('DELETE', '/orgs/[^/]+/ai/config', file='lambdas/ai/lambda_function.py'),
+    ]
+
+
+class TestRouteIndex:
+    """Index lookups match the linear scans in FullStackValidator."""
+
+    def test_find_by_path_matches_scan(self, lambda_routes):
+        parser = LambdaParser()
+        index = RouteIndex(lambda_routes, normalize=parser.normalize_path)
+        for path in ['/ws/{workspaceId}/members', '/ws/{a}/members/{b}', '/ws/config', '/orgs/{orgId}/ai/config', '/nope']:
+            expected = [
+                r for r in lambda_routes
+                if parser.normalize_path(r.path) == parser.normalize_path(path)
+            ]
+            assert index.find_by_path(path) == expected
+
+    def test_get_by_method(self, lambda_routes):
+        index = RouteIndex(lambda_routes, normalize=LambdaParser().normalize_path)
+        assert index.get('POST', '/ws/{wsId}/members') == [lambda_routes[1]]
+        assert index.get('PUT', '/ws/{wsId}/members') == []
+
+    def test_by_file_and_function(self, lambda_routes):
+        index = RouteIndex(lambda_routes)
+        assert index.by_file['lambdas/ws/lambda_function.py'] == lambda_routes[:3]
+
+        gateway_routes = [
+            GatewayRoute(file='outputs.tf', line=1, method='GET', path='/ws', lambda_function='ws'),
+            GatewayRoute(file='outputs.tf', line=2, method='GET', path='/health'),
+        ]
+        assert RouteIndex(gateway_routes).by_function == {'ws': gateway_routes[:1]}
+
+
+class TestPathTrie:
+    """Template resolution for concrete and template paths."""
+
+    def test_concrete_path_matches_templates(self, lambda_routes):
+        index = RouteIndex(lambda_routes, normalize=LambdaParser().normalize_path)
+        assert index.resolve('GET', '/ws/123/members') == [lambda_routes[0]]
+        assert index.resolve('GET', '/ws/123/members/456') == [lambda_routes[2]]
+        assert index.resolve('GET', '/ws/123') == []
+
+    def test_static_and_param_matches_keep_insertion_order(self):
+        trie = PathTrie()
+        trie.insert('/ws/{id}', 'param')
+        trie.insert('/ws/config', 'static')
+        assert trie.match('/ws/config') == ['param', 'static']
+        assert trie.match('/ws/other') == ['param']
+
+    def test_template_lookup_only_matches_params(self):
+        trie = PathTrie()
+        trie.insert('/ws/{id}', 'param')
+        trie.insert('/ws/config', 'static')
+        assert trie.match('/ws/{workspaceId}') == ['param']
+
+    def test_root_path(self):
+        trie = PathTrie()
+        trie.insert('/', 'root')
+        assert trie.match('/') == ['root']
+        assert trie.match('') == ['root']
+
+
+class TestFrontendToGatewayMatching:
+    """Frontend calls resolve to gateway templates regardless of parameter names."""
+
+    @pytest.fixture
+    def validator(self):
+        from frontend_parser import APICall, FrontendParser
+        from gateway_parser import GatewayParser
+        from validator import FullStackValidator
+
+        validator = FullStackValidator(FrontendParser(), GatewayParser(), LambdaParser(), validate_auth=False)
+        validator.gateway_index = RouteIndex([
+            GatewayRoute(file='outputs.tf', line=1, method='GET', path='/ws/{workspaceId}/members'),
+        ])
+        validator.frontend_parser.api_calls = [
+            APICall(file='api.ts', line=1, method='GET', endpoint='/ws/${wsId}/members'),
+            APICall(file='api.ts', line=2, method='DELETE', endpoint='/ws/${wsId}/members'),
+            APICall(file='api.ts', line=3, method='GET', endpoint='/ws/${wsId}/owners'),
+        ]
+        return validator
+
+    def test_param_names_do_not_cause_mismatches(self, validator):
+        validator._match_frontend_to_gateway()
+        assert [(m.frontend_line, m.mismatch_type) for m in validator.mismatches] == [
+            (2, 'method_mismatch'),
+            (3, 'route_not_found'),
+        ]
+
+    def test_resolve_path_ignores_method(self, lambda_routes):
+        index = RouteIndex(lambda_routes, normalize=LambdaParser().normalize_path)
+        assert index.resolve_path('/ws/123/members') == lambda_routes[:2]
@@ -0,0 +1,58 @@
+"""
+Tests for source_cache.py
+
+Cached artifacts must match what the analyzers computed before:
+1. line_number() vs content[:offset].count('\\n') + 1
+2. source_segment() vs ast.get_source_segment()
+3. parse_python() tree sharing and SyntaxError behaviour
+"""
+
+import ast
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from source_cache import line_number, parse_python, source_segment, clear_source_cache
+
+
+SOURCE = '''"""Module docstring."""
+import json
+
+def handler(event, context):
+    body = {"name": "café", "count": (1,
+                                      2)}
+    return json.dumps(body)\r
+\x0c
+x = 1'''
+
+
+class TestLineNumber:
+    """line_number() agrees with counting newlines."""
+
+    def test_every_offset(self):
+        for offset in range(len(SOURCE) + 1):
+            assert line_number(SOURCE, offset) == SOURCE[:offset].count('\n') + 1
+
+
+class TestSourceSegment:
+    """source_segment() agrees with ast.get_source_segment()."""
+
+    def test_every_node(self):
+        tree = ast.parse(SOURCE)
+        for node in ast.walk(tree):
+            assert source_segment(SOURCE, node) == ast.get_source_segment(SOURCE, node)
+
+
+class TestParsePython:
+    """parse_python() parses each source once."""
+
+    def test_tree_is_shared(self):
+        clear_source_cache()
+        assert parse_python(SOURCE) is parse_python(SOURCE, filename='other.py')
+
+    def test_syntax_error_names_file(self):
+        with pytest.raises(SyntaxError) as exc_info:
+            parse_python('def broken(:\n', filename='lambda_function.py')
+        assert exc_info.value.filename == 'lambda_function.py'
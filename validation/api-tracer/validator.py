@@ -10,6 +10,7 @@ Auth Lifecycle Validation (ADR-019):
 """
 
 import re
+import sys
 import logging
 import yaml
 from typing import Dict, List, Optional, Any, Set
@@ -24,6 +25,20 @@ from auth_validator import AuthLifecycleValidator, AuthIssue
 from code_quality_validator import CodeQualityValidator, CodeQualityIssue
 from db_function_validator import DBFunctionValidator, DBFunctionIssue
 from component_parser import ComponentParser, ComponentRoute
+from route_index import RouteIndex
+from source_cache import clear_source_cache
+from file_analyzer import (
+    FileAnalyzer,
+    TASK_AUTH_FRONTEND,
+    TASK_AUTH_LAMBDA,
+    TASK_CODE_QUALITY_FRONTEND,
+    TASK_CODE_QUALITY_LAMBDA,
+)
+
+# Shared project file index (validation/shared)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.project_index import get_project_index, ProjectIndex, KIND_LAMBDA
+from shared.result_cache import get_result_cache, source_version
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +115,8 @@ class FullStackValidator:
         validate_layer1: bool = True,
         validate_layer2: bool = False,
         module_filter: Optional[str] = None,
-        route_exclusion_patterns: Optional[List[str]] = None
+        route_exclusion_patterns: Optional[List[str]] = None,
+        workers: int = 1
     ):
         """Initialize validator with parsers and optional AWS configuration."""
         self.frontend_parser = frontend_parser
@@ -134,9 +150,22 @@ class FullStackValidator:
         self.component_parser = ComponentParser()
         self.component_routes_index: Dict[str, List[ComponentRoute]] = {}
         
+        # Route indexes, rebuilt after each parse (see _parse_all_layers)
+        self.gateway_index: RouteIndex = RouteIndex([])
+        self.lambda_index: RouteIndex = RouteIndex([], normalize=self.lambda_parser.normalize_path)
+        
         # Module filter for efficient per-module validation (e.g., 'module-kb')
         self.module_filter = module_filter
         
+        # Shared file index, built once per validate() run
+        self.project_index: Optional[ProjectIndex] = None
+        
+        # Per-file findings caches opened during validate() (see _result_cache)
+        self.result_caches: List[Any] = []
+        
+        # Per-file parsing/checks fan out to worker processes when workers > 1
+        self.file_analyzer = FileAnalyzer(workers)
+        
         # Load configuration file
         self.config = self._load_config()
         
@@ -164,6 +193,9 @@ class FullStackValidator:
         """
         logger.info(f"Starting full stack API validation for: {project_path}")
         
+        # Walk the project tree once; every pass below queries this index
+        self.project_index = get_project_index(project_path)
+        
         # Parse all three layers
         self._parse_all_layers(project_path)
         
@@ -186,12 +218,47 @@ class FullStackValidator:
         if self.validate_db_functions:
             self._validate_db_functions(project_path)
         
+        # Stop worker processes (if any were started)
+        self.file_analyzer.close()
+        
+        # Persist per-file findings for the next incremental run
+        for cache in self.result_caches:
+            cache.flush()
+            if cache.enabled:
+                logger.info(f"Result cache {cache.validator}: {cache.hits} hits, {cache.misses} misses")
+        self.result_caches = []
+        
+        # Parsed sources (lines, ASTs) are only shared within one run
+        clear_source_cache()
+        
         # Generate report
         report = self._generate_report()
         
         logger.info(f"Validation complete: {report.status} with {len(self.mismatches)} mismatches")
         return report
     
+    def _result_cache(self, name: str, config: Optional[Dict[str, Any]] = None):
+        """
+        Open the per-file findings cache for one validation pass.
+        
+        Entries are keyed by this package's source version plus `config`,
+        so only files whose content changed are re-analyzed. Returns a
+        disabled cache unless cora-validate --incremental is in effect.
+        """
+        cache = get_result_cache(f"api-tracer.{name}", source_version(Path(__file__).parent), config)
+        self.result_caches.append(cache)
+        return cache
+    
+    def _read_files(self, file_paths: List[Path], label: str) -> List[tuple]:
+        """Read files through the project index as (path, content) pairs, skipping unreadable ones."""
+        items = []
+        for file_path in file_paths:
+            try:
+                items.append((file_path, self.project_index.read_text(file_path)))
+            except Exception as e:
+                logger.warning(f"Failed to validate {label} file {file_path}: {e}")
+        return items
+    
     def _parse_all_layers(self, project_path: str):
         """Parse frontend, gateway, and Lambda layers."""
         project = Path(project_path)
@@ -209,7 +276,12 @@ class FullStackValidator:
         for path in frontend_paths:
             if path.exists():
                 logger.info(f"Parsing frontend files in: {path}")
-                self.frontend_parser.parse_directory(str(path))
+                self.frontend_parser.parse_directory(
+                    str(path),
+                    project_index=self.project_index,
+                    result_cache=self._result_cache('frontend_calls'),
+                    file_analyzer=self.file_analyzer,
+                )
         
         # Filter out _module-template files from frontend calls
         self.frontend_parser.api_calls = [
@@ -263,15 +335,16 @@ class FullStackValidator:
             else:
                 glob_pattern = 'module-*/infrastructure/outputs.tf'
             
-            for module_path in (project / 'packages').glob(glob_pattern):
+            packages_path = project / 'packages'
+            module_outputs = self.project_index.glob(glob_pattern, under=packages_path) if packages_path.exists() else []
+            for module_path in module_outputs:
                 # Skip _module-template
                 if '_module-template' in str(module_path):
                     logger.info(f"Skipping template module: {module_path}")
                     continue
-                if module_path.is_file():
-                    logger.info(f"Parsing routes from {module_path}")
-                    routes = self.gateway_parser.parse_file(str(module_path))
-                    all_gateway_routes.extend(routes)
+                logger.info(f"Parsing routes from {module_path}")
+                routes = self.gateway_parser.parse_file(str(module_path))
+                all_gateway_routes.extend(routes)
             
             # Update gateway_parser.routes with accumulated routes
             self.gateway_parser.routes = all_gateway_routes
@@ -285,7 +358,12 @@ class FullStackValidator:
         else:
             lambda_path = project / 'packages'
         if lambda_path.exists():
-            self.lambda_parser.parse_directory(str(lambda_path))
+            self.lambda_parser.parse_directory(
+                str(lambda_path),
+                project_index=self.project_index,
+                result_cache=self._result_cache('lambda_routes'),
+                file_analyzer=self.file_analyzer,
+            )
         
         # Filter out _module-template files from Lambda routes
         self.lambda_parser.routes = [
@@ -295,8 +373,12 @@ class FullStackValidator:
         module_info = f" (filtered to {self.module_filter})" if self.module_filter else ""
         logger.info(f"Found {len(self.lambda_parser.routes)} Lambda route handlers{module_info} (excluding templates)")
         
+        # Index routes once; the cross-layer passes below only do lookups
+        self.gateway_index = RouteIndex(self.gateway_parser.routes)
+        
         # Enhance Lambda path inference using Gateway route definitions
         self._enhance_lambda_path_inference(project)
+        self.lambda_index = RouteIndex(self.lambda_parser.routes, normalize=self.lambda_parser.normalize_path)
         
         # Parse admin component route metadata (@routes docstrings)
         logger.info("Parsing admin component route metadata...")
@@ -304,7 +386,7 @@ class FullStackValidator:
         for path in frontend_paths:
             if path.exists():
                 logger.info(f"Parsing admin components in: {path}")
-                routes = self.component_parser.parse_directory(str(path))
+                routes = self.component_parser.parse_directory(str(path), project_index=self.project_index)
                 component_routes.extend(routes)
         
         # Build index for fast lookup
@@ -333,14 +415,8 @@ class FullStackValidator:
         """
         logger.info("Enhancing Lambda path inference from Gateway routes...")
         
-        # Build mapping: lambda_function -> list of gateway routes
-        lambda_to_gateway = {}
-        for gateway_route in self.gateway_parser.routes:
-            if gateway_route.lambda_function:
-                func_name = gateway_route.lambda_function
-                if func_name not in lambda_to_gateway:
-                    lambda_to_gateway[func_name] = []
-                lambda_to_gateway[func_name].append(gateway_route)
+        # Mapping: lambda_function -> list of gateway routes
+        lambda_to_gateway = self.gateway_index.by_function
         
         # Find Lambda routes that need inference (path = '/')
         generic_routes = [r for r in self.lambda_parser.routes if r.path == '/']
@@ -414,16 +490,14 @@ class FullStackValidator:
         """
         logger.info("Matching frontend → API Gateway...")
         
-        # Build index of gateway routes for fast lookup
-        gateway_routes_index = self._build_gateway_routes_index()
-        
         for call in self.frontend_parser.api_calls:
             # Normalize endpoint for comparison
             normalized_endpoint = self.frontend_parser.normalize_endpoint(call.endpoint)
-            route_key = f"{call.method} {normalized_endpoint}"
             
-            # Check if route exists in gateway
-            if route_key not in gateway_routes_index:
+            # Check if route exists in gateway. Resolved through the path
+            # trie, so parameter names don't have to agree:
+            # Frontend: /ws/{param}/members  ->  Gateway: /ws/{workspaceId}/members
+            if not self.gateway_index.resolve(call.method, normalized_endpoint):
                 # Route not found - check if it's a method mismatch
                 path_matches = self._find_gateway_routes_by_path(normalized_endpoint)
                 
@@ -467,8 +541,8 @@ class FullStackValidator:
         """
         logger.info("Matching API Gateway → Lambda...")
         
-        # Build index of Lambda routes for fast lookup
-        lambda_routes_index = self._build_lambda_routes_index()
+        # Index of Lambda routes by method + normalized path
+        lambda_routes_index = self.lambda_index.by_key
         
         for route in self.gateway_parser.routes:
             # Normalize Gateway route path to match Lambda index format
@@ -516,8 +590,8 @@ class FullStackValidator:
         """
         logger.info("Validating parameters across layers...")
         
-        # Build Lambda routes index
-        lambda_routes_index = self._build_lambda_routes_index()
+        # Index of Lambda routes by method + normalized path
+        lambda_routes_index = self.lambda_index.by_key
         
         for call in self.frontend_parser.api_calls:
             normalized_endpoint = self.frontend_parser.normalize_endpoint(call.endpoint)
@@ -710,11 +784,8 @@ class FullStackValidator:
         lambda_file_to_routes = {}
         
         for gateway_route in self.gateway_parser.routes:
-            # Find Lambda routes from the same file
-            matching_lambdas = [
-                lr for lr in self.lambda_parser.routes
-                if self._routes_match(gateway_route, lr)
-            ]
+            # Find Lambda routes with the same method and (normalized) path
+            matching_lambdas = self.lambda_index.get(gateway_route.method, gateway_route.path)
             
             for lambda_route in matching_lambdas:
                 if lambda_route.file not in lambda_file_to_routes:
@@ -724,7 +795,7 @@ class FullStackValidator:
         # Check each Lambda file
         for lambda_file, gateway_routes in lambda_file_to_routes.items():
             # Get all Lambda routes from this file
-            file_lambda_routes = [lr for lr in self.lambda_parser.routes if lr.file == lambda_file]
+            file_lambda_routes = self.lambda_index.by_file.get(lambda_file, [])
             
             if not file_lambda_routes:
                 continue
@@ -781,51 +852,13 @@ class FullStackValidator:
                         suggestion=f"Add path_params.get('{gateway_param}') to Lambda code (routes: {', '.join(gateway_paths)})"
                     ))
     
-    def _routes_match(self, gateway_route: 'GatewayRoute', lambda_route: 'LambdaRoute') -> bool:
-        """Check if a Gateway route matches a Lambda route."""
-        # Normalize both paths for comparison
-        normalized_gateway = self.lambda_parser.normalize_path(gateway_route.path)
-        normalized_lambda = self.lambda_parser.normalize_path(lambda_route.path)
-        
-        # Methods must match
-        if gateway_route.method != lambda_route.method:
-            return False
-        
-        # Paths must match (normalized)
-        return normalized_gateway == normalized_lambda
-    
-    def _build_gateway_routes_index(self) -> Dict[str, List[GatewayRoute]]:
-        """Build index of gateway routes by method + path."""
-        index = {}
-        for route in self.gateway_parser.routes:
-            key = f"{route.method} {route.path}"
-            if key not in index:
-                index[key] = []
-            index[key].append(route)
-        return index
-    
-    def _build_lambda_routes_index(self) -> Dict[str, List[LambdaRoute]]:
-        """Build index of Lambda routes by method + path."""
-        index = {}
-        for route in self.lambda_parser.routes:
-            normalized_path = self.lambda_parser.normalize_path(route.path)
-            key = f"{route.method} {normalized_path}"
-            if key not in index:
-                index[key] = []
-            index[key].append(route)
-        return index
-    
     def _find_gateway_routes_by_path(self, path: str) -> List[GatewayRoute]:
-        """Find all gateway routes for a specific path (any method)."""
-        return [r for r in self.gateway_parser.routes if r.path == path]
+        """Find all gateway routes whose path template matches a path (any method)."""
+        return self.gateway_index.resolve_path(path)
     
     def _find_lambda_routes_by_path(self, path: str) -> List[LambdaRoute]:
-        """Find all Lambda routes for a specific path (any method)."""
-        normalized_path = self.lambda_parser.normalize_path(path)
-        return [
-            r for r in self.lambda_parser.routes 
-            if self.lambda_parser.normalize_path(r.path) == normalized_path
-        ]
+        """Find all Lambda routes for a specific path (any method), compared normalized."""
+        return self.lambda_index.find_by_path(path)
     
     def _validate_code_quality(self, project_path: str):
         """
@@ -849,22 +882,23 @@ class FullStackValidator:
         else:
             lambda_path = project / 'packages'
         if lambda_path.exists():
-            for file_path in lambda_path.glob("**/lambda_function.py"):
-                # Skip templates and build artifacts
-                # .build, dist, build: Lambda build artifacts (bundled/concatenated code)
-                # .next: Next.js build artifacts (transpiled frontend code)
-                # node_modules: Frontend dependencies
-                path_str = str(file_path)
-                if any(skip in path_str for skip in ['_module-template', '.build', '.next', 'node_modules', 'dist', 'build', '__pycache__', '.venv']):
-                    continue
-
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    issues = self.code_quality_validator.validate_lambda_file(str(file_path), content)
-                    code_quality_issues.extend(issues)
-                except Exception as e:
-                    logger.warning(f"Failed to validate Lambda file {file_path}: {e}")
+            # Build artifacts (.build, dist, .next, node_modules) are pruned by the index;
+            # build/ and .venv are skipped here (as are templates)
+            items = self._read_files(
+                [
+                    file_path for file_path in self.project_index.files(
+                        kind=KIND_LAMBDA, under=lambda_path, exclude_dirs=['build', '.venv']
+                    )
+                    if '_module-template' not in str(file_path)
+                ],
+                'Lambda',
+            )
+            for issues in self.file_analyzer.analyze(
+                TASK_CODE_QUALITY_LAMBDA, items,
+                lambda file_path, content: self.code_quality_validator.validate_lambda_file(str(file_path), content),
+                CodeQualityIssue, self._result_cache('code_quality_lambda'),
+            ):
+                code_quality_issues.extend(issues)
         
         # Validate frontend files (filtered by module if specified)
         frontend_paths = []
@@ -873,22 +907,22 @@ class FullStackValidator:
         else:
             frontend_paths.append(project / 'packages')
             frontend_paths.append(project / 'apps' / 'web')
-            
+        
+        frontend_files = []
         for frontend_path in frontend_paths:
             if frontend_path.exists():
-                for ext in ['tsx', 'ts']:
-                    for file_path in frontend_path.glob(f"**/*.{ext}"):
-                        # Skip templates and node_modules
-                        if '_module-template' in str(file_path) or 'node_modules' in str(file_path):
-                            continue
-                        
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                            issues = self.code_quality_validator.validate_frontend_file(str(file_path), content)
-                            code_quality_issues.extend(issues)
-                        except Exception as e:
-                            logger.warning(f"Failed to validate frontend file {file_path}: {e}")
+                # Skip templates (node_modules is pruned by the index)
+                frontend_files.extend(
+                    file_path for file_path in self.project_index.files(under=frontend_path, suffixes=('.tsx', '.ts'))
+                    if '_module-template' not in str(file_path)
+                )
+        
+        for issues in self.file_analyzer.analyze(
+            TASK_CODE_QUALITY_FRONTEND, self._read_files(frontend_files, 'frontend'),
+            lambda file_path, content: self.code_quality_validator.validate_frontend_file(str(file_path), content),
+            CodeQualityIssue, self._result_cache('code_quality_frontend'),
+        ):
+            code_quality_issues.extend(issues)
         
         # Validate gateway routes
         route_dicts = [
@@ -992,25 +1026,30 @@ class FullStackValidator:
         else:
             frontend_paths.append(project / 'packages')
             frontend_paths.append(project / 'apps' / 'web')
-            
+        
+        frontend_files = []
         for frontend_path in frontend_paths:
             if frontend_path.exists():
-                for ext in ['tsx', 'ts']:
-                    for file_path in frontend_path.glob(f"**/*.{ext}"):
-                        # Skip templates, node_modules, and build artifacts
-                        path_str = str(file_path)
-                        if any(skip in path_str for skip in ['_module-template', 'node_modules', '.next']):
-                            continue
-                        
-                        # Only validate admin pages
-                        if '/admin/' in path_str or '/workspace/' in path_str:
-                            try:
-                                with open(file_path, 'r', encoding='utf-8') as f:
-                                    content = f.read()
-                                issues = self.auth_validator.validate_frontend_file(str(file_path), content)
-                                auth_issues.extend(issues)
-                            except Exception as e:
-                                logger.warning(f"Failed to validate frontend file {file_path}: {e}")
+                for file_path in self.project_index.files(under=frontend_path, suffixes=('.tsx', '.ts')):
+                    # Skip templates (node_modules and build artifacts are pruned by the index)
+                    path_str = str(file_path)
+                    if '_module-template' in path_str:
+                        continue
+                    
+                    # Only validate admin pages
+                    if '/admin/' in path_str or '/workspace/' in path_str:
+                        frontend_files.append(file_path)
+        
+        # Frontend findings depend on the known admin components (delegation checks)
+        frontend_options = {
+            'known_components': sorted(self.auth_validator.frontend_validator.known_components or []),
+        }
+        for issues in self.file_analyzer.analyze(
+            TASK_AUTH_FRONTEND, self._read_files(frontend_files, 'frontend'),
+            lambda file_path, content: self.auth_validator.validate_frontend_file(str(file_path), content),
+            AuthIssue, self._result_cache('auth_frontend', frontend_options), frontend_options,
+        ):
+            auth_issues.extend(issues)
         
         # Validate Lambda files (filtered by module if specified)
         if self.module_filter:
@@ -1018,22 +1057,25 @@ class FullStackValidator:
         else:
             lambda_path = project / 'packages'
         if lambda_path.exists():
-            for file_path in lambda_path.glob("**/lambda_function.py"):
-                # Skip templates
-                if '_module-template' in str(file_path):
-                    continue
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    issues = self.auth_validator.validate_lambda_file(
-                        str(file_path), 
-                        content,
-                        validate_layer2=validate_layer2
-                    )
-                    auth_issues.extend(issues)
-                except Exception as e:
-                    logger.warning(f"Failed to validate Lambda file {file_path}: {e}")
+            # Skip templates
+            items = self._read_files(
+                [
+                    file_path for file_path in self.project_index.files(kind=KIND_LAMBDA, under=lambda_path)
+                    if '_module-template' not in str(file_path)
+                ],
+                'Lambda',
+            )
+            lambda_options = {'validate_layer2': validate_layer2}
+            for issues in self.file_analyzer.analyze(
+                TASK_AUTH_LAMBDA, items,
+                lambda file_path, content: self.auth_validator.validate_lambda_file(
+                    str(file_path),
+                    content,
+                    validate_layer2=validate_layer2
+                ),
+                AuthIssue, self._result_cache('auth_lambda', lambda_options), lambda_options,
+            ):
+                auth_issues.extend(issues)
         
         # Convert auth issues to APIMismatch format for unified reporting
         for issue in auth_issues:
@@ -12,6 +12,90 @@ import traceback
 from pathlib import Path
 from .validator import CoraComplianceChecker
 
+# Shared plugin interface for in-process execution by cora-validate
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.plugin import ValidationResult, result_from_output
+from shared.result_cache import get_result_cache, source_version
+
+
+def _check_lambda(checker: CoraComplianceChecker, file_path: Path, content: str) -> dict:
+    """Check one Lambda and return its result dict plus aggregated errors/warnings."""
+    result = checker.check_file(file_path, content)
+    errors = []
+    warnings = []
+    
+    # Aggregate issues for summary
+    if not result.is_fully_compliant:
+        for std in result.standards:
+            if not std.is_compliant:
+                for issue in std.issues:
+                    errors.append(f"{result.lambda_name}: {std.standard_name} - {issue}")
+            elif std.score < 1.0:
+                for issue in std.issues:
+                    warnings.append(f"{result.lambda_name}: {std.standard_name} - {issue}")
+    
+    return {"result": result.to_dict(), "errors": errors, "warnings": warnings}
+
+
+def collect_results(root_dir: Path, cache_dir: str = None) -> dict:
+    """
+    Check all Lambda functions under root_dir and build the JSON output.
+    
+    Per-file findings are replayed from the incremental results cache
+    (cache_dir or $CORA_VALIDATE_CACHE_DIR) for unchanged files.
+    """
+    checker = CoraComplianceChecker(str(root_dir))
+    cache = get_result_cache(
+        "cora",
+        source_version(Path(__file__).parent),
+        {"root_dir": str(root_dir)},
+        cache_dir=cache_dir,
+    )
+    
+    # Find all Lambda functions
+    lambda_files = checker.find_lambda_functions()
+    
+    results = []
+    errors = []
+    warnings = []
+    info = []
+    
+    if not lambda_files:
+        info.append("No Lambda functions found")
+    
+    for file_path in lambda_files:
+        try:
+            with open(file_path, 'r') as f:
+                content = f.read()
+            checked = cache.get_or_compute(
+                file_path, content, lambda: _check_lambda(checker, file_path, content)
+            )
+            results.append(checked["result"])
+            errors.extend(checked["errors"])
+            warnings.extend(checked["warnings"])
+
+        except Exception as e:
+            errors.append(f"Failed to check {file_path}: {str(e)}")
+    
+    cache.flush()
+    
+    return {
+        "passed": len(errors) == 0,
+        "errors": errors,
+        "warnings": warnings,
+        "info": info,
+        "details": {
+            "total_lambdas": len(lambda_files),
+            "compliant_lambdas": sum(1 for r in results if r["is_fully_compliant"]),
+            "results": results
+        }
+    }
+
+def run(target: str, options: dict) -> ValidationResult:
+    """In-process plugin entry point (see shared/plugin.py)."""
+    output = collect_results(Path(target), cache_dir=options.get("cache_dir"))
+    return result_from_output("cora", output, output["passed"])
+
 def main():
     parser = argparse.ArgumentParser(description="CORA Compliance Validator")
     parser.add_argument("path", help="Path to project root")
@@ -25,50 +109,10 @@ def main():
             print(json.dumps({"error": f"Path not found: {args.path}"}))
             sys.exit(1)
             
-        checker = CoraComplianceChecker(str(root_dir))
-        
-        # Find all Lambda functions
-        lambda_files = checker.find_lambda_functions()
-        
-        results = []
-        errors = []
-        warnings = []
-        info = []
-        
-        if not lambda_files:
-            info.append("No Lambda functions found")
-        
-        for file_path in lambda_files:
-            try:
-                result = checker.check_file(file_path)
-                results.append(result.to_dict())
-                
-                # Aggregate issues for summary
-                if not result.is_fully_compliant:
-                    for std in result.standards:
-                        if not std.is_compliant:
-                            for issue in std.issues:
-                                errors.append(f"{result.lambda_name}: {std.standard_name} - {issue}")
-                        elif std.score < 1.0:
-                             for issue in std.issues:
-                                warnings.append(f"{result.lambda_name}: {std.standard_name} - {issue}")
-
-            except Exception as e:
-                errors.append(f"Failed to check {file_path}: {str(e)}")
-        
-        overall_passed = len(errors) == 0
-        
-        output = {
-            "passed": overall_passed,
-            "errors": errors,
-            "warnings": warnings,
-            "info": info,
-            "details": {
-                "total_lambdas": len(lambda_files),
-                "compliant_lambdas": sum(1 for r in results if r["is_fully_compliant"]),
-                "results": results
-            }
-        }
+        output = collect_results(root_dir)
+        overall_passed = output["passed"]
+        errors = output["errors"]
+        warnings = output["warnings"]
         
         if args.format == "json":
             print(json.dumps(output, indent=2))
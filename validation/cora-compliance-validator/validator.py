@@ -533,10 +533,11 @@ class CoraComplianceChecker:
             issues=issues
         )
     
-    def check_file(self, file_path: Path) -> LambdaCoraCompliance:
+    def check_file(self, file_path: Path, content: Optional[str] = None) -> LambdaCoraCompliance:
         """Check a single Lambda function file for CORA compliance"""
-        with open(file_path, 'r') as f:
-            content = f.read()
+        if content is None:
+            with open(file_path, 'r') as f:
+                content = f.read()
         
         # Extract module and lambda name FIRST (needed for whitelisting)
         try:
@@ -16,6 +16,7 @@ Usage:
     python cora-validate.py --help
     python cora-validate.py project /path/to/project
     python cora-validate.py module /path/to/module
+    python cora-validate.py project /path/to/project --jobs 4
     python cora-validate.py report /path/to/results
 """
 
@@ -23,13 +24,22 @@ import sys
 import json
 import argparse
 import subprocess
+import importlib
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from enum import Enum
 
+# Make validator packages and shared/ importable when run from any directory
+sys.path.insert(0, str(Path(__file__).parent))
+from shared.plugin import ValidationResult, result_from_output
+from shared.project_index import clear_project_indexes
+from shared.result_cache import CACHE_DIR_ENV, DEFAULT_CACHE_DIR_NAME
+from shared.change_scope import ValidationScope, get_changed_files, plan_scope
+
 
 class ValidationLevel(Enum):
     """Validation certification levels."""
@@ -45,20 +55,6 @@ class OutputFormat(Enum):
     MARKDOWN = "markdown"
 
 
-@dataclass
-class ValidationResult:
-    """Result from a single validator."""
-    validator: str
-    passed: bool
-    errors: list = field(default_factory=list)
-    warnings: list = field(default_factory=list)
-    info: list = field(default_factory=list)
-    details: dict = field(default_factory=dict)  # Detailed results (e.g. lists of files)
-    duration_ms: int = 0
-    skipped: bool = False
-    skip_reason: str = ""
-
-
 @dataclass
 class ValidationReport:
     """Complete validation report."""
@@ -72,6 +68,7 @@ class ValidationReport:
     total_warnings: int = 0
     certification_level: Optional[str] = None
     duration_ms: int = 0
+    scope: Optional[dict] = None  # Diff-aware scope (--changed-since); None = full validation
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
@@ -86,6 +83,7 @@ class ValidationReport:
             "total_warnings": self.total_warnings,
             "certification_level": self.certification_level,
             "duration_ms": self.duration_ms,
+            "scope": self.scope,
         }
     
     def save_results(self, output_dir: Path):
@@ -106,10 +104,27 @@ class ValidationReport:
 class CoraValidator:
     """Main CORA validation orchestrator."""
 
-    def __init__(self, verbose: bool = False, template_mode: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        template_mode: bool = False,
+        jobs: int = 1,
+        on_result: Optional[Callable[[ValidationResult], None]] = None,
+        isolate: Optional[list] = None,
+        cache_dir: Optional[str] = None,
+    ):
         self.verbose = verbose
         self.template_mode = template_mode
         self.validation_dir = Path(__file__).parent
+        # Number of validators allowed to run concurrently (0 = one per CPU)
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        # Called with each ValidationResult as soon as its validator finishes
+        self.on_result = on_result
+        # Validators forced to run as subprocesses even if they provide a
+        # plugin entry point (None = none, empty list = all)
+        self.isolate = isolate
+        # Persistent per-file findings cache (None = full re-analysis every run)
+        self.cache_dir = cache_dir
 
     def clear_cache(self):
         """Clear Python bytecode cache to ensure fresh validation results."""
@@ -147,6 +162,7 @@ class CoraValidator:
             "module": "structure-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",  # path --format json
+            "plugin": True,  # in-process cli.run()
         },
         "portability": {
             "name": "Portability Validator", 
@@ -154,6 +170,7 @@ class CoraValidator:
             "module": "portability-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",  # path --format json
+            "plugin": True,  # in-process cli.run()
         },
         "a11y": {
             "name": "Accessibility Validator",
@@ -161,6 +178,7 @@ class CoraValidator:
             "module": "a11y-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",  # path --format json (assumed)
+            "file_types": [".ts", ".tsx", ".js", ".jsx"],  # changes that can affect results
         },
         "api": {
             "name": "API Tracer",
@@ -168,6 +186,8 @@ class CoraValidator:
             "module": "api-tracer",
             "supports": ["project"],
             "cli_style": "click",  # --path /path --output json
+            "file_types": [".py", ".ts", ".tsx", ".tf"],  # changes that can affect results
+            "module_option": "--module",  # restrict a project run to one module
         },
         "import": {
             "name": "Import Validator",
@@ -175,6 +195,7 @@ class CoraValidator:
             "module": "import_validator",
             "supports": ["project", "module"],
             "cli_style": "click",  # --path /path --output json
+            "file_types": [".py", ".ts", ".tsx"],  # changes that can affect results
         },
         "schema": {
             "name": "Schema Validator",
@@ -182,6 +203,7 @@ class CoraValidator:
             "module": "schema-validator",
             "supports": ["project"],
             "cli_style": "click_env",  # --path /path --output json + requires .env
+            "file_types": [".py", ".sql"],  # changes that can affect results
         },
         "external_uid": {
             "name": "External UID Validator",
@@ -189,6 +211,8 @@ class CoraValidator:
             "module": "external-uid-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",  # path --format json
+            "plugin": True,  # in-process cli.run()
+            "file_types": [".py"],  # changes that can affect results
         },
         "cora": {
             "name": "CORA Compliance",
@@ -196,6 +220,8 @@ class CoraValidator:
             "module": "cora-compliance-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",
+            "plugin": True,  # in-process cli.run()
+            "file_types": [".py"],  # changes that can affect results
         },
         "frontend": {
             "name": "Frontend Compliance",
@@ -203,6 +229,8 @@ class CoraValidator:
             "module": "frontend-compliance-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",
+            "plugin": True,  # in-process cli.run()
+            "file_types": [".ts", ".tsx"],  # changes that can affect results
         },
         "api_response": {
             "name": "API Response Validator",
@@ -210,6 +238,7 @@ class CoraValidator:
             "module": "api-response-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",
+            "file_types": [".py", ".ts", ".tsx", ".js", ".jsx"],  # changes that can affect results
         },
         # NOTE: role_naming is now integrated into API-Tracer's code_quality_validator
         # "role_naming": {
@@ -225,6 +254,7 @@ class CoraValidator:
             "module": "rpc-function-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",
+            "file_types": [".py", ".sql"],  # changes that can affect results
         },
         "db_naming": {
             "name": "Database Naming Validator",
@@ -232,6 +262,7 @@ class CoraValidator:
             "module": "db-naming-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",
+            "file_types": [".sql"],  # changes that can affect results
         },
         "ui_library": {
             "name": "UI Library Validator",
@@ -239,6 +270,7 @@ class CoraValidator:
             "module": "ui-library-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",
+            "file_types": [".ts", ".tsx", ".js", ".jsx", ".css", "package.json"],  # changes that can affect results
         },
         "typescript": {
             "name": "TypeScript Type Check",
@@ -246,6 +278,7 @@ class CoraValidator:
             "module": "typescript-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",
+            "file_types": [".ts", ".tsx", ".json"],  # changes that can affect results
         },
         "nextjs_routing": {
             "name": "Next.js Routing Validator",
@@ -253,6 +286,7 @@ class CoraValidator:
             "module": "nextjs-routing-validator",
             "supports": ["project"],
             "cli_style": "argparse",
+            "file_types": [".ts", ".tsx", "package.json"],  # changes that can affect results
         },
         # NOTE: admin_auth (frontend admin pages) is now integrated into API-Tracer's auth_validator
         # "admin_auth": {
@@ -268,6 +302,7 @@ class CoraValidator:
             "module": "audit-column-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",
+            "file_types": [".sql"],  # changes that can affect results
         },
         "module_toggle": {
             "name": "Module Toggle Validator",
@@ -287,9 +322,14 @@ class CoraValidator:
             "module": "admin-route-validator",
             "supports": ["project", "module"],
             "cli_style": "argparse",
+            "file_types": [".py", ".tf"],  # changes that can affect results
         },
     }
 
+    # Longest-running validators are scheduled first so they don't become
+    # the tail of a parallel run.
+    LONG_RUNNING_VALIDATORS = ["typescript", "api"]
+
 
     def log(self, message: str):
         """Log message if verbose mode enabled."""
@@ -301,6 +341,7 @@ class CoraValidator:
         validator_key: str,
         target_path: str,
         validation_type: str,
+        module_filter: Optional[str] = None,
     ) -> ValidationResult:
         """
         Run a single validator and return results.
@@ -309,13 +350,11 @@ class CoraValidator:
             validator_key: Key from VALIDATORS dict
             target_path: Path to validate
             validation_type: "project" or "module"
+            module_filter: Module to restrict a project run to (validators with a module_option)
             
         Returns:
             ValidationResult with outcomes
         """
-        import time
-        start_time = time.time()
-        
         validator_info = self.VALIDATORS.get(validator_key)
         if not validator_info:
             return ValidationResult(
@@ -348,6 +387,61 @@ class CoraValidator:
 
         self.log(f"Running {validator_info['name']}...")
 
+        if validator_info.get("plugin") and not self._is_isolated(validator_key):
+            return self._run_plugin(validator_key, validator_info, target_path, validation_type)
+
+        return self._run_subprocess(validator_key, validator_info, target_path, module_filter)
+
+    def _is_isolated(self, validator_key: str) -> bool:
+        """Whether a validator must run in a subprocess instead of in-process."""
+        if self.isolate is None:
+            return False
+        # An empty isolate list means "isolate everything"
+        return not self.isolate or validator_key in self.isolate
+
+    def _run_plugin(
+        self,
+        validator_key: str,
+        validator_info: dict,
+        target_path: str,
+        validation_type: str,
+    ) -> ValidationResult:
+        """Run a validator in-process through its cli.run() plugin entry point."""
+        import time
+        start_time = time.time()
+
+        try:
+            # Keep hyphenated module names - import_module accepts directory names with hyphens
+            module = importlib.import_module(validator_info["module"] + ".cli")
+            options = {
+                "validation_type": validation_type,
+                "template_mode": self.template_mode,
+                "verbose": self.verbose,
+                "cache_dir": self.cache_dir,
+            }
+            result = module.run(target_path, options)
+            result.validator = validator_key
+            result.duration_ms = int((time.time() - start_time) * 1000)
+            return result
+        except Exception as e:
+            return ValidationResult(
+                validator=validator_key,
+                passed=False,
+                errors=[f"Validator error: {str(e)}"],
+                duration_ms=int((time.time() - start_time) * 1000)
+            )
+
+    def _run_subprocess(
+        self,
+        validator_key: str,
+        validator_info: dict,
+        target_path: str,
+        module_filter: Optional[str] = None,
+    ) -> ValidationResult:
+        """Run a validator's CLI in a subprocess and parse its JSON output."""
+        import time
+        start_time = time.time()
+
         try:
             # Build CLI command based on validator's CLI style
             cli_style = validator_info.get("cli_style", "argparse")
@@ -388,11 +482,17 @@ class CoraValidator:
                     "--format", "json"
                 ]
             
+            if module_filter and validator_info.get("module_option"):
+                cmd.extend([validator_info["module_option"], module_filter])
+            
             self.log(f"Command: {' '.join(cmd)}")
             
             # Set PYTHONPATH to include validation directory so Python can import validator modules
             env = os.environ.copy()
             env['PYTHONPATH'] = str(self.validation_dir) + os.pathsep + env.get('PYTHONPATH', '')
+            if self.cache_dir:
+                # Validators read the results cache location from the environment
+                env[CACHE_DIR_ENV] = self.cache_dir
             
             # Run the validator's CLI with JSON output
             result = subprocess.run(
@@ -417,65 +517,24 @@ class CoraValidator:
 
             # Determine pass/fail from return code or output
             passed = result.returncode == 0
-            
-            # Get lists of actual error/warning objects
-            # Some validators (like import_validator) nest errors in a summary object
-            errors = output.get("errors", [])
-            if not errors and "summary" in output:
-                summary_errors = output.get("summary", {}).get("errors", [])
-                # Convert integer counts to empty lists (validators that return {"summary": {"errors": 0}})
-                errors = summary_errors if isinstance(summary_errors, list) else []
-            
-            warnings = output.get("warnings", [])
-            if not warnings and "summary" in output:
-                summary_warnings = output.get("summary", {}).get("warnings", [])
-                # Convert integer counts to empty lists
-                warnings = summary_warnings if isinstance(summary_warnings, list) else []
-            
-            info = output.get("info", [])
-            details = output.get("details", {})
+            validation_result = result_from_output(validator_key, output, passed)
+            validation_result.duration_ms = duration_ms
             
             # If validator failed but didn't provide errors, capture stderr
-            if not passed and not errors:
+            if not passed and not validation_result.errors:
                 if result.stderr:
                     # Convert stderr to error messages
                     stderr_lines = [line.strip() for line in result.stderr.split('\n') if line.strip()]
                     if stderr_lines:
-                        errors = stderr_lines[:10]  # Limit to first 10 lines
+                        validation_result.errors = stderr_lines[:10]  # Limit to first 10 lines
                 elif output.get("raw_output"):
                     # Use stdout as error message if no stderr
-                    errors = [f"Validator failed with output: {output['raw_output'][:200]}"]
+                    validation_result.errors = [f"Validator failed with output: {output['raw_output'][:200]}"]
                 else:
                     # No output at all
-                    errors = [f"Validator failed with exit code {result.returncode} but provided no output"]
-            
-            # Ensure errors and warnings are proper lists, not counts or [0] format
-            # If a validator returned a count instead of a list, convert to empty list if 0
-            if isinstance(errors, (int, float)):
-                errors = [] if errors == 0 else [f"{int(errors)} errors (details not provided)"]
-            elif isinstance(errors, list) and len(errors) > 0:
-                # Check if list contains only numeric values (e.g. [0] or [5])
-                if all(isinstance(e, (int, float)) for e in errors):
-                    error_count = sum(int(e) for e in errors)
-                    errors = [] if error_count == 0 else [f"{error_count} errors (details not provided)"]
-            
-            if isinstance(warnings, (int, float)):
-                warnings = [] if warnings == 0 else [f"{int(warnings)} warnings (details not provided)"]
-            elif isinstance(warnings, list) and len(warnings) > 0:
-                # Check if list contains only numeric values
-                if all(isinstance(w, (int, float)) for w in warnings):
-                    warning_count = sum(int(w) for w in warnings)
-                    warnings = [] if warning_count == 0 else [f"{warning_count} warnings (details not provided)"]
+                    validation_result.errors = [f"Validator failed with exit code {result.returncode} but provided no output"]
                 
-            return ValidationResult(
-                validator=validator_key,
-                passed=passed,
-                errors=errors if isinstance(errors, list) else [str(errors)],
-                warnings=warnings if isinstance(warnings, list) else [str(warnings)],
-                info=info if isinstance(info, list) else [str(info)],
-                details=details,
-                duration_ms=duration_ms
-            )
+            return validation_result
 
         except subprocess.TimeoutExpired:
             return ValidationResult(
@@ -496,6 +555,7 @@ class CoraValidator:
         self,
         project_path: str,
         validators: Optional[list] = None,
+        changed_since: Optional[str] = None,
     ) -> ValidationReport:
         """
         Validate a CORA project.
@@ -503,6 +563,8 @@ class CoraValidator:
         Args:
             project_path: Path to project root
             validators: List of validator keys to run, or None for all
+            changed_since: Git ref; only validate what files changed since
+                it can affect (see shared/change_scope.py)
             
         Returns:
             ValidationReport with all results
@@ -510,8 +572,10 @@ class CoraValidator:
         import time
         start_time = time.time()
         
-        # Clear cache to ensure fresh results
-        self.clear_cache()
+        # Clear cache to ensure fresh results (incremental runs keep bytecode;
+        # cached findings are keyed by validator source instead)
+        if not self.cache_dir:
+            self.clear_cache()
         
         # Default to all validators that support project validation
         if validators is None:
@@ -520,22 +584,28 @@ class CoraValidator:
                 if "project" in v["supports"]
             ]
 
+        scope = None
+        if changed_since:
+            changed = get_changed_files(project_path, changed_since)
+            scope = plan_scope(
+                project_path,
+                changed,
+                {k: self.VALIDATORS[k] for k in validators if k in self.VALIDATORS},
+                since_ref=changed_since,
+            )
+            self.log(f"{len(changed)} files changed since {changed_since}; "
+                     f"running {len(scope.runs)} of {len(validators)} validators")
+            validators = [k for k in validators if k not in scope.unaffected]
+
         report = ValidationReport(
             target_path=project_path,
             validation_type="project",
             timestamp=datetime.now().isoformat(),
             validators_run=validators,
+            scope=scope.to_dict() if scope else None,
         )
 
-        for validator_key in validators:
-            result = self.run_validator(validator_key, project_path, "project")
-            report.results[validator_key] = result
-            
-            if not result.skipped:
-                if not result.passed:
-                    report.overall_passed = False
-                report.total_errors += len(result.errors)
-                report.total_warnings += len(result.warnings)
+        self._run_validators(report, validators, project_path, "project", scope)
 
         report.duration_ms = int((time.time() - start_time) * 1000)
         report.certification_level = self._determine_certification(report)
@@ -560,8 +630,10 @@ class CoraValidator:
         import time
         start_time = time.time()
         
-        # Clear cache to ensure fresh results
-        self.clear_cache()
+        # Clear cache to ensure fresh results (incremental runs keep bytecode;
+        # cached findings are keyed by validator source instead)
+        if not self.cache_dir:
+            self.clear_cache()
         
         # Default to all validators that support module validation
         if validators is None:
@@ -577,8 +649,77 @@ class CoraValidator:
             validators_run=validators,
         )
 
+        self._run_validators(report, validators, module_path, "module")
+
+        report.duration_ms = int((time.time() - start_time) * 1000)
+        report.certification_level = self._determine_certification(report)
+        
+        return report
+
+    def _schedule(self, validators: list) -> list:
+        """Order validators for execution: long-running ones first, rest as given."""
+        first = [k for k in self.LONG_RUNNING_VALIDATORS if k in validators]
+        return first + [k for k in validators if k not in first]
+
+    def _run_validators(
+        self,
+        report: ValidationReport,
+        validators: list,
+        target_path: str,
+        validation_type: str,
+        scope: Optional[ValidationScope] = None,
+    ):
+        """
+        Run validators and collect their results into the report.
+        
+        With jobs > 1 independent validators run concurrently, each in its
+        own subprocess, bounded by self.jobs. Results are passed to
+        on_result as they finish, but are stored in the report in the
+        requested order so the combined report is deterministic.
+        
+        With a diff-aware scope, each validator runs once per scoped target
+        (e.g. once per changed module) and the runs are merged.
+        """
+        # (validator_key, target_path, validation_type, module_filter) per invocation
+        tasks = []
         for validator_key in validators:
-            result = self.run_validator(validator_key, module_path, "module")
+            # Unknown keys have no scoped runs; run_validator reports them
+            if scope is None or validator_key not in scope.runs:
+                tasks.append((validator_key, target_path, validation_type, None))
+                continue
+            for run in scope.runs[validator_key]:
+                run_path = str(Path(target_path) / run.target) if run.target != "." else target_path
+                tasks.append((validator_key, run_path, run.validation_type, run.module_filter))
+        
+        task_results = {}
+        
+        # Fresh file index per run; in-process plugins share it via get_project_index()
+        clear_project_indexes()
+        
+        if self.jobs <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                result = self.run_validator(*task)
+                task_results[task] = result
+                if self.on_result:
+                    self.on_result(result)
+        else:
+            self.log(f"Running {len(tasks)} validator runs with {self.jobs} parallel jobs")
+            scheduled = self._schedule(validators)
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                futures = {
+                    executor.submit(self.run_validator, *task): task
+                    for task in sorted(tasks, key=lambda t: scheduled.index(t[0]))
+                }
+                for future in as_completed(futures):
+                    task = futures[future]
+                    result = future.result()
+                    task_results[task] = result
+                    if self.on_result:
+                        self.on_result(result)
+
+        for validator_key in validators:
+            runs = [(task, task_results[task]) for task in tasks if task[0] == validator_key]
+            result = self._merge_results(validator_key, runs, target_path)
             report.results[validator_key] = result
             
             if not result.skipped:
@@ -587,10 +728,26 @@ class CoraValidator:
                 report.total_errors += len(result.errors)
                 report.total_warnings += len(result.warnings)
 
-        report.duration_ms = int((time.time() - start_time) * 1000)
-        report.certification_level = self._determine_certification(report)
+    def _merge_results(self, validator_key: str, runs: list, target_path: str) -> ValidationResult:
+        """Combine the results of one validator's scoped runs into a single result."""
+        if len(runs) == 1:
+            return runs[0][1]
         
-        return report
+        merged = ValidationResult(validator=validator_key, passed=True, skipped=True)
+        for (_, run_path, validation_type, module_filter), result in runs:
+            label = f"--module {module_filter}" if module_filter else os.path.relpath(run_path, target_path)
+            merged.details[label] = result.details
+            merged.duration_ms += result.duration_ms
+            if result.skipped:
+                continue
+            merged.skipped = False
+            merged.passed = merged.passed and result.passed
+            merged.errors.extend(result.errors)
+            merged.warnings.extend(result.warnings)
+            merged.info.extend(result.info)
+        if merged.skipped:
+            merged.skip_reason = runs[0][1].skip_reason
+        return merged
 
     def _determine_certification(self, report: ValidationReport) -> str:
         """
@@ -1093,6 +1250,21 @@ class ReportFormatter:
         
         return lines
     
+    def _scope_lines(self, report: ValidationReport) -> list:
+        """Describe the diff-aware scope that was actually validated ("Label: value" lines)."""
+        scope = report.scope
+        if not scope:
+            return []
+        lines = [
+            f"Scope: changes since {scope['since_ref']} ({scope['changed_files']} files)",
+            f"Modules: {', '.join(scope['modules']) or 'none (project-wide changes only)'}",
+        ]
+        for key, targets in scope["validators"].items():
+            lines.append(f"Scope {key}: {', '.join(targets)}")
+        if scope["unaffected_validators"]:
+            lines.append(f"Not run (unaffected): {', '.join(scope['unaffected_validators'])}")
+        return lines
+
     def format_json(self, report: ValidationReport) -> str:
         """Format as JSON."""
         return json.dumps(report.to_dict(), indent=2)
@@ -1193,6 +1365,8 @@ class ReportFormatter:
         lines.append(f"Type: {report.validation_type}")
         lines.append(f"Timestamp: {report.timestamp}")
         lines.append(f"Duration: {report.duration_ms}ms")
+        for scope_line in self._scope_lines(report):
+            lines.append(scope_line)
         lines.append("")
         
         # Overall status
@@ -1250,6 +1424,9 @@ class ReportFormatter:
         lines.append(f"| Warnings | {report.total_warnings} |")
         lines.append(f"| Duration | {report.duration_ms}ms |")
         lines.append(f"| Timestamp | {report.timestamp} |")
+        for scope_line in self._scope_lines(report):
+            label, _, value = scope_line.partition(": ")
+            lines.append(f"| {label} | {value} |")
         lines.append("")
         
         # Validator results
@@ -1403,6 +1580,15 @@ Examples:
   # Validate and save results
   python cora-validate.py project /path/to/project --save-results --detailed-report
 
+  # Run up to 4 validators in parallel
+  python cora-validate.py project /path/to/project --jobs 4
+
+  # Re-analyze only files changed since the last incremental run
+  python cora-validate.py project /path/to/project --incremental
+
+  # Only run validators/modules affected by changes since origin/main
+  python cora-validate.py project /path/to/project --changed-since origin/main
+
   # Generate report from existing results
   python cora-validate.py report validation-results/ --format markdown --output report.md
         """,
@@ -1459,10 +1645,39 @@ Examples:
             action="store_true",
             help="Template validation mode (no live database required). Uses static schema parsing."
         )
+        p.add_argument(
+            "--jobs", "-j",
+            type=int,
+            default=1,
+            help="Number of validators to run in parallel (default: 1, 0 = one per CPU)"
+        )
+        p.add_argument(
+            "--isolate",
+            nargs="*",
+            metavar="VALIDATOR",
+            help="Run plugin validators in subprocesses instead of in-process "
+                 "(all if no names given; use for validators that crash or hang)"
+        )
+        p.add_argument(
+            "--incremental",
+            action="store_true",
+            help=f"Cache per-file findings and only re-analyze changed files "
+                 f"(cache stored in <path>/{DEFAULT_CACHE_DIR_NAME}/)"
+        )
+        p.add_argument(
+            "--cache-dir",
+            help="Results cache directory for --incremental (implies --incremental)"
+        )
 
     # Project validation
     project_parser = subparsers.add_parser("project", help="Validate a CORA project")
     project_parser.add_argument("path", help="Path to project root")
+    project_parser.add_argument(
+        "--changed-since",
+        metavar="GIT_REF",
+        help="Diff-aware mode: only run validators (scoped to modules where possible) "
+             "affected by files changed since GIT_REF, including uncommitted changes"
+    )
     add_common_args(project_parser)
 
     # Module validation
@@ -1513,7 +1728,8 @@ def load_report_from_results(results_dir: str) -> ValidationReport:
         total_errors=data.get("total_errors", 0),
         total_warnings=data.get("total_warnings", 0),
         certification_level=data.get("certification_level"),
-        duration_ms=data.get("duration_ms", 0)
+        duration_ms=data.get("duration_ms", 0),
+        scope=data.get("scope"),
     )
     return report
 
@@ -1570,13 +1786,40 @@ def main():
 
     # Run validation
     template_mode = getattr(args, 'template_mode', False)
-    validator = CoraValidator(verbose=args.verbose, template_mode=template_mode)
+    jobs = getattr(args, 'jobs', 1)
+    cache_dir = getattr(args, 'cache_dir', None)
+    if cache_dir is None and getattr(args, 'incremental', False):
+        cache_dir = str(path.resolve() / DEFAULT_CACHE_DIR_NAME)
+    elif cache_dir is not None:
+        cache_dir = str(Path(cache_dir).resolve())
+    
+    def print_progress(result: ValidationResult):
+        """Stream per-validator status to stderr as results arrive."""
+        if result.skipped:
+            status = "skipped"
+        else:
+            status = "passed" if result.passed else "failed"
+        print(f"[{result.validator}] {status} ({result.duration_ms}ms)", file=sys.stderr)
+    
+    validator = CoraValidator(
+        verbose=args.verbose,
+        template_mode=template_mode,
+        jobs=jobs,
+        on_result=print_progress if jobs != 1 else None,
+        isolate=getattr(args, 'isolate', None),
+        cache_dir=cache_dir,
+    )
     
     if args.command == "project":
-        report = validator.validate_project(
-            str(path.resolve()),
-            validators=args.validators
-        )
+        try:
+            report = validator.validate_project(
+                str(path.resolve()),
+                validators=args.validators,
+                changed_since=args.changed_since,
+            )
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
     elif args.command == "module":
         report = validator.validate_module(
             str(path.resolve()),
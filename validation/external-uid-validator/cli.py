@@ -13,6 +13,16 @@ from pathlib import Path
 # Import validator from current package
 from .validator import validate
 
+# Shared plugin interface for in-process execution by cora-validate
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.plugin import ValidationResult, result_from_output
+
+
+def run(target: str, options: dict) -> ValidationResult:
+    """In-process plugin entry point (see shared/plugin.py)."""
+    result = validate(target)
+    return result_from_output("external_uid", result, result['passed'])
+
 
 def main():
     """CLI entry point."""
@@ -9,12 +9,19 @@ This prevents the recurring error:
 """
 
 import ast
+import sys
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Set
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.ignore_matcher import IgnoreMatcher
+
 logger = logging.getLogger(__name__)
 
+# Build artifacts, dependencies and archives (pruned from directory scans)
+IGNORED_DIRS = {'.build', 'dist', 'node_modules', '.venv', '__pycache__', 'backend-archive'}
+
 
 class ExternalUIDValidator:
     """Validates proper external UID to Supabase UUID conversion."""
@@ -64,14 +71,11 @@ class ExternalUIDValidator:
         """
         all_errors = []
         path = Path(directory)
-        ignored_dirs = {'.build', 'dist', 'node_modules', '.venv', '__pycache__', 'backend-archive'}
+        # Ignored directories are pruned, never descended
+        matcher = IgnoreMatcher(path, skip_dirs=IGNORED_DIRS, read_gitignore=False)
         
         # Only validate Lambda function files (typically lambda_function.py)
-        for file_path in path.glob("**/lambda_function.py"):
-            # Check if file is in an ignored directory
-            if any(part in ignored_dirs for part in file_path.parts):
-                continue
-                
+        for file_path in matcher.files(pattern="**/lambda_function.py"):
             if file_path.is_file():
                 errors = self.validate_file(str(file_path))
                 all_errors.extend(errors)
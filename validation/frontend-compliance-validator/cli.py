@@ -37,6 +37,12 @@ except ImportError:
     SEVERITY_MEDIUM = "medium"
     SEVERITY_LOW = "low"
 
+# Shared plugin interface for in-process execution by cora-validate
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.plugin import ValidationResult, result_from_output
+from shared.result_cache import get_result_cache, source_version
+from shared.project_index import get_project_index
+
 
 def _standardize_issue(issue, file_path, project_root=None):
     """
@@ -80,6 +86,87 @@ def _standardize_issue(issue, file_path, project_root=None):
     )
 
 
+def _check_frontend_file(checker: FrontendComplianceChecker, file_path: Path, content: str, root_dir: Path) -> dict:
+    """Check one file and return its result dict plus standardized errors."""
+    result = checker.check_file(file_path, content)
+    errors = []
+    
+    # Convert issues to standard format
+    if not result.is_compliant:
+        for issue in result.issues:
+            errors.append(_standardize_issue(issue, result.path, str(root_dir)))
+    
+    return {"result": result.to_dict(), "errors": errors}
+
+
+def collect_results(root_dir: Path, cache_dir: str = None) -> dict:
+    """
+    Check all frontend files under root_dir and build the JSON output.
+    
+    Per-file findings are replayed from the incremental results cache
+    (cache_dir or $CORA_VALIDATE_CACHE_DIR) for unchanged files.
+    """
+    checker = FrontendComplianceChecker(str(root_dir))
+    index = get_project_index(checker.root_dir)
+    cache = get_result_cache(
+        "frontend",
+        source_version(Path(__file__).parent),
+        {"root_dir": str(root_dir)},
+        cache_dir=cache_dir,
+    )
+    
+    # Find all frontend files
+    files = checker.find_frontend_files()
+    
+    results = []
+    errors = []
+    warnings = []
+    info = []
+    
+    if not files:
+        info.append("No frontend files found")
+    
+    for file_path in files:
+        try:
+            content = index.read_text(file_path)
+            checked = cache.get_or_compute(
+                file_path, content, lambda: _check_frontend_file(checker, file_path, content, root_dir)
+            )
+            results.append(checked["result"])
+            errors.extend(checked["errors"])
+
+        except Exception as e:
+            # Create standardized error for file processing failure
+            error = create_error(
+                file=str(file_path.relative_to(root_dir)),
+                message=f"Failed to check file: {str(e)}",
+                category="Frontend Compliance",
+                severity=SEVERITY_HIGH,
+                project_root=str(root_dir)
+            )
+            errors.append(error)
+    
+    cache.flush()
+    
+    return {
+        "passed": len(errors) == 0,
+        "errors": errors,
+        "warnings": warnings,
+        "info": info,
+        "details": {
+            "total_files": len(files),
+            "compliant_files": sum(1 for r in results if r["is_compliant"]),
+            "results": results
+        }
+    }
+
+
+def run(target: str, options: dict) -> ValidationResult:
+    """In-process plugin entry point (see shared/plugin.py)."""
+    output = collect_results(Path(target), cache_dir=options.get("cache_dir"))
+    return result_from_output("frontend", output, output["passed"])
+
+
 def main():
     parser = argparse.ArgumentParser(description="Frontend Compliance Validator")
     parser.add_argument("path", help="Path to project root")
@@ -93,54 +180,10 @@ def main():
             print(json.dumps({"error": f"Path not found: {args.path}"}))
             sys.exit(1)
             
-        checker = FrontendComplianceChecker(str(root_dir))
-        
-        # Find all frontend files
-        files = checker.find_frontend_files()
-        
-        results = []
-        errors = []
-        warnings = []
-        info = []
-        
-        if not files:
-            info.append("No frontend files found")
-        
-        for file_path in files:
-            try:
-                result = checker.check_file(file_path)
-                results.append(result.to_dict())
-                
-                # Convert issues to standard format
-                if not result.is_compliant:
-                    for issue in result.issues:
-                        standardized = _standardize_issue(issue, result.path, str(root_dir))
-                        errors.append(standardized)
-
-            except Exception as e:
-                # Create standardized error for file processing failure
-                error = create_error(
-                    file=str(file_path.relative_to(root_dir)),
-                    message=f"Failed to check file: {str(e)}",
-                    category="Frontend Compliance",
-                    severity=SEVERITY_HIGH,
-                    project_root=str(root_dir)
-                )
-                errors.append(error)
-        
-        overall_passed = len(errors) == 0
-        
-        output = {
-            "passed": overall_passed,
-            "errors": errors,
-            "warnings": warnings,
-            "info": info,
-            "details": {
-                "total_files": len(files),
-                "compliant_files": sum(1 for r in results if r["is_compliant"]),
-                "results": results
-            }
-        }
+        output = collect_results(root_dir)
+        overall_passed = output["passed"]
+        errors = output["errors"]
+        warnings = output["warnings"]
         
         if args.format == "json":
             print(json.dumps(output, indent=2))
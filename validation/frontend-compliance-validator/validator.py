@@ -6,11 +6,17 @@ Validates frontend code against CORA standards.
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Set, Optional
 from dataclasses import dataclass, field
 
+# Shared project file index (validation/shared)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.project_index import get_project_index
+
+
 @dataclass
 class ComplianceIssue:
     line_number: int
@@ -40,7 +46,7 @@ class FileCompliance:
 
 class FrontendComplianceChecker:
     def __init__(self, root_dir: str):
-        self.root_dir = Path(root_dir)
+        self.root_dir = Path(root_dir).resolve()
 
     def find_frontend_files(self) -> List[Path]:
         """Find all .ts and .tsx files in packages/[module]/frontend/ and apps/web"""
@@ -63,19 +69,15 @@ class FrontendComplianceChecker:
         return sorted(frontend_files)
 
     def _find_ts_files(self, directory: Path) -> List[Path]:
-        files = []
-        for path in directory.rglob("*"):
-            if path.is_file() and path.suffix in [".ts", ".tsx"]:
-                # Skip node_modules, .build, dist, .next
-                if any(part in path.parts for part in ["node_modules", ".build", "dist", ".next"]):
-                    continue
-                files.append(path)
-        return files
-
-    def check_file(self, file_path: Path) -> FileCompliance:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
+        # node_modules, .build, dist and .next are pruned by the project index
+        index = get_project_index(self.root_dir)
+        return index.files(under=directory, suffixes=(".ts", ".tsx"))
+
+    def check_file(self, file_path: Path, content: Optional[str] = None) -> FileCompliance:
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        lines = content.split('\n')
         
         issues = []
         relative_path = str(file_path.relative_to(self.root_dir))
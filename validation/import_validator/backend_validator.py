@@ -3,9 +3,14 @@ Backend Validator
 Validates Python Lambda function imports against actual module signatures
 """
 import ast
+import sys
 from typing import Dict, Any, List, Optional, Set
 from pathlib import Path
 
+# Shared project file index (validation/shared)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.project_index import get_project_index
+
 
 class ImportCall:
     """Represents a function call found in a Lambda file"""
@@ -455,16 +460,12 @@ def validate_lambda_directory(directory: str, signatures: Dict[str, Any]) -> Dic
     """
     validator = BackendValidator(signatures)
     
-    # Find all Python files
+    # Find all Python files (__pycache__ and .build are pruned by the project index)
     path = Path(directory)
-    python_files = list(path.rglob('*.py'))
+    python_files = get_project_index(path).files(under=path, suffixes=('.py',))
     
     results = []
     for file_path in python_files:
-        # Skip __pycache__ and other build artifacts
-        if '__pycache__' in str(file_path) or '.build' in str(file_path):
-            continue
-        
         result = validator.validate_file(str(file_path))
         results.append(result)
     
@@ -5,9 +5,14 @@ Ensures CORA modules don't import auth providers directly
 """
 import re
 import os
+import sys
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple
 
+# Shared project file index (validation/shared)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.project_index import get_project_index
+
 
 # Prohibited auth provider imports for CORA modules
 PROHIBITED_IMPORTS = {
@@ -347,9 +352,7 @@ def validate_frontend_directory(directory: str, base_path: str) -> Dict:
     dir_path = Path(directory)
     
     # Find all TypeScript/React files
-    ts_files = []
-    for ext in ['*.ts', '*.tsx']:
-        ts_files.extend(dir_path.rglob(ext))
+    ts_files = get_project_index(dir_path).files(under=dir_path, suffixes=('.ts', '.tsx'))
     
     # Filter to only CORA module files and apps/web files
     relevant_files = []
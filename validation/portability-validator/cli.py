@@ -16,6 +16,10 @@ from pathlib import Path
 
 from .validator import PortabilityValidator
 
+# Shared plugin interface for in-process execution by cora-validate
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.plugin import ValidationResult, result_from_output
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser."""
@@ -230,6 +234,13 @@ def format_markdown(result: dict) -> str:
     return "\n".join(lines)
 
 
+def run(target: str, options: dict) -> ValidationResult:
+    """In-process plugin entry point (see shared/plugin.py)."""
+    validator = PortabilityValidator(verbose=False)
+    result_dict = validator.validate_path(str(Path(target).resolve())).to_dict()
+    return result_from_output("portability", result_dict, result_dict['summary']['errors'] == 0)
+
+
 def main():
     """Main entry point."""
     parser = create_parser()
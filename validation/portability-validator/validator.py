@@ -15,9 +15,10 @@ Standard: 05_std_quality_VALIDATOR-OUTPUT
 import re
 import os
 import sys
+import bisect
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 # Import shared output format utilities
 try:
@@ -31,6 +32,7 @@ try:
         SEVERITY_LOW,
         SEVERITY_CRITICAL
     )
+    from shared.ignore_matcher import IgnoreMatcher
 except ImportError:
     # Fallback if shared module not available
     def create_error(file, message, category, severity="high", line=None, suggestion=None, project_root=None):
@@ -43,6 +45,111 @@ except ImportError:
     SEVERITY_MEDIUM = "medium"
     SEVERITY_LOW = "low"
     SEVERITY_CRITICAL = "critical"
+    IgnoreMatcher = None
+
+
+# Lines starting with these (after whitespace) are comments and never scanned
+COMMENT_PREFIXES = ("//", "#", "*")
+
+# aws_account_id false-positive checks
+UUID_REGEX = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-\d{12}')
+VERSION_REGEX = re.compile(r'["\']\?\d+\.\d+\.\d+["\']?')
+NON_ACCOUNT_CONTEXTS = ("version", "port", "year", "date", "time", "uuid", "guid", "id\":")
+
+
+class PatternScanner:
+    """
+    Scans a whole file buffer for a set of patterns at once.
+
+    Patterns of the same case-sensitivity class are combined into one regex:
+    a lookahead alternation that stops only where some pattern starts,
+    followed by one optional named lookahead group per pattern. Every
+    pattern's match at that position is captured, so results are the same
+    as running each pattern's finditer() on each line: matches of different
+    patterns may overlap, matches of one pattern don't.
+
+    Patterns that can't be combined (capturing groups, global inline flags)
+    are scanned line by line with their own precompiled regex.
+    """
+
+    def __init__(self, patterns: List[Tuple[str, dict]]):
+        """
+        Args:
+            patterns: (name, config) pairs in report order
+        """
+        self.patterns = patterns
+        self._regexes: List[re.Pattern] = []
+        self._line_patterns: List[int] = []
+        self._buffer_regexes: List[Tuple[re.Pattern, List[int]]] = []
+
+        classes: Dict[int, List[int]] = {0: [], re.IGNORECASE: []}
+        for index, (_, config) in enumerate(patterns):
+            flags = re.IGNORECASE if config.get("case_insensitive") else 0
+            regex = re.compile(config["pattern"], flags)
+            self._regexes.append(regex)
+            if regex.groups:
+                self._line_patterns.append(index)
+            else:
+                classes[flags].append(index)
+
+        for flags, members in classes.items():
+            if not members:
+                continue
+            sources = [self.patterns[index][1]["pattern"] for index in members]
+            combined = "(?=" + "|".join(f"(?:{source})" for source in sources) + ")" + "".join(
+                f"(?:(?=(?P<p{index}>{source})))?" for index, source in zip(members, sources)
+            )
+            try:
+                # MULTILINE so ^/$ anchor at line boundaries, as when scanning lines
+                self._buffer_regexes.append((re.compile(combined, flags | re.MULTILINE), members))
+            except re.error:
+                self._line_patterns.extend(members)
+
+    def scan(self, text: str, lines: List[str], line_starts: List[int]) -> List[Tuple[int, int, str]]:
+        """
+        Find pattern matches in a file.
+
+        Args:
+            text: File contents
+            lines: text split into lines, each keeping its '\\n'
+            line_starts: Offset of each line in text
+
+        Returns:
+            (line index, pattern index, matched value) tuples, ordered by
+            line, then pattern, then position (the per-line scan order)
+        """
+        hits = []
+        for regex, members in self._buffer_regexes:
+            # Pattern index -> (line index, end offset) of its last match
+            last_match: Dict[int, Tuple[int, int]] = {}
+            for match in regex.finditer(text):
+                line_index = bisect.bisect_right(line_starts, match.start()) - 1
+                line_start = line_starts[line_index]
+                line_end = line_start + len(lines[line_index])
+                for index in members:
+                    start, end = match.span(f"p{index}")
+                    if start < 0:
+                        continue
+                    previous = last_match.get(index)
+                    if previous is not None and previous[0] == line_index and start < previous[1]:
+                        continue
+                    if end > line_end:
+                        # Ran into the next line; match within this line only
+                        line_match = self._regexes[index].match(lines[line_index], start - line_start)
+                        if line_match is None:
+                            continue
+                        end = line_start + line_match.end()
+                    last_match[index] = (line_index, end)
+                    hits.append((line_index, index, start, text[start:end]))
+
+        for index in self._line_patterns:
+            regex = self._regexes[index]
+            for line_index, line in enumerate(lines):
+                for match in regex.finditer(line):
+                    hits.append((line_index, index, line_starts[line_index] + match.start(), match.group()))
+
+        hits.sort(key=lambda hit: hit[:3])
+        return [(line_index, index, value) for line_index, index, _, value in hits]
 
 
 @dataclass
@@ -272,7 +379,10 @@ class PortabilityValidator:
     ):
         self.verbose = verbose
         self.patterns = {**self.DEFAULT_PATTERNS}
-        self.gitignore_patterns = []
+        # .gitignore matcher for the validated directory (see _load_gitignore)
+        self.ignore_matcher = None
+        # Scanners by active pattern set (files differ only in exclude_files matches)
+        self._scanners: Dict[tuple, PatternScanner] = {}
         
         if custom_patterns:
             self.patterns.update(custom_patterns)
@@ -292,77 +402,19 @@ class PortabilityValidator:
             print(f"[DEBUG] {message}")
 
     def _load_gitignore(self, project_root: Path):
-        """Load and parse .gitignore file from project root."""
-        gitignore_path = project_root / ".gitignore"
-        
-        if not gitignore_path.exists():
-            self.log("No .gitignore file found")
+        """Compile the project's .gitignore files (root and nested) into a matcher."""
+        if IgnoreMatcher is None:
+            self.log("Shared ignore matcher not available; .gitignore not applied")
             return
-        
-        try:
-            with open(gitignore_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            
-            for line in lines:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-                
-                # Simple gitignore pattern - convert to regex-like pattern
-                # This is a simplified implementation that handles common cases
-                self.gitignore_patterns.append(line)
-            
-            self.log(f"Loaded {len(self.gitignore_patterns)} patterns from .gitignore")
-        except Exception as e:
-            self.log(f"Error reading .gitignore: {e}")
-    
+        self.ignore_matcher = IgnoreMatcher(project_root)
+        if not (project_root / ".gitignore").exists():
+            self.log("No .gitignore file found")
+
     def _is_gitignored(self, file_path: Path, project_root: Path) -> bool:
-        """Check if a file matches any gitignore pattern."""
-        if not self.gitignore_patterns:
-            return False
-        
-        # Get relative path from project root
-        try:
-            rel_path = file_path.relative_to(project_root)
-        except ValueError:
-            # File is not under project root
+        """Check if a file or directory is ignored by the project's .gitignore files."""
+        if self.ignore_matcher is None:
             return False
-        
-        rel_path_str = str(rel_path)
-        file_name = file_path.name
-        
-        for pattern in self.gitignore_patterns:
-            # Simple pattern matching
-            # Handle common gitignore patterns:
-            # - Exact filename match
-            # - Wildcard patterns (*.ext)
-            # - Directory patterns (dir/)
-            # - Path patterns (path/to/file)
-            
-            if pattern == rel_path_str or pattern == file_name:
-                return True
-            
-            # Wildcard patterns (e.g., *.env, setup.config.*.yaml)
-            if "*" in pattern:
-                import fnmatch
-                if fnmatch.fnmatch(file_name, pattern):
-                    return True
-                if fnmatch.fnmatch(rel_path_str, pattern):
-                    return True
-            
-            # Directory patterns (e.g., node_modules/)
-            if pattern.endswith("/"):
-                dir_pattern = pattern.rstrip("/")
-                if str(rel_path).startswith(dir_pattern + "/") or str(rel_path) == dir_pattern:
-                    return True
-            
-            # Path patterns (e.g., .env.local)
-            if "/" in pattern:
-                if rel_path_str.startswith(pattern) or rel_path_str == pattern:
-                    return True
-        
-        return False
+        return self.ignore_matcher.is_ignored(file_path)
 
     def validate_path(self, target_path: str) -> ValidationResult:
         """
@@ -390,6 +442,7 @@ class PortabilityValidator:
             return result
 
         # Load gitignore if validating a directory (project root)
+        self.ignore_matcher = None
         if path.is_dir():
             self._load_gitignore(path)
 
@@ -402,43 +455,54 @@ class PortabilityValidator:
         return result
 
     def _validate_directory(self, dir_path: Path, result: ValidationResult, project_root: Path):
-        """Recursively validate all files in a directory."""
+        """Validate all files in a directory tree, never descending into skipped or gitignored directories."""
+        if self.ignore_matcher is None:
+            self._validate_directory_tree(dir_path, result, project_root)
+            return
+
+        # Gitignored entries are dropped (and their subtrees pruned) by the walk
+        for current, dirnames, filenames in self.ignore_matcher.walk(dir_path):
+            dirnames[:] = [d for d in dirnames if not self._skip_entry(current / d, is_dir=True)]
+            for filename in filenames:
+                file_path = current / filename
+                if not self._skip_entry(file_path, is_dir=False):
+                    self._validate_file(file_path, result, project_root)
+
+    def _validate_directory_tree(self, dir_path: Path, result: ValidationResult, project_root: Path):
+        """Recursively validate all files in a directory (fallback without the shared ignore matcher)."""
         for item in dir_path.iterdir():
-            # Skip hidden files/directories
-            if item.name.startswith(".") and item.name not in [".env"]:
+            is_dir = item.is_dir()
+            if self._skip_entry(item, is_dir):
                 continue
-            
-            # Skip configured directories
-            if item.is_dir() and item.name in self.SKIP_DIRECTORIES:
-                self.log(f"Skipping directory: {item}")
-                continue
-            
-            # Skip configured files
-            if item.is_file() and item.name in self.SKIP_FILES:
-                self.log(f"Skipping file: {item}")
-                continue
-            
-            # Skip gitignored files/directories
-            if self._is_gitignored(item, project_root):
-                self.log(f"Skipping gitignored: {item}")
-                continue
-            
-            if item.is_dir():
-                self._validate_directory(item, result, project_root)
+            if is_dir:
+                self._validate_directory_tree(item, result, project_root)
             elif item.is_file():
                 self._validate_file(item, result, project_root)
 
+    def _skip_entry(self, item: Path, is_dir: bool) -> bool:
+        """Whether a directory entry is skipped (hidden or configured skip lists)."""
+        # Skip hidden files/directories
+        if item.name.startswith(".") and item.name not in [".env"]:
+            return True
+        
+        # Skip configured directories
+        if is_dir and item.name in self.SKIP_DIRECTORIES:
+            self.log(f"Skipping directory: {item}")
+            return True
+        
+        # Skip configured files
+        if not is_dir and item.name in self.SKIP_FILES:
+            self.log(f"Skipping file: {item}")
+            return True
+        
+        return False
+
     def _validate_file(self, file_path: Path, result: ValidationResult, project_root: Path):
         """Validate a single file for portability issues."""
         # Check file extension
         if file_path.suffix not in self.SCANNABLE_EXTENSIONS:
             return
         
-        # Check if gitignored (skip validation for gitignored files)
-        if self._is_gitignored(file_path, project_root):
-            self.log(f"Skipping gitignored file: {file_path}")
-            return
-        
         # Check whitelist patterns
         for whitelist_pattern in self.WHITELIST_PATTERNS:
             if file_path.match(whitelist_pattern):
@@ -450,69 +514,89 @@ class PortabilityValidator:
 
         try:
             with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
+                text = f.read()
         except Exception as e:
             self.log(f"Error reading {file_path}: {e}")
             return
 
-        for line_num, line in enumerate(lines, start=1):
-            self._check_line(file_path, line_num, line, result)
+        lines = text.split("\n")
+        if lines[-1]:
+            lines = [line + "\n" for line in lines[:-1]] + [lines[-1]]
+        else:
+            lines = [line + "\n" for line in lines[:-1]]
+        line_starts = [0]
+        for line in lines[:-1]:
+            line_starts.append(line_starts[-1] + len(line))
+
+        scanner = self._scanner_for(file_path)
+        lowered: Dict[int, str] = {}
+        for line_index, pattern_index, matched_value in scanner.scan(text, lines, line_starts):
+            line = lines[line_index]
+            # Skip comment lines
+            if line.lstrip().startswith(COMMENT_PREFIXES):
+                continue
+            if line_index not in lowered:
+                lowered[line_index] = line.lower()
+            pattern_name, pattern_config = scanner.patterns[pattern_index]
+            self._check_match(
+                file_path, line_index + 1, line, lowered[line_index],
+                pattern_name, pattern_config, matched_value, result,
+            )
 
-    def _check_line(
+    def _scanner_for(self, file_path: Path) -> PatternScanner:
+        """Return the scanner for the patterns that apply to a file (exclude_files resolved once per file)."""
+        active = [
+            (name, config) for name, config in self.patterns.items()
+            if not any(file_path.match(ef) for ef in config.get("exclude_files", []))
+        ]
+        key = tuple(
+            (name, config["pattern"], bool(config.get("case_insensitive"))) for name, config in active
+        )
+        scanner = self._scanners.get(key)
+        if scanner is None:
+            scanner = self._scanners[key] = PatternScanner(active)
+        return scanner
+
+    def _check_match(
         self,
         file_path: Path,
         line_num: int,
         line: str,
+        line_lower: str,
+        pattern_name: str,
+        pattern_config: dict,
+        matched_value: str,
         result: ValidationResult
     ):
-        """Check a single line against all patterns."""
-        # Skip comment lines
-        stripped = line.strip()
-        if stripped.startswith("//") or stripped.startswith("#") or stripped.startswith("*"):
+        """Report a pattern match unless its line context excludes it."""
+        # Check context exclusions
+        exclude_contexts = pattern_config.get("exclude_contexts", [])
+        if any(ctx.lower() in line_lower for ctx in exclude_contexts):
             return
 
-        for pattern_name, pattern_config in self.patterns.items():
-            # Check file exclusions
-            exclude_files = pattern_config.get("exclude_files", [])
-            if any(file_path.match(ef) for ef in exclude_files):
-                continue
-
-            # Compile pattern
-            flags = re.IGNORECASE if pattern_config.get("case_insensitive") else 0
-            regex = re.compile(pattern_config["pattern"], flags)
-
-            # Find matches
-            for match in regex.finditer(line):
-                matched_value = match.group()
-                
-                # Check context exclusions
-                exclude_contexts = pattern_config.get("exclude_contexts", [])
-                if any(ctx.lower() in line.lower() for ctx in exclude_contexts):
-                    continue
-
-                # Skip if looks like a version number or UUID
-                if pattern_name == "aws_account_id":
-                    # Skip if part of a UUID pattern
-                    # UUIDs: 8-4-4-4-12 format (e.g., 123e4567-e89b-12d3-a456-426614174000)
-                    if re.search(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-\d{12}', line.lower()):
-                        continue
-                    # Skip version-like patterns
-                    if re.search(r'["\']\?\d+\.\d+\.\d+["\']?', line):
-                        continue
-                    # Skip obvious non-account-id contexts
-                    if any(x in line.lower() for x in ["version", "port", "year", "date", "time", "uuid", "guid", "id\":"]):
-                        continue
+        # Skip if looks like a version number or UUID
+        if pattern_name == "aws_account_id":
+            # Skip if part of a UUID pattern
+            # UUIDs: 8-4-4-4-12 format (e.g., 123e4567-e89b-12d3-a456-426614174000)
+            if UUID_REGEX.search(line_lower):
+                return
+            # Skip version-like patterns
+            if VERSION_REGEX.search(line):
+                return
+            # Skip obvious non-account-id contexts
+            if any(x in line_lower for x in NON_ACCOUNT_CONTEXTS):
+                return
 
-                result.add_issue(PortabilityIssue(
-                    severity=pattern_config["severity"],
-                    message=pattern_config["message"],
-                    file_path=str(file_path),
-                    line_number=line_num,
-                    line_content=line.rstrip(),
-                    pattern_name=pattern_name,
-                    matched_value=matched_value,
-                    suggestion=pattern_config.get("suggestion"),
-                ))
+        result.add_issue(PortabilityIssue(
+            severity=pattern_config["severity"],
+            message=pattern_config["message"],
+            file_path=str(file_path),
+            line_number=line_num,
+            line_content=line.rstrip(),
+            pattern_name=pattern_name,
+            matched_value=matched_value,
+            suggestion=pattern_config.get("suggestion"),
+        ))
 
     def add_project_name_pattern(self, project_name: str):
         """Add a pattern to detect hardcoded project name."""
@@ -7,10 +7,15 @@ Ensures code follows role naming standards:
 """
 
 import re
+import sys
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass, field
 
+# Shared project file index (validation/shared)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.project_index import get_project_index
+
 
 @dataclass
 class Violation:
@@ -380,9 +385,10 @@ class RoleNamingValidator:
         files_with_violations = set()
         
         project_root = Path(project_root).resolve()
+        index = get_project_index(project_root)
         
         for ext in self.INCLUDE_EXTENSIONS:
-            for file_path in project_root.rglob(f'*{ext}'):
+            for file_path in index.files(under=project_root, suffixes=(ext,)):
                 if self.should_exclude(file_path, project_root):
                     continue
                 
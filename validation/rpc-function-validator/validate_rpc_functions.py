@@ -21,6 +21,10 @@ from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+# Shared project file index (validation/shared)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.project_index import get_project_index, KIND_LAMBDA, KIND_SQL_SCHEMA
+
 
 @dataclass
 class RPCCall:
@@ -83,14 +87,14 @@ class RPCFunctionValidator:
         for search_path in search_paths:
             if not search_path.exists():
                 continue
-            for py_file in search_path.rglob("lambda_function.py"):
-                lambda_files.append(py_file)
+            index = get_project_index(search_path)
+            lambda_files.extend(index.files(kind=KIND_LAMBDA, under=search_path))
             # Also check for other .py files in lambda directories
-            for py_file in search_path.rglob("lambdas/**/*.py"):
+            for py_file in index.glob("**/lambdas/**/*.py", under=search_path):
                 if py_file.name != "__init__.py":
                     lambda_files.append(py_file)
                     
-        return list(set(lambda_files))  # Remove duplicates
+        return sorted(set(lambda_files))  # Remove duplicates
     
     def find_sql_files(self, base_path: Path) -> List[Path]:
         """Find all SQL schema files."""
@@ -105,8 +109,8 @@ class RPCFunctionValidator:
         for search_path in search_paths:
             if not search_path.exists():
                 continue
-            for sql_file in search_path.rglob("*.sql"):
-                sql_files.append(sql_file)
+            index = get_project_index(search_path)
+            sql_files.extend(index.files(kind=KIND_SQL_SCHEMA, under=search_path))
                 
         return sql_files
     
@@ -6,13 +6,20 @@ Identifies table names, column references, and query operations.
 """
 
 import ast
+import sys
 import logging
 from typing import Dict, List, Set, Optional, Any
 from dataclasses import dataclass, field
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.ignore_matcher import IgnoreMatcher
+
 logger = logging.getLogger(__name__)
 
+# Build artifacts, dependencies and archives (pruned from directory scans)
+IGNORED_DIRS = {'.build', 'dist', 'node_modules', '.venv', '__pycache__', 'backend-archive'}
+
 
 @dataclass
 class QueryReference:
@@ -76,13 +83,10 @@ class QueryParser:
         """
         all_queries = []
         path = Path(directory)
-        ignored_dirs = {'.build', 'dist', 'node_modules', '.venv', '__pycache__', 'backend-archive'}
+        # Ignored directories are pruned, never descended
+        matcher = IgnoreMatcher(path, skip_dirs=IGNORED_DIRS, read_gitignore=False)
         
-        for file_path in path.glob(pattern):
-            # Check if file is in an ignored directory
-            if any(part in ignored_dirs for part in file_path.parts):
-                continue
-                
+        for file_path in matcher.files(pattern=pattern):
             if file_path.is_file():
                 queries = self.parse_file(str(file_path))
                 all_queries.extend(queries)
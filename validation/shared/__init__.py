@@ -6,12 +6,21 @@ Shared utilities and parsers used across multiple validators.
 Components:
 - schema_types: Common dataclasses for schema representation
 - static_schema_parser: SQL file parser for schema extraction
+- plugin: In-process validator plugin interface (ValidationResult)
+- project_index: Single-walk project file index shared by validators
+- result_cache: Incremental per-file findings cache
+- change_scope: Diff-aware validation scope for --changed-since
+- ignore_matcher: Compiled .gitignore matcher with directory pruning
 """
 
 __version__ = "1.0.0"
 
 from .schema_types import ColumnInfo, TableInfo
 from .static_schema_parser import StaticSchemaParser, find_schema_sql_files, load_static_schema
+from .plugin import ValidationResult, result_from_output
+from .project_index import ProjectIndex, get_project_index
+from .result_cache import ResultCache, get_result_cache
+from .ignore_matcher import IgnoreMatcher
 
 __all__ = [
     'ColumnInfo',
@@ -19,4 +28,11 @@ __all__ = [
     'StaticSchemaParser',
     'find_schema_sql_files',
     'load_static_schema',
+    'ValidationResult',
+    'result_from_output',
+    'ProjectIndex',
+    'get_project_index',
+    'ResultCache',
+    'get_result_cache',
+    'IgnoreMatcher',
 ]
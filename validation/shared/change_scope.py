@@ -0,0 +1,156 @@
+"""
+Diff-Aware Validation Scope
+
+Maps the files changed since a git ref to the validators and modules they
+can affect, so `cora-validate.py project --changed-since <ref>` only runs
+what can produce different results:
+
+- Validators declare the file types they read via "file_types" in
+  CoraValidator.VALIDATORS (no entry = any change is relevant). Validators
+  with no relevant changes are not run.
+- Changes inside a module directory (any path component named module-*)
+  scope the validator to that module: validators supporting module
+  validation run on the module directory; project-only validators with a
+  "module_option" (api-tracer's --module, i.e. FullStackValidator's
+  module_filter) run once per module under packages/.
+- Any relevant change outside a module (apps/web, shared config, ...)
+  makes that validator run project-wide.
+
+Usage:
+    from shared.change_scope import get_changed_files, plan_scope
+
+    changed = get_changed_files(project_path, 'origin/main')
+    scope = plan_scope(project_path, changed, CoraValidator.VALIDATORS)
+    for run in scope.runs.get('api', []):
+        ...
+"""
+
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SCOPE_PROJECT = "project"
+SCOPE_MODULE = "module"
+
+
+@dataclass
+class ScopedRun:
+    """One validator invocation within a diff-aware scope."""
+    target: str  # Path relative to the project root ("." for the project)
+    validation_type: str  # "project" or "module"
+    module_filter: Optional[str] = None  # Module name for the validator's module_option
+
+
+@dataclass
+class ValidationScope:
+    """Validators and targets affected by a set of changed files."""
+    since_ref: str
+    changed_files: List[str] = field(default_factory=list)
+    modules: List[str] = field(default_factory=list)  # Affected module directories
+    runs: Dict[str, List[ScopedRun]] = field(default_factory=dict)  # Validator key -> runs
+    unaffected: List[str] = field(default_factory=list)  # Validators with no relevant changes
+
+    def to_dict(self) -> dict:
+        """Summary for reports: which scope was actually validated."""
+        return {
+            "since_ref": self.since_ref,
+            "changed_files": len(self.changed_files),
+            "modules": self.modules,
+            "validators": {
+                key: [describe_run(run) for run in runs]
+                for key, runs in self.runs.items()
+            },
+            "unaffected_validators": self.unaffected,
+        }
+
+
+def describe_run(run: ScopedRun) -> str:
+    """Human-readable target of a scoped run."""
+    if run.module_filter:
+        return f"project (--module {run.module_filter})"
+    return run.target if run.validation_type == SCOPE_MODULE else "project"
+
+
+def get_changed_files(project_path, since_ref: str) -> List[str]:
+    """
+    List files changed since a git ref, relative to project_path.
+
+    Includes committed, staged and unstaged changes (the working tree
+    compared with since_ref) plus untracked files that aren't ignored.
+
+    Raises:
+        RuntimeError: If project_path isn't in a git repository or the ref is unknown
+    """
+    project_path = Path(project_path)
+    commands = [
+        ["git", "-C", str(project_path), "diff", "--name-only", "--relative", since_ref, "--"],
+        ["git", "-C", str(project_path), "ls-files", "--others", "--exclude-standard"],
+    ]
+    changed = set()
+    for cmd in commands:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"git {' '.join(cmd[3:])} failed: {result.stderr.strip()}")
+        changed.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return sorted(changed)
+
+
+def module_dir_for(path: str) -> Optional[str]:
+    """Return the module directory containing a relative path (e.g. 'packages/module-kb'), if any."""
+    parts = path.split("/")
+    for i, part in enumerate(parts[:-1]):
+        if part.startswith("module-"):
+            return "/".join(parts[:i + 1])
+    return None
+
+
+def _is_relevant(path: str, file_types: Optional[List[str]]) -> bool:
+    """Whether a changed file can affect a validator reading file_types."""
+    return file_types is None or path.endswith(tuple(file_types))
+
+
+def plan_scope(project_path, changed_files: List[str], validators: Dict[str, dict], since_ref: str = "") -> ValidationScope:
+    """
+    Decide which validators to run, and on which targets, for a change set.
+
+    Args:
+        project_path: Project root the changed paths are relative to
+        changed_files: Changed paths relative to project_path
+        validators: Validator key -> VALIDATORS info, in run order
+        since_ref: Git ref the changes were computed against (for reporting)
+
+    Returns:
+        ValidationScope with runs for affected validators
+    """
+    project = Path(project_path)
+    scope = ValidationScope(since_ref=since_ref, changed_files=list(changed_files))
+    all_modules = set()
+
+    for key, info in validators.items():
+        relevant = [f for f in changed_files if _is_relevant(f, info.get("file_types"))]
+        if not relevant:
+            scope.unaffected.append(key)
+            continue
+
+        module_dirs = {module_dir_for(f) for f in relevant}
+        # Changes outside modules, or to deleted modules, need a project-wide run
+        project_wide = None in module_dirs or any(not (project / m).is_dir() for m in module_dirs)
+
+        if not project_wide and SCOPE_MODULE in info["supports"]:
+            runs = [ScopedRun(target=m, validation_type=SCOPE_MODULE) for m in sorted(module_dirs)]
+        elif not project_wide and info.get("module_option") and all(
+            m.startswith("packages/") and m.count("/") == 1 for m in module_dirs
+        ):
+            runs = [
+                ScopedRun(target=".", validation_type=SCOPE_PROJECT, module_filter=m.split("/")[1])
+                for m in sorted(module_dirs)
+            ]
+        else:
+            runs = [ScopedRun(target=".", validation_type=SCOPE_PROJECT)]
+
+        scope.runs[key] = runs
+        all_modules.update(m for m in module_dirs if m)
+
+    scope.modules = sorted(all_modules)
+    return scope
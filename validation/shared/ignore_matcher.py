@@ -0,0 +1,326 @@
+"""
+Compiled .gitignore Matcher
+
+Decides whether project paths are ignored, with gitignore semantics:
+
+- Patterns without a '/' (other than a trailing one) match a name at any
+  depth; patterns with one are anchored to their .gitignore's directory
+- '*', '?' and '[...]' don't cross '/'; '**/' matches any number of
+  leading directories, '/**' everything inside, '/**/' zero or more
+  directories
+- A trailing '/' matches directories only
+- '!' re-includes a path excluded by an earlier pattern (but not a path
+  inside an excluded directory)
+- Nested .gitignore files apply below their directory and take precedence
+  over their parents
+
+Each .gitignore is compiled into one regex per entry type (the rules in
+reverse order as named alternatives, so the first alternative that matches
+is the last matching rule). Directory decisions are cached, and walk()
+prunes ignored directories so their subtrees are never descended.
+
+Validators with hardcoded skip lists (node_modules, .next, dist, ...) can
+pass them as skip_dirs to get the same pruning without reading .gitignore.
+
+Usage:
+    from shared.ignore_matcher import IgnoreMatcher
+
+    matcher = IgnoreMatcher(project_root, skip_dirs={'node_modules', '.next'})
+    for dirpath, dirnames, filenames in matcher.walk():
+        ...
+    matcher.is_ignored(project_root / 'apps/web/.env.local')
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .project_index import _glob_to_regex
+
+GITIGNORE_FILE = '.gitignore'
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one path segment of a gitignore pattern to a regex."""
+    parts = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        if char == '\\' and i + 1 < len(segment):
+            parts.append(re.escape(segment[i + 1]))
+            i += 2
+            continue
+        if char == '*':
+            while i + 1 < len(segment) and segment[i + 1] == '*':
+                i += 1
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            end = segment.find(']', i + 2 if segment[i + 1:i + 2] in ('!', '^') else i + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = segment[i + 1:end]
+                if body[:1] in ('!', '^'):
+                    body = '^' + body[1:]
+                parts.append('[' + body.replace('\\', '\\\\') + ']')
+                i = end
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return ''.join(parts)
+
+
+def translate_pattern(pattern: str) -> Optional[Tuple[str, bool, bool]]:
+    """
+    Translate one .gitignore line.
+
+    Returns:
+        (regex source, negated, directory_only), or None for blank lines
+        and comments. The regex matches paths relative to the .gitignore's
+        directory.
+    """
+    # Trailing spaces are ignored unless escaped
+    stripped = pattern.rstrip('\n').rstrip('\r')
+    while stripped.endswith(' ') and not stripped.endswith('\\ '):
+        stripped = stripped[:-1]
+    if not stripped or stripped.startswith('#'):
+        return None
+
+    negated = stripped.startswith('!')
+    if negated:
+        stripped = stripped[1:]
+    elif stripped.startswith('\\!') or stripped.startswith('\\#'):
+        stripped = stripped[1:]
+
+    directory_only = stripped.endswith('/')
+    stripped = stripped.rstrip('/')
+    if not stripped:
+        return None
+
+    anchored = '/' in stripped
+    segments = stripped.lstrip('/').split('/')
+
+    regex = []
+    for i, segment in enumerate(segments):
+        first = i == 0
+        last = i == len(segments) - 1
+        if segment == '**':
+            if last:
+                # 'dir/**' matches everything inside dir (not dir itself)
+                regex.append('.+' if first else '/.+')
+            elif first:
+                regex.append('(?:.+/)?')
+            else:
+                regex.append('/(?:.+/)?')
+            continue
+        if not first and segments[i - 1] != '**':
+            regex.append('/')
+        regex.append(_translate_segment(segment))
+
+    source = ''.join(regex)
+    if not anchored:
+        source = '(?:.+/)?' + source
+    return source, negated, directory_only
+
+
+class IgnoreRules:
+    """Compiled rules from one .gitignore (or pattern list), relative to its directory."""
+
+    def __init__(self, patterns: Iterable[str], base: str = ''):
+        """
+        Args:
+            patterns: .gitignore lines
+            base: Directory of the .gitignore, relative to the matcher root ('' = root)
+        """
+        self.base = base
+        rules = [rule for rule in (translate_pattern(p) for p in patterns) if rule is not None]
+        self.negated = [negated for _, negated, _ in rules]
+        self._regexes = {
+            is_dir: self._compile(rules, is_dir) for is_dir in (True, False)
+        }
+
+    @staticmethod
+    def _compile(rules: List[Tuple[str, bool, bool]], is_dir: bool) -> Optional['re.Pattern']:
+        """One alternation over the rules, last rule first."""
+        alternatives = [
+            f"(?P<r{index}>{source})"
+            for index, (source, _, directory_only) in reversed(list(enumerate(rules)))
+            if is_dir or not directory_only
+        ]
+        if not alternatives:
+            return None
+        return re.compile('(?:' + '|'.join(alternatives) + r')\Z', re.DOTALL)
+
+    def __len__(self) -> int:
+        return len(self.negated)
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Decide a path relative to this file's directory.
+
+        Returns:
+            True if ignored, False if re-included by a negation, None if no rule matches
+        """
+        regex = self._regexes[is_dir]
+        if regex is None:
+            return None
+        match = regex.match(rel_path)
+        if match is None:
+            return None
+        return not self.negated[int(match.lastgroup[1:])]
+
+
+class IgnoreMatcher:
+    """Gitignore-aware path filter for one project tree."""
+
+    def __init__(
+        self,
+        root,
+        skip_dirs: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        read_gitignore: bool = True,
+    ):
+        """
+        Args:
+            root: Project root (paths are matched relative to it)
+            skip_dirs: Directory names always pruned, at any depth
+            patterns: Extra gitignore-style patterns, applied at the root
+                      before the root .gitignore
+            read_gitignore: Load .gitignore files (root and nested)
+        """
+        self.root = Path(root).resolve()
+        self.skip_dirs = frozenset(skip_dirs)
+        self.read_gitignore = read_gitignore
+        self._extra_rules = IgnoreRules(patterns)
+        # Relative directory -> rule sets that apply inside it (shallowest first)
+        self._stacks: Dict[str, List[IgnoreRules]] = {}
+        # Relative directory -> whether it (or an ancestor) is ignored
+        self._ignored_dirs: Dict[str, bool] = {'': False}
+
+    def _relative(self, path) -> str:
+        """Path relative to the root as a POSIX string ('' for the root)."""
+        rel = Path(path).resolve().relative_to(self.root).as_posix()
+        return '' if rel == '.' else rel
+
+    def _load_rules(self, rel_dir: str) -> Optional[IgnoreRules]:
+        """Compile the .gitignore in a directory, if any."""
+        if not self.read_gitignore:
+            return None
+        gitignore = self.root / rel_dir / GITIGNORE_FILE
+        try:
+            with open(gitignore, 'r', encoding='utf-8', errors='ignore') as f:
+                rules = IgnoreRules(f.readlines(), base=rel_dir)
+        except OSError:
+            return None
+        return rules or None
+
+    def _stack(self, rel_dir: str) -> List[IgnoreRules]:
+        """Rule sets that apply to entries of a directory."""
+        stack = self._stacks.get(rel_dir)
+        if stack is None:
+            if rel_dir:
+                parent = rel_dir.rpartition('/')[0]
+                stack = list(self._stack(parent))
+            else:
+                stack = [self._extra_rules] if self._extra_rules else []
+            rules = self._load_rules(rel_dir)
+            if rules is not None:
+                stack.append(rules)
+            self._stacks[rel_dir] = stack
+        return stack
+
+    def _decide(self, rel_dir: str, name: str, is_dir: bool) -> bool:
+        """Whether an entry of a (not ignored) directory is ignored."""
+        if is_dir and name in self.skip_dirs:
+            return True
+        rel_path = f"{rel_dir}/{name}" if rel_dir else name
+        for rules in reversed(self._stack(rel_dir)):
+            decision = rules.match(rel_path[len(rules.base) + 1:] if rules.base else rel_path, is_dir)
+            if decision is not None:
+                return decision
+        return False
+
+    def _dir_ignored(self, rel_dir: str) -> bool:
+        """Whether a directory is ignored, itself or through an ancestor (cached)."""
+        ignored = self._ignored_dirs.get(rel_dir)
+        if ignored is None:
+            parent, _, name = rel_dir.rpartition('/')
+            ignored = self._dir_ignored(parent) or self._decide(parent, name, True)
+            self._ignored_dirs[rel_dir] = ignored
+        return ignored
+
+    def is_ignored_entry(self, rel_dir: str, name: str, is_dir: bool) -> bool:
+        """
+        Whether `name` inside a directory is ignored.
+
+        Args:
+            rel_dir: Directory relative to the root, POSIX-style ('' = root)
+            name: Entry name
+            is_dir: Whether the entry is a directory
+        """
+        if self._dir_ignored(rel_dir):
+            return True
+        if is_dir:
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            return self._dir_ignored(rel_path)
+        return self._decide(rel_dir, name, False)
+
+    def is_ignored(self, path, is_dir: Optional[bool] = None) -> bool:
+        """
+        Whether a path is ignored. Paths outside the root are never ignored.
+
+        Args:
+            path: File or directory path
+            is_dir: Entry type (checked on disk if not given)
+        """
+        try:
+            rel = self._relative(path)
+        except ValueError:
+            return False
+        if not rel:
+            return False
+        if is_dir is None:
+            is_dir = Path(path).is_dir()
+        rel_dir, _, name = rel.rpartition('/')
+        return self.is_ignored_entry(rel_dir, name, is_dir)
+
+    def walk(self, top=None) -> Iterator[Tuple[Path, List[str], List[str]]]:
+        """
+        os.walk() over non-ignored entries, in sorted order.
+
+        Ignored directories are pruned before they are descended. Like
+        os.walk(), callers may prune `dirnames` further in place.
+
+        Args:
+            top: Directory to walk (default: the root); must be inside the root
+        """
+        top = self.root if top is None else Path(top).resolve()
+        if self.is_ignored(top, is_dir=True):
+            return
+        for dirpath, dirnames, filenames in os.walk(top):
+            rel_dir = self._relative(dirpath)
+            dirnames[:] = sorted(d for d in dirnames if not self.is_ignored_entry(rel_dir, d, True))
+            files = sorted(f for f in filenames if not self._decide(rel_dir, f, False))
+            yield Path(dirpath), dirnames, files
+
+    def files(self, top=None, pattern: Optional[str] = None) -> List[Path]:
+        """
+        Non-ignored files below a directory, in walk order.
+
+        Args:
+            top: Directory to walk (default: the root)
+            pattern: Optional glob relative to top, e.g. '**/lambda_function.py'
+        """
+        top = self.root if top is None else Path(top).resolve()
+        regex = _glob_to_regex(pattern) if pattern else None
+        results = []
+        for dirpath, _, filenames in self.walk(top):
+            rel_dir = os.path.relpath(dirpath, top)
+            prefix = '' if rel_dir == '.' else rel_dir.replace(os.sep, '/') + '/'
+            for name in filenames:
+                if regex is None or regex.match(prefix + name):
+                    results.append(dirpath / name)
+        return results
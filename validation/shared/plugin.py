@@ -0,0 +1,90 @@
+"""
+In-process validator plugin interface.
+
+A validator package opts in to in-process execution by exposing a ``run``
+function in its ``cli`` module:
+
+    def run(target: str, options: dict) -> ValidationResult:
+        ...
+
+``target`` is the path being validated. ``options`` carries orchestrator
+settings (``validation_type``, ``template_mode``, ``verbose``,
+``cache_dir``); plugins ignore keys they don't use. ``cache_dir`` is the
+incremental results cache directory (see result_cache.py), or None. ``run`` must not print to stdout or call
+``sys.exit`` - it returns the same errors/warnings/info/details the
+validator's ``--format json`` output would contain.
+
+cora-validate.py imports and calls ``run`` directly, avoiding an interpreter
+start-up and JSON round trip per validator. Validators without ``run`` (and
+any validator when ``--isolate`` is given) are still executed as
+``python -m <validator>.cli`` subprocesses, and their JSON output is
+converted with ``result_from_output``.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ValidationResult:
+    """Result from a single validator."""
+    validator: str
+    passed: bool
+    errors: list = field(default_factory=list)
+    warnings: list = field(default_factory=list)
+    info: list = field(default_factory=list)
+    details: dict = field(default_factory=dict)  # Detailed results (e.g. lists of files)
+    duration_ms: int = 0
+    skipped: bool = False
+    skip_reason: str = ""
+
+
+def _normalize_issues(issues, label: str) -> list:
+    """
+    Coerce an errors/warnings value into a list of issues.
+
+    Some validators report counts (e.g. 0, [0] or [5]) instead of issue
+    lists; those are converted to an empty list or a single summary item.
+    """
+    if isinstance(issues, (int, float)):
+        return [] if issues == 0 else [f"{int(issues)} {label} (details not provided)"]
+    if isinstance(issues, list):
+        if issues and all(isinstance(i, (int, float)) for i in issues):
+            count = sum(int(i) for i in issues)
+            return [] if count == 0 else [f"{count} {label} (details not provided)"]
+        return issues
+    return [str(issues)]
+
+
+def result_from_output(validator: str, output: dict, passed: bool) -> ValidationResult:
+    """
+    Build a ValidationResult from a validator's JSON output dictionary.
+
+    Args:
+        validator: Validator key
+        output: Parsed ``--format json`` output (or the equivalent dict)
+        passed: Whether the validator passed (exit code 0)
+
+    Returns:
+        ValidationResult with errors/warnings/info normalized to lists
+    """
+    # Some validators (like import_validator) nest errors in a summary object
+    errors = output.get("errors", [])
+    if not errors and "summary" in output:
+        summary_errors = output.get("summary", {}).get("errors", [])
+        errors = summary_errors if isinstance(summary_errors, list) else []
+
+    warnings = output.get("warnings", [])
+    if not warnings and "summary" in output:
+        summary_warnings = output.get("summary", {}).get("warnings", [])
+        warnings = summary_warnings if isinstance(summary_warnings, list) else []
+
+    info = output.get("info", [])
+
+    return ValidationResult(
+        validator=validator,
+        passed=passed,
+        errors=_normalize_issues(errors, "errors"),
+        warnings=_normalize_issues(warnings, "warnings"),
+        info=info if isinstance(info, list) else [str(info)],
+        details=output.get("details", {}),
+    )
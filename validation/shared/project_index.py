@@ -0,0 +1,273 @@
+"""
+Project File Index
+
+Walks a project tree once and classifies every file by kind, so validators
+can query file lists (and cached file contents) instead of each running their
+own rglob over the whole tree.
+
+Excluded directories (node_modules, .next, .build, dist, ...) are pruned
+during the walk, so their subtrees are never descended.
+
+Usage:
+    from shared.project_index import get_project_index, KIND_LAMBDA
+
+    index = get_project_index(project_path)
+    for path in index.files(kind=KIND_LAMBDA, under=project_path / 'packages'):
+        content = index.read_text(path)
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Directories pruned from every walk (dependencies and build artifacts)
+DEFAULT_EXCLUDED_DIRS = frozenset({
+    'node_modules',
+    '.next',
+    '.build',
+    'dist',
+    '.git',
+    '__pycache__',
+})
+
+# File kinds
+KIND_LAMBDA = 'lambda'                          # lambda_function.py
+KIND_PYTHON = 'python'                          # any other .py
+KIND_FRONTEND_PAGE = 'frontend_page'            # Next.js page.tsx / page.ts
+KIND_FRONTEND_COMPONENT = 'frontend_component'  # other .ts/.tsx/.js/.jsx
+KIND_TERRAFORM_OUTPUTS = 'terraform_outputs'    # outputs.tf
+KIND_TERRAFORM = 'terraform'                    # other .tf
+KIND_SQL_SCHEMA = 'sql_schema'                  # .sql
+KIND_OTHER = 'other'
+
+FRONTEND_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+
+
+def classify_file(path: Path) -> str:
+    """Return the file kind for a path."""
+    name = path.name
+    suffix = path.suffix
+    if name == 'lambda_function.py':
+        return KIND_LAMBDA
+    if suffix == '.py':
+        return KIND_PYTHON
+    if suffix in FRONTEND_EXTENSIONS:
+        if path.stem == 'page':
+            return KIND_FRONTEND_PAGE
+        return KIND_FRONTEND_COMPONENT
+    if name == 'outputs.tf':
+        return KIND_TERRAFORM_OUTPUTS
+    if suffix == '.tf':
+        return KIND_TERRAFORM
+    if suffix == '.sql':
+        return KIND_SQL_SCHEMA
+    return KIND_OTHER
+
+
+def _translate_glob_segment(segment: str) -> str:
+    """
+    Translate one path segment of a glob to a regex that can't match '/'.
+
+    Follows fnmatch: '*', '?', '[...]' and '[!...]' ('!' negates, a ']'
+    right after the opening bracket is literal, an unclosed '[' is
+    literal); other characters, backslashes included, match themselves.
+    """
+    parts = []
+    i = 0
+    n = len(segment)
+    while i < n:
+        char = segment[i]
+        i += 1
+        if char == '*':
+            while i < n and segment[i] == '*':
+                i += 1
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            end = i
+            if end < n and segment[end] == '!':
+                end += 1
+            if end < n and segment[end] == ']':
+                end += 1
+            end = segment.find(']', end)
+            if end == -1:
+                parts.append(re.escape(char))
+                continue
+            body = segment[i:end]
+            i = end + 1
+            negate = body.startswith('!')
+            if negate:
+                body = body[1:]
+            items = []
+            k = 0
+            while k < len(body):
+                if k + 2 < len(body) and body[k + 1] == '-':
+                    # Reversed ranges match nothing, as in fnmatch
+                    if body[k] <= body[k + 2]:
+                        items.append(re.escape(body[k]) + '-' + re.escape(body[k + 2]))
+                    k += 3
+                else:
+                    items.append(re.escape(body[k]))
+                    k += 1
+            if negate:
+                parts.append('[^/' + ''.join(items) + ']')
+            else:
+                parts.append('[' + ''.join(items) + ']' if items else '(?!)')
+        else:
+            parts.append(re.escape(char))
+    return ''.join(parts)
+
+
+def _glob_to_regex(pattern: str) -> 're.Pattern':
+    """
+    Translate a glob pattern (relative, '/'-separated) to a regex.
+
+    Supports '*', '?', '[...]' within a path segment and '**' spanning any
+    number of directories (including none), like pathlib's recursive glob.
+    """
+    parts = []
+    segments = pattern.split('/')
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == '**':
+            parts.append('.*' if last else '(?:[^/]+/)*')
+            continue
+        parts.append(_translate_glob_segment(segment) + ('' if last else '/'))
+    return re.compile('^' + ''.join(parts) + '$')
+
+
+class ProjectIndex:
+    """Single-walk index of project files, grouped by kind."""
+
+    def __init__(self, root, exclude_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS):
+        self.root = Path(root).resolve()
+        self.exclude_dirs = frozenset(exclude_dirs)
+        # Relative POSIX path -> kind, in sorted walk order
+        self._files: Dict[str, str] = {}
+        self._contents: Dict[Path, str] = {}
+        self._lock = threading.Lock()
+        self._walk()
+
+    def _walk(self):
+        """Walk the tree once, pruning excluded directories in place."""
+        entries: List[Tuple[str, str]] = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(d for d in dirnames if d not in self.exclude_dirs)
+            rel_dir = os.path.relpath(dirpath, self.root)
+            prefix = '' if rel_dir == '.' else rel_dir.replace(os.sep, '/') + '/'
+            for filename in filenames:
+                entries.append((prefix + filename, classify_file(Path(filename))))
+        self._files = dict(sorted(entries))
+
+    def _relative(self, path) -> str:
+        """Return path relative to the index root as a POSIX string."""
+        rel = Path(path).resolve().relative_to(self.root).as_posix()
+        return '' if rel == '.' else rel
+
+    def files(
+        self,
+        kind: Optional[str] = None,
+        under=None,
+        suffixes: Optional[Iterable[str]] = None,
+        exclude_dirs: Optional[Iterable[str]] = None,
+    ) -> List[Path]:
+        """
+        Query indexed files.
+
+        Args:
+            kind: Only files of this kind (see KIND_* constants)
+            under: Only files below this directory
+            suffixes: Only files with one of these suffixes (e.g. ['.ts', '.tsx'])
+            exclude_dirs: Additional directory names to skip for this query
+
+        Returns:
+            Sorted list of absolute file paths
+        """
+        prefix = ''
+        if under is not None:
+            prefix = self._relative(under)
+            if prefix:
+                prefix += '/'
+        suffixes = tuple(suffixes) if suffixes else None
+        extra_excludes = set(exclude_dirs) if exclude_dirs else None
+
+        results = []
+        for rel, file_kind in self._files.items():
+            if kind is not None and file_kind != kind:
+                continue
+            if prefix and not rel.startswith(prefix):
+                continue
+            if suffixes and not rel.endswith(suffixes):
+                continue
+            if extra_excludes and not extra_excludes.isdisjoint(rel.split('/')[:-1]):
+                continue
+            results.append(self.root / rel)
+        return results
+
+    def glob(self, pattern: str, under=None) -> List[Path]:
+        """
+        Match indexed files against a glob pattern.
+
+        Args:
+            pattern: Glob relative to `under` (or the root), e.g. '**/components/admin/*.tsx'
+            under: Directory the pattern is relative to
+
+        Returns:
+            Sorted list of absolute file paths
+        """
+        base = ''
+        if under is not None:
+            base = self._relative(under)
+            if base:
+                base += '/'
+        regex = _glob_to_regex(pattern)
+        return [
+            self.root / rel
+            for rel in self._files
+            if rel.startswith(base) and regex.match(rel[len(base):])
+        ]
+
+    def read_text(self, path) -> str:
+        """Read a file as UTF-8, caching the contents for later readers."""
+        path = Path(path)
+        content = self._contents.get(path)
+        if content is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            with self._lock:
+                self._contents[path] = content
+        return content
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+_indexes: Dict[Path, ProjectIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_project_index(root) -> ProjectIndex:
+    """
+    Return the shared ProjectIndex covering `root`, building it on first use.
+
+    An index already built for `root` or one of its ancestors is reused, so
+    validators running in the same process share one walk per run. Query
+    with `under=root` when the returned index may cover a larger tree.
+    """
+    root = Path(root).resolve()
+    with _indexes_lock:
+        for indexed_root, index in _indexes.items():
+            if root == indexed_root or indexed_root in root.parents:
+                return index
+        index = ProjectIndex(root)
+        _indexes[root] = index
+        return index
+
+
+def clear_project_indexes():
+    """Drop all shared indexes (e.g. between orchestrator runs)."""
+    with _indexes_lock:
+        _indexes.clear()
@@ -0,0 +1,226 @@
+"""
+Incremental Validation Results Cache
+
+Persists per-file findings on disk so repeated validation runs only
+re-analyze files that changed. Entries are keyed by:
+
+- validator: cache namespace (e.g. 'api-tracer.lambda_routes')
+- config key: hash of the validator version (its source files) and any
+  config that affects findings, so editing a validator or changing its
+  options invalidates old entries
+- path + content hash: findings are replayed only for byte-identical files
+
+Findings are stored as JSON in a SQLite database (stdlib, safe for the
+concurrent validator subprocesses started by `cora-validate --jobs`).
+
+Caching is opt-in: cora-validate sets CORA_VALIDATE_CACHE_DIR when run
+with --incremental. Without it, get_result_cache() returns a disabled
+cache whose get_or_compute() simply calls through.
+
+Usage:
+    from shared.result_cache import get_result_cache, source_version
+
+    cache = get_result_cache('my-validator', source_version(Path(__file__).parent))
+    for path in files:
+        content = path.read_text()
+        issues = cache.get_or_compute(path, content, lambda: check(path, content), Issue)
+    cache.flush()
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Environment variable holding the cache directory (set by cora-validate --incremental)
+CACHE_DIR_ENV = 'CORA_VALIDATE_CACHE_DIR'
+
+# Default cache directory name, created in the validated project root
+DEFAULT_CACHE_DIR_NAME = '.cora-validate-cache'
+
+_DB_NAME = 'results.sqlite3'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS findings (
+    validator TEXT NOT NULL,
+    config_key TEXT NOT NULL,
+    path TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    findings TEXT NOT NULL,
+    PRIMARY KEY (validator, config_key, path)
+)
+"""
+
+
+def content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest of file contents."""
+    return hashlib.sha256(content.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+_source_versions: Dict[Path, str] = {}
+_source_versions_lock = threading.Lock()
+
+
+def source_version(package_dir) -> str:
+    """
+    Return a version hash for a validator package.
+
+    Hashes the relative path and contents of every .py file below
+    package_dir, so any edit to the validator invalidates its cache entries.
+    """
+    package_dir = Path(package_dir).resolve()
+    with _source_versions_lock:
+        version = _source_versions.get(package_dir)
+        if version is None:
+            digest = hashlib.sha256()
+            for path in sorted(package_dir.rglob('*.py')):
+                if '__pycache__' in path.parts:
+                    continue
+                digest.update(path.relative_to(package_dir).as_posix().encode('utf-8'))
+                digest.update(path.read_bytes())
+            version = digest.hexdigest()
+            _source_versions[package_dir] = version
+        return version
+
+
+class ResultCache:
+    """Per-validator view of the on-disk findings cache."""
+
+    enabled = True
+
+    def __init__(self, cache_dir, validator: str, version: str, config: Optional[Dict[str, Any]] = None):
+        """
+        Open (or create) the cache database and load this validator's entries.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            validator: Cache namespace for the validator (or validator pass)
+            version: Validator version, usually source_version(package_dir)
+            config: Options that affect findings (must be JSON-serializable)
+        """
+        self.validator = validator
+        key_source = json.dumps({'version': version, 'config': config}, sort_keys=True, default=str)
+        self.config_key = hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+        self.hits = 0
+        self.misses = 0
+
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(cache_dir / _DB_NAME), timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, str, str, str, str]] = []
+
+        # Load all entries for this validator/config up front (one query per run)
+        rows = self._conn.execute(
+            'SELECT path, content_hash, findings FROM findings WHERE validator = ? AND config_key = ?',
+            (validator, self.config_key),
+        )
+        self._entries: Dict[str, Tuple[str, str]] = {path: (digest, data) for path, digest, data in rows}
+
+    def get(self, path, content: str) -> Optional[Any]:
+        """Return cached findings for path if its content is unchanged, else None."""
+        entry = self._entries.get(str(path))
+        if entry is not None and entry[0] == content_hash(content):
+            self.hits += 1
+            return json.loads(entry[1])
+        self.misses += 1
+        return None
+
+    def put(self, path, content: str, findings: Any):
+        """Record findings for path (JSON-serializable); written on flush()."""
+        data = json.dumps(findings)
+        digest = content_hash(content)
+        with self._lock:
+            self._entries[str(path)] = (digest, data)
+            self._pending.append((self.validator, self.config_key, str(path), digest, data))
+
+    def get_or_compute(self, path, content: str, compute: Callable[[], Any], cls: Optional[type] = None) -> Any:
+        """
+        Return cached findings for path, or compute and store them.
+
+        Args:
+            path: File path (cache key)
+            content: File contents (hashed to detect changes)
+            compute: Called on a cache miss to produce the findings
+            cls: If given, findings are a list of `cls` dataclass instances,
+                 stored with asdict() and rebuilt with cls(**fields)
+
+        Returns:
+            The findings, from cache or freshly computed
+        """
+        cached = self.get(path, content)
+        if cached is not None:
+            return [cls(**fields) for fields in cached] if cls else cached
+        findings = compute()
+        self.put(path, content, [asdict(f) for f in findings] if cls else findings)
+        return findings
+
+    def flush(self):
+        """Write pending entries to disk."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO findings (validator, config_key, path, content_hash, findings) '
+                'VALUES (?, ?, ?, ?, ?)',
+                pending,
+            )
+            self._conn.commit()
+
+
+class DisabledResultCache:
+    """Stand-in used when caching is off; always computes."""
+
+    enabled = False
+    hits = 0
+    misses = 0
+
+    def get(self, path, content: str) -> Optional[Any]:
+        return None
+
+    def put(self, path, content: str, findings: Any):
+        pass
+
+    def get_or_compute(self, path, content: str, compute: Callable[[], Any], cls: Optional[type] = None) -> Any:
+        return compute()
+
+    def flush(self):
+        pass
+
+
+def get_result_cache(
+    validator: str,
+    version: str,
+    config: Optional[Dict[str, Any]] = None,
+    cache_dir=None,
+):
+    """
+    Return the findings cache for a validator.
+
+    Args:
+        validator: Cache namespace for the validator (or validator pass)
+        version: Validator version, usually source_version(package_dir)
+        config: Options that affect findings
+        cache_dir: Cache directory (defaults to $CORA_VALIDATE_CACHE_DIR)
+
+    Returns:
+        ResultCache, or DisabledResultCache if no cache directory is
+        configured or the database can't be opened
+    """
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return DisabledResultCache()
+    try:
+        return ResultCache(cache_dir, validator, version, config)
+    except (OSError, sqlite3.Error):
+        # A broken cache must never fail validation
+        return DisabledResultCache()
@@ -16,6 +16,10 @@ from pathlib import Path
 
 from .validator import StructureValidator
 
+# Shared plugin interface for in-process execution by cora-validate
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.plugin import ValidationResult, result_from_output
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser."""
@@ -211,6 +215,13 @@ def format_markdown(result: dict) -> str:
     return "\n".join(lines)
 
 
+def run(target: str, options: dict) -> ValidationResult:
+    """In-process plugin entry point (see shared/plugin.py)."""
+    validator = StructureValidator(verbose=False)
+    result_dict = validator.validate_project(str(Path(target).resolve())).to_dict()
+    return result_from_output("structure", result_dict, result_dict['summary']['errors'] == 0)
+
+
 def main():
     """Main entry point."""
     parser = create_parser()